@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Measure cold-start time of both MCP servers.
+
+Each server is started in a fresh interpreter (stdio servers are spawned per
+editor session, so every start is a cold start). The report splits the time
+into importing fastmcp (shared by every MCP server and outside our control),
+importing the server module and ``create_server()``, lists the slowest
+imports of the server module (``python -X importtime``), and checks that
+heavy dependencies are not loaded before the first tool call.
+
+Usage:
+    python scripts/measure_startup.py [--runs 5] [--top 15] [--json] [--check]
+
+``--check`` exits with status 1 when a server exceeds its budget (server import
+plus ``create_server()``, in milliseconds; override with ``STARTUP_BUDGET_MS``)
+or loads one of ``DEFERRED_MODULES`` at startup.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "analyzer": ("mcp_local_repo_analyzer.server", "LocalRepoAnalyzerServer"),
+    "recommender": ("mcp_pr_recommender.server", "PRRecommenderServer"),
+}
+
+# Server import + create_server(), on top of importing fastmcp. Both take well
+# under 200ms on a laptop; before lazy loading the recommender took ~950ms.
+BUDGET_MS = {"analyzer": 500.0, "recommender": 500.0}
+
+# Only imported once a tool needs them
+DEFERRED_MODULES = ("openai",)
+
+_CHILD = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import fastmcp
+t1 = time.perf_counter()
+from {module} import {cls}
+t2 = time.perf_counter()
+_, services = asyncio.run({cls}().create_server())
+t3 = time.perf_counter()
+print(json.dumps({{
+    "fastmcp_ms": (t1 - t0) * 1000,
+    "import_ms": (t2 - t1) * 1000,
+    "create_ms": (t3 - t2) * 1000,
+    "deferred_loaded": [m for m in {deferred!r} if m in sys.modules],
+    "pending_services": list(getattr(services, "pending", [])),
+}}))
+"""
+
+
+def _run_child(module: str, cls: str, importtime: bool = False) -> tuple[dict[str, Any], str]:
+    code = _CHILD.format(module=module, cls=cls, deferred=DEFERRED_MODULES)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT / "src"), os.environ.get("PYTHONPATH")]))}
+    args = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code]
+    proc = subprocess.run(args, capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def slowest_imports(importtime_log: str, after: str = "fastmcp", top: int = 15) -> list[tuple[str, float]]:
+    """Return the ``top`` modules by cumulative import time (ms) imported after ``after``."""
+    entries = []
+    seen_after = False
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        if seen_after:
+            entries.append((name.rstrip(), int(cumulative) / 1000))
+        elif name.rstrip() == f" {after}":  # top-level entries are indented by one space
+            seen_after = True
+    return sorted(entries, key=lambda entry: -entry[1])[:top]
+
+
+def measure(name: str, runs: int = 5, top: int = 15) -> dict[str, Any]:
+    """Start server ``name`` ``runs`` times and return the fastest run plus its import breakdown."""
+    module, cls = SERVERS[name]
+    samples = [_run_child(module, cls)[0] for _ in range(runs)]
+    best = min(samples, key=lambda s: s["import_ms"] + s["create_ms"])
+    _, log = _run_child(module, cls, importtime=True)
+    budget = float(os.environ.get("STARTUP_BUDGET_MS", BUDGET_MS[name]))
+    return {
+        **best,
+        "startup_ms": best["import_ms"] + best["create_ms"],
+        "budget_ms": budget,
+        "slowest_imports": slowest_imports(log, top=top),
+    }
+
+
+def check(report: dict[str, dict[str, Any]]) -> list[str]:
+    """Return a message for every server over budget or loading deferred modules."""
+    failures = []
+    for name, result in report.items():
+        if result["startup_ms"] > result["budget_ms"]:
+            failures.append(f"{name}: startup {result['startup_ms']:.0f}ms exceeds budget {result['budget_ms']:.0f}ms")
+        if result["deferred_loaded"]:
+            failures.append(f"{name}: imports {', '.join(result['deferred_loaded'])} at startup")
+    return failures
+
+
+def format_report(report: dict[str, dict[str, Any]]) -> str:
+    """Render ``report`` as plain text."""
+    lines = []
+    for name, result in report.items():
+        lines += [
+            f"{name}: {result['startup_ms']:.0f}ms (budget {result['budget_ms']:.0f}ms) = "
+            f"import {result['import_ms']:.0f}ms + create_server {result['create_ms']:.0f}ms; "
+            f"fastmcp import {result['fastmcp_ms']:.0f}ms not counted",
+            f"  services deferred: {', '.join(result['pending_services']) or 'none'}",
+            f"  deferred modules loaded: {', '.join(result['deferred_loaded']) or 'none'}",
+            "  slowest imports (cumulative, -X importtime):",
+            *(f"    {ms:8.1f}ms {module}" for module, ms in result["slowest_imports"]),
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Measure both servers and print the report."""
+    parser = argparse.ArgumentParser(description="Measure MCP server cold-start time")
+    parser.add_argument("--server", choices=sorted(SERVERS), action="append", help="Server to measure (default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Starts per server; the fastest is reported")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when over budget")
+    args = parser.parse_args()
+
+    report = {name: measure(name, args.runs, args.top) for name in args.server or SERVERS}
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    failures = check(report)
+    if args.check and failures:
+        print("\n".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
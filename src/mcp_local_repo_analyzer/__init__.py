@@ -1,6 +1,7 @@
 """Local repository analyzer package."""
 
-from . import config, models, server, services, tools
+import importlib
+from typing import Any
 
 __all__ = [
     "models",
@@ -9,3 +10,10 @@ __all__ = [
     "config",
     "server",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Submodules load on first access, so importing one model does not pull in the server and tools
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
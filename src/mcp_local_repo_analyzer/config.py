@@ -69,6 +69,50 @@ class GitAnalyzerSettings(BaseMCPSettings):
         le=10000,
         description="Threshold for considering a file change large (in lines)",
     )
+    snapshot_ttl_seconds: int = Field(
+        default=300,
+        ge=10,
+        le=3600,
+        description="Lifetime of paginated result snapshots (in seconds)",
+    )
+    max_snapshots: int = Field(
+        default=32,
+        ge=1,
+        le=1000,
+        description="Maximum number of paginated result snapshots kept in memory",
+    )
+    coalesce_concurrent_requests: bool = Field(
+        default=True,
+        description="Share one computation between concurrent identical analyses of the same repository state",
+    )
+    use_index_reader: bool = Field(
+        default=True,
+        description="Detect modified and deleted tracked files by reading .git/index instead of running git status",
+    )
+    use_object_reader: bool = Field(
+        default=True,
+        description="Read HEAD and index blobs from .git/objects for staged line counts instead of running git diff",
+    )
+    git_max_concurrency: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum git subprocesses running at once across all requests (0 uses the CPU count)",
+    )
+    git_timeout_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="Deadline for quick git commands such as status, rev-parse and branch (0 disables)",
+    )
+    git_content_timeout_seconds: float = Field(
+        default=120.0,
+        ge=0,
+        description="Deadline for git commands whose cost grows with history or diff size, e.g. diff and log (0 disables)",
+    )
+    git_terminate_grace_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="Time a timed-out or cancelled git process gets to exit after SIGTERM before it is killed",
+    )
 
 
 # Global settings instance
@@ -7,6 +7,7 @@ from .analysis_repository import BranchStatus, RepositoryStatus
 from .categorization import ChangeCategorization
 from .changes import StagedChanges, WorkingDirectoryChanges
 from .commits import StashedChanges, UnpushedCommit
+from .file_table import FileStatusRow, FileStatusTable
 from .files import DiffHunk, FileDiff, FileStatus
 from .repository import LocalRepository
 from .results import OutstandingChangesAnalysis
@@ -15,6 +16,8 @@ from .risk import RiskAssessment
 __all__ = [
     # Git models
     "FileStatus",
+    "FileStatusRow",
+    "FileStatusTable",
     "FileDiff",
     "DiffHunk",
     "UnpushedCommit",
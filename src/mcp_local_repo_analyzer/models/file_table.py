@@ -0,0 +1,292 @@
+"""Columnar storage for large batches of file statuses.
+
+``FileStatusTable`` keeps one array per ``FileStatus`` field instead of one
+pydantic object per file: paths are interned once, status codes are stored as
+byte-sized ids, line counts as unsigned int arrays and flags as bitsets. Rows
+are exposed through lightweight ``FileStatusRow`` views with the same
+attributes and derived properties as ``FileStatus``; pydantic objects are only
+created when a batch crosses the MCP serialization boundary.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from sys import getsizeof
+from typing import Any, overload
+
+from .files import ChangeType, FileStatus, change_type, file_type, status_description
+
+# Field order of FileStatus, used for dict/model conversion
+FILE_STATUS_FIELDS = (
+    "path",
+    "status_code",
+    "staged",
+    "working_tree_status",
+    "index_status",
+    "lines_added",
+    "lines_deleted",
+    "is_binary",
+    "old_path",
+)
+
+
+class FileStatusRow:
+    """Read-only view of one row of a ``FileStatusTable``.
+
+    Supports the attribute access of ``FileStatus`` (including ``total_changes``,
+    ``status_description``, ``change_type`` and ``file_type``) without
+    materializing a pydantic model.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "FileStatusTable", row: int) -> None:
+        """Create a view of ``row`` in ``table``."""
+        self._table = table
+        self._row = row
+
+    @property
+    def path(self) -> str:
+        """File path relative to repository root."""
+        return self._table._strings[self._table._path[self._row]]
+
+    @property
+    def status_code(self) -> str:
+        """Git status code."""
+        return self._table._codes[self._table._status[self._row]]  # type: ignore[return-value]
+
+    @property
+    def staged(self) -> bool:
+        """File is staged for commit."""
+        return self._table._get_bit(self._table._staged, self._row)
+
+    @property
+    def working_tree_status(self) -> str | None:
+        """Working tree status."""
+        return self._table._codes[self._table._worktree[self._row]]
+
+    @property
+    def index_status(self) -> str | None:
+        """Index status."""
+        return self._table._codes[self._table._index[self._row]]
+
+    @property
+    def lines_added(self) -> int:
+        """Lines added."""
+        return self._table._added[self._row]
+
+    @property
+    def lines_deleted(self) -> int:
+        """Lines deleted."""
+        return self._table._deleted[self._row]
+
+    @property
+    def is_binary(self) -> bool:
+        """File is binary."""
+        return self._table._get_bit(self._table._binary, self._row)
+
+    @property
+    def old_path(self) -> str | None:
+        """Original path for renames."""
+        string_id = self._table._old_path[self._row]
+        return self._table._strings[string_id - 1] if string_id else None
+
+    # Derived properties use the same helpers as FileStatus so both behave identically
+    @property
+    def total_changes(self) -> int:
+        """Total number of line changes."""
+        return self.lines_added + self.lines_deleted
+
+    @property
+    def status_description(self) -> str:
+        """Human-readable status description."""
+        return status_description(self.status_code)
+
+    @property
+    def change_type(self) -> ChangeType:
+        """Categorize the type of change."""
+        return change_type(self.status_code)
+
+    @property
+    def file_type(self) -> str:
+        """Determine file type based on extension."""
+        return file_type(self.path)
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the row as a ``FileStatus``-compatible dict."""
+        return {name: getattr(self, name) for name in FILE_STATUS_FIELDS}
+
+    def to_file_status(self) -> FileStatus:
+        """Materialize the row as a pydantic ``FileStatus``."""
+        return FileStatus.model_construct(**self.model_dump())
+
+    def __repr__(self) -> str:
+        """Short representation for debugging."""
+        return f"FileStatusRow(path={self.path!r}, status_code={self.status_code!r})"
+
+
+class FileStatusTable(Sequence[FileStatusRow]):
+    """Struct-of-arrays container for many file statuses.
+
+    Values are validated once on ``append``; rows are read back through
+    ``FileStatusRow`` views or converted with ``to_models``/``to_dicts``.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        # Intern tables: every distinct path and status code is stored once
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._codes: list[str | None] = [None]
+        self._code_ids: dict[str | None, int] = {None: 0}
+
+        self._path = array("I")
+        self._old_path = array("I")  # string id + 1, 0 for None
+        self._status = bytearray()
+        self._worktree = bytearray()
+        self._index = bytearray()
+        self._added = array("I")
+        self._deleted = array("I")
+        self._staged = bytearray()
+        self._binary = bytearray()
+
+    @classmethod
+    def from_models(cls, files: Iterable[Any]) -> "FileStatusTable":
+        """Build a table from ``FileStatus`` objects (or anything with the same attributes)."""
+        table = cls()
+        for file in files:
+            table.append(
+                file.path,
+                file.status_code,
+                staged=file.staged,
+                working_tree_status=file.working_tree_status,
+                index_status=file.index_status,
+                lines_added=file.lines_added,
+                lines_deleted=file.lines_deleted,
+                is_binary=file.is_binary,
+                old_path=file.old_path,
+            )
+        return table
+
+    @classmethod
+    def from_dicts(cls, records: Iterable[Mapping[str, Any]]) -> "FileStatusTable":
+        """Build a table from ``FileStatus``-shaped dicts, e.g. decoded MCP payloads."""
+        table = cls()
+        for record in records:
+            table.append(
+                record["path"],
+                record["status_code"],
+                staged=record.get("staged", False),
+                working_tree_status=record.get("working_tree_status"),
+                index_status=record.get("index_status"),
+                lines_added=record.get("lines_added", 0),
+                lines_deleted=record.get("lines_deleted", 0),
+                is_binary=record.get("is_binary", False),
+                old_path=record.get("old_path"),
+            )
+        return table
+
+    def append(
+        self,
+        path: str,
+        status_code: str,
+        staged: bool = False,
+        working_tree_status: str | None = None,
+        index_status: str | None = None,
+        lines_added: int = 0,
+        lines_deleted: int = 0,
+        is_binary: bool = False,
+        old_path: str | None = None,
+    ) -> int:
+        """Append a row and return its index.
+
+        Raises:
+            ValueError: If a line count is negative or too many distinct status codes are used
+        """
+        if lines_added < 0 or lines_deleted < 0:
+            raise ValueError(f"Line counts must be non-negative for {path}")
+
+        row = len(self._path)
+        if row % 8 == 0:
+            self._staged.append(0)
+            self._binary.append(0)
+
+        self._path.append(self._intern(path))
+        self._old_path.append(self._intern(old_path) + 1 if old_path is not None else 0)
+        self._status.append(self._code(status_code))
+        self._worktree.append(self._code(working_tree_status))
+        self._index.append(self._code(index_status))
+        self._added.append(int(lines_added))
+        self._deleted.append(int(lines_deleted))
+        if staged:
+            self._staged[row >> 3] |= 1 << (row & 7)
+        if is_binary:
+            self._binary[row >> 3] |= 1 << (row & 7)
+        return row
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return string_id
+
+    def _code(self, value: str | None) -> int:
+        code_id = self._code_ids.get(value)
+        if code_id is None:
+            if len(self._codes) > 255:
+                raise ValueError("FileStatusTable supports at most 255 distinct status codes")
+            code_id = self._code_ids[value] = len(self._codes)
+            self._codes.append(value)
+        return code_id
+
+    @staticmethod
+    def _get_bit(bits: bytearray, row: int) -> bool:
+        return bool(bits[row >> 3] & (1 << (row & 7)))
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self._path)
+
+    @overload
+    def __getitem__(self, row: int) -> FileStatusRow: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[FileStatusRow]: ...
+
+    def __getitem__(self, row: int | slice) -> FileStatusRow | list[FileStatusRow]:
+        """Return a view of ``row`` (negative indices count from the end), or a list of views for a slice."""
+        size = len(self._path)
+        if isinstance(row, slice):
+            return [FileStatusRow(self, i) for i in range(*row.indices(size))]
+        if row < 0:
+            row += size
+        if not 0 <= row < size:
+            raise IndexError("FileStatusTable index out of range")
+        return FileStatusRow(self, row)
+
+    def __iter__(self) -> Iterator[FileStatusRow]:
+        """Iterate over row views."""
+        return (FileStatusRow(self, row) for row in range(len(self._path)))
+
+    def total_changes(self) -> int:
+        """Sum of added and deleted lines over all rows."""
+        return sum(self._added) + sum(self._deleted)
+
+    def to_models(self) -> list[FileStatus]:
+        """Materialize every row as a ``FileStatus`` (the serialization boundary)."""
+        return [row.to_file_status() for row in self]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert every row to a ``FileStatus``-compatible dict without building models."""
+        return [row.model_dump() for row in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the table's columns and intern tables."""
+        columns = (self._path, self._old_path, self._added, self._deleted)
+        flags = (self._status, self._worktree, self._index, self._staged, self._binary)
+        return (
+            sum(c.itemsize * len(c) for c in columns)
+            + sum(len(f) for f in flags)
+            + sum(getsizeof(s) for s in self._strings)
+        )
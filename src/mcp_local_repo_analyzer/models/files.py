@@ -4,6 +4,75 @@ from typing import Literal, cast
 
 from pydantic import BaseModel, Field
 
+ChangeType = Literal["addition", "modification", "deletion", "rename", "copy", "untracked"]
+
+_STATUS_DESCRIPTIONS = {
+    "M": "Modified",
+    "A": "Added",
+    "D": "Deleted",
+    "R": "Renamed",
+    "C": "Copied",
+    "U": "Unmerged",
+    "?": "Untracked",
+    "!": "Ignored",
+}
+
+_CHANGE_TYPES = {
+    "A": "addition",
+    "M": "modification",
+    "D": "deletion",
+    "R": "rename",
+    "C": "copy",
+    "?": "untracked",
+}
+
+
+def status_description(status_code: str) -> str:
+    """Human-readable description of a git status code."""
+    return _STATUS_DESCRIPTIONS.get(status_code, status_code)
+
+
+def change_type(status_code: str) -> ChangeType:
+    """Categorize the type of change of a git status code."""
+    return cast(ChangeType, _CHANGE_TYPES.get(status_code, "modification"))
+
+
+def file_type(path: str) -> str:
+    """Determine file type based on extension."""
+    if not path:
+        return "unknown"
+
+    # Get file extension
+    ext = path.split(".")[-1].lower() if "." in path else ""
+
+    # Map extensions to file types
+    if ext in ["py", "pyx", "pyi"]:
+        return "python"
+    elif ext in ["js", "ts", "jsx", "tsx"]:
+        return "javascript"
+    elif ext in ["html", "htm", "xml"]:
+        return "markup"
+    elif ext in ["css", "scss", "sass", "less"]:
+        return "stylesheet"
+    elif ext in ["md", "rst", "txt"]:
+        return "documentation"
+    elif ext in ["json", "yaml", "yml", "toml", "ini", "cfg"]:
+        return "configuration"
+    elif ext in ["sh", "bash", "zsh", "fish"]:
+        return "shell"
+    elif ext in ["sql", "db", "sqlite"]:
+        return "database"
+    elif ext in ["png", "jpg", "jpeg", "gif", "svg", "ico"]:
+        return "image"
+    elif ext in ["pdf", "doc", "docx"]:
+        return "document"
+    elif path.startswith("."):
+        return "dotfile"
+    elif "/" not in path and "." not in path:
+        return "executable"
+    else:
+        return ext if ext else "unknown"
+
 
 class FileStatus(BaseModel):
     """Represents the status of a single file."""
@@ -26,72 +95,17 @@ class FileStatus(BaseModel):
     @property
     def status_description(self) -> str:
         """Human-readable status description."""
-        status_map = {
-            "M": "Modified",
-            "A": "Added",
-            "D": "Deleted",
-            "R": "Renamed",
-            "C": "Copied",
-            "U": "Unmerged",
-            "?": "Untracked",
-            "!": "Ignored",
-        }
-        return status_map.get(self.status_code, self.status_code)
+        return status_description(self.status_code)
 
     @property
-    def change_type(
-        self,
-    ) -> Literal["addition", "modification", "deletion", "rename", "copy", "untracked"]:
+    def change_type(self) -> ChangeType:
         """Categorize the type of change."""
-        mapping = {
-            "A": "addition",
-            "M": "modification",
-            "D": "deletion",
-            "R": "rename",
-            "C": "copy",
-            "?": "untracked",
-        }
-        return cast(
-            Literal["addition", "modification", "deletion", "rename", "copy", "untracked"],
-            mapping.get(self.status_code, "modification"),
-        )
+        return change_type(self.status_code)
 
     @property
     def file_type(self) -> str:
         """Determine file type based on extension."""
-        if not self.path:
-            return "unknown"
-
-        # Get file extension
-        ext = self.path.split(".")[-1].lower() if "." in self.path else ""
-
-        # Map extensions to file types
-        if ext in ["py", "pyx", "pyi"]:
-            return "python"
-        elif ext in ["js", "ts", "jsx", "tsx"]:
-            return "javascript"
-        elif ext in ["html", "htm", "xml"]:
-            return "markup"
-        elif ext in ["css", "scss", "sass", "less"]:
-            return "stylesheet"
-        elif ext in ["md", "rst", "txt"]:
-            return "documentation"
-        elif ext in ["json", "yaml", "yml", "toml", "ini", "cfg"]:
-            return "configuration"
-        elif ext in ["sh", "bash", "zsh", "fish"]:
-            return "shell"
-        elif ext in ["sql", "db", "sqlite"]:
-            return "database"
-        elif ext in ["png", "jpg", "jpeg", "gif", "svg", "ico"]:
-            return "image"
-        elif ext in ["pdf", "doc", "docx"]:
-            return "document"
-        elif self.path.startswith("."):
-            return "dotfile"
-        elif "/" not in self.path and "." not in self.path:
-            return "executable"
-        else:
-            return ext if ext else "unknown"
+        return file_type(self.path)
 
 
 class DiffHunk(BaseModel):
@@ -14,7 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from .analysis_repository import RepositoryStatus
 from .categorization import ChangeCategorization
@@ -38,10 +38,58 @@ class OutstandingChangesAnalysis(BaseModel):
     repository_status: RepositoryStatus | None = Field(None, description="Complete repository status (optional)")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata about the analysis")
 
-    @property
-    def all_changed_files(self) -> list[FileStatus]:
-        """Get all changed files from working directory and staged changes."""
+    # (fingerprint, merged files, path index) computed from repository_status on first access
+    _changed_files_cache: tuple[tuple[int, ...], list[FileStatus], dict[str, FileStatus]] | None = PrivateAttr(
+        default=None
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field, dropping cached file views when the repository status is replaced."""
+        super().__setattr__(name, value)
+        if name == "repository_status":
+            self.invalidate_changed_files()
+
+    def invalidate_changed_files(self) -> None:
+        """Drop the cached ``all_changed_files`` view and path index.
+
+        Needed only after mutating file lists of ``repository_status`` in place
+        without changing their lengths; replacing the status or any of its file
+        lists, or adding/removing files, is detected automatically.
+        """
+        self._changed_files_cache = None
+
+    def _changed_files_fingerprint(self) -> tuple[int, ...]:
+        """Cheap identity/length fingerprint of the file lists behind ``all_changed_files``."""
+        status = self.repository_status
+        if status is None:
+            return ()
+
+        fingerprint = [id(status), id(status.working_directory), id(status.staged_changes)]
+        lists = []
+        if status.working_directory:
+            working = status.working_directory
+            lists = [
+                working.modified_files,
+                working.added_files,
+                working.deleted_files,
+                working.renamed_files,
+                working.untracked_files,
+            ]
+        if status.staged_changes:
+            lists.append(status.staged_changes.staged_files)
+        for files in lists:
+            fingerprint.extend((id(files), len(files)))
+        return tuple(fingerprint)
+
+    def _changed_files_view(self) -> tuple[list[FileStatus], dict[str, FileStatus]]:
+        """Return the merged file list and path index, rebuilding them if stale."""
+        fingerprint = self._changed_files_fingerprint()
+        cache = self._changed_files_cache
+        if cache is not None and cache[0] == fingerprint:
+            return cache[1], cache[2]
+
         all_files: list[FileStatus] = []
+        by_path: dict[str, FileStatus] = {}
 
         if self.repository_status:
             # Add working directory files
@@ -51,15 +99,31 @@ class OutstandingChangesAnalysis(BaseModel):
                 all_files.extend(self.repository_status.working_directory.deleted_files)
                 all_files.extend(self.repository_status.working_directory.renamed_files)
                 all_files.extend(self.repository_status.working_directory.untracked_files)
+                for file in all_files:
+                    by_path.setdefault(file.path, file)
 
             # Add staged files (if not already in working directory)
             if self.repository_status.staged_changes:
-                staged_paths = {f.path for f in all_files}
                 for staged_file in self.repository_status.staged_changes.staged_files:
-                    if staged_file.path not in staged_paths:
+                    if staged_file.path not in by_path:
                         all_files.append(staged_file)
+                        by_path[staged_file.path] = staged_file
+
+        self._changed_files_cache = (fingerprint, all_files, by_path)
+        return all_files, by_path
 
-        return all_files
+    @property
+    def all_changed_files(self) -> list[FileStatus]:
+        """Get all changed files from working directory and staged changes.
+
+        The merged list is computed once and cached; treat it as read-only.
+        """
+        return self._changed_files_view()[0]
+
+    @property
+    def changed_files_by_path(self) -> dict[str, FileStatus]:
+        """Index of ``all_changed_files`` by path (first occurrence wins); treat it as read-only."""
+        return self._changed_files_view()[1]
 
     @property
     def is_ready_for_commit(self) -> bool:
@@ -5,10 +5,23 @@ from typing import Any
 
 from fastmcp import FastMCP
 
-from mcp_local_repo_analyzer.config import GitAnalyzerSettings
-from mcp_local_repo_analyzer.services import ChangeDetector, DiffAnalyzer, StatusTracker
+from mcp_local_repo_analyzer.services import (
+    ChangeDetector,
+    DiffAnalyzer,
+    RequestCoalescer,
+    SnapshotCache,
+    StatusTracker,
+)
 from mcp_local_repo_analyzer.services.client import GitClient
 from shared.base.server import BaseMCPServer
+from shared.base.services import LazyServices
+
+
+def _settings(_services: LazyServices) -> Any:
+    # Imported here: pydantic-settings is one of the slower imports at startup
+    from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+
+    return GitAnalyzerSettings()
 
 
 class LocalRepoAnalyzerServer(BaseMCPServer):
@@ -49,51 +62,23 @@ class LocalRepoAnalyzerServer(BaseMCPServer):
             """
 
     async def initialize_services(self) -> dict[str, Any]:
-        """Initialize analyzer-specific services."""
-        self.logger.info("Initializing services...")
-
-        # Create default settings for GitClient
-        # TODO: Load from configuration file when available
-        settings = GitAnalyzerSettings()
-
-        try:
-            git_client = GitClient(settings)
-            self.logger.info("GitClient initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize GitClient: {e}")
-            raise
-
-        try:
-            change_detector = ChangeDetector(git_client)
-            self.logger.info("ChangeDetector initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize ChangeDetector: {e}")
-            raise
-
-        try:
-            diff_analyzer = DiffAnalyzer(settings)
-            self.logger.info("DiffAnalyzer initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize DiffAnalyzer: {e}")
-            raise
-
-        try:
-            status_tracker = StatusTracker(git_client, change_detector)
-            self.logger.info("StatusTracker initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize StatusTracker: {e}")
-            raise
-
-        # Create services dict for dependency injection
-        services = {
-            "git_client": git_client,
-            "change_detector": change_detector,
-            "diff_analyzer": diff_analyzer,
-            "status_tracker": status_tracker,
-        }
-
-        self.logger.info("All services initialized successfully")
-        return services
+        """Register analyzer services; each is built on first use."""
+        # TODO: Load settings from a configuration file when available
+        return LazyServices(
+            {
+                "settings": _settings,
+                "git_client": lambda s: GitClient(s["settings"]),
+                "coalescer": lambda s: RequestCoalescer(s["settings"].coalesce_concurrent_requests),
+                "change_detector": lambda s: ChangeDetector(s["git_client"], s["coalescer"]),
+                "diff_analyzer": lambda s: DiffAnalyzer(s["settings"]),
+                "status_tracker": lambda s: StatusTracker(s["git_client"], s["change_detector"], s["coalescer"]),
+                # Shared by all paginated tools so cursors work across calls
+                "snapshot_cache": lambda s: SnapshotCache(
+                    ttl_seconds=s["settings"].snapshot_ttl_seconds,
+                    max_snapshots=s["settings"].max_snapshots,
+                ),
+            }
+        )
 
     async def register_tools(self, mcp: FastMCP, services: dict[str, Any]) -> None:
         """Register analyzer-specific tools."""
@@ -6,7 +6,10 @@ diff analysis, and status tracking for repository monitoring.
 
 from .change_detector import ChangeDetector
 from .client import GitClient
+from .coalescing import RequestCoalescer
 from .diff_analyzer import DiffAnalyzer
+from .git_scheduler import GitPriority, GitScheduler
+from .snapshot_cache import CursorError, SnapshotCache
 from .status_tracker import StatusTracker
 
 __all__ = [
@@ -14,4 +17,9 @@ __all__ = [
     "DiffAnalyzer",
     "StatusTracker",
     "GitClient",
+    "SnapshotCache",
+    "CursorError",
+    "RequestCoalescer",
+    "GitPriority",
+    "GitScheduler",
 ]
@@ -13,30 +13,42 @@ from mcp_local_repo_analyzer.models import (
     WorkingDirectoryChanges,
 )
 from mcp_local_repo_analyzer.models.repository import LocalRepository
+from shared.utils.context_logging import ContextLogger
 from shared.utils.logging import logging_service
 
 from .client import GitClient
+from .coalescing import RequestCoalescer
 
 
 class ChangeDetector:
     """Service for detecting different types of git changes."""
 
-    def __init__(self, git_client: GitClient):
+    def __init__(self, git_client: GitClient, coalescer: RequestCoalescer | None = None):
         """Initialize change detector with git client."""
         self.git_client = git_client
+        self.coalescer = coalescer or RequestCoalescer()
         self.logger = logging_service.get_logger(__name__)
 
     async def detect_working_directory_changes(
-        self, repo: LocalRepository, ctx: Optional["Context"] = None
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
     ) -> WorkingDirectoryChanges:
-        """Detect uncommitted changes in working directory (changes NOT YET staged)."""
-        if ctx:
-            await ctx.debug("Detecting working directory changes (unstaged only)")
+        """Detect uncommitted changes in working directory (changes NOT YET staged).
+
+        Concurrent calls for the same repository state share one computation.
+        """
+        return await self.coalescer.run(
+            "working_directory_changes", repo.path, lambda: self._detect_working_directory_changes(repo, ctx)
+        )
+
+    async def _detect_working_directory_changes(
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
+    ) -> WorkingDirectoryChanges:
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Detecting working directory changes (unstaged only)")
 
         try:
-            status_info = await self.git_client.get_status(repo.path, ctx)
-            if ctx:
-                await ctx.debug(f"Raw git status info: {status_info}")
+            status_info = await self.git_client.get_working_directory_status(repo.path, log)
+            await log.debug("Raw git status info: %s", status_info)
 
             modified_files = []
             added_files = []
@@ -44,8 +56,7 @@ class ChangeDetector:
             renamed_files = []
             untracked_files = []
 
-            if ctx:
-                await ctx.debug(f"Processing {len(status_info['files'])} file status entries for WD changes")
+            await log.debug("Processing %d file status entries for WD changes", len(status_info["files"]))
 
             for file_info in status_info["files"]:
                 index_status = file_info.get("index_status")  # Left-hand side of status output (staged)
@@ -61,7 +72,7 @@ class ChangeDetector:
                 # AND not being an untracked file, OR if it's untracked.
 
                 # Handle untracked files explicitly first, as they are always unstaged
-                if status_code == "?":
+                if status_code in ("?", "??"):
                     # Untracked files have no index_status or working_status beyond '?'
                     file_status = FileStatus(
                         path=file_info["filename"],
@@ -92,26 +103,27 @@ class ChangeDetector:
                     is_binary = False
 
                     try:
-                        if ctx:
-                            await ctx.debug(f"Getting diff stats for unstaged WD file {file_info['filename']}")
                         diff_stats = await self.git_client.get_diff_stats(
                             repo.path,
                             file_info["filename"],
                             staged=False,  # Get diff between working tree and index (unstaged changes)
-                            ctx=ctx,
+                            ctx=log,
                         )
                         lines_added = diff_stats.get("lines_added", 0)
                         lines_deleted = diff_stats.get("lines_deleted", 0)
                         is_binary = diff_stats.get("is_binary", False)
-                        if ctx:
-                            await ctx.debug(
-                                f"Got diff stats for unstaged WD file {file_info['filename']}: +{lines_added}/-{lines_deleted}, binary={is_binary}"
-                            )
+                        await log.item(
+                            "Unstaged diff stats",
+                            "%s: +%d/-%d, binary=%s",
+                            file_info["filename"],
+                            lines_added,
+                            lines_deleted,
+                            is_binary,
+                        )
                     except Exception as e:
-                        if ctx:
-                            await ctx.error(
-                                f"Failed to get diff stats for unstaged WD file {file_info['filename']}: {str(e)}"
-                            )
+                        await log.error(
+                            f"Failed to get diff stats for unstaged WD file {file_info['filename']}: {str(e)}"
+                        )
                         raise
 
                     file_status = FileStatus(
@@ -139,10 +151,11 @@ class ChangeDetector:
                     # For other composite states like 'UD' (unmerged), we'll categorize based on actual status_code
                     # or simply ignore for this tool if not 'M', 'A', 'D', 'R'.
                 else:
-                    if ctx:
-                        await ctx.debug(
-                            f"File {file_info['filename']} has no unstaged changes in working directory (status: {status_code})"
-                        )
+                    await log.item(
+                        "Files without unstaged changes", "%s (status: %s)", file_info["filename"], status_code
+                    )
+
+            await log.flush()
 
             changes = WorkingDirectoryChanges(
                 modified_files=modified_files,
@@ -152,11 +165,11 @@ class ChangeDetector:
                 untracked_files=untracked_files,
             )
 
-            if ctx:
+            if log:
                 total_files = changes.total_files  # This property will now correctly reflect unstaged only
-                await ctx.debug(f"Detected working directory changes: {total_files} total files (unstaged)")
+                await log.debug(f"Detected working directory changes: {total_files} total files (unstaged)")
                 if total_files > 0:  # type: ignore[operator]
-                    await ctx.info(
+                    await log.info(
                         f"Working directory summary: "
                         f"{len(modified_files)} modified, "
                         f"{len(added_files)} added, "
@@ -168,22 +181,30 @@ class ChangeDetector:
             return changes
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to detect working directory changes: {str(e)}")
+            await log.error(f"Failed to detect working directory changes: {str(e)}")
             raise
 
-    async def detect_staged_changes(self, repo: LocalRepository, ctx: Optional["Context"] = None) -> StagedChanges:
-        """Detect changes staged for commit (changes IN THE INDEX)."""
-        if ctx:
-            await ctx.debug("Detecting staged changes (in index only)")
+    async def detect_staged_changes(
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
+    ) -> StagedChanges:
+        """Detect changes staged for commit (changes IN THE INDEX).
+
+        Concurrent calls for the same repository state share one computation.
+        """
+        return await self.coalescer.run("staged_changes", repo.path, lambda: self._detect_staged_changes(repo, ctx))
+
+    async def _detect_staged_changes(
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
+    ) -> StagedChanges:
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Detecting staged changes (in index only)")
 
         try:
-            status_info = await self.git_client.get_status(repo.path, ctx)
+            status_info = await self.git_client.get_status(repo.path, log)
 
             staged_files = []
 
-            if ctx:
-                await ctx.debug(f"Processing {len(status_info['files'])} file status entries for staged changes")
+            await log.debug("Processing %d file status entries for staged changes", len(status_info["files"]))
 
             for file_info in status_info["files"]:
                 index_status = file_info.get("index_status")  # Left-hand side of status output (staged)
@@ -200,30 +221,28 @@ class ChangeDetector:
                     is_binary = False
 
                     try:
-                        if ctx:
-                            await ctx.debug(f"Getting diff stats for staged file {file_info['filename']}")
-
                         # For staged changes, get diff between index and HEAD (staged=True)
                         diff_stats = await self.git_client.get_diff_stats(
                             repo.path,
                             file_info["filename"],
                             staged=True,  # Always True for staged changes
-                            ctx=ctx,
+                            ctx=log,
                         )
                         lines_added = diff_stats.get("lines_added", 0)
                         lines_deleted = diff_stats.get("lines_deleted", 0)
                         is_binary = diff_stats.get("is_binary", False)
 
-                        if ctx:
-                            await ctx.debug(
-                                f"Got diff stats for staged file {file_info['filename']}: +{lines_added}/-{lines_deleted}, binary={is_binary}"
-                            )
+                        await log.item(
+                            "Staged diff stats",
+                            "%s: +%d/-%d, binary=%s",
+                            file_info["filename"],
+                            lines_added,
+                            lines_deleted,
+                            is_binary,
+                        )
 
                     except Exception as e:
-                        if ctx:
-                            await ctx.error(
-                                f"Failed to get diff stats for staged file {file_info['filename']}: {str(e)}"
-                            )
+                        await log.error(f"Failed to get diff stats for staged file {file_info['filename']}: {str(e)}")
                         raise
 
                     file_status = FileStatus(
@@ -239,43 +258,44 @@ class ChangeDetector:
                     )
                     staged_files.append(file_status)
                 else:
-                    if ctx:
-                        await ctx.debug(f"File {file_info['filename']} has no staged changes (status: {status_code})")
+                    await log.item(
+                        "Files without staged changes", "%s (status: %s)", file_info["filename"], status_code
+                    )
+
+            await log.flush()
 
             changes = StagedChanges(staged_files=staged_files)
 
-            if ctx:
+            if log:
                 if changes.ready_to_commit:
-                    await ctx.info(f"Found {changes.total_staged} staged files ready for commit")
-                    await ctx.debug(
+                    await log.info(f"Found {changes.total_staged} staged files ready for commit")
+                    await log.debug(
                         f"Staged changes summary: "
                         f"{changes.total_additions} additions, "
                         f"{changes.total_deletions} deletions"
                     )
                 else:
-                    await ctx.debug("No staged changes found")
+                    await log.debug("No staged changes found")
 
             return changes
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to detect staged changes: {str(e)}")
+            await log.error(f"Failed to detect staged changes: {str(e)}")
             raise
 
     async def detect_unpushed_commits(
-        self, repo: LocalRepository, ctx: Optional["Context"] = None
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
     ) -> list[UnpushedCommit]:
         """Detect commits that haven't been pushed to remote."""
-        if ctx:
-            await ctx.debug("Detecting unpushed commits")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Detecting unpushed commits")
 
         try:
-            commits_data = await self.git_client.get_unpushed_commits(repo.path, ctx=ctx)
+            commits_data = await self.git_client.get_unpushed_commits(repo.path, ctx=log)
 
             unpushed_commits = []
 
-            if ctx:
-                await ctx.debug(f"Processing {len(commits_data)} unpushed commits")
+            await log.debug(f"Processing {len(commits_data)} unpushed commits")
 
             for commit_data in commits_data:
                 try:
@@ -292,8 +312,7 @@ class ChangeDetector:
                     except ValueError:
                         # Fallback to current time if parsing fails
                         commit_date = datetime.now()
-                        if ctx:
-                            await ctx.warning(f"Failed to parse commit date: {date_str}")
+                        await log.warning(f"Failed to parse commit date: {date_str}")
 
                     unpushed_commit = UnpushedCommit(
                         sha=commit_data["sha"],
@@ -308,43 +327,40 @@ class ChangeDetector:
                     unpushed_commits.append(unpushed_commit)
 
                 except (KeyError, ValueError) as e:
-                    if ctx:
-                        await ctx.warning(f"Failed to parse commit data: {e}")
+                    await log.warning(f"Failed to parse commit data: {e}")
                     continue
 
-            if ctx:
+            if log:
                 if unpushed_commits:
                     # Removed unused variable 'authors'
-                    await ctx.info(f"Found {len(unpushed_commits)} unpushed commits")
+                    await log.info(f"Found {len(unpushed_commits)} unpushed commits")
 
                     # Log commit summary
                     recent_commits = unpushed_commits[:3]  # Show first 3
                     for commit in recent_commits:
-                        await ctx.debug(f"Unpushed: {commit.short_sha} - {commit.short_message}")
+                        await log.debug(f"Unpushed: {commit.short_sha} - {commit.short_message}")
                 else:
-                    await ctx.debug("No unpushed commits found")
+                    await log.debug("No unpushed commits found")
 
             return unpushed_commits
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to detect unpushed commits: {str(e)}")
+            await log.error(f"Failed to detect unpushed commits: {str(e)}")
             raise
 
     async def detect_stashed_changes(
-        self, repo: LocalRepository, ctx: Optional["Context"] = None
+        self, repo: LocalRepository, ctx: Optional["Context | ContextLogger"] = None
     ) -> list[StashedChanges]:
         """Detect stashed changes."""
-        if ctx:
-            await ctx.debug("Detecting stashed changes")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Detecting stashed changes")
 
         try:
-            stashes_data = await self.git_client.get_stash_list(repo.path, ctx)
+            stashes_data = await self.git_client.get_stash_list(repo.path, log)
 
             stashed_changes = []
 
-            if ctx:
-                await ctx.debug(f"Processing {len(stashes_data)} stashed changes")
+            await log.debug(f"Processing {len(stashes_data)} stashed changes")
 
             for stash_data in stashes_data:
                 try:
@@ -366,21 +382,19 @@ class ChangeDetector:
                     stashed_changes.append(stashed_change)
 
                 except (KeyError, ValueError) as e:
-                    if ctx:
-                        await ctx.warning(f"Failed to parse stash data: {e}")
+                    await log.warning(f"Failed to parse stash data: {e}")
                     continue
 
-            if ctx:
+            if log:
                 if stashed_changes:
-                    await ctx.info(f"Found {len(stashed_changes)} stashed changes")
+                    await log.info(f"Found {len(stashed_changes)} stashed changes")
                     for stash in stashed_changes[:3]:  # Show first 3
-                        await ctx.debug(f"Stash {stash.stash_index}: {stash.message}")
+                        await log.debug(f"Stash {stash.stash_index}: {stash.message}")
                 else:
-                    await ctx.debug("No stashed changes found")
+                    await log.debug("No stashed changes found")
 
             return stashed_changes
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to detect stashed changes: {str(e)}")
+            await log.error(f"Failed to detect stashed changes: {str(e)}")
             raise
@@ -4,13 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import re
+import signal
+import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import Context
 
-from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from shared.utils.context_logging import ContextLogger
+from shared.utils.git import common_git_dir, git_dir
 from shared.utils.logging import logging_service
+from shared.utils.metrics import GIT_BYTES, GIT_COMMANDS, GIT_LATENCY, GIT_TERMINATIONS, git_subcommand
+from shared.utils.profiling import current_profile
+
+from .diff_analyzer import count_changed_lines, is_binary_content
+from .git_index import S_IFGITLINK, IndexFormatError, WorktreeChanges, read_index, scan_worktree
+from .git_objects import ObjectStoreError, head_entry, open_object_store
+from .git_scheduler import CONTENT_COMMANDS, get_git_scheduler, priority_for
+
+if TYPE_CHECKING:
+    from mcp_local_repo_analyzer.config import GitAnalyzerSettings
 
 
 class GitCommandError(Exception):
@@ -24,99 +39,255 @@ class GitCommandError(Exception):
         super().__init__(f"Git command failed: {' '.join(command)}\nError: {stderr}")
 
 
+class GitCommandTimeout(GitCommandError):
+    """Exception raised when a git command exceeds its deadline and is killed."""
+
+    def __init__(self, command: list[str], timeout: float):
+        """Initialize git timeout error with the deadline that was exceeded."""
+        self.timeout = timeout
+        super().__init__(command, -1, f"timed out after {timeout:g}s")
+
+
+# Run git in its own process group so helpers it spawns are stopped with it
+_NEW_PROCESS_GROUP = os.name == "posix"
+
+# Configuration that can change what ``git diff --numstat`` reports
+_DIFF_CONFIG = re.compile(r"^\s*(algorithm|attributesfile)\s*=|^\s*\[\s*include", re.IGNORECASE | re.MULTILINE)
+
+
+# Configuration file -> (mtime_ns, size, whether it sets any of _DIFF_CONFIG)
+_config_checks: dict[str, tuple[tuple[int, int], bool]] = {}
+
+
+def _sets_diff_config(path: str) -> bool:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    key = (info.st_mtime_ns, info.st_size)
+    cached = _config_checks.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            found = bool(_DIFF_CONFIG.search(f.read()))
+    except OSError:
+        return False
+    _config_checks[path] = (key, found)
+    return found
+
+
+def _custom_diff_config(repo_path: Path, file_path: str) -> bool:
+    """Return True if attributes or configuration may change git's line counts for ``file_path``.
+
+    Looks for ``.gitattributes`` files on the path, repository and user
+    attribute files, and diff algorithm, attributes file or include settings
+    in the repository, user and system configuration. Called per file, so it
+    works on strings and rereads configuration files only when they change.
+    """
+    if any(name.startswith("GIT_CONFIG") for name in os.environ):
+        return True
+    directory = git_dir(repo_path)
+    if directory is None:
+        return True
+    common = str(common_git_dir(directory))
+    home = os.path.expanduser("~")
+    xdg = os.path.join(os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config"), "git")
+    attributes = [os.path.join(common, "info", "attributes"), os.path.join(xdg, "attributes")]
+    root = str(repo_path)
+    parent = os.path.dirname(file_path)
+    while True:
+        attributes.append(os.path.join(root, parent, ".gitattributes"))
+        if not parent:
+            break
+        parent = os.path.dirname(parent)
+    if any(os.path.exists(path) for path in attributes):
+        return True
+    configs = (
+        os.path.join(common, "config"),
+        os.path.join(str(directory), "config.worktree"),
+        os.path.join(home, ".gitconfig"),
+        os.path.join(xdg, "config"),
+        "/etc/gitconfig",
+    )
+    return any(_sets_diff_config(path) for path in configs)
+
+
 class GitClient:
     """Git command execution client with error handling."""
 
     def __init__(self, settings: GitAnalyzerSettings):
         """Initialize git client with settings."""
         self.settings = settings
+        self.scheduler = get_git_scheduler(settings.git_max_concurrency)
         self.logger = logging_service.get_logger(__name__)
 
+    def timeout_for(self, subcommand: str) -> float | None:
+        """Return the deadline in seconds for ``subcommand``, or None when disabled.
+
+        Commands whose cost grows with history or diff size (``CONTENT_COMMANDS``)
+        get ``git_content_timeout_seconds``, all others ``git_timeout_seconds``.
+        """
+        if subcommand in CONTENT_COMMANDS:
+            timeout = self.settings.git_content_timeout_seconds
+        else:
+            timeout = self.settings.git_timeout_seconds
+        return timeout or None
+
+    def _signal(self, process: asyncio.subprocess.Process, sig: signal.Signals) -> None:
+        try:
+            if _NEW_PROCESS_GROUP:
+                os.killpg(process.pid, sig)
+            elif sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    async def _stop(self, process: asyncio.subprocess.Process, subcommand: str, reason: str) -> None:
+        """Stop ``process`` and its process group: SIGTERM, then SIGKILL after the grace period."""
+        if process.returncode is not None:
+            return
+        self._signal(process, signal.SIGTERM)
+        final = "term"
+        try:
+            await asyncio.wait_for(process.wait(), self.settings.git_terminate_grace_seconds)
+        except asyncio.TimeoutError:
+            self._signal(process, signal.SIGKILL)
+            final = "kill"
+            await process.wait()
+        except asyncio.CancelledError:
+            # Cancelled again while waiting: do not leave the process behind
+            self._signal(process, signal.SIGKILL)
+            final = "kill"
+            raise
+        finally:
+            GIT_TERMINATIONS.inc(command=subcommand, reason=reason, signal=final)
+            self.logger.warning(f"Stopped git {subcommand} (pid {process.pid}) on {reason} with SIG{final.upper()}")
+
+    async def _run(
+        self, full_command: list[str], repo_path: Path, timeout: float | None = None
+    ) -> tuple[int, bytes, bytes]:
+        """Run a git subprocess to completion, recording its duration and output size.
+
+        The process starts once the shared ``GitScheduler`` grants it a slot.
+        It is stopped (with its process group) when it exceeds ``timeout``
+        (default: ``timeout_for`` its subcommand) or when the calling task is
+        cancelled, e.g. because the MCP client went away.
+        """
+        subcommand = git_subcommand(full_command[3:])
+        if timeout is None:
+            timeout = self.timeout_for(subcommand)
+        profile = current_profile()
+        async with self.scheduler.slot(str(repo_path), priority_for(subcommand)):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *full_command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=repo_path,
+                    start_new_session=_NEW_PROCESS_GROUP,
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                except asyncio.TimeoutError:
+                    status = "timeout"
+                    await self._stop(process, subcommand, "timeout")
+                    raise GitCommandTimeout(full_command, timeout or 0) from None
+                except asyncio.CancelledError:
+                    status = "cancelled"
+                    await self._stop(process, subcommand, "cancelled")
+                    raise
+                status = "ok" if process.returncode == 0 else "failed"
+                GIT_BYTES.inc(len(stdout) + len(stderr), command=subcommand)
+                return process.returncode or 0, stdout, stderr
+            finally:
+                duration = time.perf_counter() - start
+                GIT_LATENCY.observe(duration, command=subcommand)
+                GIT_COMMANDS.inc(command=subcommand, status=status)
+                if profile is not None:
+                    profile.record_git(subcommand, start, duration, status)
+
     async def execute_command(
         self,
         repo_path: Path,
         command: list[str],
         check: bool = True,
-        ctx: Context | None = None,
+        ctx: Context | ContextLogger | None = None,
+        timeout: float | None = None,
     ) -> str:
-        """Execute a git command in the given repository."""
+        """Execute a git command in the given repository.
+
+        ``timeout`` overrides the configured deadline for this call; a command
+        that exceeds it is killed and raises ``GitCommandTimeout``.
+        """
+        log = ContextLogger.wrap(ctx)
         full_command = ["git", "-C", str(repo_path)] + command
 
-        if ctx:
-            await ctx.debug(f"Executing git command: {' '.join(full_command)}")
+        if log.debug_enabled:
+            await log.debug("Executing git command: %s", " ".join(full_command))
 
         try:
-            result = await asyncio.create_subprocess_exec(
-                *full_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=repo_path,
-            )
-
-            stdout, stderr = await result.communicate()
+            returncode, stdout, stderr = await self._run(full_command, repo_path, timeout)
             stdout_str = stdout.decode("utf-8").strip()
             stderr_str = stderr.decode("utf-8").strip()
 
-            if check and result.returncode != 0:
-                if ctx:
-                    await ctx.error(f"Git command failed (exit {result.returncode}): {stderr_str}")
-                raise GitCommandError(full_command, result.returncode or 0, stderr_str) from None
+            if check and returncode != 0:
+                await log.error(f"Git command failed (exit {returncode}): {stderr_str}")
+                raise GitCommandError(full_command, returncode, stderr_str) from None
 
-            if ctx and stdout_str:
-                await ctx.debug(f"Git command output: {len(stdout_str)} characters")
+            if stdout_str:
+                await log.debug("Git command output: %d characters", len(stdout_str))
 
             return stdout_str
 
+        except GitCommandTimeout as e:
+            await log.error(f"Git command timed out after {e.timeout:g}s: {' '.join(full_command)}")
+            raise
         except FileNotFoundError as e:
             error_msg = "Git command not found - is git installed?"
-            if ctx:
-                await ctx.error(error_msg)
+            await log.error(error_msg)
             raise GitCommandError(full_command, -1, error_msg) from e
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Unexpected error executing git command: {str(e)}")
+            await log.error(f"Unexpected error executing git command: {str(e)}")
             raise GitCommandError(full_command, -1, str(e)) from e
 
-    async def get_status(self, repo_path: Path, ctx: Context | None = None) -> dict[str, Any]:
+    async def get_status(self, repo_path: Path, ctx: Context | ContextLogger | None = None) -> dict[str, Any]:
         """Get git status information."""
-        if ctx:
-            await ctx.debug("Getting git status (porcelain format)")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Getting git status (porcelain format)")
 
         # Get porcelain status for parsing - DON'T strip the output as leading spaces are significant
         full_command = ["git", "-C", str(repo_path), "status", "--porcelain=v1"]
 
-        if ctx:
-            await ctx.debug(f"Executing git command: {' '.join(full_command)}")
+        if log.debug_enabled:
+            await log.debug("Executing git command: %s", " ".join(full_command))
 
         try:
-            result = await asyncio.create_subprocess_exec(
-                *full_command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=repo_path,
-            )
-
-            stdout, stderr = await result.communicate()
+            returncode, stdout, stderr = await self._run(full_command, repo_path)
             # Don't strip the output - leading spaces are significant for git status parsing
             status_output = stdout.decode("utf-8").rstrip("\n")  # Only remove trailing newlines
             stderr_str = stderr.decode("utf-8").strip()
 
-            if result.returncode != 0:
-                if ctx:
-                    await ctx.error(f"Git command failed (exit {result.returncode}): {stderr_str}")
-                raise GitCommandError(full_command, result.returncode or 0, stderr_str)
+            if returncode != 0:
+                await log.error(f"Git command failed (exit {returncode}): {stderr_str}")
+                raise GitCommandError(full_command, returncode, stderr_str)
 
-            if ctx and status_output:
-                await ctx.debug(f"Git command output: {len(status_output)} characters")
+            if status_output:
+                await log.debug("Git command output: %d characters", len(status_output))
 
+        except GitCommandTimeout as e:
+            await log.error(f"Git command timed out after {e.timeout:g}s: {' '.join(full_command)}")
+            raise
         except FileNotFoundError as e:
             error_msg = "Git command not found - is git installed?"
-            if ctx:
-                await ctx.error(error_msg)
+            await log.error(error_msg)
             raise GitCommandError(full_command, -1, error_msg) from e
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Unexpected error executing git command: {str(e)}")
+            await log.error(f"Unexpected error executing git command: {str(e)}")
             raise GitCommandError(full_command, -1, str(e)) from e
 
         files = []
@@ -163,35 +334,237 @@ class GitClient:
                     }
                 )
 
-        if ctx:
-            await ctx.debug(f"Parsed {len(files)} file status entries")
+        await log.debug("Parsed %d file status entries", len(files))
+
+        return {"files": files}
+
+    async def _porcelain_z(self, repo_path: Path, paths: list[str] | None) -> list[tuple[str, str]]:
+        """Return ``(XY, path)`` pairs from ``git status --porcelain -z`` for tracked files, limited to ``paths``."""
+        command = ["--literal-pathspecs", "status", "--porcelain=v1", "-z", "--untracked-files=no"]
+        full_command = ["git", "-C", str(repo_path), *command, *(["--", *paths] if paths else [])]
+        returncode, stdout, stderr = await self._run(full_command, repo_path)
+        if returncode != 0:
+            raise GitCommandError(full_command, returncode, stderr.decode("utf-8", "replace").strip())
+        records = stdout.decode("utf-8", "surrogateescape").split("\0")
+        result = []
+        i = 0
+        while i < len(records):
+            record = records[i]
+            i += 1
+            if len(record) < 4:
+                continue
+            result.append((record[:2], record[3:]))
+            if "R" in record[:2] or "C" in record[:2]:
+                i += 1  # the original path of a rename or copy follows
+        return result
+
+    async def get_worktree_changes(
+        self, repo_path: Path, ctx: Context | ContextLogger | None = None
+    ) -> dict[str, list[str]]:
+        """Return tracked files that are modified, deleted or unmerged in the working tree.
+
+        Reads ``.git/index`` in process and compares its stat data with the
+        working tree, so a typical call runs no git at all. Entries the stat
+        data cannot decide (see ``git_index``) are checked with one
+        ``git status`` over just those paths. Falls back to a full
+        ``git status`` when the index cannot be read or ``use_index_reader``
+        is off. Untracked files are not included.
+        """
+        log = ContextLogger.wrap(ctx)
+        changes: WorktreeChanges | None = None
+        if self.settings.use_index_reader:
+            try:
+                changes = await asyncio.to_thread(scan_worktree, repo_path)
+            except (OSError, IndexFormatError) as e:
+                await log.debug(f"Index reader unavailable, using git status: {e}")
+
+        if changes is None:
+            changes = WorktreeChanges()
+            check: list[str] | None = None
+        elif changes.uncertain:
+            check = changes.uncertain
+        else:
+            return {"modified": changes.modified, "deleted": changes.deleted, "unmerged": changes.unmerged}
+
+        # Long pathspec lists cost more than a full status
+        pending = set(check) if check is not None else None
+        for xy, path in await self._porcelain_z(repo_path, check if check and len(check) <= 200 else None):
+            if pending is not None and path not in pending:
+                continue
+            if xy in ("DD", "AU", "UD", "UA", "DU", "AA", "UU"):
+                changes.unmerged.append(path)
+            elif xy[1] == "D":
+                changes.deleted.append(path)
+            elif xy[1] in "MTA":
+                changes.modified.append(path)
+        await log.debug(f"Checked {len(check) if check is not None else 'all'} index entries with git status")
+        return {
+            "modified": sorted(set(changes.modified)),
+            "deleted": sorted(set(changes.deleted)),
+            "unmerged": sorted(set(changes.unmerged)),
+        }
+
+    async def _untracked(self, repo_path: Path) -> list[str]:
+        """Return untracked paths, with wholly untracked directories collapsed as ``git status`` shows them."""
+        command = ["ls-files", "-z", "--others", "--exclude-standard", "--directory", "--no-empty-directory"]
+        full_command = ["git", "-C", str(repo_path), *command]
+        returncode, stdout, stderr = await self._run(full_command, repo_path)
+        if returncode != 0:
+            raise GitCommandError(full_command, returncode, stderr.decode("utf-8", "replace").strip())
+        return [path for path in stdout.decode("utf-8", "surrogateescape").split("\0") if path]
+
+    async def _index_statuses(self, repo_path: Path, paths: list[str], log: ContextLogger) -> dict[str, str]:
+        """Return the staged status ("A" or "M") of those ``paths`` whose index entry differs from HEAD."""
+        if not paths or not self.settings.use_object_reader:
+            return {}
+
+        def statuses() -> dict[str, str]:
+            index = read_index(repo_path)
+            result = {}
+            for path in paths:
+                staged = index.lookup(path)
+                if len(staged) != 1:
+                    continue
+                head = head_entry(repo_path, path)
+                if head is None:
+                    result[path] = "A"
+                elif head != (staged[0].mode, staged[0].oid):
+                    result[path] = "M"
+            return result
+
+        try:
+            return await asyncio.to_thread(statuses)
+        except (OSError, IndexFormatError, ObjectStoreError) as e:
+            await log.debug(f"Cannot compare the index with HEAD: {e}")
+            return {}
 
+    async def get_working_directory_status(
+        self, repo_path: Path, ctx: Context | ContextLogger | None = None
+    ) -> dict[str, Any]:
+        """Get files with unstaged changes and untracked files, in the format of ``get_status``.
+
+        Tracked files come from ``get_worktree_changes`` and untracked ones from
+        one ``git ls-files``, so this runs a single git process where the tree
+        is clean. Index statuses of changed files are read from the index and
+        HEAD by the object reader (None when it is off). Unmerged files are
+        left out, having no working tree status of their own. Falls back to
+        ``get_status`` when ``use_index_reader`` is off.
+        """
+        log = ContextLogger.wrap(ctx)
+        if not self.settings.use_index_reader:
+            return await self.get_status(repo_path, log)
+
+        worktree = await self.get_worktree_changes(repo_path, log)
+        changed = [(path, "M") for path in worktree["modified"]] + [(path, "D") for path in worktree["deleted"]]
+        index_statuses = await self._index_statuses(repo_path, [path for path, _ in changed], log)
+        files = [
+            {
+                "filename": path,
+                "index_status": index_statuses.get(path),
+                "working_status": working_status,
+                "status_code": index_statuses.get(path, " ") + working_status,
+            }
+            for path, working_status in changed
+        ]
+        files += [
+            {"filename": path, "index_status": "?", "working_status": "?", "status_code": "??"}
+            for path in await self._untracked(repo_path)
+        ]
+        await log.debug("Found %d working directory entries", len(files))
         return {"files": files}
 
+    async def read_blob(self, repo_path: Path, oid: bytes | str, ctx: Context | ContextLogger | None = None) -> bytes:
+        """Return the content of blob ``oid``.
+
+        Reads the object store in process and falls back to ``git cat-file``
+        for objects it cannot read, such as blobs a partial clone has not
+        fetched yet, or when ``use_object_reader`` is off.
+        """
+        name = oid if isinstance(oid, str) else oid.hex()
+        if self.settings.use_object_reader:
+            try:
+                return await asyncio.to_thread(lambda: open_object_store(repo_path).read_blob(name))
+            except (OSError, ObjectStoreError) as e:
+                await ContextLogger.wrap(ctx).debug(f"Object reader unavailable, using git cat-file: {e}")
+        full_command = ["git", "-C", str(repo_path), "cat-file", "blob", name]
+        returncode, stdout, stderr = await self._run(full_command, repo_path)
+        if returncode != 0:
+            raise GitCommandError(full_command, returncode, stderr.decode("utf-8", "replace").strip())
+        return stdout
+
+    async def _staged_diff_stats(self, repo_path: Path, file_path: str, log: ContextLogger) -> dict[str, Any] | None:
+        """Count staged line changes of ``file_path`` from the HEAD and index blobs.
+
+        Returns None, leaving the file to ``git diff --cached --numstat``, when
+        nothing is staged for it, for conflicts, submodules and intent-to-add
+        entries, when attributes or configuration may change git's counts, and
+        when too many lines changed to match git's diff exactly.
+        """
+        if not self.settings.use_object_reader:
+            return None
+
+        def entries() -> tuple[tuple[int, bytes] | None, tuple[int, bytes] | None] | None:
+            staged = read_index(repo_path).lookup(file_path)
+            if len(staged) > 1 or (staged and (staged[0].stage or staged[0].intent_to_add)):
+                return None
+            if _custom_diff_config(repo_path, file_path):
+                return None
+            new = (staged[0].mode, staged[0].oid) if staged else None
+            return head_entry(repo_path, file_path), new
+
+        try:
+            found = await asyncio.to_thread(entries)
+        except (OSError, IndexFormatError, ObjectStoreError) as e:
+            await log.debug(f"Cannot read staged blobs of {file_path}: {e}")
+            return None
+        if found is None:
+            return None
+        old, new = found
+        if (old is None and new is None) or (old and new and old[1] == new[1]):
+            return None
+        if any(entry and entry[0] == S_IFGITLINK for entry in (old, new)):
+            return None
+
+        try:
+            old_data = await self.read_blob(repo_path, old[1], log) if old else b""
+            new_data = await self.read_blob(repo_path, new[1], log) if new else b""
+        except GitCommandError as e:
+            await log.debug(f"Cannot read staged blobs of {file_path}: {e}")
+            return None
+        if is_binary_content(old_data) or is_binary_content(new_data):
+            await log.item("Binary files", "%s", file_path)
+            return {"lines_added": 0, "lines_deleted": 0, "is_binary": True}
+        counts = await asyncio.to_thread(count_changed_lines, old_data, new_data)
+        if counts is None:
+            return None
+        await log.item("Diff stats", "%s: +%d/-%d", file_path, *counts)
+        return {"lines_added": counts[0], "lines_deleted": counts[1], "is_binary": False}
+
     async def get_diff(
         self,
         repo_path: Path,
         staged: bool = False,
         file_path: str | None = None,
-        ctx: Context | None = None,
+        ctx: Context | ContextLogger | None = None,
     ) -> str:
         """Get diff output."""
+        log = ContextLogger.wrap(ctx)
         command = ["diff"]
         if staged:
             command.append("--cached")
         if file_path:
             command.extend(["--", file_path])
 
-        if ctx:
+        if log.debug_enabled:
             diff_type = "staged" if staged else "working tree"
             target = f" for {file_path}" if file_path else ""
-            await ctx.debug(f"Getting {diff_type} diff{target}")
+            await log.debug(f"Getting {diff_type} diff{target}")
 
-        diff_output = await self.execute_command(repo_path, command, ctx=ctx)
+        diff_output = await self.execute_command(repo_path, command, ctx=log)
 
-        if ctx:
-            lines_count = len(diff_output.split("\n")) if diff_output else 0
-            await ctx.debug(f"Retrieved diff with {lines_count} lines")
+        if log.debug_enabled:
+            lines_count = diff_output.count("\n") + 1 if diff_output else 0
+            await log.debug("Retrieved diff with %d lines", lines_count)
 
         return diff_output
 
@@ -200,7 +573,7 @@ class GitClient:
         repo_path: Path,
         file_path: str,
         staged: bool | None = None,
-        ctx: Context | None = None,
+        ctx: Context | ContextLogger | None = None,
     ) -> dict[str, Any]:
         """Get diff statistics for a specific file.
 
@@ -210,20 +583,19 @@ class GitClient:
             staged: If True, get staged diff stats. If False, get working diff stats. If None, detect automatically.
             ctx: Context for logging
         """
-        if ctx:
-            await ctx.debug(f"Getting diff stats for {file_path} (staged={staged})")
+        log = ContextLogger.wrap(ctx)
+        await log.item("Diff stats requests", "%s (staged=%s)", file_path, staged)
 
         try:
             # If staged is not specified, detect the file status first
             if staged is None:
                 status_output = await self.execute_command(
-                    repo_path, ["status", "--porcelain", "--", file_path], ctx=ctx
+                    repo_path, ["status", "--porcelain", "--", file_path], ctx=log
                 )
 
                 if not status_output.strip():
                     # No changes for this file
-                    if ctx:
-                        await ctx.debug(f"No changes detected for {file_path}")
+                    await log.item("Files without changes", "%s", file_path)
                     return {"lines_added": 0, "lines_deleted": 0, "is_binary": False}
 
                 # Parse the status to understand the file state
@@ -241,12 +613,20 @@ class GitClient:
                     else:
                         staged = False
 
-                    if ctx:
-                        await ctx.debug(
-                            f"Auto-detected file state for {file_path}: "
-                            f"index='{index_status}', working='{working_status}', "
-                            f"using staged={staged}"
-                        )
+                    await log.item(
+                        "Auto-detected file states",
+                        "%s: index='%s', working='%s', using staged=%s",
+                        file_path,
+                        index_status,
+                        working_status,
+                        staged,
+                    )
+
+            # Staged changes can be counted from the HEAD and index blobs without git
+            if staged:
+                stats = await self._staged_diff_stats(repo_path, file_path, log)
+                if stats is not None:
+                    return stats
 
             # Try to get numstat for the appropriate diff
             commands_to_try = []
@@ -269,24 +649,21 @@ class GitClient:
 
             for command in commands_to_try:
                 try:
-                    numstat_output = await self.execute_command(repo_path, command, ctx=ctx)
+                    numstat_output = await self.execute_command(repo_path, command, ctx=log)
                     if numstat_output.strip():
                         used_command = command
                         break
-                    elif ctx:
-                        await ctx.debug(f"Command {' '.join(command)} returned empty output")
+                    await log.item("Empty numstat output", "%s", command)
                 except GitCommandError as e:
-                    if ctx:
-                        await ctx.debug(f"Command {' '.join(command)} failed: {e}")
+                    await log.item("Failed numstat commands", "%s: %s", command, e)
                     continue
 
             if not numstat_output or not numstat_output.strip():
-                if ctx:
-                    await ctx.warning(f"No diff output found for {file_path} with any command")
+                await log.warning(f"No diff output found for {file_path} with any command")
                 return {"lines_added": 0, "lines_deleted": 0, "is_binary": False}
 
-            if ctx and used_command:
-                await ctx.debug(f"Successfully got diff stats using: {' '.join(used_command)}")
+            if used_command:
+                await log.item("Numstat commands used", "%s", used_command)
 
             # Parse the numstat output
             lines = numstat_output.strip().split("\n")
@@ -305,8 +682,7 @@ class GitClient:
 
                         # Check if binary file (git shows "-" for binary files)
                         if additions_str == "-" and deletions_str == "-":
-                            if ctx:
-                                await ctx.debug(f"Binary file detected: {file_path}")
+                            await log.item("Binary files", "%s", file_path)
                             return {
                                 "lines_added": 0,
                                 "lines_deleted": 0,
@@ -317,8 +693,7 @@ class GitClient:
                             lines_added = int(additions_str)
                             lines_deleted = int(deletions_str)
 
-                            if ctx:
-                                await ctx.debug(f"Diff stats for {file_path}: +{lines_added}/-{lines_deleted}")
+                            await log.item("Diff stats", "%s: +%d/-%d", file_path, lines_added, lines_deleted)
 
                             return {
                                 "lines_added": lines_added,
@@ -326,48 +701,42 @@ class GitClient:
                                 "is_binary": False,
                             }
                         except ValueError:
-                            if ctx:
-                                await ctx.warning(f"Failed to parse numstat output: {line}")
+                            await log.warning(f"Failed to parse numstat output: {line}")
 
             # Fallback - if we can't parse numstat, assume no changes
-            if ctx:
-                await ctx.warning(f"Could not parse diff stats for {file_path}")
+            await log.warning(f"Could not parse diff stats for {file_path}")
             return {"lines_added": 0, "lines_deleted": 0, "is_binary": False}
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to get diff stats for {file_path}: {e}")
+            await log.error(f"Failed to get diff stats for {file_path}: {e}")
             return {"lines_added": 0, "lines_deleted": 0, "is_binary": False}
 
     async def get_unpushed_commits(
-        self, repo_path: Path, remote: str = "origin", ctx: Context | None = None
+        self, repo_path: Path, remote: str = "origin", ctx: Context | ContextLogger | None = None
     ) -> list[dict[str, Any]]:
         """Get commits that haven't been pushed to remote."""
-        if ctx:
-            await ctx.debug(f"Getting unpushed commits for remote '{remote}'")
+        log = ContextLogger.wrap(ctx)
+        await log.debug(f"Getting unpushed commits for remote '{remote}'")
 
         try:
             # Get current branch
-            current_branch = await self.execute_command(repo_path, ["branch", "--show-current"], ctx=ctx)
+            current_branch = await self.execute_command(repo_path, ["branch", "--show-current"], ctx=log)
 
-            if ctx:
-                await ctx.debug(f"Current branch: {current_branch}")
+            await log.debug(f"Current branch: {current_branch}")
 
             # Get unpushed commits
             log_format = '--pretty=format:{"sha":"%H","message":"%s","author":"%an","email":"%ae","date":"%ai"}'
             upstream = f"{remote}/{current_branch}"
 
             try:
-                if ctx:
-                    await ctx.debug(f"Checking for commits ahead of {upstream}")
+                await log.debug(f"Checking for commits ahead of {upstream}")
 
-                output = await self.execute_command(repo_path, ["log", f"{upstream}..HEAD", log_format], ctx=ctx)
+                output = await self.execute_command(repo_path, ["log", f"{upstream}..HEAD", log_format], ctx=log)
             except GitCommandError:
                 # If upstream doesn't exist, get all commits (limited)
-                if ctx:
-                    await ctx.warning(f"Upstream {upstream} not found, getting recent commits")
+                await log.warning(f"Upstream {upstream} not found, getting recent commits")
 
-                output = await self.execute_command(repo_path, ["log", log_format, "--max-count=10"], ctx=ctx)
+                output = await self.execute_command(repo_path, ["log", log_format, "--max-count=10"], ctx=log)
 
             commits = []
             for line in output.split("\n"):
@@ -376,27 +745,24 @@ class GitClient:
                         commit_data = json.loads(line)
                         commits.append(commit_data)
                     except json.JSONDecodeError:
-                        if ctx:
-                            await ctx.warning(f"Failed to parse commit JSON: {line[:50]}...")
+                        await log.warning(f"Failed to parse commit JSON: {line[:50]}...")
                         continue
 
-            if ctx:
-                await ctx.debug(f"Found {len(commits)} unpushed commits")
+            await log.debug(f"Found {len(commits)} unpushed commits")
 
             return commits
 
         except GitCommandError as e:
-            if ctx:
-                await ctx.warning(f"Failed to get unpushed commits: {e}")
+            await log.warning(f"Failed to get unpushed commits: {e}")
             return []
 
-    async def get_stash_list(self, repo_path: Path, ctx: Context | None = None) -> list[dict[str, Any]]:
+    async def get_stash_list(self, repo_path: Path, ctx: Context | ContextLogger | None = None) -> list[dict[str, Any]]:
         """Get list of stashed changes."""
-        if ctx:
-            await ctx.debug("Getting git stash list")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Getting git stash list")
 
         try:
-            output = await self.execute_command(repo_path, ["stash", "list", "--pretty=format:%gd|%s|%cr"], ctx=ctx)
+            output = await self.execute_command(repo_path, ["stash", "list", "--pretty=format:%gd|%s|%cr"], ctx=log)
 
             stashes = []
             for i, line in enumerate(output.split("\n")):
@@ -412,37 +778,32 @@ class GitClient:
                             }
                         )
 
-            if ctx:
-                await ctx.debug(f"Found {len(stashes)} stashed changes")
+            await log.debug(f"Found {len(stashes)} stashed changes")
 
             return stashes
 
         except GitCommandError as e:
-            if ctx:
-                await ctx.warning(f"Failed to get stash list: {e}")
+            await log.warning(f"Failed to get stash list: {e}")
             return []
 
-    async def get_branch_info(self, repo_path: Path, ctx: Context | None = None) -> dict[str, Any]:
+    async def get_branch_info(self, repo_path: Path, ctx: Context | ContextLogger | None = None) -> dict[str, Any]:
         """Get branch information."""
-        if ctx:
-            await ctx.debug("Getting branch information")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Getting branch information")
 
         try:
             # Get current branch
-            current_branch = await self.execute_command(repo_path, ["branch", "--show-current"], ctx=ctx)
+            current_branch = await self.execute_command(repo_path, ["branch", "--show-current"], ctx=log)
 
-            if ctx:
-                await ctx.debug(f"Current branch: {current_branch}")
+            await log.debug(f"Current branch: {current_branch}")
 
             # Get upstream info
             upstream = None
             try:
-                upstream = await self.execute_command(repo_path, ["rev-parse", "--abbrev-ref", "@{upstream}"], ctx=ctx)
-                if ctx:
-                    await ctx.debug(f"Upstream branch: {upstream}")
+                upstream = await self.execute_command(repo_path, ["rev-parse", "--abbrev-ref", "@{upstream}"], ctx=log)
+                await log.debug(f"Upstream branch: {upstream}")
             except GitCommandError:
-                if ctx:
-                    await ctx.debug("No upstream branch configured")
+                await log.debug("No upstream branch configured")
 
             # Get ahead/behind counts
             ahead, behind = 0, 0
@@ -451,26 +812,22 @@ class GitClient:
                     counts = await self.execute_command(
                         repo_path,
                         ["rev-list", "--left-right", "--count", f"{upstream}...HEAD"],
-                        ctx=ctx,
+                        ctx=log,
                     )
                     behind, ahead = map(int, counts.split())
 
-                    if ctx:
-                        await ctx.debug(f"Branch status: {ahead} ahead, {behind} behind")
+                    await log.debug(f"Branch status: {ahead} ahead, {behind} behind")
 
                 except (GitCommandError, ValueError) as e:
-                    if ctx:
-                        await ctx.warning(f"Failed to get ahead/behind counts: {e}")
+                    await log.warning(f"Failed to get ahead/behind counts: {e}")
 
             # Get HEAD commit SHA
             try:
-                head_commit = await self.execute_command(repo_path, ["rev-parse", "HEAD"], ctx=ctx)
-                if ctx:
-                    await ctx.debug(f"HEAD commit: {head_commit[:8]}...")
+                head_commit = await self.execute_command(repo_path, ["rev-parse", "HEAD"], ctx=log)
+                await log.debug(f"HEAD commit: {head_commit[:8]}...")
             except GitCommandError:
                 head_commit = "unknown"
-                if ctx:
-                    await ctx.warning("Failed to get HEAD commit SHA")
+                await log.warning("Failed to get HEAD commit SHA")
 
             return {
                 "current_branch": current_branch,
@@ -481,8 +838,7 @@ class GitClient:
             }
 
         except GitCommandError as e:
-            if ctx:
-                await ctx.error(f"Failed to get branch info: {e}")
+            await log.error(f"Failed to get branch info: {e}")
             return {
                 "current_branch": "unknown",
                 "upstream": None,
@@ -491,15 +847,15 @@ class GitClient:
                 "head_commit": "unknown",
             }
 
-    async def get_repository_info(self, repo_path: Path, ctx: Context | None = None) -> dict[str, Any]:
+    async def get_repository_info(self, repo_path: Path, ctx: Context | ContextLogger | None = None) -> dict[str, Any]:
         """Get general repository information."""
-        if ctx:
-            await ctx.debug("Getting repository information")
+        log = ContextLogger.wrap(ctx)
+        await log.debug("Getting repository information")
 
         try:
             # Check if it's a bare repository
             try:
-                await self.execute_command(repo_path, ["rev-parse", "--is-bare-repository"], ctx=ctx)
+                await self.execute_command(repo_path, ["rev-parse", "--is-bare-repository"], ctx=log)
                 is_bare = True
             except GitCommandError:
                 is_bare = False
@@ -507,7 +863,7 @@ class GitClient:
             # Get remote URLs
             remotes: dict[str, dict[str, str]] = {}
             try:
-                remote_output = await self.execute_command(repo_path, ["remote", "-v"], ctx=ctx)
+                remote_output = await self.execute_command(repo_path, ["remote", "-v"], ctx=log)
                 for line in remote_output.split("\n"):
                     if line.strip():
                         parts = line.split()
@@ -521,18 +877,20 @@ class GitClient:
                             remotes[remote_name][remote_type] = remote_url
 
             except GitCommandError:
-                if ctx:
-                    await ctx.debug("No remotes configured")
+                await log.debug("No remotes configured")
 
-            # Check if repository is dirty (has uncommitted changes)
+            # Check if repository is dirty (has uncommitted changes); a tracked
+            # file changed in the working tree settles it without running git
             try:
-                status_output = await self.execute_command(repo_path, ["status", "--porcelain"], ctx=ctx)
-                is_dirty = bool(status_output.strip())
+                worktree = await self.get_worktree_changes(repo_path, log)
+                is_dirty = any(worktree.values())
+                if not is_dirty:
+                    status_output = await self.execute_command(repo_path, ["status", "--porcelain"], ctx=log)
+                    is_dirty = bool(status_output.strip())
             except GitCommandError:
                 is_dirty = False
 
-            if ctx:
-                await ctx.debug(f"Repository info: bare={is_bare}, dirty={is_dirty}, remotes={len(remotes)}")
+            await log.debug(f"Repository info: bare={is_bare}, dirty={is_dirty}, remotes={len(remotes)}")
 
             return {
                 "is_bare": is_bare,
@@ -542,8 +900,7 @@ class GitClient:
             }
 
         except Exception as e:
-            if ctx:
-                await ctx.error(f"Failed to get repository info: {e}")
+            await log.error(f"Failed to get repository info: {e}")
             return {
                 "is_bare": False,
                 "is_dirty": False,
@@ -0,0 +1,36 @@
+"""Coalescing of identical concurrent analyses of one repository."""
+
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import TypeVar
+
+from shared.utils.git import repository_fingerprint
+from shared.utils.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """Shares one computation between concurrent identical repository analyses.
+
+    Several clients often analyze the same repository at the same moment; each
+    would otherwise run the same pipeline and fork the same git commands. Calls
+    are identical when the operation, the resolved repository root, the extra
+    arguments and the repository fingerprint (HEAD, index, refs, stash) match,
+    so a commit, checkout or staging change in between starts a fresh
+    computation. Joining callers share the result or the exception; nothing is
+    cached once the computation completes.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Create a coalescer; when ``enabled`` is False every call computes on its own."""
+        self.enabled = enabled
+        self._flights = SingleFlight("repository_analysis")
+
+    async def run(self, operation: str, repo_path: Path, compute: Callable[[], Awaitable[T]], *args: Hashable) -> T:
+        """Return ``compute()``, joining an identical computation that is already running."""
+        if not self.enabled:
+            return await compute()
+        root = Path(repo_path).resolve()
+        key = (operation, str(root), args, repository_fingerprint(root))
+        return await self._flights.do(key, compute)
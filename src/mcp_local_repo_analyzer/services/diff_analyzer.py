@@ -1,18 +1,88 @@
 """Service for analyzing git diffs and generating insights."""
 
+from __future__ import annotations
+
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastmcp.server.dependencies import get_context
 
-from mcp_local_repo_analyzer.config import GitAnalyzerSettings
 from mcp_local_repo_analyzer.models.categorization import ChangeCategorization
 from mcp_local_repo_analyzer.models.files import DiffHunk, FileDiff, FileStatus
 from mcp_local_repo_analyzer.models.risk import RiskAssessment
 from shared.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    # Only for annotations; settings (and pydantic-settings) load when the server builds them
+    from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+
 logger = get_logger(__name__)
 
+# Git treats content as binary if a NUL byte occurs in its first 8000 bytes
+_BINARY_PROBE_SIZE = 8000
+
+# Git's diff is minimal only while a region needs at most 256 edits; beyond
+# that its heuristics may report different counts
+_MAX_MINIMAL_EDITS = 200
+
+
+def is_binary_content(data: bytes) -> bool:
+    """Return True if git would treat ``data`` as binary."""
+    return b"\0" in data[:_BINARY_PROBE_SIZE]
+
+
+def _lines(data: bytes) -> list[bytes]:
+    lines = data.split(b"\n")
+    last = lines.pop()
+    lines = [line + b"\n" for line in lines]
+    # A last line without newline differs from the same line with one
+    if last:
+        lines.append(last)
+    return lines
+
+
+def count_changed_lines(old: bytes, new: bytes, max_edits: int = _MAX_MINIMAL_EDITS) -> tuple[int, int] | None:
+    """Return ``(added, deleted)`` lines of a minimal line diff from ``old`` to ``new``.
+
+    These are the counts ``git diff --numstat`` reports for text content.
+    Returns None when more than ``max_edits`` lines change, where git's
+    counts may differ from a minimal diff.
+    """
+    a, b = _lines(old), _lines(new)
+    start = 0
+    end_a, end_b = len(a), len(b)
+    while start < end_a and start < end_b and a[start] == b[start]:
+        start += 1
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    n, m = end_a - start, end_b - start
+    if not n or not m:
+        return m, n
+    if abs(n - m) > max_edits:
+        return None
+
+    # Myers' O(ND) search for the shortest edit script, on line ids
+    ids: dict[bytes, int] = {}
+    x_lines = [ids.setdefault(line, len(ids)) for line in a[start:end_a]]
+    y_lines = [ids.setdefault(line, len(ids)) for line in b[start:end_b]]
+    furthest = {1: 0}
+    for edits in range(min(n + m, max_edits) + 1):
+        for k in range(-edits, edits + 1, 2):
+            if k == -edits or (k != edits and furthest[k - 1] < furthest[k + 1]):
+                x = furthest[k + 1]
+            else:
+                x = furthest[k - 1] + 1
+            y = x - k
+            while x < n and y < m and x_lines[x] == y_lines[y]:
+                x += 1
+                y += 1
+            furthest[k] = x
+            if x >= n and y >= m:
+                common = (n + m - edits) // 2
+                return m - common, n - common
+    return None
+
 
 class DiffAnalyzer:
     """Service for analyzing git diffs and generating insights."""
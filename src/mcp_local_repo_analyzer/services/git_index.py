@@ -0,0 +1,550 @@
+"""In-process reader for the git index (``.git/index``).
+
+Answers "which tracked files changed in the working tree" without running
+git: the index records the stat data (mtime, ctime, inode, size, mode) each
+file had when it was last staged or refreshed, so a file whose ``lstat``
+still matches is unchanged. Supports index versions 2 to 4, the split index
+(``link`` extension and ``sharedindex.*`` file), the cache tree (``TREE``)
+and the untracked cache (``UNTR``); other optional extensions are skipped.
+
+Entries whose stat data cannot decide are reported as ``uncertain`` for the
+caller to check with git: racily clean entries (modified in the same second
+the index was written), entries git smudged for that reason (size 0),
+same-size files with new timestamps, mode-only changes and submodules.
+"""
+
+import mmap
+import os
+import stat
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from shared.utils.git import git_dir, object_id_size
+from shared.utils.metrics import record_cache_lookup
+
+INDEX_SIGNATURE = b"DIRC"
+S_IFGITLINK = 0o160000
+
+# Entry flags
+_ASSUME_VALID = 0x8000
+_EXTENDED = 0x4000
+_STAGE_MASK = 0x3000
+_NAME_MASK = 0x0FFF
+
+# Extended flags (index v3+)
+_SKIP_WORKTREE = 0x4000
+_INTENT_TO_ADD = 0x2000
+
+_NS = 1_000_000_000
+
+# Size of the stat data stored for untracked cache directories
+_STAT_DATA_SIZE = 36
+
+# Entries per thread when comparing against the working tree; below one chunk
+# the comparison runs inline
+_CHUNK_SIZE = 2000
+
+
+class IndexFormatError(ValueError):
+    """Raised when an index file is corrupt or uses a format this reader does not support."""
+
+
+class IndexEntry:
+    """One path (at one merge stage) in the index."""
+
+    __slots__ = (
+        "path",
+        "ctime_ns",
+        "mtime_ns",
+        "ino",
+        "mode",
+        "size",
+        "oid",
+        "flags",
+        "extended_flags",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        ctime_ns: int,
+        mtime_ns: int,
+        ino: int,
+        mode: int,
+        size: int,
+        oid: bytes,
+        flags: int,
+        extended_flags: int = 0,
+    ) -> None:
+        """Create an entry; times are nanoseconds since the epoch, like ``os.stat_result.st_mtime_ns``."""
+        self.path = path
+        self.ctime_ns = ctime_ns
+        self.mtime_ns = mtime_ns
+        self.ino = ino
+        self.mode = mode
+        self.size = size
+        self.oid = oid
+        self.flags = flags
+        self.extended_flags = extended_flags
+
+    @property
+    def stage(self) -> int:
+        """Merge stage: 0 normally, 1-3 for the sides of a conflict."""
+        return (self.flags & _STAGE_MASK) >> 12
+
+    @property
+    def assume_valid(self) -> bool:
+        """True if marked ``--assume-unchanged``."""
+        return bool(self.flags & _ASSUME_VALID)
+
+    @property
+    def skip_worktree(self) -> bool:
+        """True if outside the sparse checkout (or marked ``--skip-worktree``)."""
+        return bool(self.extended_flags & _SKIP_WORKTREE)
+
+    @property
+    def intent_to_add(self) -> bool:
+        """True if added with ``git add -N``."""
+        return bool(self.extended_flags & _INTENT_TO_ADD)
+
+
+class UntrackedDirectory:
+    """A directory in the untracked cache and the untracked names recorded for it."""
+
+    __slots__ = ("path", "untracked", "valid", "check_only", "stat_data")
+
+    def __init__(self, path: str, untracked: list[str]) -> None:
+        self.path = path
+        self.untracked = untracked
+        self.valid = False
+        self.check_only = False
+        self.stat_data: bytes | None = None
+
+
+class UntrackedCache:
+    """Contents of the ``UNTR`` extension."""
+
+    __slots__ = ("ident", "exclude_per_dir", "dir_flags", "directories")
+
+    def __init__(self, ident: bytes, exclude_per_dir: str, dir_flags: int) -> None:
+        self.ident = ident
+        self.exclude_per_dir = exclude_per_dir
+        self.dir_flags = dir_flags
+        self.directories: list[UntrackedDirectory] = []
+
+
+class GitIndex:
+    """Parsed index file: entries sorted by path and stage, plus the extensions used here."""
+
+    __slots__ = ("version", "entries", "cache_tree", "untracked_cache", "shared_index", "mtime_s", "_by_path")
+
+    def __init__(self, version: int, entries: list[IndexEntry], mtime_s: int = 0) -> None:
+        self.version = version
+        self.entries = entries
+        # Directory path ("" for the root) -> tree id, None where invalidated
+        self.cache_tree: dict[str, bytes | None] = {}
+        self.untracked_cache: UntrackedCache | None = None
+        self.shared_index: str | None = None
+        self.mtime_s = mtime_s
+        self._by_path: dict[str, list[IndexEntry]] | None = None
+
+    def lookup(self, path: str) -> list[IndexEntry]:
+        """Return the entries of ``path``: one when merged, one per stage when conflicted."""
+        if self._by_path is None:
+            by_path: dict[str, list[IndexEntry]] = {}
+            for entry in self.entries:
+                by_path.setdefault(entry.path, []).append(entry)
+            self._by_path = by_path
+        return self._by_path.get(path, [])
+
+    @classmethod
+    def read(cls, path: Path | str, hash_size: int = 20) -> "GitIndex":
+        """Parse the index file at ``path``, merging in its shared index when split.
+
+        Raises:
+            OSError: If the file (or its shared index) cannot be read
+            IndexFormatError: If the file is corrupt or unsupported
+        """
+        path = Path(path)
+        index, link = _parse_file(path, hash_size)
+        if link is not None and link[0].strip(b"\0"):
+            base_oid, delete_bitmap, replace_bitmap = link
+            index.shared_index = base_oid.hex()
+            shared, _ = _parse_file(path.parent / f"sharedindex.{index.shared_index}", hash_size)
+            index.entries = _merge_split_index(shared.entries, index.entries, delete_bitmap, replace_bitmap)
+            if not index.cache_tree:
+                index.cache_tree = shared.cache_tree
+        return index
+
+
+def _varint(buf: bytes | mmap.mmap, pos: int) -> tuple[int, int]:
+    """Decode git's offset varint (index v4 path prefixes, untracked cache counts)."""
+    byte = buf[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = buf[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _cstring(buf: mmap.mmap | bytes, pos: int) -> tuple[bytes, int]:
+    end = buf.find(b"\0", pos)
+    if end < 0:
+        raise IndexFormatError("unterminated string")
+    return buf[pos:end], end + 1
+
+
+def _decode(name: bytes) -> str:
+    return name.decode("utf-8", "surrogateescape")
+
+
+def ewah_positions(buf: bytes, pos: int = 0) -> tuple[list[int], int]:
+    """Decode an EWAH-compressed bitmap; return the set bit positions and the offset after it."""
+    bit_size, word_count = struct.unpack_from(">II", buf, pos)
+    pos += 8
+    words = struct.unpack_from(f">{word_count}Q", buf, pos)
+    pos += 8 * word_count + 4  # words, then the position of the last run-length word
+    positions: list[int] = []
+    bit = 0
+    i = 0
+    while i < word_count:
+        marker = words[i]
+        i += 1
+        run_length = (marker >> 1) & 0xFFFFFFFF
+        literal_count = marker >> 33
+        if marker & 1:
+            positions.extend(range(bit, bit + 64 * run_length))
+        bit += 64 * run_length
+        for word in words[i : i + literal_count]:
+            while word:
+                low = word & -word
+                positions.append(bit + low.bit_length() - 1)
+                word ^= low
+            bit += 64
+        i += literal_count
+    return [p for p in positions if p < bit_size], pos
+
+
+def _parse_file(path: Path, hash_size: int) -> tuple[GitIndex, tuple[bytes, bytes, bytes] | None]:
+    with open(path, "rb") as f:
+        mtime_s = int(os.fstat(f.fileno()).st_mtime)
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return GitIndex(2, [], mtime_s), None
+    with buf:
+        return _parse(buf, hash_size, mtime_s)
+
+
+def _parse(buf: mmap.mmap, hash_size: int, mtime_s: int) -> tuple[GitIndex, tuple[bytes, bytes, bytes] | None]:
+    if len(buf) < 12 + hash_size or buf[:4] != INDEX_SIGNATURE:
+        raise IndexFormatError("not a git index file")
+    version, count = struct.unpack_from(">II", buf, 4)
+    if version not in (2, 3, 4):
+        raise IndexFormatError(f"unsupported index version {version}")
+
+    header = struct.Struct(f">10I{hash_size}sH")
+    unpack = header.unpack_from
+    fixed = header.size
+    entries: list[IndexEntry] = []
+    append = entries.append
+    pos = 12
+    previous = b""
+    for _ in range(count):
+        start = pos
+        ctime_s, ctime_ns, mtime_s_, mtime_ns, _dev, ino, mode, _uid, _gid, size, oid, flags = unpack(buf, pos)
+        pos += fixed
+        extended_flags = 0
+        if flags & _EXTENDED:
+            if version < 3:
+                raise IndexFormatError("extended flags in a version 2 index")
+            (extended_flags,) = struct.unpack_from(">H", buf, pos)
+            pos += 2
+        if version == 4:
+            strip, pos = _varint(buf, pos)
+            if strip > len(previous):
+                raise IndexFormatError("corrupt path prefix in version 4 index")
+            suffix, pos = _cstring(buf, pos)
+            name = previous[: len(previous) - strip] + suffix
+            previous = name
+        else:
+            length = flags & _NAME_MASK
+            if length < _NAME_MASK:
+                name = buf[pos : pos + length]
+            else:
+                name, _ = _cstring(buf, pos)
+            # Entries are NUL padded to a multiple of 8 bytes
+            pos = start + ((pos - start + len(name) + 8) & ~7)
+        append(
+            IndexEntry(
+                _decode(name),
+                ctime_s * _NS + ctime_ns,
+                mtime_s_ * _NS + mtime_ns,
+                ino,
+                mode,
+                size,
+                oid,
+                flags,
+                extended_flags,
+            )
+        )
+
+    index = GitIndex(version, entries, mtime_s)
+    link = None
+    end = len(buf) - hash_size
+    while pos + 8 <= end:
+        signature = buf[pos : pos + 4]
+        (size,) = struct.unpack_from(">I", buf, pos + 4)
+        data = buf[pos + 8 : pos + 8 + size]
+        pos += 8 + size
+        if signature == b"TREE":
+            index.cache_tree = _parse_cache_tree(data, hash_size)
+        elif signature == b"link":
+            link = _parse_link(data, hash_size)
+        elif signature == b"UNTR":
+            index.untracked_cache = _parse_untracked_cache(data, hash_size)
+        elif not b"A"[0] <= signature[0] <= b"Z"[0]:
+            # Lowercase signatures mark extensions that readers must understand, e.g. sparse directories
+            raise IndexFormatError(f"unsupported index extension {signature!r}")
+    return index, link
+
+
+def _parse_cache_tree(data: bytes, hash_size: int) -> dict[str, bytes | None]:
+    trees: dict[str, bytes | None] = {}
+    pos = 0
+
+    def node(prefix: str) -> None:
+        nonlocal pos
+        name, pos = _cstring(data, pos)
+        line_end = data.index(b"\n", pos)
+        entry_count, subtree_count = (int(n) for n in data[pos:line_end].split(b" "))
+        pos = line_end + 1
+        path = prefix + _decode(name)
+        oid = None
+        if entry_count >= 0:
+            oid = data[pos : pos + hash_size]
+            pos += hash_size
+        trees[path] = oid
+        for _ in range(subtree_count):
+            node(f"{path}/" if path else "")
+
+    while pos < len(data):
+        node("")
+    return trees
+
+
+def _parse_link(data: bytes, hash_size: int) -> tuple[bytes, bytes, bytes]:
+    base_oid = data[:hash_size]
+    rest = data[hash_size:]
+    if not rest:
+        return base_oid, b"", b""
+    _, split = ewah_positions(rest)
+    return base_oid, rest[:split], rest[split:]
+
+
+def _merge_split_index(
+    base: list[IndexEntry], entries: list[IndexEntry], delete_bitmap: bytes, replace_bitmap: bytes
+) -> list[IndexEntry]:
+    """Apply a split index to the entries of its shared index (see git's ``merge_base_index``)."""
+    merged = list(base)
+    replaced = ewah_positions(replace_bitmap)[0] if replace_bitmap else []
+    if len(replaced) > len(entries):
+        raise IndexFormatError("split index replaces more entries than it contains")
+    # Replacements come first, in bitmap order, and may omit their path
+    for replacement, position in zip(entries, replaced, strict=False):
+        if not replacement.path:
+            replacement.path = merged[position].path
+        merged[position] = replacement
+    deleted = set(ewah_positions(delete_bitmap)[0]) if delete_bitmap else set()
+    by_key = {(e.path, e.stage): e for i, e in enumerate(merged) if i not in deleted}
+    for entry in entries[len(replaced) :]:
+        by_key[(entry.path, entry.stage)] = entry
+    return sorted(by_key.values(), key=lambda e: (e.path.encode("utf-8", "surrogateescape"), e.stage))
+
+
+def _parse_untracked_cache(data: bytes, hash_size: int) -> UntrackedCache:
+    ident_size, pos = _varint(data, 0)
+    ident = data[pos : pos + ident_size]
+    pos += ident_size
+    pos += 2 * _STAT_DATA_SIZE  # stat data of info/exclude and core.excludesFile
+    (dir_flags,) = struct.unpack_from(">I", data, pos)
+    pos += 4 + 2 * hash_size  # hashes of info/exclude and core.excludesFile
+    exclude_per_dir, pos = _cstring(data, pos)
+    cache = UntrackedCache(ident, _decode(exclude_per_dir), dir_flags)
+    directory_count, pos = _varint(data, pos)
+    if not directory_count:
+        return cache
+
+    def directory(prefix: str) -> None:
+        nonlocal pos
+        untracked_count, pos = _varint(data, pos)
+        subdir_count, pos = _varint(data, pos)
+        name, pos = _cstring(data, pos)
+        path = prefix + _decode(name)
+        names = []
+        for _ in range(untracked_count):
+            untracked, pos = _cstring(data, pos)
+            names.append(_decode(untracked))
+        cache.directories.append(UntrackedDirectory(path, names))
+        for _ in range(subdir_count):
+            directory(f"{path}/" if path else "")
+
+    directory("")
+    valid, pos = ewah_positions(data, pos)
+    check_only, pos = ewah_positions(data, pos)
+    ewah_positions(data, pos)  # directories with a recorded .gitignore hash
+    for i in check_only:
+        cache.directories[i].check_only = True
+    # Valid directories carry the stat data they had when their untracked names were recorded
+    for i in valid:
+        cache.directories[i].valid = True
+        cache.directories[i].stat_data = data[pos : pos + _STAT_DATA_SIZE]
+        pos += _STAT_DATA_SIZE
+    return cache
+
+
+_cache: OrderedDict[str, tuple[tuple[int, int, int], GitIndex]] = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_SIZE = 8
+
+
+def read_index(repo_root: Path | str) -> GitIndex:
+    """Return the parsed index of the repository at ``repo_root``.
+
+    The last few parsed indexes are kept and reused while the index file is
+    unchanged. A repository without an index file has no tracked files.
+
+    Raises:
+        FileNotFoundError: If ``repo_root`` is not the root of a non-bare repository
+        IndexFormatError: If the index is corrupt or unsupported
+    """
+    directory = git_dir(repo_root)
+    if directory is None:
+        raise FileNotFoundError(f"No git directory at {repo_root}")
+    path = directory / "index"
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        return GitIndex(2, [])
+    key = (info.st_mtime_ns, info.st_size, info.st_ino)
+    name = str(path)
+    with _cache_lock:
+        cached = _cache.get(name)
+        if cached is not None and cached[0] == key:
+            _cache.move_to_end(name)
+            record_cache_lookup("git_index", True)
+            return cached[1]
+    record_cache_lookup("git_index", False)
+    index = GitIndex.read(path, object_id_size(directory))
+    with _cache_lock:
+        _cache[name] = (key, index)
+        _cache.move_to_end(name)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+class WorktreeChanges:
+    """Tracked paths whose working tree state differs from the index."""
+
+    __slots__ = ("modified", "deleted", "unmerged", "uncertain")
+
+    def __init__(self) -> None:
+        self.modified: list[str] = []
+        self.deleted: list[str] = []
+        self.unmerged: list[str] = []
+        # Paths whose stat data cannot decide; check them with git
+        self.uncertain: list[str] = []
+
+    def extend(self, other: "WorktreeChanges") -> None:
+        """Add the paths of ``other``."""
+        self.modified += other.modified
+        self.deleted += other.deleted
+        self.unmerged += other.unmerged
+        self.uncertain += other.uncertain
+
+
+def _compare(root: str, entries: Sequence[IndexEntry], index_mtime_s: int) -> WorktreeChanges:
+    changes = WorktreeChanges()
+    lstat = os.lstat
+    prefix = os.path.join(root, "")
+    # Entries modified in or after the second the index was written are racily clean
+    racy_ns = index_mtime_s * _NS
+    for entry in entries:
+        if entry.flags & (_ASSUME_VALID | _STAGE_MASK) or entry.extended_flags & (_SKIP_WORKTREE | _INTENT_TO_ADD):
+            if entry.stage:
+                if not changes.unmerged or changes.unmerged[-1] != entry.path:
+                    changes.unmerged.append(entry.path)
+            elif entry.intent_to_add:
+                changes.modified.append(entry.path)
+            continue
+        try:
+            st = lstat(prefix + entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            changes.deleted.append(entry.path)
+            continue
+        # Fast path: a regular file whose stat data matches exactly
+        if (
+            st.st_mtime_ns == entry.mtime_ns
+            and st.st_ctime_ns == entry.ctime_ns
+            and st.st_size == entry.size
+            and st.st_ino & 0xFFFFFFFF == entry.ino
+            and st.st_mode & 0o170100 == entry.mode & 0o170100
+        ):
+            if entry.mtime_ns >= racy_ns:
+                changes.uncertain.append(entry.path)
+            continue
+
+        mode = entry.mode
+        if mode == S_IFGITLINK:
+            changes.uncertain.append(entry.path)
+        elif stat.S_IFMT(mode) != stat.S_IFMT(st.st_mode):
+            (changes.deleted if stat.S_ISDIR(st.st_mode) else changes.modified).append(entry.path)
+        elif st.st_size & 0xFFFFFFFF != entry.size:
+            # Git smudges racily clean entries by recording size 0
+            (changes.uncertain if entry.size == 0 else changes.modified).append(entry.path)
+        elif (
+            (stat.S_ISREG(st.st_mode) and (mode ^ st.st_mode) & 0o100)
+            or st.st_mtime_ns // _NS != entry.mtime_ns // _NS
+            or st.st_ctime_ns // _NS != entry.ctime_ns // _NS
+            # Sub-second times only count when git recorded them
+            or (entry.mtime_ns % _NS and st.st_mtime_ns != entry.mtime_ns)
+            or (entry.ino and st.st_ino & 0xFFFFFFFF != entry.ino)
+            or entry.mtime_ns >= racy_ns
+        ):
+            changes.uncertain.append(entry.path)
+    return changes
+
+
+def compare_worktree(repo_root: Path | str, index: GitIndex, max_workers: int | None = None) -> WorktreeChanges:
+    """Compare the index entries with the working tree by ``lstat``, in parallel for large indexes."""
+    root = str(repo_root)
+    entries = index.entries
+    if len(entries) <= _CHUNK_SIZE:
+        return _compare(root, entries, index.mtime_s)
+    # Chunks end on path boundaries so the stages of one conflicted path stay together
+    chunks = []
+    start = 0
+    while start < len(entries):
+        end = min(start + _CHUNK_SIZE, len(entries))
+        while end < len(entries) and entries[end].path == entries[end - 1].path:
+            end += 1
+        chunks.append(entries[start:end])
+        start = end
+    workers = max_workers or min(len(chunks), os.cpu_count() or 4)
+    changes = WorktreeChanges()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="git-index") as pool:
+        for part in pool.map(lambda chunk: _compare(root, chunk, index.mtime_s), chunks):
+            changes.extend(part)
+    return changes
+
+
+def scan_worktree(repo_root: Path | str, max_workers: int | None = None) -> WorktreeChanges:
+    """Read the index of ``repo_root`` and compare it with the working tree."""
+    return compare_worktree(repo_root, read_index(repo_root), max_workers)
@@ -0,0 +1,567 @@
+"""In-process reader for the git object store (``.git/objects``).
+
+Reads commits, trees and blobs without running git. Loose objects are
+single zlib streams. Packed objects are found through the fanout table and
+binary search of the memory-mapped ``.idx`` file, and may be stored as deltas
+against another object; delta chains are resolved with a small cache of
+recently used bases, since neighbouring objects usually share them.
+Alternate object directories are followed.
+
+Objects that are not stored locally (partial clones fetch them on demand)
+raise ``ObjectNotFoundError``; refs stored in the reftable format and other
+unsupported layouts raise ``ObjectStoreError``. Callers fall back to
+``git cat-file`` for those.
+"""
+
+import mmap
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from shared.utils.git import common_git_dir, git_dir, object_id_size
+from shared.utils.metrics import record_cache_lookup
+
+OBJECT_TYPES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+_TYPE_CODES = {name: code for code, name in OBJECT_TYPES.items()}
+_OFS_DELTA = 6
+_REF_DELTA = 7
+
+_IDX_V2_SIGNATURE = b"\377tOc"
+_PACK_SIGNATURE = b"PACK"
+
+# Compressed bytes fed to zlib at a time when inflating packed objects
+_INFLATE_STEP = 64 * 1024
+
+# Git follows at most this many levels of symbolic refs and alternates
+_MAX_DEPTH = 5
+
+# Parsed trees kept per object store; trees are immutable, so entries never go stale
+_TREE_CACHE_SIZE = 256
+
+
+class ObjectStoreError(ValueError):
+    """An object, pack or ref is corrupt or stored in a way this reader does not support."""
+
+
+class ObjectNotFoundError(ObjectStoreError):
+    """The object is not in the local object store."""
+
+
+def _hex(oid: bytes | str) -> str:
+    return oid if isinstance(oid, str) else oid.hex()
+
+
+def _raw(oid: bytes | str) -> bytes:
+    return bytes.fromhex(oid) if isinstance(oid, str) else oid
+
+
+def _delta_size(delta: bytes, pos: int) -> tuple[int, int]:
+    size = shift = 0
+    while True:
+        byte = delta[pos]
+        pos += 1
+        size |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return size, pos
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its delta base and a git delta (copy and insert instructions).
+
+    Raises:
+        ObjectStoreError: If the delta does not fit the base
+    """
+    try:
+        base_size, pos = _delta_size(delta, 0)
+        result_size, pos = _delta_size(delta, pos)
+    except IndexError:
+        raise ObjectStoreError("Truncated delta header") from None
+    if base_size != len(base):
+        raise ObjectStoreError(f"Delta expects a base of {base_size} bytes, got {len(base)}")
+    source = memoryview(base)
+    result = bytearray()
+    end = len(delta)
+    try:
+        while pos < end:
+            op = delta[pos]
+            pos += 1
+            if op & 0x80:
+                # Copy from the base: bits 0-3 select offset bytes, bits 4-6 size bytes
+                offset = size = 0
+                for i in range(4):
+                    if op & (1 << i):
+                        offset |= delta[pos] << (8 * i)
+                        pos += 1
+                for i in range(3):
+                    if op & (0x10 << i):
+                        size |= delta[pos] << (8 * i)
+                        pos += 1
+                result += source[offset : offset + (size or 0x10000)]
+            elif op:
+                result += delta[pos : pos + op]
+                pos += op
+            else:
+                raise ObjectStoreError("Reserved delta instruction")
+    except IndexError:
+        raise ObjectStoreError("Truncated delta") from None
+    if len(result) != result_size:
+        raise ObjectStoreError(f"Delta produced {len(result)} bytes, expected {result_size}")
+    return bytes(result)
+
+
+class DeltaBaseCache:
+    """Least recently used objects that served as delta bases, bounded by total size."""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, int], tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pack: str, offset: int) -> tuple[int, bytes] | None:
+        with self._lock:
+            entry = self._entries.get((pack, offset))
+            if entry is not None:
+                self._entries.move_to_end((pack, offset))
+        record_cache_lookup("git_delta_base", entry is not None)
+        return entry
+
+    def put(self, pack: str, offset: int, kind: int, data: bytes) -> None:
+        # Bases larger than a quarter of the cache would evict everything else
+        if len(data) * 4 > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop((pack, offset), None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[(pack, offset)] = (kind, data)
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+_delta_bases = DeltaBaseCache()
+
+
+def _map(path: Path) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class PackIndex:
+    """Memory-mapped ``.idx`` file (version 1 or 2) mapping object ids to pack offsets."""
+
+    __slots__ = ("path", "version", "count", "hash_size", "_map", "_fanout", "_names", "_stride", "_offsets")
+
+    def __init__(self, path: Path, hash_size: int = 20) -> None:
+        """Map the index file at ``path``.
+
+        Raises:
+            OSError: If the file cannot be read
+            ObjectStoreError: If the file is not a pack index
+        """
+        self.path = path
+        self.hash_size = hash_size
+        self._map = _map(path)
+        if self._map[:4] == _IDX_V2_SIGNATURE:
+            (self.version,) = struct.unpack_from(">I", self._map, 4)
+            if self.version != 2:
+                raise ObjectStoreError(f"Unsupported pack index version {self.version}: {path}")
+            fanout = 8
+        else:
+            self.version = 1
+            fanout = 0
+        try:
+            self._fanout = struct.unpack_from(">256I", self._map, fanout)
+        except struct.error:
+            raise ObjectStoreError(f"Truncated pack index: {path}") from None
+        self.count = self._fanout[255]
+        if self.version == 2:
+            # Sorted names, then CRCs, then 31-bit offsets (high bit: index into 64-bit offsets)
+            self._names = fanout + 1024
+            self._stride = hash_size
+            self._offsets = self._names + self.count * (hash_size + 4)
+        else:
+            # Records of a 4-byte offset followed by the name
+            self._names = 1024 + 4
+            self._stride = hash_size + 4
+            self._offsets = 1024
+
+    def find(self, oid: bytes) -> int | None:
+        """Return the pack offset of ``oid``, or None if the pack does not contain it."""
+        first = oid[0]
+        lo = self._fanout[first - 1] if first else 0
+        hi = self._fanout[first]
+        names = self._map
+        base, stride, size = self._names, self._stride, self.hash_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            at = base + mid * stride
+            name = names[at : at + size]
+            if name < oid:
+                lo = mid + 1
+            elif name > oid:
+                hi = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def _offset(self, position: int) -> int:
+        if self.version == 1:
+            offset: int = struct.unpack_from(">I", self._map, self._offsets + position * self._stride)[0]
+            return offset
+        offset = struct.unpack_from(">I", self._map, self._offsets + 4 * position)[0]
+        if offset & 0x80000000:
+            large = self._offsets + 4 * self.count + 8 * (offset & 0x7FFFFFFF)
+            offset = struct.unpack_from(">Q", self._map, large)[0]
+        return offset
+
+
+class Pack:
+    """A memory-mapped ``.pack`` file with its index."""
+
+    __slots__ = ("name", "index", "_map")
+
+    def __init__(self, idx_path: Path, hash_size: int = 20) -> None:
+        """Map ``idx_path`` and the pack file next to it.
+
+        Raises:
+            OSError: If either file cannot be read
+            ObjectStoreError: If either file is not in a supported format
+        """
+        self.name = str(idx_path)
+        self.index = PackIndex(idx_path, hash_size)
+        self._map = _map(idx_path.with_suffix(".pack"))
+        if self._map[:4] != _PACK_SIGNATURE or struct.unpack_from(">I", self._map, 4)[0] not in (2, 3):
+            raise ObjectStoreError(f"Unsupported pack file: {idx_path.with_suffix('.pack')}")
+
+    def read(self, offset: int, store: "ObjectStore") -> tuple[int, bytes]:
+        """Return the type code and content of the object at ``offset``, resolving deltas.
+
+        Bases of deltas stored as object ids may live elsewhere in ``store``.
+        """
+        chain: list[tuple[int, int, int]] = []
+        while True:
+            if chain:
+                cached = _delta_bases.get(self.name, offset)
+                if cached is not None:
+                    kind, data = cached
+                    break
+            kind, size, pos, base_offset, base_oid = self._header(offset)
+            if kind == _OFS_DELTA:
+                chain.append((offset, pos, size))
+                offset = base_offset
+            elif kind == _REF_DELTA:
+                chain.append((offset, pos, size))
+                found = self.index.find(base_oid)
+                if found is None:
+                    kind, data = store.read_raw(base_oid)
+                    break
+                offset = found
+            elif kind in OBJECT_TYPES:
+                data = self._inflate(pos, size)
+                if chain:
+                    _delta_bases.put(self.name, offset, kind, data)
+                break
+            else:
+                raise ObjectStoreError(f"Unknown object type {kind} at offset {offset} of {self.name}")
+        for i in range(len(chain) - 1, -1, -1):
+            offset, pos, size = chain[i]
+            data = apply_delta(data, self._inflate(pos, size))
+            if i:
+                _delta_bases.put(self.name, offset, kind, data)
+        return kind, data
+
+    def _header(self, offset: int) -> tuple[int, int, int, int, bytes]:
+        # Type code, size, data position, then the base of an offset delta or of a ref delta
+        m = self._map
+        try:
+            byte = m[offset]
+            pos = offset + 1
+            kind = (byte >> 4) & 7
+            size = byte & 0x0F
+            shift = 4
+            while byte & 0x80:
+                byte = m[pos]
+                pos += 1
+                size |= (byte & 0x7F) << shift
+                shift += 7
+            base_offset = 0
+            base_oid = b""
+            if kind == _OFS_DELTA:
+                byte = m[pos]
+                pos += 1
+                distance = byte & 0x7F
+                while byte & 0x80:
+                    byte = m[pos]
+                    pos += 1
+                    distance = ((distance + 1) << 7) | (byte & 0x7F)
+                base_offset = offset - distance
+            elif kind == _REF_DELTA:
+                base_oid = m[pos : pos + self.index.hash_size]
+                pos += self.index.hash_size
+        except IndexError:
+            raise ObjectStoreError(f"Truncated object at offset {offset} of {self.name}") from None
+        return kind, size, pos, base_offset, base_oid
+
+    def _inflate(self, pos: int, size: int) -> bytes:
+        view = memoryview(self._map)
+        inflater = zlib.decompressobj()
+        parts = []
+        try:
+            while not inflater.eof:
+                chunk = view[pos : pos + _INFLATE_STEP]
+                if not chunk:
+                    raise ObjectStoreError(f"Truncated object data in {self.name}")
+                parts.append(inflater.decompress(chunk))
+                pos += _INFLATE_STEP
+        except zlib.error as e:
+            raise ObjectStoreError(f"Corrupt object data in {self.name}: {e}") from None
+        finally:
+            view.release()
+        data = b"".join(parts)
+        if len(data) != size:
+            raise ObjectStoreError(f"Object in {self.name} inflated to {len(data)} bytes, expected {size}")
+        return data
+
+
+class ObjectStore:
+    """Reader for one object directory: loose objects, packs and alternates.
+
+    Packs are mapped once and the pack directory is rescanned when an object
+    is not found, which picks up fetches and repacks. Safe to use from
+    several threads.
+    """
+
+    def __init__(self, objects_dir: Path | str, hash_size: int = 20, depth: int = 0) -> None:
+        """Create a reader for ``objects_dir``; ``depth`` counts alternates followed to get here."""
+        self.objects_dir = Path(objects_dir)
+        self.hash_size = hash_size
+        self._packs: dict[str, Pack] = {}
+        self._pack_dir_mtime = -1
+        self._trees: OrderedDict[bytes, dict[bytes, tuple[int, bytes]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._alternates = self._read_alternates(depth) if depth < _MAX_DEPTH else []
+
+    def _read_alternates(self, depth: int) -> list["ObjectStore"]:
+        try:
+            lines = (self.objects_dir / "info" / "alternates").read_text().splitlines()
+        except OSError:
+            return []
+        stores = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                stores.append(ObjectStore(self.objects_dir / line, self.hash_size, depth + 1))
+        return stores
+
+    def read(self, oid: bytes | str) -> tuple[str, bytes]:
+        """Return the type name and content of object ``oid``.
+
+        Raises:
+            ObjectNotFoundError: If the object is not stored locally
+            ObjectStoreError: If the object cannot be read
+        """
+        kind, data = self.read_raw(_raw(oid))
+        return OBJECT_TYPES[kind], data
+
+    def read_blob(self, oid: bytes | str) -> bytes:
+        """Return the content of blob ``oid``; raises like ``read``, or if ``oid`` is not a blob."""
+        kind, data = self.read(oid)
+        if kind != "blob":
+            raise ObjectStoreError(f"Object {_hex(oid)} is a {kind}, not a blob")
+        return data
+
+    def read_raw(self, oid: bytes) -> tuple[int, bytes]:
+        """Return the type code and content of object ``oid`` (binary id)."""
+        found = self._read_packed(oid, rescan=False)
+        if found is None:
+            found = self._read_loose(oid)
+        if found is None:
+            found = self._read_packed(oid, rescan=True)
+        if found is not None:
+            return found
+        for alternate in self._alternates:
+            try:
+                return alternate.read_raw(oid)
+            except ObjectNotFoundError:
+                continue
+        raise ObjectNotFoundError(f"Object {oid.hex()} not found in {self.objects_dir}")
+
+    def _read_packed(self, oid: bytes, rescan: bool) -> tuple[int, bytes] | None:
+        if rescan or self._pack_dir_mtime < 0:
+            if not self._scan_packs():
+                return None
+        for pack in list(self._packs.values()):
+            offset = pack.index.find(oid)
+            if offset is not None:
+                return pack.read(offset, self)
+        return None
+
+    def _scan_packs(self) -> bool:
+        """Map new packs and forget removed ones; return False if nothing changed."""
+        pack_dir = self.objects_dir / "pack"
+        try:
+            mtime = pack_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        with self._lock:
+            if mtime == self._pack_dir_mtime:
+                return False
+            names = {str(path) for path in pack_dir.glob("*.idx")} if mtime else set()
+            packs = {name: pack for name, pack in self._packs.items() if name in names}
+            for name in sorted(names - packs.keys()):
+                try:
+                    packs[name] = Pack(Path(name), self.hash_size)
+                except (OSError, ObjectStoreError, ValueError):
+                    # Packs being written or removed concurrently are picked up on the next scan
+                    continue
+            self._packs = packs
+            self._pack_dir_mtime = mtime
+            return True
+
+    def _read_loose(self, oid: bytes) -> tuple[int, bytes] | None:
+        name = oid.hex()
+        try:
+            compressed = (self.objects_dir / name[:2] / name[2:]).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            raw = zlib.decompress(compressed)
+        except zlib.error as e:
+            raise ObjectStoreError(f"Corrupt loose object {name}: {e}") from None
+        header, _, data = raw.partition(b"\0")
+        kind, _, size = header.partition(b" ")
+        code = _TYPE_CODES.get(kind.decode("ascii", "replace"))
+        if code is None or not size.isdigit() or int(size) != len(data):
+            raise ObjectStoreError(f"Corrupt loose object header {header[:32]!r} in {name}")
+        return code, data
+
+    def commit_tree(self, commit: bytes | str) -> bytes:
+        """Return the tree id of ``commit``."""
+        kind, data = self.read(commit)
+        if kind != "commit" or not data.startswith(b"tree "):
+            raise ObjectStoreError(f"Object {_hex(commit)} is not a commit")
+        return bytes.fromhex(data[5 : 5 + 2 * self.hash_size].decode("ascii"))
+
+    def tree_entries(self, tree: bytes | str) -> dict[bytes, tuple[int, bytes]]:
+        """Return the entries of ``tree`` as ``name -> (mode, object id)``."""
+        tree = _raw(tree)
+        with self._lock:
+            cached = self._trees.get(tree)
+            if cached is not None:
+                self._trees.move_to_end(tree)
+        record_cache_lookup("git_tree", cached is not None)
+        if cached is not None:
+            return cached
+        kind, data = self.read(tree)
+        if kind != "tree":
+            raise ObjectStoreError(f"Object {_hex(tree)} is not a tree")
+        entries = {}
+        pos = 0
+        size = self.hash_size
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            entries[data[space + 1 : nul]] = (int(data[pos:space], 8), data[nul + 1 : nul + 1 + size])
+            pos = nul + 1 + size
+        with self._lock:
+            self._trees[tree] = entries
+            while len(self._trees) > _TREE_CACHE_SIZE:
+                self._trees.popitem(last=False)
+        return entries
+
+    def tree_entry(self, tree: bytes | str, path: str) -> tuple[int, bytes] | None:
+        """Return ``(mode, object id)`` of ``path`` (``/``-separated) in ``tree``, or None if absent."""
+        entry: tuple[int, bytes] = (0o40000, _raw(tree))
+        for name in path.encode("utf-8", "surrogateescape").split(b"/"):
+            if entry[0] != 0o40000:
+                return None
+            found = self.tree_entries(entry[1]).get(name)
+            if found is None:
+                return None
+            entry = found
+        return entry
+
+
+def _read_ref(directory: Path, common: Path, name: str) -> bytes | None:
+    """Return the object id ``name`` points to, following symbolic refs, or None if unborn."""
+    for _ in range(_MAX_DEPTH):
+        # Per-worktree refs (HEAD) live in the worktree's git directory, the rest in the common one
+        value = None
+        for base in (directory, common) if directory != common else (directory,):
+            try:
+                value = (base / name).read_text().strip()
+                break
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                continue
+        if value is None:
+            value = _packed_ref(common, name)
+            if value is None:
+                return None
+        if value.startswith("ref:"):
+            name = value[len("ref:") :].strip()
+            continue
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            raise ObjectStoreError(f"Malformed ref {name}: {value[:80]!r}") from None
+    raise ObjectStoreError(f"Too many levels of symbolic refs from {name}")
+
+
+def _packed_ref(common: Path, name: str) -> str | None:
+    try:
+        lines = (common / "packed-refs").read_text().splitlines()
+    except FileNotFoundError:
+        return None
+    suffix = " " + name
+    for line in lines:
+        if line.endswith(suffix) and not line.startswith(("#", "^")):
+            return line[: -len(suffix)]
+    return None
+
+
+_stores: dict[str, ObjectStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_object_store(repo_root: Path | str) -> ObjectStore:
+    """Return the process-wide object store reader of the repository at ``repo_root``.
+
+    Raises:
+        FileNotFoundError: If ``repo_root`` is not the root of a non-bare repository
+    """
+    directory = git_dir(repo_root)
+    if directory is None:
+        raise FileNotFoundError(f"No git directory at {repo_root}")
+    common = common_git_dir(directory)
+    objects = str(common / "objects")
+    with _stores_lock:
+        store = _stores.get(objects)
+        if store is None:
+            store = _stores[objects] = ObjectStore(objects, object_id_size(directory))
+        return store
+
+
+def head_entry(repo_root: Path | str, path: str) -> tuple[int, bytes] | None:
+    """Return ``(mode, object id)`` of ``path`` in the HEAD commit, or None if HEAD lacks it or is unborn.
+
+    Raises:
+        FileNotFoundError: If ``repo_root`` is not the root of a non-bare repository
+        ObjectStoreError: If refs use the reftable format or objects cannot be read
+    """
+    directory = git_dir(repo_root)
+    if directory is None:
+        raise FileNotFoundError(f"No git directory at {repo_root}")
+    common = common_git_dir(directory)
+    if (common / "reftable").is_dir():
+        raise ObjectStoreError("Reftable refs are not supported")
+    head = _read_ref(directory, common, "HEAD")
+    if head is None:
+        return None
+    store = open_object_store(repo_root)
+    return store.tree_entry(store.commit_tree(head), path)
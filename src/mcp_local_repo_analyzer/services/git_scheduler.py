@@ -0,0 +1,156 @@
+"""Process-wide scheduling of git subprocesses."""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+from shared.utils.metrics import GIT_QUEUE_DEPTH, GIT_QUEUE_WAIT, GIT_RUNNING
+
+
+class GitPriority(IntEnum):
+    """Scheduling class of a git command; lower values are started first."""
+
+    METADATA = 0
+    STATUS = 1
+    CONTENT = 2
+
+
+# Cheap lookups of refs and configuration
+METADATA_COMMANDS = frozenset(
+    {"rev-parse", "branch", "symbolic-ref", "show-ref", "for-each-ref", "config", "remote", "stash", "tag", "describe"}
+)
+
+# Subcommands whose run time grows with history or diff size
+CONTENT_COMMANDS = frozenset(
+    {"diff", "log", "show", "blame", "grep", "rev-list", "shortlog", "cherry", "format-patch", "archive", "cat-file"}
+)
+
+
+def priority_for(subcommand: str) -> GitPriority:
+    """Return the scheduling class of a git subcommand; unknown ones are scheduled like ``status``."""
+    if subcommand in METADATA_COMMANDS:
+        return GitPriority.METADATA
+    if subcommand in CONTENT_COMMANDS:
+        return GitPriority.CONTENT
+    return GitPriority.STATUS
+
+
+def default_git_concurrency() -> int:
+    """Return the default number of concurrent git subprocesses: one per CPU."""
+    return os.cpu_count() or 4
+
+
+class _Waiter:
+    """A command waiting for a slot."""
+
+    __slots__ = ("future", "repo", "priority")
+
+    def __init__(self, future: "asyncio.Future[None]", repo: str, priority: GitPriority) -> None:
+        self.future = future
+        self.repo = repo
+        self.priority = priority
+
+
+class GitScheduler:
+    """Bounds concurrent git subprocesses and decides which waiting command starts next.
+
+    When all slots are taken, a freed slot goes to the highest priority class
+    with waiting commands (metadata, then status, then diff/log). Within a
+    class, repositories take turns, so one repository with hundreds of queued
+    diffs does not hold up the others. Commands of one repository and class
+    start in arrival order. Meant to be used from a single event loop.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Create a scheduler allowing ``max_concurrency`` commands at a time.
+
+        ``running`` counts commands holding a slot and ``queued`` those waiting.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.running = 0
+        self.queued = 0
+        self._queues: list[OrderedDict[str, deque[_Waiter]]] = [OrderedDict() for _ in GitPriority]
+
+    @asynccontextmanager
+    async def slot(self, repo: str, priority: GitPriority) -> AsyncIterator[None]:
+        """Hold a slot for one git command of ``repo`` for the duration of the ``with`` block."""
+        await self._acquire(repo, priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, repo: str, priority: GitPriority) -> None:
+        label = priority.name.lower()
+        if self.running < self.max_concurrency and not self.queued:
+            self.running += 1
+            GIT_RUNNING.inc()
+            GIT_QUEUE_WAIT.observe(0, priority=label)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), repo, priority)
+        self._queues[priority].setdefault(repo, deque()).append(waiter)
+        self.queued += 1
+        GIT_QUEUE_DEPTH.inc(priority=label)
+        start = time.perf_counter()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was handed over just before the cancellation: pass it on
+                self._release()
+            else:
+                self._discard(waiter)
+            raise
+        finally:
+            GIT_QUEUE_WAIT.observe(time.perf_counter() - start, priority=label)
+
+    def _release(self) -> None:
+        waiter = self._next_waiter()
+        if waiter is None:
+            self.running -= 1
+            GIT_RUNNING.dec()
+        else:
+            # The slot passes straight to the waiter, so ``running`` is unchanged
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        for queue in self._queues:
+            while queue:
+                repo, waiters = next(iter(queue.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    queue.move_to_end(repo)
+                else:
+                    del queue[repo]
+                self.queued -= 1
+                GIT_QUEUE_DEPTH.dec(priority=waiter.priority.name.lower())
+                if not waiter.future.done():
+                    return waiter
+        return None
+
+    def _discard(self, waiter: _Waiter) -> None:
+        queue = self._queues[waiter.priority]
+        waiters = queue.get(waiter.repo)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del queue[waiter.repo]
+        self.queued -= 1
+        GIT_QUEUE_DEPTH.dec(priority=waiter.priority.name.lower())
+
+
+_schedulers: dict[int, GitScheduler] = {}
+
+
+def get_git_scheduler(max_concurrency: int | None = None) -> GitScheduler:
+    """Return the process-wide scheduler for ``max_concurrency`` (default: ``default_git_concurrency``)."""
+    limit = max_concurrency or default_git_concurrency()
+    if limit not in _schedulers:
+        _schedulers[limit] = GitScheduler(limit)
+    return _schedulers[limit]
@@ -0,0 +1,160 @@
+"""In-memory snapshots backing cursor-based pagination of file listings."""
+
+import base64
+import binascii
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from shared.utils import paginate
+from shared.utils.metrics import record_cache_lookup
+
+
+class CursorError(ValueError):
+    """Raised when a pagination cursor is malformed, expired or used with the wrong tool."""
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    """Encode a snapshot id and offset into an opaque cursor string."""
+    raw = f"{snapshot_id}:{offset}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        CursorError: If the cursor is not a valid encoding
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        snapshot_id, offset = raw.split(":")
+        position = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise CursorError(f"Malformed cursor: {cursor!r}") from e
+    if not snapshot_id or position < 0:
+        raise CursorError(f"Malformed cursor: {cursor!r}")
+    return snapshot_id, position
+
+
+class Snapshot:
+    """A frozen, stably ordered file listing and the context needed to render its pages."""
+
+    __slots__ = ("snapshot_id", "kind", "items", "context", "expires_at")
+
+    def __init__(self, snapshot_id: str, kind: str, items: Sequence[Any], context: Any, expires_at: float) -> None:
+        """Create a snapshot; see ``SnapshotCache.create``."""
+        self.snapshot_id = snapshot_id
+        self.kind = kind
+        self.items = items
+        self.context = context
+        self.expires_at = expires_at
+
+
+class SnapshotCache:
+    """Server-side snapshots of large tool results, addressed by opaque cursors.
+
+    The first call of a paginated tool stores its complete listing here and
+    returns a cursor for the next page; later pages are sliced from the
+    snapshot, so they need no git work and see a consistent view of the
+    repository. Snapshots expire ``ttl_seconds`` after creation and the least
+    recently used one is dropped once ``max_snapshots`` is exceeded.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, max_snapshots: int = 32) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Lifetime of a snapshot
+            max_snapshots: Maximum number of snapshots kept at once
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, items: Sequence[Any], context: Any = None) -> Snapshot:
+        """Store a listing of the given kind (usually the tool name) and return its snapshot."""
+        snapshot = Snapshot(secrets.token_hex(8), kind, items, context, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._evict_expired()
+            self._snapshots[snapshot.snapshot_id] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def get(self, snapshot_id: str) -> Snapshot | None:
+        """Return a live snapshot, or None if it is unknown or expired."""
+        with self._lock:
+            snapshot = self._snapshots.get(snapshot_id)
+            if snapshot is not None and snapshot.expires_at <= time.monotonic():
+                del self._snapshots[snapshot_id]
+                snapshot = None
+            if snapshot is not None:
+                self._snapshots.move_to_end(snapshot_id)
+        record_cache_lookup("snapshot", snapshot is not None)
+        return snapshot
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for snapshot_id in [sid for sid, s in self._snapshots.items() if s.expires_at <= now]:
+            del self._snapshots[snapshot_id]
+
+    def first_page(
+        self,
+        kind: str,
+        items: Sequence[Any],
+        context: Any = None,
+        offset: int = 0,
+        limit: int | None = None,
+        pack: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+    ) -> tuple[Sequence[Any], dict[str, Any]]:
+        """Page a freshly computed listing, snapshotting it only if more pages follow.
+
+        Args:
+            kind: Listing kind (usually the tool name) checked when a cursor is used
+            items: Full, stably ordered listing
+            context: Data needed to render later pages
+            offset: Index of the first item of the page
+            limit: Maximum page size, or None for everything from ``offset`` on
+            pack: Converts ``items`` into a compact form for storage, e.g.
+                ``FileStatusTable.from_models``; only called when a snapshot is taken
+
+        Returns:
+            Tuple of (page, pagination metadata including ``next_cursor``)
+        """
+        page, pagination = paginate(items, offset, limit)
+        next_cursor = None
+        if pagination["has_more"]:
+            snapshot = self.create(kind, pack(items) if pack is not None else items, context)
+            next_cursor = encode_cursor(snapshot.snapshot_id, pagination["next_offset"])
+        pagination["next_cursor"] = next_cursor
+        return page, pagination
+
+    def next_page(
+        self, kind: str, cursor: str, limit: int | None = None
+    ) -> tuple[Snapshot, Sequence[Any], dict[str, Any]]:
+        """Return the snapshot and page a cursor points to.
+
+        Raises:
+            CursorError: If the cursor is malformed, expired or belongs to another kind of listing
+        """
+        snapshot_id, offset = decode_cursor(cursor)
+        snapshot = self.get(snapshot_id)
+        if snapshot is None:
+            raise CursorError("Cursor has expired; repeat the request without a cursor")
+        if snapshot.kind != kind:
+            raise CursorError(f"Cursor belongs to {snapshot.kind}, not {kind}")
+
+        page, pagination = paginate(snapshot.items, offset, limit)
+        pagination["next_cursor"] = (
+            encode_cursor(snapshot_id, pagination["next_offset"]) if pagination["has_more"] else None
+        )
+        return snapshot, page, pagination
+
+    def __len__(self) -> int:
+        """Return the number of stored snapshots (including expired ones not yet evicted)."""
+        return len(self._snapshots)
@@ -12,18 +12,31 @@ from mcp_local_repo_analyzer.models.repository import LocalRepository
 from mcp_local_repo_analyzer.services import ChangeDetector
 
 from .client import GitClient
+from .coalescing import RequestCoalescer
 
 
 class StatusTracker:
     """Service for tracking repository status and health."""
 
-    def __init__(self, git_client: GitClient, change_detector: ChangeDetector):
+    def __init__(
+        self, git_client: GitClient, change_detector: ChangeDetector, coalescer: RequestCoalescer | None = None
+    ):
         """Initialize status tracker with required services."""
         self.git_client = git_client
         self.change_detector = change_detector
+        self.coalescer = coalescer or RequestCoalescer()
 
     async def get_repository_status(self, repo: LocalRepository, ctx: Optional["Context"] = None) -> RepositoryStatus:
-        """Get complete repository status."""
+        """Get complete repository status.
+
+        Concurrent calls for the same repository state share one computation (and
+        one set of git processes); see ``RequestCoalescer``.
+        """
+        return await self.coalescer.run(
+            "repository_status", repo.path, lambda: self._get_repository_status(repo, ctx), repo.current_branch
+        )
+
+    async def _get_repository_status(self, repo: LocalRepository, ctx: Optional["Context"] = None) -> RepositoryStatus:
         # Get all types of changes
         working_directory = await self.change_detector.detect_working_directory_changes(repo, ctx)
         staged_changes = await self.change_detector.detect_staged_changes(repo, ctx)
@@ -7,18 +7,30 @@ from typing import Any
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from mcp_local_repo_analyzer.models.file_table import FileStatusRow, FileStatusTable
+from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_local_repo_analyzer.models.repository import LocalRepository
-from shared.utils import find_git_root, is_git_repository
+from mcp_local_repo_analyzer.services.snapshot_cache import CursorError, SnapshotCache
+from shared.utils import ContextLogger, find_git_root, is_git_repository
 
 
 def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
     """Register staging area analysis tools."""
 
+    # Paginated listings share one snapshot cache per services dict, created on first use
+    def snapshots() -> SnapshotCache:
+        if "snapshot_cache" not in services:
+            services["snapshot_cache"] = SnapshotCache()
+        return services["snapshot_cache"]  # type: ignore[no-any-return]
+
     @mcp.tool()
     async def analyze_staged_changes(
         ctx: Context,
         repository_path: str = Field(default=".", description="Path to git repository"),
         include_diffs: bool = Field(True, description="Include diff content for staged files"),
+        offset: int = Field(0, ge=0, description="Index of the first staged file to list"),
+        limit: int | None = Field(None, ge=1, description="Maximum staged files to list (default: all)"),
+        cursor: str | None = Field(None, description="pagination.next_cursor of a previous call"),
     ) -> dict[str, Any]:
         """Analyze changes staged for commit.
 
@@ -34,8 +46,9 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             "statistics": {                   # Line change statistics for impact assessment
                 "total_additions": int, "total_deletions": int
             },
-            "staged_files": List[FileStatus], # List of staged file information for iteration
-            "diffs": List[dict] | None        # Diff content if include_diffs=True
+            "staged_files": List[FileStatus], # Staged file information (current page)
+            "diffs": List[dict] | None,       # Diff content if include_diffs=True (first page only)
+            "pagination": dict                # offset, limit, returned, total, has_more, next_offset, next_cursor
         }
         ```
 
@@ -71,22 +84,36 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `ready_to_commit=False`: No staged changes → analyze working directory instead
         - `total_staged_files > X`: Many files → trigger additional validation
         - `statistics.total_additions > X`: Large additions → review for quality
+        - `pagination.next_cursor` set: More files → call again with `cursor` to page on
         """
+        log = ContextLogger.wrap(ctx)
+        if cursor:
+            try:
+                snapshot, page, pagination = snapshots().next_page("analyze_staged_changes", cursor, limit)
+            except CursorError as e:
+                await log.error(str(e))
+                return {"error": str(e)}
+            return {
+                **snapshot.context,
+                "staged_files": [_format_staged_file(f) for f in page],
+                "pagination": pagination,
+            }
+
         start_time = time.time()
-        await ctx.info(f"Starting staged changes analysis for: {repository_path}")
+        await log.info(f"Starting staged changes analysis for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
-            await ctx.debug(f"Found git repository at: {repo_path}")
+            await log.debug(f"Found git repository at: {repo_path}")
 
         try:
-            await ctx.report_progress(0, 4)
-            await ctx.debug("Creating repository model")
+            await log.progress(0, 4)
+            await log.debug("Creating repository model")
 
             repo = LocalRepository(
                 path=repo_path,
@@ -99,17 +126,17 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.report_progress(1, 4)
-            await ctx.debug("Detecting staged changes")
+            await log.progress(1, 4)
+            await log.debug("Detecting staged changes")
 
             # Use existing StagedChanges model
             current_services = services
-            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, ctx)
+            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, log)
 
-            await ctx.report_progress(2, 4)
-            await ctx.info(f"Found {staged_changes.total_staged} staged files")
+            await log.progress(2, 4)
+            await log.info(f"Found {staged_changes.total_staged} staged files")
 
-            result = {
+            header = {
                 "repository_path": str(repo_path),
                 "total_staged_files": staged_changes.total_staged,
                 "ready_to_commit": staged_changes.ready_to_commit,
@@ -117,32 +144,33 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                     "total_additions": staged_changes.total_additions,
                     "total_deletions": staged_changes.total_deletions,
                 },
-                "staged_files": [
-                    {
-                        "path": f.path,
-                        "status": f.status_code,
-                        "status_description": f.status_description,
-                        "lines_added": f.lines_added,
-                        "lines_deleted": f.lines_deleted,
-                        "total_changes": f.total_changes,
-                        "is_binary": f.is_binary,
-                    }
-                    for f in staged_changes.staged_files
-                ],
+            }
+            page, pagination = snapshots().first_page(
+                "analyze_staged_changes",
+                staged_changes.staged_files,
+                header,
+                offset,
+                limit,
+                pack=FileStatusTable.from_models,
+            )
+            result = {
+                **header,
+                "staged_files": [_format_staged_file(f) for f in page],
+                "pagination": pagination,
             }
 
             # Add diffs if requested
-            if include_diffs and staged_changes.staged_files:
-                await ctx.debug(f"Generating diffs for {min(10, len(staged_changes.staged_files))} staged files")
+            if include_diffs and page:
+                await log.debug(f"Generating diffs for {min(10, len(page))} staged files")
                 diffs = []
-                files_to_process = staged_changes.staged_files[:10]  # Limit to 10 files
+                files_to_process = page[:10]  # Limit to 10 files
 
                 for i, file_status in enumerate(files_to_process):
-                    await ctx.report_progress(2.5 + (i / len(files_to_process)) * 0.5, 4)
+                    await log.progress(2.5 + (i / len(files_to_process)) * 0.5, 4)
 
                     try:
                         if file_status.is_binary:
-                            await ctx.debug(f"Skipping binary file: {file_status.path}")
+                            await log.debug(f"Skipping binary file: {file_status.path}")
                             diffs.append(
                                 {
                                     "file_path": file_status.path,
@@ -152,16 +180,16 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                             )
                             continue
 
-                        await ctx.debug(f"Getting staged diff for: {file_status.path}")
+                        await log.debug(f"Getting staged diff for: {file_status.path}")
                         diff_content = await current_services["git_client"].get_diff(
-                            repo_path, staged=True, file_path=file_status.path, ctx=ctx
+                            repo_path, staged=True, file_path=file_status.path, ctx=log
                         )
 
                         # Truncate long diffs
                         lines = diff_content.split("\n")
                         if len(lines) > 100:
                             diff_content = "\n".join(lines[:100]) + "\n... (truncated)"
-                            await ctx.debug(f"Truncated diff for {file_status.path} from {len(lines)} to 100 lines")
+                            await log.debug(f"Truncated diff for {file_status.path} from {len(lines)} to 100 lines")
 
                         diffs.append(
                             {
@@ -171,7 +199,7 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                         )
 
                     except Exception as e:
-                        await ctx.warning(f"Failed to get diff for {file_status.path}: {str(e)}")
+                        await log.warning(f"Failed to get diff for {file_status.path}: {str(e)}")
                         diffs.append(
                             {
                                 "file_path": file_status.path,
@@ -181,15 +209,15 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
 
                 result["diffs"] = diffs
 
-            await ctx.report_progress(4, 4)
+            await log.progress(4, 4)
             duration = time.time() - start_time
-            await ctx.info(f"Staged changes analysis completed in {duration:.2f} seconds")
+            await log.info(f"Staged changes analysis completed in {duration:.2f} seconds")
 
             return result
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Staged changes analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Staged changes analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to analyze staged changes: {str(e)}"}
 
     @mcp.tool()
@@ -250,18 +278,19 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `summary.total_files > X`: Large commits → require additional review
         - `ready_to_commit=True`: Can commit → check push readiness after commit
         """
-        await ctx.info(f"Previewing commit for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Previewing commit for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -273,30 +302,30 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Detecting staged changes")
+            await log.debug("Detecting staged changes")
             current_services = services
-            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, ctx)
+            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, log)
 
             if not staged_changes.ready_to_commit:
-                await ctx.info("No changes staged for commit")
+                await log.info("No changes staged for commit")
                 return {
                     "repository_path": str(repo_path),
                     "ready_to_commit": False,
                     "message": "No changes staged for commit",
                 }
 
-            await ctx.debug("Categorizing staged changes")
+            await log.debug("Categorizing staged changes")
             # Categorize changes using existing analyzer
             categories = current_services["diff_analyzer"].categorize_changes(staged_changes.staged_files)
 
-            await ctx.debug("Analyzing file types")
+            await log.debug("Analyzing file types")
             # Get file types
             file_types: dict[str, int] = {}
             for file_status in staged_changes.staged_files:
                 ext = Path(file_status.path).suffix.lower() or "no_extension"
                 file_types[ext] = file_types.get(ext, 0) + 1
 
-            await ctx.info(
+            await log.info(
                 f"Commit preview ready: {staged_changes.total_staged} files, {categories.total_files} categorized"
             )
 
@@ -326,7 +355,7 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to preview commit: {str(e)}")
+            await log.error(f"Failed to preview commit: {str(e)}")
             return {"error": f"Failed to preview commit: {str(e)}"}
 
     @mcp.tool()
@@ -388,19 +417,20 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `risk_level="high"`: High risk → require additional review/analysis
         - `errors`: Specific blocking issues that need resolution
         """
+        log = ContextLogger.wrap(ctx)
         start_time = time.time()
-        await ctx.info(f"Starting staged changes validation for: {repository_path}")
+        await log.info(f"Starting staged changes validation for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -412,23 +442,23 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Detecting staged changes")
+            await log.debug("Detecting staged changes")
             current_services = services
-            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, ctx)
+            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, log)
 
             if not staged_changes.ready_to_commit:
-                await ctx.info("No changes staged for commit - validation not applicable")
+                await log.info("No changes staged for commit - validation not applicable")
                 return {
                     "repository_path": str(repo_path),
                     "valid": False,
                     "message": "No changes staged for commit",
                 }
 
-            await ctx.debug("Performing risk assessment")
+            await log.debug("Performing risk assessment")
             # Perform validation using existing risk assessment
             risk_assessment = current_services["diff_analyzer"].assess_risk(staged_changes.staged_files)
 
-            await ctx.debug("Categorizing changes for validation")
+            await log.debug("Categorizing changes for validation")
             categories = current_services["diff_analyzer"].categorize_changes(staged_changes.staged_files)
 
             warnings = []
@@ -438,32 +468,32 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             if risk_assessment.is_high_risk:
                 warning_msg = f"High-risk changes detected: {', '.join(risk_assessment.risk_factors)}"
                 warnings.append(warning_msg)
-                await ctx.warning(warning_msg)
+                await log.warning(warning_msg)
 
             # Check for large changes
             if risk_assessment.large_changes:
                 warning_msg = f"Large changes in {len(risk_assessment.large_changes)} files"
                 warnings.append(warning_msg)
-                await ctx.warning(warning_msg)
+                await log.warning(warning_msg)
 
             # Check for critical files
             if categories.has_critical_changes:
                 warning_msg = f"Critical files changed: {len(categories.critical_files)}"
                 warnings.append(warning_msg)
-                await ctx.warning(warning_msg)
+                await log.warning(warning_msg)
 
             # Check for binary files
             binary_files = [f.path for f in staged_changes.staged_files if f.is_binary]
             if binary_files:
                 warning_msg = f"Binary files included: {len(binary_files)}"
                 warnings.append(warning_msg)
-                await ctx.warning(warning_msg)
+                await log.warning(warning_msg)
 
             # Check for potential conflicts
             if risk_assessment.potential_conflicts:
                 error_msg = f"Potential conflicts detected in: {', '.join(risk_assessment.potential_conflicts)}"
                 errors.append(error_msg)
-                await ctx.error(error_msg)
+                await log.error(error_msg)
 
             # Overall validation result
             is_valid = len(errors) == 0
@@ -483,7 +513,7 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             recommendations = [r for r in recommendations if r]
 
             duration = time.time() - start_time
-            await ctx.info(f"Validation completed in {duration:.2f} seconds - {'VALID' if is_valid else 'INVALID'}")
+            await log.info(f"Validation completed in {duration:.2f} seconds - {'VALID' if is_valid else 'INVALID'}")
 
             return {
                 "repository_path": str(repo_path),
@@ -503,5 +533,18 @@ def register_staging_area_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Staged changes validation failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Staged changes validation failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to validate staged changes: {str(e)}"}
+
+
+def _format_staged_file(file_status: FileStatus | FileStatusRow) -> dict[str, Any]:
+    """Format a staged FileStatus for JSON serialization."""
+    return {
+        "path": file_status.path,
+        "status": file_status.status_code,
+        "status_description": file_status.status_description,
+        "lines_added": file_status.lines_added,
+        "lines_deleted": file_status.lines_deleted,
+        "total_changes": file_status.total_changes,
+        "is_binary": file_status.is_binary,
+    }
@@ -12,7 +12,7 @@ from mcp_local_repo_analyzer.models.analysis_repository import RepositoryStatus
 from mcp_local_repo_analyzer.models.categorization import ChangeCategorization
 from mcp_local_repo_analyzer.models.repository import LocalRepository
 from mcp_local_repo_analyzer.models.risk import RiskAssessment
-from shared.utils import find_git_root, is_git_repository
+from shared.utils import ContextLogger, find_git_root, is_git_repository
 
 
 def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
@@ -101,28 +101,29 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `quick_stats.unpushed_commits > 0`: Local commits → check push readiness
         - `branch_status.needs_pull`: Behind remote → sync before push
         """
+        log = ContextLogger.wrap(ctx)
         start_time = time.time()
-        await ctx.info(f"Starting comprehensive repository analysis for: {repository_path}")
+        await log.info(f"Starting comprehensive repository analysis for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
-            await ctx.debug(f"Found git repository at: {repo_path}")
+            await log.debug(f"Found git repository at: {repo_path}")
 
         try:
-            await ctx.report_progress(0, 6)
-            await ctx.debug("Getting branch information")
+            await log.progress(0, 6)
+            await log.debug("Getting branch information")
 
             # Get branch info
             current_services = services
-            branch_info = await current_services["git_client"].get_branch_info(repo_path, ctx)
+            branch_info = await current_services["git_client"].get_branch_info(repo_path, log)
 
-            await ctx.report_progress(1, 6)
-            await ctx.debug("Creating repository model")
+            await log.progress(1, 6)
+            await log.debug("Creating repository model")
 
             repo = LocalRepository(
                 path=repo_path,
@@ -135,24 +136,24 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.report_progress(2, 6)
-            await ctx.info("Analyzing all repository components...")
+            await log.progress(2, 6)
+            await log.info("Analyzing all repository components...")
 
             # Get complete repository status using existing RepositoryStatus model
-            repo_status = await current_services["status_tracker"].get_repository_status(repo, ctx)
+            repo_status = await current_services["status_tracker"].get_repository_status(repo, log)
 
-            await ctx.report_progress(3, 6)
-            await ctx.debug("Categorizing and analyzing file changes")
+            await log.progress(3, 6)
+            await log.debug("Categorizing and analyzing file changes")
 
             # Analyze all files together for categorization and risk
             all_changed_files = repo_status.working_directory.all_files + repo_status.staged_changes.staged_files
 
-            await ctx.debug(f"Analyzing {len(all_changed_files)} total changed files")
+            await log.debug(f"Analyzing {len(all_changed_files)} total changed files")
             categories = current_services["diff_analyzer"].categorize_changes(all_changed_files)
             risk_assessment = current_services["diff_analyzer"].assess_risk(all_changed_files)
 
-            await ctx.report_progress(4, 6)
-            await ctx.debug("Generating recommendations and summary")
+            await log.progress(4, 6)
+            await log.debug("Generating recommendations and summary")
 
             # Generate recommendations
             recommendations = _generate_recommendations(repo_status, risk_assessment, categories)
@@ -160,8 +161,8 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             # Create summary text
             summary_text = _create_summary_text(repo_status, risk_assessment)
 
-            await ctx.report_progress(5, 6)
-            await ctx.debug("Compiling final results")
+            await log.progress(5, 6)
+            await log.debug("Compiling final results")
 
             # --- IMPORTANT FIX HERE: Calculate actual unstaged working directory changes ---
             actual_unstaged_count = 0
@@ -206,7 +207,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             }
 
             if detailed:
-                await ctx.debug("Adding detailed breakdown to results")
+                await log.debug("Adding detailed breakdown to results")
                 result["detailed_breakdown"] = {
                     "working_directory": {
                         # These counts should align with the _actual_ counts from detect_working_directory_changes,
@@ -232,27 +233,27 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                     },
                 }
 
-            await ctx.report_progress(6, 6)
+            await log.progress(6, 6)
             duration = time.time() - start_time
 
             # Log summary insights
             if repo_status.has_outstanding_work:
-                await ctx.info(f"Analysis complete: {repo_status.total_outstanding_changes} outstanding changes found")
+                await log.info(f"Analysis complete: {repo_status.total_outstanding_changes} outstanding changes found")
                 if risk_assessment.risk_level == "high":
-                    await ctx.warning("High-risk changes detected - review carefully before proceeding")
+                    await log.warning("High-risk changes detected - review carefully before proceeding")
                 elif len(repo_status.unpushed_commits) > 10:
-                    await ctx.warning(
+                    await log.warning(
                         f"Many unpushed commits ({len(repo_status.unpushed_commits)}) - consider pushing soon"
                     )
             else:
-                await ctx.info("Repository is clean - no outstanding changes detected")
+                await log.info("Repository is clean - no outstanding changes detected")
 
-            await ctx.info(f"Comprehensive analysis completed in {duration:.2f} seconds")
+            await log.info(f"Comprehensive analysis completed in {duration:.2f} seconds")
             return result
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Comprehensive analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Comprehensive analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to get outstanding summary: {str(e)}"}
 
     @mcp.tool()
@@ -317,19 +318,20 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `issues`: Specific problems → route to appropriate remediation tools
         - `health_score >= 90`: Excellent health → focus on optimization
         """
+        log = ContextLogger.wrap(ctx)
         start_time = time.time()
-        await ctx.info(f"Starting repository health analysis for: {repository_path}")
+        await log.info(f"Starting repository health analysis for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -341,11 +343,11 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Gathering health metrics")
+            await log.debug("Gathering health metrics")
             current_services = services
-            health_metrics = await current_services["status_tracker"].get_health_metrics(repo, ctx)
+            health_metrics = await current_services["status_tracker"].get_health_metrics(repo, log)
 
-            await ctx.debug("Calculating health score")
+            await log.debug("Calculating health score")
             # Determine overall health score (0-100)
             health_score = 100
             issues = []
@@ -353,34 +355,34 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             if health_metrics["has_uncommitted_changes"]:
                 health_score -= 20
                 issues.append("Uncommitted changes in working directory")
-                await ctx.warning("Uncommitted changes detected")
+                await log.warning("Uncommitted changes detected")
 
             if health_metrics["staged_changes_count"] > 0:
                 health_score -= 15
                 issues.append(f"{health_metrics['staged_changes_count']} staged changes not committed")
-                await ctx.warning("Staged changes detected")
+                await log.warning("Staged changes detected")
 
             if health_metrics["unpushed_commits_count"] > 5:
                 health_score -= 15
                 issues.append(f"{health_metrics['unpushed_commits_count']} unpushed commits")
-                await ctx.warning(f"Many unpushed commits: {health_metrics['unpushed_commits_count']}")
+                await log.warning(f"Many unpushed commits: {health_metrics['unpushed_commits_count']}")
             elif health_metrics["unpushed_commits_count"] > 0:
                 health_score -= 5
 
             if health_metrics["stashed_changes_count"] > 0:
                 health_score -= 10
                 issues.append(f"{health_metrics['stashed_changes_count']} stashed changes")
-                await ctx.info(f"Stashed changes present: {health_metrics['stashed_changes_count']}")
+                await log.info(f"Stashed changes present: {health_metrics['stashed_changes_count']}")
 
             if "behind" in health_metrics["branch_sync_status"]:
                 health_score -= 15
                 issues.append("Branch is behind remote")
-                await ctx.warning("Branch is behind remote")
+                await log.warning("Branch is behind remote")
 
             if "diverged" in health_metrics["branch_sync_status"]:
                 health_score -= 25
                 issues.append("Branch has diverged from remote")
-                await ctx.error("Branch has diverged from remote")
+                await log.error("Branch has diverged from remote")
 
             # Determine health status
             if health_score >= 90:
@@ -396,7 +398,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             recommendations = _generate_health_recommendations(health_metrics, issues)
 
             duration = time.time() - start_time
-            await ctx.info(f"Health analysis complete: {health_status} ({health_score}/100) in {duration:.2f} seconds")
+            await log.info(f"Health analysis complete: {health_status} ({health_score}/100) in {duration:.2f} seconds")
 
             return {
                 "repository_path": str(repo_path),
@@ -409,7 +411,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Repository health analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Repository health analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to analyze repository health: {str(e)}"}
 
     @mcp.tool()
@@ -476,22 +478,23 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `has_commits_to_push=False`: No commits → focus on local development
         - `blockers`: Specific issues requiring targeted remediation tools
         """
-        await ctx.info(f"Assessing push readiness for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Assessing push readiness for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Getting branch information")
+            await log.debug("Getting branch information")
             current_services = services
-            branch_info = await current_services["git_client"].get_branch_info(repo_path, ctx)
+            branch_info = await current_services["git_client"].get_branch_info(repo_path, log)
 
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -503,10 +506,10 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Getting repository status for push readiness check")
-            repo_status = await current_services["status_tracker"].get_repository_status(repo, ctx)
+            await log.debug("Getting repository status for push readiness check")
+            repo_status = await current_services["status_tracker"].get_repository_status(repo, log)
 
-            await ctx.debug("Checking push readiness criteria")
+            await log.debug("Checking push readiness criteria")
             # Check readiness criteria
             blockers = []
             warnings = []
@@ -515,37 +518,37 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             if repo_status.working_directory.has_changes:
                 blocker_msg = "Uncommitted changes in working directory"
                 blockers.append(blocker_msg)
-                await ctx.warning(blocker_msg)
+                await log.warning(blocker_msg)
 
             # Check for staged changes
             if repo_status.staged_changes.ready_to_commit:
                 blocker_msg = "Staged changes not yet committed"
                 blockers.append(blocker_msg)
-                await ctx.warning(blocker_msg)
+                await log.warning(blocker_msg)
 
             # Check if there are commits to push
             has_commits_to_push = len(repo_status.unpushed_commits) > 0
             if not has_commits_to_push:
                 warning_msg = "No new commits to push"
                 warnings.append(warning_msg)
-                await ctx.info(warning_msg)
+                await log.info(warning_msg)
 
             # Check if behind remote
             if repo_status.branch_status.behind_by > 0:
                 blocker_msg = f"Branch is {repo_status.branch_status.behind_by} commits behind remote"
                 blockers.append(blocker_msg)
-                await ctx.warning(blocker_msg)
+                await log.warning(blocker_msg)
 
             # Check for stashed changes (warning, not blocker)
             if repo_status.stashed_changes:
                 warning_msg = f"{len(repo_status.stashed_changes)} stashed changes present"
                 warnings.append(warning_msg)
-                await ctx.info(warning_msg)
+                await log.info(warning_msg)
 
             # Determine readiness
             is_ready = len(blockers) == 0 and has_commits_to_push
 
-            await ctx.debug("Generating action plan")
+            await log.debug("Generating action plan")
             # Generate action plan
             action_plan = []
             if blockers:
@@ -561,7 +564,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 action_plan.append("No commits to push")
 
             readiness_status = "READY" if is_ready else "NOT READY"
-            await ctx.info(f"Push readiness assessment: {readiness_status}")
+            await log.info(f"Push readiness assessment: {readiness_status}")
 
             return {
                 "repository_path": str(repo_path),
@@ -580,7 +583,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to assess push readiness: {str(e)}")
+            await log.error(f"Failed to assess push readiness: {str(e)}")
             return {"error": f"Failed to assess push readiness: {str(e)}"}
 
     @mcp.tool()
@@ -636,18 +639,19 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `total_stashes > 3`: Many stashes → potential workflow issues
         - `has_stashes=True`: Hidden work exists → consider in workflow planning
         """
-        await ctx.info(f"Analyzing stashed changes for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Analyzing stashed changes for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -659,12 +663,12 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Detecting stashed changes")
+            await log.debug("Detecting stashed changes")
             current_services = services
-            stashed_changes = await current_services["change_detector"].detect_stashed_changes(repo, ctx)
+            stashed_changes = await current_services["change_detector"].detect_stashed_changes(repo, log)
 
             if not stashed_changes:
-                await ctx.info("No stashed changes found")
+                await log.info("No stashed changes found")
                 return {
                     "repository_path": str(repo_path),
                     "has_stashes": False,
@@ -672,8 +676,8 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                     "message": "No stashed changes found",
                 }
 
-            await ctx.info(f"Found {len(stashed_changes)} stashed changes")
-            await ctx.debug("Processing stash information")
+            await log.info(f"Found {len(stashed_changes)} stashed changes")
+            await log.debug("Processing stash information")
 
             stashes_data = []
             for stash in stashed_changes:
@@ -700,7 +704,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to analyze stashed changes: {str(e)}")
+            await log.error(f"Failed to analyze stashed changes: {str(e)}")
             return {"error": f"Failed to analyze stashed changes: {str(e)}"}
 
     @mcp.tool()
@@ -758,24 +762,25 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
         - `risk_level="high"`: High conflict risk → require manual review
         - `potential_conflict_files`: Specific files needing conflict resolution
         """
-        await ctx.info(f"Detecting potential conflicts with branch '{target_branch}' for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Detecting potential conflicts with branch '{target_branch}' for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Getting branch information")
+            await log.debug("Getting branch information")
             current_services = services
-            branch_info = await current_services["git_client"].get_branch_info(repo_path, ctx)
+            branch_info = await current_services["git_client"].get_branch_info(repo_path, log)
             current_branch = branch_info.get("current_branch", "main")
 
             if current_branch == target_branch:
-                await ctx.info("Already on target branch - no conflicts to check")
+                await log.info("Already on target branch - no conflicts to check")
                 return {
                     "repository_path": str(repo_path),
                     "current_branch": current_branch,
@@ -784,7 +789,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                     "message": "Cannot check conflicts - already on target branch",
                 }
 
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -796,12 +801,12 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
                 upstream_branch=None,
             )
 
-            await ctx.debug("Getting working directory and staged changes")
+            await log.debug("Getting working directory and staged changes")
             # Get working directory and staged changes
-            working_changes = await current_services["change_detector"].detect_working_directory_changes(repo, ctx)
-            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, ctx)
+            working_changes = await current_services["change_detector"].detect_working_directory_changes(repo, log)
+            staged_changes = await current_services["change_detector"].detect_staged_changes(repo, log)
 
-            await ctx.debug("Analyzing potential conflicts")
+            await log.debug("Analyzing potential conflicts")
             # Simple conflict detection based on file changes
             all_files = working_changes.all_files + staged_changes.staged_files
 
@@ -809,7 +814,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             risk_assessment = current_services["diff_analyzer"].assess_risk(all_files)
             potential_conflicts = risk_assessment.potential_conflicts
 
-            await ctx.debug("Applying conflict detection heuristics")
+            await log.debug("Applying conflict detection heuristics")
             # Additional heuristics for conflict detection
             high_risk_files = []
             for file_status in all_files:
@@ -823,12 +828,12 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             has_potential_conflicts = len(potential_conflicts) > 0 or len(high_risk_files) > 0
 
             if has_potential_conflicts:
-                await ctx.warning(
+                await log.warning(
                     f"Potential conflicts detected: {len(potential_conflicts)} direct conflicts, "
                     f"{len(high_risk_files)} high-risk files"
                 )
             else:
-                await ctx.info("No obvious conflict risks detected")
+                await log.info("No obvious conflict risks detected")
 
             # Generate recommendations
             recommendations = []
@@ -857,7 +862,7 @@ def register_summary_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to detect conflicts: {str(e)}")
+            await log.error(f"Failed to detect conflicts: {str(e)}")
             return {"error": f"Failed to detect conflicts: {str(e)}"}
 
 
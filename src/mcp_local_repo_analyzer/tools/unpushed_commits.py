@@ -8,7 +8,7 @@ from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from mcp_local_repo_analyzer.models.repository import LocalRepository
-from shared.utils import find_git_root, is_git_repository
+from shared.utils import ContextLogger, find_git_root, is_git_repository
 
 
 def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
@@ -81,32 +81,33 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
         - `total_unpushed_commits > 10`: Many commits → consider squashing/organizing
         - `summary.unique_authors > 1`: Multiple authors → check for collaboration issues
         """
+        log = ContextLogger.wrap(ctx)
         start_time = time.time()
-        await ctx.info(f"Starting unpushed commits analysis for: {repository_path}")
+        await log.info(f"Starting unpushed commits analysis for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
-            await ctx.debug(f"Found git repository at: {repo_path}")
+            await log.debug(f"Found git repository at: {repo_path}")
 
         try:
-            await ctx.report_progress(0, 5)
-            await ctx.debug("Getting branch information")
+            await log.progress(0, 5)
+            await log.debug("Getting branch information")
 
             # Get branch info first
             # Access services from closure
             current_services = services
-            branch_info = await services["git_client"].get_branch_info(repo_path, ctx)
+            branch_info = await services["git_client"].get_branch_info(repo_path, log)
             current_branch = branch or branch_info.get("current_branch", "main")
 
-            await ctx.info(f"Analyzing branch: {current_branch}")
+            await log.info(f"Analyzing branch: {current_branch}")
 
-            await ctx.report_progress(1, 5)
-            await ctx.debug("Creating repository model")
+            await log.progress(1, 5)
+            await log.debug("Creating repository model")
 
             repo = LocalRepository(
                 path=repo_path,
@@ -119,20 +120,20 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                 upstream_branch=None,
             )
 
-            await ctx.report_progress(2, 5)
-            await ctx.debug("Detecting unpushed commits")
+            await log.progress(2, 5)
+            await log.debug("Detecting unpushed commits")
 
             # Use existing UnpushedCommit model
-            unpushed_commits = await current_services["change_detector"].detect_unpushed_commits(repo, ctx)
+            unpushed_commits = await current_services["change_detector"].detect_unpushed_commits(repo, log)
 
             # Limit commits if requested
             original_count = len(unpushed_commits)
             if len(unpushed_commits) > max_commits:
                 unpushed_commits = unpushed_commits[:max_commits]
-                await ctx.info(f"Limited results to {max_commits} commits (total found: {original_count})")
+                await log.info(f"Limited results to {max_commits} commits (total found: {original_count})")
 
-            await ctx.report_progress(3, 5)
-            await ctx.debug(f"Processing {len(unpushed_commits)} commits")
+            await log.progress(3, 5)
+            await log.debug(f"Processing {len(unpushed_commits)} commits")
 
             commits_data = []
             total_insertions = 0
@@ -140,7 +141,7 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
 
             for i, commit in enumerate(unpushed_commits):
                 if i % 5 == 0:  # Update progress every 5 commits
-                    await ctx.report_progress(3 + (i / len(unpushed_commits)) * 1, 5)
+                    await log.progress(3 + (i / len(unpushed_commits)) * 1, 5)
 
                 commit_data = {
                     "sha": commit.sha,
@@ -159,15 +160,15 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                 total_insertions += commit.insertions
                 total_deletions += commit.deletions
 
-            await ctx.report_progress(4, 5)
-            await ctx.debug("Analyzing commit authors and statistics")
+            await log.progress(4, 5)
+            await log.debug("Analyzing commit authors and statistics")
 
             # Get unique authors
             authors = list({commit.author for commit in unpushed_commits})
 
-            await ctx.report_progress(5, 5)
+            await log.progress(5, 5)
             duration = time.time() - start_time
-            await ctx.info(
+            await log.info(
                 f"Unpushed commits analysis completed in {duration:.2f} seconds - found {len(unpushed_commits)} commits"
             )
 
@@ -189,7 +190,7 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Unpushed commits analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Unpushed commits analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to analyze unpushed commits: {str(e)}"}
 
     @mcp.tool()
@@ -255,23 +256,24 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
         - `sync_priority="high"`: Urgent sync → prioritize sync operations
         - `is_up_to_date=True`: Already synced → focus on local development
         """
-        await ctx.info(f"Comparing local branch with remote '{remote_name}' for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Comparing local branch with remote '{remote_name}' for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Getting branch information")
+            await log.debug("Getting branch information")
             # Access services from closure
             current_services = services
-            branch_info = await services["git_client"].get_branch_info(repo_path, ctx)
+            branch_info = await services["git_client"].get_branch_info(repo_path, log)
 
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -283,9 +285,9 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                 upstream_branch=None,
             )
 
-            await ctx.debug("Getting branch status")
+            await log.debug("Getting branch status")
             # Use existing BranchStatus model
-            branch_status = await current_services["status_tracker"].get_branch_status(repo, ctx)
+            branch_status = await current_services["status_tracker"].get_branch_status(repo, log)
 
             # Determine sync actions needed
             actions_needed = []
@@ -294,23 +296,23 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
             if branch_status.needs_pull:
                 actions_needed.append("pull")
 
-            await ctx.debug("Determining sync priority and recommendations")
+            await log.debug("Determining sync priority and recommendations")
 
             # Determine sync priority
             if branch_status.ahead_by > 0 and branch_status.behind_by > 0:
                 sync_priority = "high"  # Diverged
                 sync_recommendation = "Pull and merge/rebase, then push"
-                await ctx.warning(
+                await log.warning(
                     f"Branch has diverged: {branch_status.ahead_by} ahead, {branch_status.behind_by} behind"
                 )
             elif branch_status.ahead_by > 5:
                 sync_priority = "medium"  # Many commits ahead
                 sync_recommendation = "Push commits to remote"
-                await ctx.info(f"Branch is {branch_status.ahead_by} commits ahead - consider pushing")
+                await log.info(f"Branch is {branch_status.ahead_by} commits ahead - consider pushing")
             elif branch_status.behind_by > 5:
                 sync_priority = "medium"  # Many commits behind
                 sync_recommendation = "Pull latest changes"
-                await ctx.info(f"Branch is {branch_status.behind_by} commits behind - consider pulling")
+                await log.info(f"Branch is {branch_status.behind_by} commits behind - consider pulling")
             elif branch_status.ahead_by > 0:
                 sync_priority = "low"  # Few commits ahead
                 sync_recommendation = "Push when ready"
@@ -320,7 +322,7 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
             else:
                 sync_priority = "none"  # Up to date
                 sync_recommendation = "Branch is up to date"
-                await ctx.info("Branch is up to date with remote")
+                await log.info("Branch is up to date with remote")
 
             return {
                 "repository_path": str(repo_path),
@@ -339,7 +341,7 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to compare with remote: {str(e)}")
+            await log.error(f"Failed to compare with remote: {str(e)}")
             return {"error": f"Failed to compare with remote: {str(e)}"}
 
     @mcp.tool()
@@ -413,24 +415,25 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
         - `message_patterns.other > 30%`: Poor commit messages → review standards
         - `daily_activity`: Activity patterns for workflow optimization
         """
+        log = ContextLogger.wrap(ctx)
         start_time = time.time()
-        await ctx.info(f"Starting commit history analysis for: {repository_path}")
+        await log.info(f"Starting commit history analysis for: {repository_path}")
 
         if author:
-            await ctx.info(f"Filtering by author: {author}")
+            await log.info(f"Filtering by author: {author}")
         if since:
-            await ctx.info(f"Analyzing commits since: {since}")
+            await log.info(f"Analyzing commits since: {since}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug("Creating repository model")
+            await log.debug("Creating repository model")
             repo = LocalRepository(
                 path=repo_path,
                 name=repo_path.name,
@@ -442,13 +445,13 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                 upstream_branch=None,
             )
 
-            await ctx.debug("Getting unpushed commits for analysis")
+            await log.debug("Getting unpushed commits for analysis")
             # Get unpushed commits (this is our main commit source for now)
             # Access services from closure
             current_services = services
-            all_commits = await current_services["change_detector"].detect_unpushed_commits(repo, ctx)
+            all_commits = await current_services["change_detector"].detect_unpushed_commits(repo, log)
 
-            await ctx.debug(f"Found {len(all_commits)} total commits, applying filters")
+            await log.debug(f"Found {len(all_commits)} total commits, applying filters")
 
             # Apply filters
             filtered_commits = all_commits
@@ -460,19 +463,19 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                     for c in filtered_commits
                     if author.lower() in c.author.lower() or author.lower() in c.author_email.lower()
                 ]
-                await ctx.info(f"Author filter reduced commits from {original_count} to {len(filtered_commits)}")
+                await log.info(f"Author filter reduced commits from {original_count} to {len(filtered_commits)}")
 
             # TODO: Add date filtering when 'since' is provided
             if since:
-                await ctx.warning("Date filtering not yet implemented - ignoring 'since' parameter")
+                await log.warning("Date filtering not yet implemented - ignoring 'since' parameter")
 
             # Limit results
             original_count = len(filtered_commits)
             if len(filtered_commits) > max_commits:
                 filtered_commits = filtered_commits[:max_commits]
-                await ctx.info(f"Limited results to {max_commits} commits (filtered total: {original_count})")
+                await log.info(f"Limited results to {max_commits} commits (filtered total: {original_count})")
 
-            await ctx.debug("Analyzing commit patterns and statistics")
+            await log.debug("Analyzing commit patterns and statistics")
 
             # Analyze patterns
             authors_stats: dict[str, dict[str, int]] = {}
@@ -541,7 +544,7 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
                     message_patterns["other"] += 1
 
             duration = time.time() - start_time
-            await ctx.info(f"Commit history analysis completed in {duration:.2f} seconds")
+            await log.info(f"Commit history analysis completed in {duration:.2f} seconds")
 
             return {
                 "repository_path": str(repo_path),
@@ -579,5 +582,5 @@ def register_unpushed_commits_tools(mcp: FastMCP, services: dict[str, Any]) -> N
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Commit history analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Commit history analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to analyze commit history: {str(e)}"}
@@ -1,5 +1,6 @@
 """FastMCP tools for working directory analysis with enhanced return types."""
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -8,9 +9,15 @@ from pydantic import Field
 
 from mcp_local_repo_analyzer.models.analysis_repository import BranchStatus
 from mcp_local_repo_analyzer.models.changes import StagedChanges, WorkingDirectoryChanges
+from mcp_local_repo_analyzer.models.file_table import FileStatusRow, FileStatusTable
 from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_local_repo_analyzer.models.repository import LocalRepository
-from shared.utils import find_git_root, is_git_repository
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.services.snapshot_cache import CursorError, SnapshotCache
+from shared.utils import ContextLogger, find_git_root, is_git_repository
+
+# WorkingDirectoryChanges lists in all_files order
+_CHANGE_LISTS = ("modified_files", "added_files", "deleted_files", "renamed_files", "untracked_files")
 
 
 def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) -> None:
@@ -20,6 +27,12 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
     def get_services() -> dict[str, Any]:
         return services
 
+    # Paginated listings share one snapshot cache per services dict, created on first use
+    def snapshots() -> SnapshotCache:
+        if "snapshot_cache" not in services:
+            services["snapshot_cache"] = SnapshotCache()
+        return services["snapshot_cache"]  # type: ignore[no-any-return]
+
     @mcp.tool()
     async def analyze_working_directory(
         ctx: Context,
@@ -29,30 +42,51 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
         ),
         include_diffs: bool = Field(True, description="Include diff content in analysis"),
         max_diff_lines: int = Field(100, ge=10, le=1000, description="Maximum lines per diff to include"),
+        offset: int = Field(0, ge=0, description="Index of the first changed file to list"),
+        limit: int | None = Field(None, ge=1, description="Maximum changed files to list (default: all)"),
+        cursor: str | None = Field(None, description="pagination.next_cursor of a previous call"),
     ) -> dict[str, Any]:
-        """Analyze uncommitted changes in working directory."""
+        """Analyze uncommitted changes in working directory.
+
+        Categorization and risk always cover every changed file; ``offset`` and
+        ``limit`` only page the file lists under ``repository_status.working_directory``
+        (in ``all_files`` order). When more files follow, ``pagination.next_cursor``
+        fetches the next page from a server-side snapshot without re-running git;
+        diffs are only included on the first page.
+        """
         import time
         from pathlib import Path
 
         from mcp_local_repo_analyzer.models.analysis_repository import RepositoryStatus
-        from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+
+        log = ContextLogger.wrap(ctx)
+
+        if cursor:
+            try:
+                snapshot, page, pagination = snapshots().next_page("analyze_working_directory", cursor, limit)
+            except CursorError as e:
+                await log.error(str(e))
+                return {"error": str(e)}
+            await log.debug(f"Serving {pagination['returned']} files from snapshot {snapshot.snapshot_id}")
+            skeleton, sizes = snapshot.context
+            return _render_working_directory(skeleton, sizes, page, pagination)
 
         start_time = time.time()
-        await ctx.info(f"Starting working directory analysis for: {repository_path}")
+        await log.info(f"Starting working directory analysis for: {repository_path}")
 
         # Resolve repository path
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
-            await ctx.debug(f"Found git repository at: {repo_path}")
+            await log.debug(f"Found git repository at: {repo_path}")
 
         try:
-            await ctx.report_progress(0, 4)
-            await ctx.debug("Creating repository model")
+            await log.progress(0, 4)
+            await log.debug("Creating repository model")
 
             # Create repository model
             repo = LocalRepository(
@@ -66,15 +100,15 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
                 upstream_branch=None,
             )
 
-            await ctx.report_progress(1, 4)
-            await ctx.debug("Detecting working directory changes")
+            await log.progress(1, 4)
+            await log.debug("Detecting working directory changes")
 
             # Detect working directory changes - returns WorkingDirectoryChanges model
             current_services = get_services()
-            changes = await current_services["change_detector"].detect_working_directory_changes(repo, ctx)
+            changes = await current_services["change_detector"].detect_working_directory_changes(repo, log)
 
-            await ctx.report_progress(2, 4)
-            await ctx.info(f"Found {changes.total_files} changed files")
+            await log.progress(2, 4)
+            await log.info(f"Found {changes.total_files} changed files")
 
             # Use WorkingDirectoryChanges object directly
             working_dir_status = changes
@@ -111,7 +145,18 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
                 repository_status=repository_status,
             )
 
-            result = analysis.model_dump()
+            # Only the requested page of files is listed in the response; later
+            # pages are rendered from a columnar snapshot of the files
+            sizes = tuple(len(getattr(changes, name)) for name in _CHANGE_LISTS)
+            page, pagination = snapshots().first_page(
+                "analyze_working_directory",
+                changes.all_files,
+                (_without_file_lists(analysis), sizes),
+                offset,
+                limit,
+                pack=FileStatusTable.from_models,
+            )
+            result = _render_working_directory(analysis, sizes, page, pagination)
 
             # --- IMPORTANT FIX HERE: Manually add total_files to the nested dict ---
             # Because WorkingDirectoryChanges.total_files is a @property, it's not included by default
@@ -120,26 +165,26 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
             #     result["repository_status"]["working_directory"]["total_files"] = changes.total_files
 
             # Add diffs if requested
-            if include_diffs and changes.has_changes:
-                await ctx.debug(f"Generating diffs for {min(10, len(changes.all_files))} files")
+            if include_diffs and page:
+                await log.debug(f"Generating diffs for {min(10, len(page))} files")
                 diffs = await _get_file_diffs(
                     current_services,
                     repo_path,
-                    changes.all_files[:10],
+                    list(page[:10]),
                     max_diff_lines,
-                    ctx,
+                    log,
                 )
                 result["diffs"] = diffs
 
-            await ctx.report_progress(4, 4)
+            await log.progress(4, 4)
             duration = time.time() - start_time
-            await ctx.info(f"Working directory analysis completed in {duration:.2f} seconds")
+            await log.info(f"Working directory analysis completed in {duration:.2f} seconds")
 
             return result
 
         except Exception as e:
             duration = time.time() - start_time
-            await ctx.error(f"Working directory analysis failed after {duration:.2f} seconds: {str(e)}")
+            await log.error(f"Working directory analysis failed after {duration:.2f} seconds: {str(e)}")
             return {"error": f"Failed to analyze working directory: {str(e)}"}
 
     @mcp.tool()
@@ -201,40 +246,41 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
         - `is_large_change=True`: Large change → trigger validation workflows
         - `statistics.total_changes > X`: Impact-based routing
         """
-        await ctx.info(f"Getting diff for file: {file_path} (staged: {staged})")
+        log = ContextLogger.wrap(ctx)
+        await log.info(f"Getting diff for file: {file_path} (staged: {staged})")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
         try:
-            await ctx.debug(f"Executing git diff command for {file_path}")
+            await log.debug(f"Executing git diff command for {file_path}")
 
             # Get diff from git
             current_services = get_services()
             diff_content = await current_services["git_client"].get_diff(
-                repo_path, staged=staged, file_path=file_path, ctx=ctx
+                repo_path, staged=staged, file_path=file_path, ctx=log
             )
 
             if not diff_content.strip():
-                await ctx.debug(f"No changes found for file: {file_path}")
+                await log.debug(f"No changes found for file: {file_path}")
                 return {
                     "file_path": file_path,
                     "has_changes": False,
                     "message": "No changes found for this file",
                 }
 
-            await ctx.debug("Parsing diff content")
+            await log.debug("Parsing diff content")
 
             # Parse diff using existing FileDiff model
             file_diffs = current_services["diff_analyzer"].parse_diff(diff_content)
 
             if not file_diffs:
-                await ctx.warning(f"Failed to parse diff for {file_path}, returning raw content")
+                await log.warning(f"Failed to parse diff for {file_path}, returning raw content")
                 return {
                     "file_path": file_path,
                     "has_changes": False,
@@ -248,11 +294,11 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
                 lines = diff_content.split("\n")
                 truncated_diff = "\n".join(lines[:max_lines])
                 truncated_diff += f"\n... (truncated, {len(lines) - max_lines} more lines)"
-                await ctx.debug(f"Truncated diff from {len(lines)} to {max_lines} lines")
+                await log.debug(f"Truncated diff from {len(lines)} to {max_lines} lines")
             else:
                 truncated_diff = diff_content
 
-            await ctx.info(f"Successfully generated diff for {file_path} ({file_diff.total_changes} total changes)")
+            await log.info(f"Successfully generated diff for {file_path} ({file_diff.total_changes} total changes)")
 
             return {
                 "file_path": file_diff.file_path,
@@ -270,13 +316,16 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
             }
 
         except Exception as e:
-            await ctx.error(f"Failed to get diff for {file_path}: {str(e)}")
+            await log.error(f"Failed to get diff for {file_path}: {str(e)}")
             return {"error": f"Failed to get diff for {file_path}: {str(e)}"}
 
     @mcp.tool()
     async def get_untracked_files(
         ctx: Context,
         repository_path: str = Field(default=".", description="Path to git repository"),
+        offset: int = Field(0, ge=0, description="Index of the first untracked file to list"),
+        limit: int | None = Field(None, ge=1, description="Maximum untracked files to list (default: all)"),
+        cursor: str | None = Field(None, description="pagination.next_cursor of a previous call"),
     ) -> dict[str, Any]:
         """Get list of untracked files.
 
@@ -287,7 +336,8 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
         {
             "repository_path": str,           # Path to analyzed repository
             "untracked_count": int,           # Number of untracked files (>0 means new work)
-            "files": List[FileStatus]         # List of untracked file information
+            "files": List[FileStatus],        # Untracked file information (current page)
+            "pagination": dict                # offset, limit, returned, total, has_more, next_offset, next_cursor
         }
         ```
 
@@ -315,14 +365,24 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
         - `untracked_count > 0`: New files exist → check if should be staged
         - `untracked_count == 0`: No new files → focus on modified files
         - Individual files can be analyzed for staging decisions
+        - `pagination.next_cursor` set: More files → call again with `cursor` to page on
         """
-        await ctx.info(f"Getting untracked files for: {repository_path}")
+        log = ContextLogger.wrap(ctx)
+        if cursor:
+            try:
+                snapshot, page, pagination = snapshots().next_page("get_untracked_files", cursor, limit)
+            except CursorError as e:
+                await log.error(str(e))
+                return {"error": str(e)}
+            return {**snapshot.context, "files": [_format_file_status(f) for f in page], "pagination": pagination}
+
+        await log.info(f"Getting untracked files for: {repository_path}")
 
         repo_path = Path(repository_path).resolve()
         if not is_git_repository(repo_path):
             git_root = find_git_root(repo_path)
             if not git_root:
-                await ctx.error(f"No git repository found at or above {repo_path}")
+                await log.error(f"No git repository found at or above {repo_path}")
                 return {"error": f"No git repository found at or above {repo_path}"}
             repo_path = git_root
 
@@ -338,28 +398,30 @@ def register_working_directory_tools(mcp: FastMCP, services: dict[str, Any]) ->
                 upstream_branch=None,
             )
 
-            await ctx.debug("Detecting working directory changes to find untracked files")
+            await log.debug("Detecting working directory changes to find untracked files")
             current_services = get_services()
             changes: WorkingDirectoryChanges = await current_services[
                 "change_detector"
-            ].detect_working_directory_changes(repo, ctx)
-
-            untracked_files = [_format_file_status(f) for f in changes.untracked_files]
+            ].detect_working_directory_changes(repo, log)
 
-            await ctx.info(f"Found {len(untracked_files)} untracked files")
-
-            return {
+            header = {
                 "repository_path": str(repo_path),
-                "untracked_count": len(untracked_files),
-                "files": untracked_files,
+                "untracked_count": len(changes.untracked_files),
             }
+            page, pagination = snapshots().first_page(
+                "get_untracked_files", changes.untracked_files, header, offset, limit, pack=FileStatusTable.from_models
+            )
+
+            await log.info(f"Found {header['untracked_count']} untracked files")
+
+            return {**header, "files": [_format_file_status(f) for f in page], "pagination": pagination}
 
         except Exception as e:
-            await ctx.error(f"Failed to get untracked files: {str(e)}")
+            await log.error(f"Failed to get untracked files: {str(e)}")
             return {"error": f"Failed to get untracked files: {str(e)}"}
 
 
-def _format_file_status(file_status: FileStatus) -> dict[str, Any]:
+def _format_file_status(file_status: FileStatus | FileStatusRow) -> dict[str, Any]:
     """Format a FileStatus object for JSON serialization."""
     return {
         "path": file_status.path,
@@ -374,23 +436,87 @@ def _format_file_status(file_status: FileStatus) -> dict[str, Any]:
     }
 
 
+def _without_file_lists(analysis: OutstandingChangesAnalysis) -> OutstandingChangesAnalysis:
+    """Copy ``analysis`` with empty working directory lists, to keep with a snapshot of its files."""
+    repository_status = analysis.repository_status
+    if repository_status is None:
+        return analysis
+    return analysis.model_copy(
+        update={
+            "repository_status": repository_status.model_copy(update={"working_directory": WorkingDirectoryChanges()})
+        }
+    )
+
+
+def _page_working_directory(
+    sizes: Sequence[int], page: Sequence[FileStatus | FileStatusRow], start: int
+) -> WorkingDirectoryChanges:
+    """Sort ``page``, the files ``all_files[start:start + len(page)]``, back into their categories.
+
+    ``sizes`` holds the length of each category list in ``_CHANGE_LISTS`` order.
+    Snapshot rows are converted to ``FileStatus`` here, at the serialization boundary.
+    """
+    lists: list[list[FileStatus]] = []
+    position = 0
+    for size in sizes:
+        files = page[max(0, position - start) : max(0, position + size - start)]
+        lists.append([f if isinstance(f, FileStatus) else f.to_file_status() for f in files])
+        position += size
+    modified, added, deleted, renamed, untracked = lists
+    return WorkingDirectoryChanges.model_construct(
+        modified_files=modified,
+        added_files=added,
+        deleted_files=deleted,
+        renamed_files=renamed,
+        untracked_files=untracked,
+    )
+
+
+def _render_working_directory(
+    analysis: OutstandingChangesAnalysis,
+    sizes: Sequence[int],
+    page: Sequence[FileStatus | FileStatusRow],
+    pagination: dict[str, Any],
+) -> dict[str, Any]:
+    """Dump ``analysis`` listing only the page of working directory files described by ``pagination``.
+
+    ``working_directory.total_files`` keeps counting every changed file; the
+    page size is ``pagination.returned``.
+    """
+    repository_status = analysis.repository_status
+    if repository_status is None:
+        return {**analysis.model_dump(), "pagination": pagination}
+
+    if pagination["returned"] < pagination["total"]:
+        page_changes = _page_working_directory(sizes, page, pagination["offset"])
+        analysis = analysis.model_copy(
+            update={"repository_status": repository_status.model_copy(update={"working_directory": page_changes})}
+        )
+
+    result = analysis.model_dump()
+    result["repository_status"]["working_directory"]["total_files"] = pagination["total"]
+    result["pagination"] = pagination
+    return result
+
+
 async def _get_file_diffs(
     services: dict[str, Any],
     repo_path: Path,
     files: list[FileStatus],
     max_lines: int,
-    ctx: Context,
+    ctx: Context | ContextLogger,
 ) -> list[dict[str, Any]]:
     """Get diffs for a list of files."""
+    log = ContextLogger.wrap(ctx)
     diffs = []
     total_files = len(files)
 
     for i, file_status in enumerate(files):
         try:
-            await ctx.report_progress(i, total_files)
+            await log.progress(i, total_files)
 
             if file_status.is_binary:
-                await ctx.debug(f"Skipping binary file: {file_status.path}")
+                await log.debug(f"Skipping binary file: {file_status.path}")
                 diffs.append(
                     {
                         "file_path": file_status.path,
@@ -400,12 +526,12 @@ async def _get_file_diffs(
                 )
                 continue
 
-            await ctx.debug(f"Getting diff for file: {file_status.path}")
+            await log.debug(f"Getting diff for file: {file_status.path}")
             diff_content = await services["git_client"].get_diff(
                 repo_path,
                 staged=file_status.staged,
                 file_path=file_status.path,
-                ctx=ctx,
+                ctx=log,
             )
 
             if diff_content.strip():
@@ -424,7 +550,7 @@ async def _get_file_diffs(
                 )
 
         except Exception as e:
-            await ctx.warning(f"Failed to get diff for {file_status.path}: {str(e)}")
+            await log.warning(f"Failed to get diff for {file_status.path}: {str(e)}")
             diffs.append(
                 {
                     "file_path": file_status.path,
@@ -432,5 +558,5 @@ async def _get_file_diffs(
                 }
             )
 
-    await ctx.report_progress(total_files, total_files)
+    await log.progress(total_files, total_files)
     return diffs
@@ -21,12 +21,60 @@ class PRRecommenderSettings(BaseMCPSettings):
     # LLM Settings
     openai_api_key: str = Field(default="", description="OpenAI API key")
     openai_model: str = Field(default="gpt-4", description="OpenAI model to use")
+    openai_base_url: str = Field(
+        default="",
+        description="OpenAI-compatible API base URL, e.g. a local vLLM/llama.cpp server (empty = api.openai.com)",
+    )
     max_tokens_per_request: int = Field(default=2000, description="Max tokens per LLM request")
+    llm_streaming: bool = Field(
+        default=True, description="Stream LLM grouping responses and parse groups as they arrive"
+    )
+    prompt_compaction_min_files: int = Field(
+        default=25, ge=1, description="Compact the grouping prompt file listing from this many files"
+    )
+
+    # LLM Backend Settings
+    llm_timeout_seconds: float = Field(default=60.0, gt=0, description="Per-request LLM timeout")
+    llm_max_concurrency: int = Field(default=4, ge=1, description="Max in-flight LLM requests per endpoint")
+    llm_max_retries: int = Field(default=2, ge=0, description="Retries for transient LLM failures")
+    llm_retry_base_delay_seconds: float = Field(
+        default=0.5, ge=0, description="Base delay for jittered exponential retry backoff"
+    )
+    llm_hedge_delay_seconds: float = Field(
+        default=0.0, ge=0, description="Send a hedge request if no response after this delay (0 = disabled)"
+    )
+    llm_http_max_connections: int = Field(default=20, ge=1, description="Pooled HTTP connections for LLM calls")
+    llm_http2: bool = Field(default=True, description="Use HTTP/2 for LLM calls when the h2 package is installed")
+
+    # LLM Response Cache Settings
+    llm_cache_enabled: bool = Field(default=True, description="Cache LLM grouping responses on disk")
+    llm_cache_path: str = Field(
+        default="",
+        description="SQLite cache file (default: ~/.cache/mcp-auto-pr/llm_cache.sqlite3)",
+    )
+    llm_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=0, description="Cache entry TTL (0 = never expire)")
+    llm_cache_max_entries: int = Field(default=1000, ge=1, description="Max cached responses before LRU eviction")
+
+    # Incremental Re-grouping Settings
+    incremental_max_sessions: int = Field(default=32, ge=1, description="Repositories remembered for incremental mode")
+    incremental_full_regroup_ratio: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Re-group everything when more than this fraction of files is new or changed",
+    )
 
     # Grouping Settings
     max_files_per_pr: int = Field(default=8, ge=1, le=20, description="Max files per PR")
     min_files_per_pr: int = Field(default=1, ge=1, description="Min files per PR")
+    max_lines_per_pr: int = Field(default=1000, ge=1, description="Max changed lines before a group is split")
+    max_review_minutes_per_pr: int = Field(
+        default=60, ge=10, le=120, description="Max estimated review time for groups produced by splitting"
+    )
     similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0, description="Similarity threshold")
+    size_strategy_max_lines: int = Field(
+        default=400, ge=1, description="Max changed lines per PR for the size strategy"
+    )
 
     # Strategy Settings
     default_strategy: str = Field(default="semantic", description="Default grouping strategy")
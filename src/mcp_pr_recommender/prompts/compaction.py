@@ -0,0 +1,163 @@
+"""Token-budgeted compaction of file listings for LLM prompts."""
+
+import math
+from collections import Counter
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+
+# Rough chars-per-token ratio for English/code text with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+COMPACT_LISTING_NOTE = (
+    "Files are shown as a directory tree: join each indented name with its parent directories "
+    "to get the full path. A directory line with a file count stands for every file under it; "
+    'put the directory path with a trailing slash (e.g. "src/gen/") in a group\'s "files" to include them all.'
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` without calling a tokenizer service."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _change_summary(added: int, deleted: int) -> str:
+    """Format line stats, flagging files without content changes."""
+    if added == 0 and deleted == 0:
+        return "NO CHANGES"
+    return f"+{added}/-{deleted}"
+
+
+class _TrieNode:
+    """Directory node holding direct files, subdirectories and subtree aggregates."""
+
+    __slots__ = ("children", "files", "count", "added", "deleted", "statuses", "signature")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.files: list[FileStatus] = []
+        self.count = 0
+        self.added = 0
+        self.deleted = 0
+        self.statuses: Counter[str] = Counter()
+        # (status, added, deleted) shared by every file in the subtree, else None
+        self.signature: tuple[str, int, int] | None = None
+
+
+class DirectoryTrie:
+    """Directory trie over changed files used to render compact prompt listings.
+
+    Shared path prefixes are emitted once as indented directory headers, chains
+    of single-child directories are merged into one header, and subtrees whose
+    files all have the same status and line stats collapse into one summary line.
+    """
+
+    def __init__(self, files: list[FileStatus], collapse_min: int = 5) -> None:
+        """Build the trie.
+
+        Args:
+            files: Files to index
+            collapse_min: Minimum subtree size before a homogeneous directory is collapsed
+        """
+        self.collapse_min = collapse_min
+        self.root = _TrieNode()
+        self.depth = 0
+
+        for file in files:
+            parts = file.path.split("/")
+            self.depth = max(self.depth, len(parts) - 1)
+            node = self.root
+            for part in parts[:-1]:
+                node = node.children.setdefault(part, _TrieNode())
+            node.files.append(file)
+
+        self._aggregate(self.root)
+
+    def _aggregate(self, node: _TrieNode) -> None:
+        """Compute subtree counts, line totals and homogeneity bottom-up."""
+        signatures = set()
+        for child in node.children.values():
+            self._aggregate(child)
+            node.count += child.count
+            node.added += child.added
+            node.deleted += child.deleted
+            node.statuses.update(child.statuses)
+            signatures.add(child.signature)
+
+        for file in node.files:
+            node.count += 1
+            node.added += file.lines_added
+            node.deleted += file.lines_deleted
+            node.statuses[file.status_code] += 1
+            signatures.add((file.status_code, file.lines_added, file.lines_deleted))
+
+        node.signature = signatures.pop() if len(signatures) == 1 and None not in signatures else None
+
+    def render(self, max_depth: int | None = None) -> str:
+        """Render the listing, summarizing directories nested deeper than ``max_depth``."""
+        lines: list[str] = []
+        self._render_contents(self.root, 0, max_depth, lines)
+        return "\n".join(lines)
+
+    def _render_contents(self, node: _TrieNode, depth: int, max_depth: int | None, lines: list[str]) -> None:
+        """Render a directory's files (most changed first) followed by its subdirectories."""
+        indent = "  " * depth
+        for file in sorted(node.files, key=lambda f: f.total_changes, reverse=True):
+            name = file.path.rsplit("/", 1)[-1]
+            lines.append(f"{indent}{name} {file.status_code} {_change_summary(file.lines_added, file.lines_deleted)}")
+
+        for name in sorted(node.children):
+            self._render_directory(name, node.children[name], depth, max_depth, lines)
+
+    def _render_directory(
+        self, name: str, node: _TrieNode, depth: int, max_depth: int | None, lines: list[str]
+    ) -> None:
+        """Render one directory as a header, a homogeneous summary, or a depth-limited summary."""
+        # Merge chains of directories that contain nothing but a single subdirectory
+        while not node.files and len(node.children) == 1:
+            child_name, node = next(iter(node.children.items()))
+            name = f"{name}/{child_name}"
+
+        indent = "  " * depth
+        if node.signature is not None and node.count >= self.collapse_min:
+            status, added, deleted = node.signature
+            lines.append(f"{indent}{name}/ ({node.count} files, all {status} {_change_summary(added, deleted)})")
+        elif max_depth is not None and depth >= max_depth:
+            statuses = ", ".join(f"{count} {status}" for status, count in node.statuses.most_common())
+            lines.append(
+                f"{indent}{name}/ ({node.count} files, {_change_summary(node.added, node.deleted)}; {statuses})"
+            )
+        else:
+            lines.append(f"{indent}{name}/")
+            self._render_contents(node, depth + 1, max_depth, lines)
+
+
+def compact_file_listing(files: list[FileStatus], token_budget: int, collapse_min: int = 5) -> str:
+    """Render ``files`` as a compact directory tree that fits ``token_budget``.
+
+    The full tree is tried first; if it is over budget, directories are
+    summarized from the deepest level upwards. As a last resort the listing is
+    cut off with a note about the omitted entries.
+    """
+    trie = DirectoryTrie(files, collapse_min=collapse_min)
+    listing = trie.render()
+
+    max_depth = trie.depth - 1
+    while estimate_tokens(listing) > token_budget and max_depth >= 0:
+        listing = trie.render(max_depth=max_depth)
+        max_depth -= 1
+
+    if estimate_tokens(listing) <= token_budget:
+        return listing
+
+    lines = listing.split("\n")
+    kept: list[str] = []
+    # Reserve room for the truncation note itself
+    used = estimate_tokens(f"... ({len(lines)} more entries omitted to fit the token budget)") + 1
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if used + cost > token_budget:
+            break
+        kept.append(line)
+        used += cost
+    kept.append(f"... ({len(lines) - len(kept)} more entries omitted to fit the token budget)")
+    return "\n".join(kept)
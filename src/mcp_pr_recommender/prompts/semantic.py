@@ -99,3 +99,38 @@ def get_grouping_user_prompt(
     or should they be in separate cleanup PRs?
 
 Please group these files into the optimal number of logical, atomic Pull Requests."""
+
+
+def get_incremental_assignment_system_prompt() -> str:
+    """System prompt for assigning newly changed files to an existing PR grouping."""
+    return """You are an expert software engineer maintaining an existing plan of atomic Pull Requests.
+
+A developer has changed a few more files since the plan was made. For EACH listed file decide whether it
+belongs in one of the existing PR groups or needs a new group. Prefer existing groups when the file is
+clearly part of the same logical change; create a new group only for genuinely unrelated work.
+
+OUTPUT FORMAT (JSON):
+{
+  "assignments": [
+    {
+      "file": "src/module/file.py",
+      "group_id": "existing_group_id_or_new_group_id",
+      "new_group": false,
+      "category": "fix|feature|refactor|config|test|docs|chore",
+      "reasoning": "Why the file belongs there"
+    }
+  ]
+}
+
+Every listed file must appear exactly once. Use the exact group ids shown for existing groups."""
+
+
+def get_incremental_assignment_user_prompt(group_summaries: str, file_list: str) -> str:
+    """User prompt listing the existing groups and the files that need a group."""
+    return f"""**Existing PR groups:**
+{group_summaries}
+
+**Files that need a group:**
+{file_list}
+
+Assign each file to an existing group or a new group."""
@@ -5,13 +5,35 @@ from typing import Any
 
 from fastmcp import Context, FastMCP
 
-from mcp_pr_recommender.tools import (
-    FeasibilityAnalyzerTool,
-    PRRecommenderTool,
-    StrategyManagerTool,
-    ValidatorTool,
-)
 from shared.base.server import BaseMCPServer
+from shared.base.services import LazyServices
+
+# Tool classes are imported by their factories: PRRecommenderTool pulls in the
+# grouping engine and the LLM client, which dominate cold start
+
+
+def _pr_generator(_services: LazyServices) -> Any:
+    from mcp_pr_recommender.tools.pr_recommender_tool import PRRecommenderTool
+
+    return PRRecommenderTool()
+
+
+def _feasibility_analyzer(_services: LazyServices) -> Any:
+    from mcp_pr_recommender.tools.feasibility_analyzer_tool import FeasibilityAnalyzerTool
+
+    return FeasibilityAnalyzerTool()
+
+
+def _strategy_manager(_services: LazyServices) -> Any:
+    from mcp_pr_recommender.tools.strategy_manager_tool import StrategyManagerTool
+
+    return StrategyManagerTool()
+
+
+def _validator(_services: LazyServices) -> Any:
+    from mcp_pr_recommender.tools.validator_tool import ValidatorTool
+
+    return ValidatorTool()
 
 
 class PRRecommenderServer(BaseMCPServer):
@@ -55,47 +77,21 @@ class PRRecommenderServer(BaseMCPServer):
             """
 
     async def initialize_services(self) -> dict[str, Any]:
-        """Initialize recommender-specific services."""
-        self.logger.info("Initializing services...")
-
-        try:
-            pr_generator = PRRecommenderTool()
-            self.logger.info("PRRecommenderTool initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize PRRecommenderTool: {e}")
-            raise
-
-        try:
-            feasibility_analyzer = FeasibilityAnalyzerTool()
-            self.logger.info("FeasibilityAnalyzerTool initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize FeasibilityAnalyzerTool: {e}")
-            raise
-
-        try:
-            strategy_manager = StrategyManagerTool()
-            self.logger.info("StrategyManagerTool initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize StrategyManagerTool: {e}")
-            raise
-
-        try:
-            validator = ValidatorTool()
-            self.logger.info("ValidatorTool initialized")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize ValidatorTool: {e}")
-            raise
-
-        # Create services dict for dependency injection
-        services = {
-            "pr_generator": pr_generator,
-            "feasibility_analyzer": feasibility_analyzer,
-            "strategy_manager": strategy_manager,
-            "validator": validator,
-        }
-
-        self.logger.info("All services initialized successfully")
-        return services
+        """Register recommender services; each is built, with its imports, on first use."""
+        return LazyServices(
+            {
+                "pr_generator": _pr_generator,
+                "feasibility_analyzer": _feasibility_analyzer,
+                "strategy_manager": _strategy_manager,
+                "validator": _validator,
+            }
+        )
+
+    async def shutdown_services(self) -> None:
+        """Close the pooled LLM connections."""
+        from mcp_pr_recommender.services.llm_backend import close_shared_http_client
+
+        await close_shared_http_client()
 
     async def register_tools(self, mcp: FastMCP, services: dict[str, Any]) -> None:
         """Register recommender-specific tools as MCP functions."""
@@ -109,12 +105,17 @@ class PRRecommenderServer(BaseMCPServer):
                 analysis_data: dict[str, Any],
                 strategy: str = "semantic",
                 max_files_per_pr: int = 8,
+                incremental: bool = False,
             ) -> dict[str, Any]:
-                """Generate PR recommendations from git analysis data."""
+                """Generate PR recommendations from git analysis data.
+
+                Set incremental=True to reuse the previous recommendation for the same
+                repository and only re-analyze files changed since then.
+                """
                 await ctx.info("Generating PR recommendations")
                 try:
                     result = await services["pr_generator"].generate_recommendations(
-                        analysis_data, strategy, max_files_per_pr
+                        analysis_data, strategy, max_files_per_pr, incremental, ctx=ctx
                     )
                     return result  # type: ignore[no-any-return]
                 except Exception as e:
@@ -2,9 +2,14 @@
 from .atomicity_validator import AtomicityValidator
 from .grouping_engine import GroupingEngine
 from .semantic_analyzer import SemanticAnalyzer
+from .strategies import GroupingStrategy, available_strategies, get_strategy, register_strategy
 
 __all__ = [
     "AtomicityValidator",
     "GroupingEngine",
+    "GroupingStrategy",
     "SemanticAnalyzer",
+    "available_strategies",
+    "get_strategy",
+    "register_strategy",
 ]
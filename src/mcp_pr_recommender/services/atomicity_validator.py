@@ -2,8 +2,10 @@
 
 from pathlib import Path
 
+from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_pr_recommender.config import settings as get_pr_recommender_settings
 from mcp_pr_recommender.models.recommendations import ChangeGroup
+from mcp_pr_recommender.services.group_splitter import BalancedSplitter
 from shared.utils.logging import get_logger
 
 
@@ -40,7 +42,7 @@ class AtomicityValidator:
 
         # Total changes constraint
         total_changes = sum(f.total_changes for f in group.files)
-        if total_changes > 1000:  # Configurable threshold
+        if total_changes > get_pr_recommender_settings().max_lines_per_pr:
             self.logger.debug(f"Group {group.id} too many changes: {total_changes}")
             return False
 
@@ -131,25 +133,15 @@ class AtomicityValidator:
         return self._split_by_size(group)
 
     def _split_by_directory(self, group: ChangeGroup) -> list[ChangeGroup]:
-        """Split group by directory structure."""
-        from mcp_local_repo_analyzer.models.files import FileStatus
-
-        dir_groups: dict[str, list[FileStatus]] = {}
-
-        for file in group.files:
-            dir_path = str(Path(file.path).parent)
-            if dir_path not in dir_groups:
-                dir_groups[dir_path] = []
-            dir_groups[dir_path].append(file)
-
+        """Split group into balanced chunks that keep top-level directories apart."""
         split_groups = []
-        for i, (directory, files) in enumerate(dir_groups.items()):
+        for i, files in enumerate(self._splitter(locality_depth=1).split(group.files)):
             split_group = ChangeGroup(
                 id=f"{group.id}_split_{i}",
                 files=files,
                 category=group.category,
                 confidence=group.confidence * 0.9,  # Slightly lower confidence after split
-                reasoning=f"Split from {group.id}: {directory}",
+                reasoning=f"Split from {group.id}: {self._common_directory(files)}",
                 semantic_similarity=group.semantic_similarity,
             )
             split_groups.append(split_group)
@@ -158,8 +150,6 @@ class AtomicityValidator:
 
     def _split_by_concern(self, group: ChangeGroup) -> list[ChangeGroup]:
         """Split group by separating different concerns."""
-        from mcp_local_repo_analyzer.models.files import FileStatus
-
         concerns: dict[str, list[FileStatus]] = {
             "source": [],
             "test": [],
@@ -200,16 +190,11 @@ class AtomicityValidator:
         return split_groups
 
     def _split_by_size(self, group: ChangeGroup) -> list[ChangeGroup]:
-        """Split group by size when it's too large."""
-        files = group.files
-        max_files = get_pr_recommender_settings().max_files_per_pr
-
+        """Split group into chunks balanced by files, changed lines and review time."""
         split_groups = []
-        for i in range(0, len(files), max_files):
-            chunk_files = files[i : i + max_files]
-
+        for i, chunk_files in enumerate(self._splitter(locality_depth=0).split(group.files)):
             split_group = ChangeGroup(
-                id=f"{group.id}_chunk_{i // max_files}",
+                id=f"{group.id}_chunk_{i}",
                 files=chunk_files,
                 category=group.category,
                 confidence=group.confidence * 0.8,  # Lower confidence for size-based split
@@ -219,3 +204,23 @@ class AtomicityValidator:
             split_groups.append(split_group)
 
         return split_groups
+
+    def _splitter(self, locality_depth: int) -> BalancedSplitter:
+        """Create a splitter bounded by the configured PR limits."""
+        config = get_pr_recommender_settings()
+        return BalancedSplitter(
+            max_files=config.max_files_per_pr,
+            max_lines=config.max_lines_per_pr,
+            max_review_minutes=config.max_review_minutes_per_pr,
+            locality_depth=locality_depth,
+        )
+
+    def _common_directory(self, files: list[FileStatus]) -> str:
+        """Deepest directory shared by all files ("." for the repository root)."""
+        parents = [Path(f.path).parent.parts for f in files]
+        common = []
+        for parts in zip(*parents, strict=False):
+            if len(set(parts)) != 1:
+                break
+            common.append(parts[0])
+        return "/".join(common) or "."
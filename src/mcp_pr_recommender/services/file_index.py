@@ -0,0 +1,66 @@
+"""Per-request path index over changed files."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+
+
+class FileIndex:
+    """Path-keyed index of the files of one recommendation request.
+
+    Built once per request and shared by recommendation post-processing so
+    that lookups by path and membership tests are O(1) instead of scanning the
+    full file list. When a path occurs more than once the first file wins.
+    """
+
+    def __init__(self, files: Iterable[FileStatus]) -> None:
+        """Index ``files`` by path."""
+        self.by_path: dict[str, FileStatus] = {}
+        for file in files:
+            self.by_path.setdefault(file.path, file)
+        self._untracked_paths: frozenset[str] | None = None
+
+    @classmethod
+    def from_analysis(cls, analysis: OutstandingChangesAnalysis) -> FileIndex:
+        """Wrap the path index cached on ``analysis`` instead of building a second one."""
+        index = cls(())
+        index.by_path = analysis.changed_files_by_path
+        return index
+
+    def __contains__(self, path: object) -> bool:
+        """Check whether a path is part of the request."""
+        return path in self.by_path
+
+    def __len__(self) -> int:
+        """Number of distinct paths."""
+        return len(self.by_path)
+
+    def __iter__(self) -> Iterator[FileStatus]:
+        """Iterate over the indexed files in insertion order."""
+        return iter(self.by_path.values())
+
+    def get(self, path: str) -> FileStatus | None:
+        """Return the file for ``path``, or None if it is not part of the request."""
+        return self.by_path.get(path)
+
+    def select(self, paths: Iterable[str]) -> list[FileStatus]:
+        """Return the files for ``paths`` in the given order, skipping unknown paths."""
+        by_path = self.by_path
+        return [by_path[path] for path in paths if path in by_path]
+
+    @property
+    def untracked_paths(self) -> frozenset[str]:
+        """Paths of untracked files, computed on first use."""
+        if self._untracked_paths is None:
+            self._untracked_paths = frozenset(
+                path for path, file in self.by_path.items() if file.change_type == "untracked"
+            )
+        return self._untracked_paths
+
+    def count_untracked(self, paths: Iterable[str]) -> int:
+        """Count how many of ``paths`` are untracked files."""
+        untracked = self.untracked_paths
+        return sum(1 for path in paths if path in untracked)
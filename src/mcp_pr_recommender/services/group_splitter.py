@@ -0,0 +1,206 @@
+"""Balanced splitting of oversized change groups.
+
+Splitting is treated as a multi-constraint bin-packing problem: every resulting
+PR must stay within a file limit, a changed-line limit and a review-time limit.
+Directory locality is a soft constraint: files of one directory are packed as a
+unit when they fit, and units are preferably placed next to files that share
+the deepest common directory.
+"""
+
+from collections import deque
+from itertools import islice
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+
+# Bins checked per directory prefix before giving up and opening a new bin
+_SCAN_LIMIT = 32
+
+
+def estimate_review_time(files_count: int, total_lines: int) -> int:
+    """Estimate review minutes: 3 per file plus 30 seconds per 10 lines, clamped to 10-120."""
+    base_time = files_count * 3
+    line_time = total_lines // 10 * 0.5
+    return max(10, min(120, int(base_time + line_time)))
+
+
+def _shared_depth(a: tuple[str, ...], b: tuple[str, ...]) -> int:
+    """Number of leading directory components two paths share."""
+    depth = 0
+    for x, y in zip(a, b, strict=False):
+        if x != y:
+            break
+        depth += 1
+    return depth
+
+
+class _Item:
+    """Files placed together: a whole directory, or one file of an oversized directory."""
+
+    __slots__ = ("directory", "files", "lines")
+
+    def __init__(self, directory: tuple[str, ...], files: list[FileStatus]) -> None:
+        self.directory = directory
+        self.files = files
+        self.lines = sum(f.total_changes for f in files)
+
+
+class _Bin:
+    """One output PR with running totals and the common directory of its files."""
+
+    __slots__ = ("items", "files", "lines", "directory")
+
+    def __init__(self, item: _Item) -> None:
+        self.items = [item]
+        self.files = len(item.files)
+        self.lines = item.lines
+        self.directory = item.directory
+
+    def add(self, item: _Item) -> None:
+        self.items.append(item)
+        self.files += len(item.files)
+        self.lines += item.lines
+        self.directory = self.directory[: _shared_depth(self.directory, item.directory)]
+
+    def remove(self, item: _Item) -> None:
+        self.items.remove(item)
+        self.files -= len(item.files)
+        self.lines -= item.lines
+
+    @property
+    def cost(self) -> int:
+        return estimate_review_time(self.files, self.lines)
+
+
+class BalancedSplitter:
+    """Splits a file list into PR-sized chunks balancing files, lines and review time.
+
+    Placement is first-fit decreasing over directory units, indexed by
+    directory prefix so each unit only looks at bins near it in the tree. A
+    local-improvement pass then moves units from the most expensive bins to
+    the cheapest compatible ones while that lowers the larger review time.
+    """
+
+    def __init__(
+        self,
+        max_files: int,
+        max_lines: int,
+        max_review_minutes: int = 120,
+        locality_depth: int = 1,
+        improvement_passes: int = 3,
+    ) -> None:
+        """Initialize the splitter.
+
+        Args:
+            max_files: Maximum files per chunk
+            max_lines: Maximum changed lines per chunk (single larger files get their own chunk)
+            max_review_minutes: Maximum estimated review time per chunk
+            locality_depth: Minimum number of shared leading directories for files of
+                different directories to share a chunk (0 allows any mix)
+            improvement_passes: Rebalancing passes after the initial packing
+        """
+        self.max_files = max(1, max_files)
+        self.max_lines = max_lines
+        self.max_review_minutes = max_review_minutes
+        self.locality_depth = locality_depth
+        self.improvement_passes = improvement_passes
+
+    def split(self, files: list[FileStatus]) -> list[list[FileStatus]]:
+        """Split ``files`` into chunks, each sorted by path."""
+        bins = self._pack(self._items(files))
+        self._improve(bins)
+        return [sorted((f for item in b.items for f in item.files), key=lambda f: f.path) for b in bins if b.items]
+
+    def _fits(self, files: int, lines: int) -> bool:
+        # Inlined estimate_review_time: the clamp to 10-120 only matters at the extremes
+        return (
+            files <= self.max_files
+            and lines <= self.max_lines
+            and (self.max_review_minutes >= 120 or files * 3 + lines // 10 * 0.5 < self.max_review_minutes + 1)
+        )
+
+    def _compatible(self, a: tuple[str, ...], b: tuple[str, ...]) -> bool:
+        return a == b or _shared_depth(a, b) >= self.locality_depth
+
+    def _items(self, files: list[FileStatus]) -> list[_Item]:
+        """Build directory units, exploding directories too large for a single chunk."""
+        by_directory: dict[tuple[str, ...], list[FileStatus]] = {}
+        for file in files:
+            by_directory.setdefault(tuple(file.path.split("/")[:-1]), []).append(file)
+
+        items = []
+        for directory, dir_files in by_directory.items():
+            unit = _Item(directory, dir_files)
+            if self._fits(len(dir_files), unit.lines):
+                items.append(unit)
+            else:
+                items.extend(_Item(directory, [f]) for f in dir_files)
+
+        items.sort(key=lambda i: (-i.lines, -len(i.files), i.directory, i.files[0].path))
+        return items
+
+    def _prefixes(self, directory: tuple[str, ...]) -> list[tuple[str, ...]]:
+        """Directory prefixes from deepest to the shallowest allowed by ``locality_depth``."""
+        shallowest = min(self.locality_depth, len(directory))
+        return [directory[:k] for k in range(len(directory), shallowest - 1, -1)]
+
+    def _pack(self, items: list[_Item]) -> list[_Bin]:
+        """First-fit decreasing, preferring bins that share the deepest directory."""
+        bins: list[_Bin] = []
+        open_by_prefix: dict[tuple[str, ...], deque[_Bin]] = {}
+
+        for item in items:
+            target = None
+            for prefix in self._prefixes(item.directory):
+                candidates = open_by_prefix.get(prefix)
+                if not candidates:
+                    continue
+                # Bins fill up roughly in creation order, so full ones are dropped from the front
+                while candidates and not self._fits(candidates[0].files + 1, candidates[0].lines):
+                    candidates.popleft()
+                # Bins indexed under a prefix this deep are always locality-compatible
+                for candidate in islice(candidates, _SCAN_LIMIT):
+                    if self._fits(candidate.files + len(item.files), candidate.lines + item.lines):
+                        target = candidate
+                        break
+                if target is not None:
+                    break
+
+            if target is not None:
+                target.add(item)
+            else:
+                new_bin = _Bin(item)
+                bins.append(new_bin)
+                for prefix in self._prefixes(item.directory):
+                    open_by_prefix.setdefault(prefix, deque()).append(new_bin)
+
+        return bins
+
+    def _improve(self, bins: list[_Bin]) -> None:
+        """Move units from expensive to cheap bins while that lowers the pair's maximum cost."""
+        for _ in range(self.improvement_passes):
+            moved = False
+            cheapest = sorted(bins, key=lambda b: b.cost)
+            floor = cheapest[0].cost if cheapest else 0
+            for heavy in reversed(cheapest):
+                heavy_cost = heavy.cost
+                if heavy_cost <= floor:
+                    break
+                if len(heavy.items) < 2:
+                    continue
+                item = min(heavy.items, key=lambda i: (i.lines, len(i.files)))
+                heavy_after = estimate_review_time(heavy.files - len(item.files), heavy.lines - item.lines)
+                for light in cheapest[:_SCAN_LIMIT]:
+                    if light is heavy or light.cost >= heavy_cost:
+                        break
+                    light_files, light_lines = light.files + len(item.files), light.lines + item.lines
+                    if (
+                        self._compatible(light.directory, item.directory)
+                        and self._fits(light_files, light_lines)
+                        and max(heavy_after, estimate_review_time(light_files, light_lines)) < heavy_cost
+                    ):
+                        heavy.remove(item)
+                        light.add(item)
+                        moved = True
+                        break
+            if not moved:
+                break
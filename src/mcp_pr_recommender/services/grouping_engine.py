@@ -1,5 +1,6 @@
 """Simple grouping engine that orchestrates the PR recommendation process."""
 
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -8,7 +9,10 @@ from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
 from mcp_pr_recommender.config import settings
 from mcp_pr_recommender.models.recommendations import ChangeGroup, PRRecommendation, PRStrategy
 from mcp_pr_recommender.services.atomicity_validator import AtomicityValidator
+from mcp_pr_recommender.services.file_index import FileIndex
+from mcp_pr_recommender.services.group_splitter import BalancedSplitter, estimate_review_time
 from mcp_pr_recommender.services.semantic_analyzer import SemanticAnalyzer
+from mcp_pr_recommender.services.strategies import get_strategy
 from shared.utils.logging import get_logger
 
 
@@ -26,14 +30,24 @@ class GroupingEngine:
     ) -> PRStrategy:
         """Generate PR recommendations from git analysis."""
         self.logger.info(f"Generating PR recommendations using {strategy_name} strategy")
-        self.logger.info(f"Input: {len(analysis.all_changed_files)} files to analyze")
-
-        # Step 1: Simple logical grouping
-        initial_groups = self._create_simple_groups(analysis.all_changed_files)
+        changed_files = analysis.all_changed_files
+        file_index = FileIndex.from_analysis(analysis)
+        self.logger.info(f"Input: {len(changed_files)} files to analyze")
+
+        # Step 1: Simple logical grouping, or a registered deterministic strategy
+        grouping_strategy = get_strategy(strategy_name)
+        if grouping_strategy is not None:
+            clean_files = [f for f in changed_files if not self._should_exclude_file(f.path)]
+            initial_groups = grouping_strategy.group(clean_files, analysis, settings().max_files_per_pr)
+        else:
+            initial_groups = self._create_simple_groups(changed_files)
         self.logger.info(f"Initial grouping: {len(initial_groups)} groups")
 
         # Step 2: Skip semantic analysis if groups are already good
-        if len(initial_groups) <= 5 and settings().enable_llm_analysis and strategy_name == "semantic":
+        if grouping_strategy is not None:
+            refined_groups = initial_groups
+            self.logger.info(f"Using {strategy_name} strategy groups without semantic analysis")
+        elif len(initial_groups) <= 5 and settings().enable_llm_analysis and strategy_name == "semantic":
             # Instead of refine_groups, use the main analysis method
             file_statuses = [file for group in initial_groups for file in group.files]
             refined_recommendations = await self.semantic_analyzer.analyze_and_generate_prs(file_statuses, analysis)
@@ -41,7 +55,7 @@ class GroupingEngine:
             refined_groups = [
                 ChangeGroup(
                     id=rec.id,
-                    files=[f for f in analysis.all_changed_files if f.path in rec.files],
+                    files=file_index.select(rec.files),
                     category=rec.labels[0] if rec.labels else "other",
                     reasoning=rec.reasoning,
                     confidence=0.8,
@@ -69,7 +83,7 @@ class GroupingEngine:
                 "initial_groups": len(initial_groups),
                 "semantic_refined": len(refined_groups),
                 "final_groups": len(validated_groups),
-                "grouping_strategy": "simple_logical",
+                "grouping_strategy": strategy_name if grouping_strategy is not None else "simple_logical",
                 "settings_used": {
                     "max_files_per_pr": settings().max_files_per_pr,
                     "similarity_threshold": settings().similarity_threshold,
@@ -107,7 +121,8 @@ class GroupingEngine:
             )
 
         # Group 2: Project configuration (second priority)
-        config_files = [f for f in clean_files if self._is_project_config(f.path) and f not in source_files]
+        assigned = {f.path for f in source_files}
+        config_files = [f for f in clean_files if self._is_project_config(f.path) and f.path not in assigned]
         if config_files:
             groups.append(
                 ChangeGroup(
@@ -121,7 +136,8 @@ class GroupingEngine:
             )
 
         # Group 3: Tests (third priority)
-        test_files = [f for f in clean_files if self._is_test_file(f.path) and f not in source_files + config_files]
+        assigned.update(f.path for f in config_files)
+        test_files = [f for f in clean_files if self._is_test_file(f.path) and f.path not in assigned]
         if test_files:
             groups.append(
                 ChangeGroup(
@@ -135,11 +151,8 @@ class GroupingEngine:
             )
 
         # Group 4: Documentation
-        doc_files = [
-            f
-            for f in clean_files
-            if self._is_documentation(f.path) and f not in source_files + config_files + test_files
-        ]
+        assigned.update(f.path for f in test_files)
+        doc_files = [f for f in clean_files if self._is_documentation(f.path) and f.path not in assigned]
         if doc_files:
             groups.append(
                 ChangeGroup(
@@ -153,8 +166,8 @@ class GroupingEngine:
             )
 
         # Group 5: Everything else (lowest priority)
-        processed_files = source_files + config_files + test_files + doc_files
-        other_files = [f for f in clean_files if f not in processed_files]
+        assigned.update(f.path for f in doc_files)
+        other_files = [f for f in clean_files if f.path not in assigned]
         if other_files:
             groups.append(
                 ChangeGroup(
@@ -284,29 +297,26 @@ class GroupingEngine:
         return any(path.endswith(ext) for ext in doc_extensions) or any(doc_dir in path_lower for doc_dir in doc_dirs)
 
     def _split_large_group_simple(self, group: ChangeGroup) -> list[ChangeGroup]:
-        """Split a large group by directory."""
-        files = group.files
-
-        # Group by directory
-        dir_groups: dict[str, list[FileStatus]] = {}
-        for file in files:
-            parent_dir = str(Path(file.path).parent)
-            if parent_dir not in dir_groups:
-                dir_groups[parent_dir] = []
-            dir_groups[parent_dir].append(file)
-
-        # Create groups from directories
+        """Split a large group into balanced, directory-local chunks."""
+        splitter = BalancedSplitter(
+            max_files=settings().max_files_per_pr,
+            max_lines=settings().max_lines_per_pr,
+            max_review_minutes=settings().max_review_minutes_per_pr,
+        )
+
+        # Create groups from balanced chunks
         split_groups = []
-        for i, (directory, dir_files) in enumerate(dir_groups.items()):
+        for i, chunk_files in enumerate(splitter.split(group.files)):
+            directory = os.path.commonpath([str(Path(f.path).parent) for f in chunk_files]) or "."
             dir_name = Path(directory).name if directory != "." else "root"
 
             split_groups.append(
                 ChangeGroup(
                     id=f"{group.id}_dir_{i}",
-                    files=dir_files,
+                    files=chunk_files,
                     category=group.category,
                     confidence=group.confidence,
-                    reasoning=f"{group.reasoning.split('(')[0].strip()} in {dir_name} directory ({len(dir_files)} files)",
+                    reasoning=f"{group.reasoning.split('(')[0].strip()} in {dir_name} directory ({len(chunk_files)} files)",
                     semantic_similarity=group.semantic_similarity,
                 )
             )
@@ -507,14 +517,7 @@ class GroupingEngine:
 
     def _estimate_review_time(self, files_count: int, total_lines: int) -> int:
         """Realistic review time estimation."""
-        # Base: 3 minutes per file + 30 seconds per 10 lines
-        base_time = files_count * 3
-        line_time = total_lines // 10 * 0.5
-
-        estimated = int(base_time + line_time)
-
-        # Minimum 10 minutes, maximum 120 minutes for sanity
-        return max(10, min(120, estimated))
+        return estimate_review_time(files_count, total_lines)
 
     def _generate_labels(self, group: ChangeGroup) -> list[str]:
         """Generate useful labels."""
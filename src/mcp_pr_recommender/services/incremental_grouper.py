@@ -0,0 +1,259 @@
+"""Incremental re-grouping of changed files against a previous PR strategy."""
+
+import json
+from pathlib import PurePosixPath
+from typing import Any
+
+from fastmcp import Context
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_pr_recommender.config import settings
+from mcp_pr_recommender.models.recommendations import ChangeGroup, PRStrategy
+from mcp_pr_recommender.prompts.semantic import (
+    get_incremental_assignment_system_prompt,
+    get_incremental_assignment_user_prompt,
+)
+from mcp_pr_recommender.services.semantic_analyzer import SemanticAnalyzer
+from shared.utils.logging import get_logger
+
+
+def file_fingerprint(file: FileStatus) -> tuple[str, int, int, bool, str | None]:
+    """Return the attributes that decide whether a file changed since the last run."""
+    return (file.status_code, file.lines_added, file.lines_deleted, file.is_binary, file.old_path)
+
+
+class FileDelta:
+    """Difference between the files of a previous strategy and the current change set."""
+
+    def __init__(self) -> None:
+        """Initialize an empty delta."""
+        # group id -> files carried over from the previous strategy (unchanged or renamed)
+        self.kept: dict[str, list[FileStatus]] = {}
+        self.pending: list[FileStatus] = []
+        # path -> previous group id for pending files that were grouped before
+        self.previous_group: dict[str, str] = {}
+        self.unchanged = 0
+        self.changed = 0
+        self.renamed = 0
+        self.added = 0
+        self.removed: list[str] = []
+
+    @property
+    def is_empty(self) -> bool:
+        """True when nothing needs to be (re)assigned or dropped."""
+        return not self.pending and not self.removed and not self.renamed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the delta for tool responses."""
+        return {
+            "unchanged_files": self.unchanged,
+            "changed_files": self.changed,
+            "renamed_files": self.renamed,
+            "new_files": self.added,
+            "removed_files": len(self.removed),
+        }
+
+
+class IncrementalGrouper:
+    """Re-groups only the files that changed since the previous recommendation.
+
+    Unchanged files stay in their groups, renamed files follow their old path,
+    removed files are dropped, and only new or changed files are sent to the
+    LLM as an "assign to an existing group or create a new one" query.
+    """
+
+    def __init__(self, semantic_analyzer: SemanticAnalyzer) -> None:
+        """Initialize with the analyzer used for LLM access and full re-grouping."""
+        self.semantic_analyzer = semantic_analyzer
+        self.logger = get_logger(__name__)
+
+    def compute_delta(self, previous_groups: list[ChangeGroup], files: list[FileStatus]) -> FileDelta:
+        """Diff the current files against the files of the previous groups."""
+        previous: dict[str, tuple[str, FileStatus]] = {}
+        for group in previous_groups:
+            for file in group.files:
+                previous[file.path] = (group.id, file)
+
+        current_paths = {f.path for f in files}
+        consumed: set[str] = set()
+        delta = FileDelta()
+        delta.kept = {group.id: [] for group in previous_groups}
+
+        for file in files:
+            match = previous.get(file.path)
+            if match is not None:
+                group_id, old_file = match
+                consumed.add(file.path)
+                if file_fingerprint(old_file) == file_fingerprint(file):
+                    delta.kept[group_id].append(file)
+                    delta.unchanged += 1
+                else:
+                    delta.pending.append(file)
+                    delta.previous_group[file.path] = group_id
+                    delta.changed += 1
+            elif file.old_path and file.old_path in previous and file.old_path not in current_paths:
+                group_id, _ = previous[file.old_path]
+                consumed.add(file.old_path)
+                delta.kept[group_id].append(file)
+                delta.renamed += 1
+            else:
+                delta.pending.append(file)
+                delta.added += 1
+
+        delta.removed = [path for path in previous if path not in consumed]
+        return delta
+
+    async def regroup(
+        self,
+        previous: PRStrategy,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis,
+        ctx: Context | None = None,
+    ) -> tuple[list[ChangeGroup], dict[str, Any]]:
+        """Produce updated groups for ``files`` starting from a previous strategy.
+
+        Previous groups are matched by id, so a strategy whose group ids are not
+        unique is re-grouped from scratch, as is one where most files changed.
+        ``ctx`` is passed on to the full re-grouping.
+
+        Returns:
+            Tuple of (groups, stats) where stats describes the delta and how it was resolved
+        """
+        clean_files = self.semantic_analyzer.filter_files(files)
+        delta = self.compute_delta(previous.change_groups, clean_files)
+        stats: dict[str, Any] = {**delta.to_dict(), "llm_assigned": 0, "heuristic_assigned": 0, "full_regroup": False}
+
+        self.logger.info(
+            f"Incremental delta: {delta.unchanged} unchanged, {delta.changed} changed, "
+            f"{delta.renamed} renamed, {delta.added} new, {len(delta.removed)} removed"
+        )
+
+        group_ids = [group.id for group in previous.change_groups]
+        if len(set(group_ids)) != len(group_ids):
+            self.logger.info("Previous groups share ids, re-grouping all files")
+            stats["full_regroup"] = True
+            return await self.semantic_analyzer.group_files(clean_files, analysis, ctx), stats
+
+        if clean_files and len(delta.pending) > len(clean_files) * settings().incremental_full_regroup_ratio:
+            self.logger.info("Delta too large for incremental update, re-grouping all files")
+            stats["full_regroup"] = True
+            return await self.semantic_analyzer.group_files(clean_files, analysis, ctx), stats
+
+        groups = {
+            group.id: group.model_copy(update={"files": delta.kept[group.id]}) for group in previous.change_groups
+        }
+
+        if delta.pending:
+            unassigned = await self._llm_assign(delta.pending, groups)
+            stats["llm_assigned"] = len(delta.pending) - len(unassigned)
+            if unassigned:
+                self._heuristic_assign(unassigned, groups, delta.previous_group)
+                stats["heuristic_assigned"] = len(unassigned)
+
+        return [group for group in groups.values() if group.files], stats
+
+    async def _llm_assign(self, pending: list[FileStatus], groups: dict[str, ChangeGroup]) -> list[FileStatus]:
+        """Ask the LLM to place pending files; returns the files it did not assign."""
+        summaries = []
+        for group in groups.values():
+            if not group.files:
+                continue
+            sample = ", ".join(f.path for f in group.files[:5])
+            more = f" (+{len(group.files) - 5} more)" if len(group.files) > 5 else ""
+            summaries.append(f"- {group.id} [{group.category}]: {sample}{more}")
+
+        file_list = "\n".join(
+            f"- {f.path} ({f.status_description}) +{f.lines_added}/-{f.lines_deleted} lines" for f in pending
+        )
+
+        try:
+            response = await self.semantic_analyzer.backend.create_chat_completion(
+                model=settings().openai_model,
+                messages=[
+                    {"role": "system", "content": get_incremental_assignment_system_prompt()},
+                    {
+                        "role": "user",
+                        "content": get_incremental_assignment_user_prompt("\n".join(summaries), file_list),
+                    },
+                ],
+                max_tokens=settings().max_tokens_per_request,
+                temperature=0.1,
+            )
+            content = response.choices[0].message.content
+            if content is None:
+                raise ValueError("LLM returned None content")
+            assignments = self._parse_assignments(content)
+        except Exception as e:
+            self.logger.warning(f"LLM assignment failed, using heuristics: {e}")
+            return pending
+
+        pending_by_path = {f.path: f for f in pending}
+        for assignment in assignments:
+            file = pending_by_path.pop(str(assignment.get("file", "")), None)
+            group_id = assignment.get("group_id")
+            if file is None or not group_id:
+                continue
+
+            group_id = str(group_id)
+            if group_id in groups:
+                groups[group_id].files.append(file)
+            else:
+                groups[group_id] = ChangeGroup(
+                    id=group_id,
+                    files=[file],
+                    category=assignment.get("category", "chore"),
+                    confidence=0.8,
+                    reasoning=assignment.get("reasoning", "LLM created a new group for this change"),
+                    semantic_similarity=0.8,
+                )
+
+        return list(pending_by_path.values())
+
+    def _parse_assignments(self, response: str) -> list[dict[str, Any]]:
+        """Extract the assignment list from an LLM response."""
+        start = response.find("{")
+        end = response.rfind("}") + 1
+        if start == -1 or end == 0:
+            raise ValueError("No JSON found in response")
+
+        data = json.loads(response[start:end])
+        assignments = data.get("assignments")
+        if not isinstance(assignments, list):
+            raise ValueError("No 'assignments' list in response")
+        return [a for a in assignments if isinstance(a, dict)]
+
+    def _heuristic_assign(
+        self,
+        files: list[FileStatus],
+        groups: dict[str, ChangeGroup],
+        previous_group: dict[str, str],
+    ) -> None:
+        """Place files without an LLM answer by previous group or deepest shared directory."""
+        # Map every directory prefix to the first group containing a file under it
+        dir_owner: dict[PurePosixPath, str] = {}
+        for group in groups.values():
+            for file in group.files:
+                for parent in PurePosixPath(file.path).parents:
+                    if parent != PurePosixPath("."):
+                        dir_owner.setdefault(parent, group.id)
+
+        leftovers = []
+        for file in files:
+            group_id = previous_group.get(file.path)
+            if group_id is None:
+                group_id = next(
+                    (dir_owner[p] for p in PurePosixPath(file.path).parents if p in dir_owner),
+                    None,
+                )
+
+            if group_id is not None and group_id in groups:
+                groups[group_id].files.append(file)
+            else:
+                leftovers.append(file)
+
+        for group in self.semantic_analyzer.fallback_grouping(leftovers) if leftovers else []:
+            if group.id in groups:
+                groups[group.id].files.extend(group.files)
+            else:
+                groups[group.id] = group
@@ -0,0 +1,269 @@
+"""OpenAI-compatible LLM backend with a shared connection pool, concurrency limits and retries.
+
+``openai`` and ``httpx`` are imported, and the openai client (which checks
+credentials) is created, when a backend sends its first request, not at
+module import or construction: the openai package alone takes longer to
+import than the rest of the server, and most tool calls never reach the LLM.
+
+Pooled connections and semaphores belong to the event loop that created
+them, so both are kept per running loop: a later ``asyncio.run`` (tests,
+benchmarks, load runs) gets its own instead of reusing a dead loop's.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib.util
+import random
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mcp_pr_recommender.config import settings
+from shared.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+    import openai
+
+T = TypeVar("T")
+
+
+@functools.cache
+def retryable_errors() -> tuple[type[BaseException], ...]:
+    """Errors worth retrying: transport failures, timeouts, rate limits and 5xx responses."""
+    import httpx
+    import openai
+
+    return (
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+        openai.RateLimitError,
+        openai.InternalServerError,
+        httpx.TransportError,
+    )
+
+
+_shared_http_client: httpx.AsyncClient | None = None
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, int], asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@functools.cache
+def _per_loop_transport_class() -> Callable[..., httpx.AsyncBaseTransport]:
+    import httpx
+
+    class PerLoopTransport(httpx.AsyncBaseTransport):
+        """Connection pool per running event loop; pools of finished loops are dropped with the loop."""
+
+        def __init__(self, **options: Any) -> None:
+            self._options = options
+            self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = (
+                weakref.WeakKeyDictionary()
+            )
+
+        def _pool(self) -> httpx.AsyncHTTPTransport:
+            loop = asyncio.get_running_loop()
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(**self._options)
+            return pool
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            return await self._pool().handle_async_request(request)
+
+        async def aclose(self) -> None:
+            # Only the running loop's pool can be closed; others went away with their loop
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+            self._pools.clear()
+            if pool is not None:
+                await pool.aclose()
+
+    return PerLoopTransport
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client used by every LLM backend.
+
+    Keep-alive connections are reused across analyzer instances and requests
+    on the same event loop; each loop gets its own pool. HTTP/2 is enabled
+    when the optional ``h2`` package is installed.
+    """
+    import httpx
+
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        config = settings()
+        transport = _per_loop_transport_class()(
+            http2=config.llm_http2 and importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=config.llm_http_max_connections,
+                max_keepalive_connections=config.llm_http_max_connections,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _shared_http_client = httpx.AsyncClient(
+            transport=transport, timeout=httpx.Timeout(config.llm_timeout_seconds, connect=10.0)
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client, e.g. on server shutdown."""
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
+def _get_semaphore(base_url: str, max_concurrency: int) -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight requests to one endpoint from the running loop."""
+    semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    key = (base_url, max_concurrency)
+    if key not in semaphores:
+        semaphores[key] = asyncio.Semaphore(max_concurrency)
+    return semaphores[key]
+
+
+class LLMBackend:
+    """Chat-completions backend for any OpenAI-compatible endpoint.
+
+    Every backend shares one pooled ``httpx`` client and a per-endpoint
+    concurrency semaphore, both scoped to the running event loop. Requests are retried on transient failures with
+    full-jitter exponential backoff, and can optionally be hedged: if the first
+    attempt has not answered within ``hedge_delay`` seconds a second identical
+    request is raced against it and the first success wins.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        model: str | None = None,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+        retry_base_delay: float | None = None,
+        hedge_delay: float | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the backend; unset arguments come from PRRecommenderSettings."""
+        config = settings()
+        self.logger = get_logger(__name__)
+        self.base_url = base_url if base_url is not None else config.openai_base_url
+        self.model = model or config.openai_model
+        self.max_retries = max_retries if max_retries is not None else config.llm_max_retries
+        self.retry_base_delay = (
+            retry_base_delay if retry_base_delay is not None else config.llm_retry_base_delay_seconds
+        )
+        self.hedge_delay = hedge_delay if hedge_delay is not None else config.llm_hedge_delay_seconds
+        self.max_concurrency = max_concurrency if max_concurrency is not None else config.llm_max_concurrency
+        self._api_key = api_key if api_key is not None else config.openai_api_key
+        self._timeout = timeout if timeout is not None else config.llm_timeout_seconds
+        self._http_client = http_client
+        self._client: openai.AsyncOpenAI | None = None
+
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """The openai client, created on first use.
+
+        Raises:
+            openai.OpenAIError: If no API key is configured
+        """
+        if self._client is None:
+            import openai
+
+            # Recent openai releases annotate http_client with their vendored httpx
+            # fork but still accept an httpx.AsyncClient
+            http_client: Any = self._http_client or get_shared_http_client()
+            # Retries are handled here so they can be jittered and hedged consistently
+            self._client = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=self.base_url or None,
+                timeout=self._timeout,
+                max_retries=0,
+                http_client=http_client,
+            )
+        return self._client
+
+    async def create_chat_completion(self, **kwargs: Any) -> Any:
+        """Create a chat completion under the concurrency limit, with retries and hedging."""
+        kwargs.setdefault("model", self.model)
+        async with _get_semaphore(self.base_url, self.max_concurrency):
+            return await self._with_retries(lambda: self.client.chat.completions.create(**kwargs))
+
+    async def stream_chat_completion(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Stream a chat completion, holding a concurrency slot until the stream is drained."""
+        kwargs.setdefault("model", self.model)
+        kwargs["stream"] = True
+        async with _get_semaphore(self.base_url, self.max_concurrency):
+            stream = await self._with_retries(lambda: self.client.chat.completions.create(**kwargs))
+            try:
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await self._close_quietly(stream)
+
+    async def _with_retries(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory`` with full-jitter exponential backoff on retryable errors."""
+        attempt = 0
+        while True:
+            try:
+                return await self._hedged(factory)
+            except retryable_errors() as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, self.retry_base_delay * (2**attempt))
+                self.logger.warning(
+                    f"LLM request failed ({type(e).__name__}), retry {attempt + 1}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _hedged(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Race a second attempt against a slow first one when hedging is enabled."""
+        if self.hedge_delay <= 0:
+            return await factory()
+
+        first: asyncio.Task[T] = asyncio.ensure_future(factory())
+        done, _ = await asyncio.wait({first}, timeout=self.hedge_delay)
+        if done:
+            return first.result()
+
+        self.logger.debug(f"LLM request slower than {self.hedge_delay}s, sending hedge request")
+        pending: set[asyncio.Task[T]] = {first, asyncio.ensure_future(factory())}
+        error: BaseException | None = None
+        winner: asyncio.Task[T] | None = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and winner is None:
+                        winner = task
+                    elif task.exception() is None:
+                        await self._close_quietly(task.result())
+                    else:
+                        error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner is None:
+            assert error is not None
+            raise error
+        return winner.result()
+
+    @staticmethod
+    async def _close_quietly(result: Any) -> None:
+        """Release a losing or finished response (e.g. an open stream)."""
+        close = getattr(result, "close", None)
+        if close is None:
+            return
+        try:
+            maybe_awaitable = close()
+            if asyncio.iscoroutine(maybe_awaitable):
+                await maybe_awaitable
+        except Exception:
+            pass
@@ -0,0 +1,157 @@
+"""Persistent, content-addressed cache for LLM grouping responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from shared.utils.logging import get_logger
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "mcp-auto-pr" / "llm_cache.sqlite3"
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of raw LLM responses with TTL and LRU size eviction.
+
+    Entries are keyed by a SHA-256 of the model, the system prompt and the
+    normalized file list (path, status and line stats), so re-analyzing an
+    identical change set returns the stored response without an API call.
+    """
+
+    def __init__(self, path: str | Path | None = None, ttl_seconds: int = 0, max_entries: int = 1000) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location; defaults to ``DEFAULT_CACHE_PATH``
+            ttl_seconds: Entry lifetime in seconds, 0 disables expiry
+            max_entries: Maximum number of entries kept before evicting the least recently used
+        """
+        self.logger = get_logger(__name__)
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_last_accessed ON llm_responses(last_accessed)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, files: Iterable[FileStatus]) -> str:
+        """Build the content hash for a grouping request.
+
+        The file list is sorted so that the same change set produces the same
+        key regardless of the order git reported it in.
+        """
+        normalized = sorted((f.path, f.status_code, f.lines_added, f.lines_deleted, bool(f.is_binary)) for f in files)
+        payload = json.dumps(
+            {"model": model, "system_prompt": system_prompt, "files": normalized},
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            if self._is_expired(created_at, now):
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_responses SET last_accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return str(response)
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response and evict expired or least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at ``created_at`` has outlived the TTL."""
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then trim to ``max_entries`` by last access. Caller holds the lock."""
+        if self.ttl_seconds > 0:
+            cursor = self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            self.evictions += max(cursor.rowcount, 0)
+
+        (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM llm_responses ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            self.evictions += max(cursor.rowcount, 0)
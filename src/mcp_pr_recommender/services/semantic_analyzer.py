@@ -1,49 +1,119 @@
 """Semantic analysis service for PR recommendations."""
 
+import bisect
+import functools
 import json
-from typing import Literal
+import time
+from typing import Any, Literal
 
-import openai
+from fastmcp import Context
 
 from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
 from mcp_pr_recommender.config import settings
 from mcp_pr_recommender.models.recommendations import ChangeGroup, PRRecommendation
+from mcp_pr_recommender.prompts.compaction import COMPACT_LISTING_NOTE, compact_file_listing, estimate_tokens
 from mcp_pr_recommender.prompts.semantic import get_enhanced_grouping_system_prompt
+from mcp_pr_recommender.services.llm_backend import LLMBackend
+from mcp_pr_recommender.services.llm_cache import LLMResponseCache
+from mcp_pr_recommender.services.stream_parser import IncrementalGroupParser
+from shared.utils.context_logging import ContextLogger
 from shared.utils.logging import get_logger
+from shared.utils.metrics import LLM_LATENCY, LLM_REQUESTS, LLM_TOKENS, record_cache_lookup
+
+# Floor for the file listing when the rest of the prompt already uses most of the budget
+MIN_FILE_LISTING_TOKENS = 256
 
 
 class SemanticAnalyzer:
     """Analyzes semantic relationships between changed files."""
 
     def __init__(self) -> None:
-        """Initialize semantic analyzer with logging."""
+        """Initialize semantic analyzer with logging; LLM resources are created on first use."""
         self.logger = get_logger(__name__)
-        self.client = openai.AsyncOpenAI(api_key=settings().openai_api_key)
+
+    @functools.cached_property
+    def backend(self) -> LLMBackend:
+        """The LLM backend, created by the first grouping request that reaches the LLM."""
+        return LLMBackend(api_key=settings().openai_api_key)
+
+    @functools.cached_property
+    def cache(self) -> LLMResponseCache | None:
+        """The LLM response cache, opened on first use."""
+        return self._create_cache()
+
+    @property
+    def client(self) -> Any:
+        """The backend's openai client, created on first use."""
+        return self.backend.client
+
+    def _create_cache(self) -> LLMResponseCache | None:
+        """Open the LLM response cache if enabled; caching is best effort."""
+        config = settings()
+        if not config.llm_cache_enabled:
+            return None
+
+        try:
+            return LLMResponseCache(
+                path=config.llm_cache_path or None,
+                ttl_seconds=config.llm_cache_ttl_seconds,
+                max_entries=config.llm_cache_max_entries,
+            )
+        except Exception as e:
+            self.logger.warning(f"LLM response cache disabled: {e}")
+            return None
 
     async def analyze_and_generate_prs(
-        self, files: list[FileStatus], analysis: OutstandingChangesAnalysis
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis,
+        ctx: Context | None = None,
     ) -> list[PRRecommendation]:
         """Analyze files and generate PR recommendations."""
         self.logger.info(f"Starting LLM-based analysis of {len(files)} files")
 
-        # Step 1: Basic filtering only
-        clean_files = self._filter_files(files)
+        # Steps 1-2: Basic filtering, then let LLM do intelligent grouping
+        groups = await self.group_files(files, analysis, ctx)
+        if not groups:
+            return []
+
+        # Step 3: Generate PR recommendations
+        pr_recommendations = self.generate_recommendations_from_groups(groups, analysis)
+        self.logger.info(f"Generated {len(pr_recommendations)} PR recommendations")
+
+        return pr_recommendations
+
+    async def group_files(
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis,
+        ctx: Context | None = None,
+    ) -> list[ChangeGroup]:
+        """Filter files and group them into logical PR units."""
+        clean_files = self.filter_files(files)
         self.logger.info(f"Filtered to {len(clean_files)} relevant files")
 
         if not clean_files:
             self.logger.warning("No files to analyze after filtering")
             return []
 
-        # Step 2: Let LLM do intelligent grouping
-        groups = await self._llm_group_files(clean_files, analysis)
+        groups = await self._llm_group_files(clean_files, analysis, ctx)
         self.logger.info(f"LLM created {len(groups)} logical groups")
+        return groups
 
-        # Step 3: Generate PR recommendations
-        pr_recommendations = self._generate_pr_recommendations(groups, analysis)
-        self.logger.info(f"Generated {len(pr_recommendations)} PR recommendations")
+    def generate_recommendations_from_groups(
+        self, groups: list[ChangeGroup], analysis: OutstandingChangesAnalysis
+    ) -> list[PRRecommendation]:
+        """Turn already computed groups into PR recommendations."""
+        return self._generate_pr_recommendations(groups, analysis)
 
-        return pr_recommendations
+    def filter_files(self, files: list[FileStatus]) -> list[FileStatus]:
+        """Drop cache and generated files that should never be part of a PR."""
+        return self._filter_files(files)
+
+    def fallback_grouping(self, files: list[FileStatus]) -> list[ChangeGroup]:
+        """Group files by simple type heuristics without calling the LLM."""
+        return self._fallback_grouping(files)
 
     def _filter_files(self, files: list[FileStatus]) -> list[FileStatus]:
         """Filter files - exclude obvious junk files only."""
@@ -80,25 +150,56 @@ class SemanticAnalyzer:
         return any(pattern in path_lower for pattern in exclude_patterns)
 
     async def _llm_group_files(
-        self, files: list[FileStatus], analysis: OutstandingChangesAnalysis
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis,
+        ctx: Context | None = None,
     ) -> list[ChangeGroup]:
         """Use LLM to intelligently group files into logical PR units."""
+        system_prompt = get_enhanced_grouping_system_prompt()
+
+        # Identical change sets reuse the stored response instead of a new API call
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(settings().openai_model, system_prompt, files)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                groups = self._parse_grouping_response(cached, files)
+                if groups:
+                    self.logger.info("Using cached LLM grouping response")
+                    return groups
+
         # Create the grouping prompt
-        prompt = self._create_grouping_prompt(files, analysis)
+        try:
+            prompt = self._create_grouping_prompt(files, analysis)
+        except Exception as e:
+            self.logger.error(f"Failed to build grouping prompt: {e}")
+            return self._fallback_grouping(files)
+
+        messages = [
+            {
+                "role": "system",
+                "content": system_prompt,
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+        if settings().llm_streaming:
+            return await self._llm_group_files_streaming(messages, files, cache_key, ctx)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=settings().openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": get_enhanced_grouping_system_prompt(),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=settings().max_tokens_per_request * 2,  # Need more tokens for grouping
-                temperature=0.1,
-            )
+            start = time.perf_counter()
+            try:
+                response = await self.backend.create_chat_completion(
+                    model=settings().openai_model,
+                    messages=messages,
+                    max_tokens=settings().max_tokens_per_request * 2,  # Need more tokens for grouping
+                    temperature=0.1,
+                )
+            except Exception:
+                self._record_llm_request("complete", start, "error")
+                raise
+            self._record_llm_request("complete", start, "ok", getattr(response, "usage", None))
 
             # Parse LLM response into groups
             content = response.choices[0].message.content
@@ -112,12 +213,123 @@ class SemanticAnalyzer:
                 self.logger.warning("LLM grouping failed, falling back to simple grouping")
                 return self._fallback_grouping(files)
 
+            if cache_key is not None and content is not None:
+                self._cache_put(cache_key, content)
+
             return groups
 
         except Exception as e:
             self.logger.error(f"LLM grouping failed: {e}")
             return self._fallback_grouping(files)
 
+    async def _llm_group_files_streaming(
+        self,
+        messages: list[dict[str, str]],
+        files: list[FileStatus],
+        cache_key: str | None,
+        ctx: Context | None = None,
+    ) -> list[ChangeGroup]:
+        """Stream the grouping completion, surfacing groups as soon as each one closes.
+
+        Groups that were fully received are kept if the stream is truncated or
+        the tail of the response is malformed; the remaining files end up in
+        the ungrouped bucket instead of discarding the whole answer.
+        """
+        log = ContextLogger.wrap(ctx)
+        parser = IncrementalGroupParser()
+        parts: list[str] = []
+        finish_reason = None
+        grouped_files = 0
+        usage = None
+        start = time.perf_counter()
+
+        try:
+            stream = self.backend.stream_chat_completion(
+                model=settings().openai_model,
+                messages=messages,
+                max_tokens=settings().max_tokens_per_request * 2,  # Need more tokens for grouping
+                temperature=0.1,
+            )
+
+            async for chunk in stream:
+                # Only sent by endpoints that support stream_options={"include_usage": True}
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                text = choice.delta.content if choice.delta else None
+                if text:
+                    parts.append(text)
+                    for group in parser.feed(text):
+                        grouped_files += len(group.get("files", []))
+                        self.logger.debug(f"Received group {group.get('id', '?')} ({len(parser.groups)} so far)")
+                        await log.progress(min(grouped_files, len(files)), len(files))
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+        except Exception as e:
+            self._record_llm_request("stream", start, "error")
+            if not parser.groups:
+                self.logger.error(f"LLM grouping failed: {e}")
+                return self._fallback_grouping(files)
+            self.logger.warning(f"LLM stream interrupted after {len(parser.groups)} groups: {e}")
+            finish_reason = "error"
+
+        else:
+            self._record_llm_request("stream", start, "ok", usage)
+
+        content = "".join(parts)
+        groups = self._parse_grouping_response(content, files) if finish_reason != "error" else []
+
+        if groups:
+            if cache_key is not None and finish_reason in (None, "stop"):
+                self._cache_put(cache_key, content)
+        elif parser.groups:
+            self.logger.warning(
+                f"Keeping {len(parser.groups)} fully received groups from incomplete response "
+                f"(finish_reason={finish_reason})"
+            )
+            groups = self._build_groups(parser.groups, files)
+        else:
+            self.logger.warning("LLM grouping failed, falling back to simple grouping")
+            return self._fallback_grouping(files)
+
+        await log.progress(len(files), len(files))
+        return groups
+
+    @staticmethod
+    def _record_llm_request(mode: str, start: float, status: str, usage: Any = None) -> None:
+        """Record latency, outcome and token usage of one LLM completion."""
+        LLM_LATENCY.observe(time.perf_counter() - start, mode=mode)
+        LLM_REQUESTS.inc(mode=mode, status=status)
+        if usage is None:
+            return
+        for kind in ("prompt_tokens", "completion_tokens"):
+            tokens = getattr(usage, kind, None)
+            if isinstance(tokens, int):
+                LLM_TOKENS.inc(tokens, kind=kind.removesuffix("_tokens"))
+
+    def _cache_get(self, key: str) -> str | None:
+        """Read from the response cache, treating cache errors as misses."""
+        if self.cache is None:
+            return None
+        try:
+            content = self.cache.get(key)
+        except Exception as e:
+            self.logger.warning(f"LLM cache read failed: {e}")
+            content = None
+        record_cache_lookup("llm_response", content is not None)
+        return content
+
+    def _cache_put(self, key: str, content: str) -> None:
+        """Write to the response cache, ignoring cache errors."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.put(key, content)
+        except Exception as e:
+            self.logger.warning(f"LLM cache write failed: {e}")
+
     def _create_grouping_prompt(self, files: list[FileStatus], analysis: OutstandingChangesAnalysis) -> str:
         """Create the prompt for LLM grouping."""
         # Prepare file information - prioritize files with actual changes
@@ -177,7 +389,7 @@ class SemanticAnalyzer:
             else:
                 file_list.append(f"- {f['path']} ({status_desc}) NO CHANGES (likely moved/touched)")
 
-        return f"""Group these {len(files)} files into logical Pull Requests:
+        template = f"""Group these {len(files)} files into logical Pull Requests:
 
 **Repository Context:**
 - Files with actual changes: {len(files_with_changes)}
@@ -186,7 +398,7 @@ class SemanticAnalyzer:
 - Risk level: {analysis.risk_assessment.risk_level}
 
 **Files to group:**
-{chr(10).join(file_list)}
+{{file_listing}}
 
 **Additional Context:**
 {analysis.summary}
@@ -196,6 +408,19 @@ class SemanticAnalyzer:
 
 Please group these files into the optimal number of logical, atomic Pull Requests."""
 
+        file_listing = "\n".join(file_list)
+
+        # Large change sets spend most of the budget on repeated path prefixes; compact them
+        listing_budget = max(settings().max_tokens_per_request - estimate_tokens(template), MIN_FILE_LISTING_TOKENS)
+        if len(files) >= settings().prompt_compaction_min_files or estimate_tokens(file_listing) > listing_budget:
+            compacted = compact_file_listing(files, listing_budget)
+            self.logger.info(
+                f"Compacted file listing from ~{estimate_tokens(file_listing)} to ~{estimate_tokens(compacted)} tokens"
+            )
+            file_listing = f"{COMPACT_LISTING_NOTE}\n\n{compacted}"
+
+        return template.replace("{file_listing}", file_listing, 1)
+
     def _parse_grouping_response(self, response: str, files: list[FileStatus]) -> list[ChangeGroup]:
         """Parse LLM grouping response into ChangeGroup objects."""
         try:
@@ -211,45 +436,7 @@ Please group these files into the optimal number of logical, atomic Pull Request
             if "groups" not in data:
                 raise ValueError("No 'groups' key in response")
 
-            # Create file lookup
-            file_lookup = {f.path: f for f in files}
-
-            groups = []
-            used_files = set()
-
-            for i, group_data in enumerate(data["groups"]):
-                # Get files for this group
-                group_files = []
-                for file_path in group_data.get("files", []):
-                    if file_path in file_lookup and file_path not in used_files:
-                        group_files.append(file_lookup[file_path])
-                        used_files.add(file_path)
-
-                if group_files:
-                    groups.append(
-                        ChangeGroup(
-                            id=group_data.get("id", f"group_{i}"),
-                            files=group_files,
-                            category=group_data.get("category", "chore"),
-                            confidence=group_data.get("confidence", 0.8),
-                            reasoning=group_data.get("reasoning", "LLM grouped these files"),
-                            semantic_similarity=group_data.get("confidence", 0.8),
-                        )
-                    )
-
-            # Handle any ungrouped files
-            ungrouped_files = [f for f in files if f.path not in used_files]
-            if ungrouped_files:
-                groups.append(
-                    ChangeGroup(
-                        id="ungrouped_files",
-                        files=ungrouped_files,
-                        category="chore",
-                        confidence=0.6,
-                        reasoning=f"Files not grouped by LLM ({len(ungrouped_files)} files)",
-                        semantic_similarity=0.5,
-                    )
-                )
+            groups = self._build_groups(data["groups"], files)
 
             self.logger.info(f"LLM grouping rationale: {data.get('rationale', 'No rationale provided')}")
             return groups
@@ -259,6 +446,73 @@ Please group these files into the optimal number of logical, atomic Pull Request
             self.logger.debug(f"Response was: {response[:500]}...")
             return []
 
+    def _build_groups(self, groups_data: list[dict[str, Any]], files: list[FileStatus]) -> list[ChangeGroup]:
+        """Turn LLM group objects into ChangeGroups, collecting unassigned files separately."""
+        # Create file lookup
+        file_lookup = {f.path: f for f in files}
+        sorted_paths: list[str] | None = None
+
+        groups = []
+        used_files = set()
+
+        for i, group_data in enumerate(groups_data):
+            # Get files for this group
+            group_files = []
+            for file_path in group_data.get("files", []):
+                if not isinstance(file_path, str):
+                    continue
+                if file_path.endswith("/"):
+                    # Directory entries from a compacted listing stand for every file under them
+                    if sorted_paths is None:
+                        sorted_paths = sorted(file_lookup)
+                    candidates = self._paths_under(sorted_paths, file_path)
+                else:
+                    candidates = [file_path]
+
+                for path in candidates:
+                    if path in file_lookup and path not in used_files:
+                        group_files.append(file_lookup[path])
+                        used_files.add(path)
+
+            if group_files:
+                groups.append(
+                    ChangeGroup(
+                        id=group_data.get("id", f"group_{i}"),
+                        files=group_files,
+                        category=group_data.get("category", "chore"),
+                        confidence=group_data.get("confidence", 0.8),
+                        reasoning=group_data.get("reasoning", "LLM grouped these files"),
+                        semantic_similarity=group_data.get("confidence", 0.8),
+                    )
+                )
+
+        # Handle any ungrouped files
+        ungrouped_files = [f for f in files if f.path not in used_files]
+        if ungrouped_files:
+            groups.append(
+                ChangeGroup(
+                    id="ungrouped_files",
+                    files=ungrouped_files,
+                    category="chore",
+                    confidence=0.6,
+                    reasoning=f"Files not grouped by LLM ({len(ungrouped_files)} files)",
+                    semantic_similarity=0.5,
+                )
+            )
+
+        return groups
+
+    @staticmethod
+    def _paths_under(sorted_paths: list[str], prefix: str) -> list[str]:
+        """Return the paths in ``sorted_paths`` that start with directory ``prefix``."""
+        start = bisect.bisect_left(sorted_paths, prefix)
+        matches = []
+        for path in sorted_paths[start:]:
+            if not path.startswith(prefix):
+                break
+            matches.append(path)
+        return matches
+
     def _fallback_grouping(self, files: list[FileStatus]) -> list[ChangeGroup]:
         """Provide fallback grouping if LLM fails."""
         # Separate files with changes from those without
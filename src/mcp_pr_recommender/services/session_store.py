@@ -0,0 +1,60 @@
+"""In-memory store of the last PR strategy generated per repository."""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from mcp_pr_recommender.models.recommendations import PRStrategy
+
+
+class RecommendationSessionStore:
+    """Remembers the most recent PRStrategy for each repository.
+
+    Sessions are kept in least-recently-used order and the oldest repository
+    is dropped once ``max_sessions`` is exceeded.
+    """
+
+    def __init__(self, max_sessions: int = 32) -> None:
+        """Initialize an empty store.
+
+        Args:
+            max_sessions: Maximum number of repositories to remember
+        """
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, PRStrategy] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(repository_path: str | Path) -> str:
+        """Normalize a repository path into a session key."""
+        return str(Path(repository_path).expanduser().resolve())
+
+    def get(self, repository_path: str | Path) -> PRStrategy | None:
+        """Return the previous strategy for a repository, if any."""
+        key = self._key(repository_path)
+        with self._lock:
+            strategy = self._sessions.get(key)
+            if strategy is not None:
+                self._sessions.move_to_end(key)
+            return strategy
+
+    def save(self, repository_path: str | Path, strategy: PRStrategy) -> None:
+        """Store the latest strategy for a repository."""
+        key = self._key(repository_path)
+        with self._lock:
+            self._sessions[key] = strategy
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def clear(self, repository_path: str | Path | None = None) -> None:
+        """Forget one repository's session, or all sessions when no path is given."""
+        with self._lock:
+            if repository_path is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(self._key(repository_path), None)
+
+    def __len__(self) -> int:
+        """Return the number of stored sessions."""
+        return len(self._sessions)
@@ -0,0 +1,417 @@
+"""Deterministic, LLM-free grouping strategies and their registry.
+
+Every strategy turns a list of changed files into ``ChangeGroup`` objects of at
+most ``max_files_per_pr`` files without calling the LLM, so results are
+reproducible and fast enough for very large change sets.
+"""
+
+import posixpath
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import Counter
+from pathlib import Path
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_pr_recommender.config import settings
+from mcp_pr_recommender.models.recommendations import ChangeGroup
+from shared.utils.logging import get_logger
+
+_STRATEGIES: dict[str, type["GroupingStrategy"]] = {}
+
+
+def register_strategy(cls: type["GroupingStrategy"]) -> type["GroupingStrategy"]:
+    """Class decorator adding a strategy to the registry under its ``name``."""
+    _STRATEGIES[cls.name] = cls
+    return cls
+
+
+def get_strategy(name: str) -> "GroupingStrategy | None":
+    """Return a new instance of the named strategy, or None if it is not registered."""
+    cls = _STRATEGIES.get(name)
+    return cls() if cls is not None else None
+
+
+def available_strategies() -> list[str]:
+    """Names of all registered deterministic strategies."""
+    return sorted(_STRATEGIES)
+
+
+def infer_category(files: list[FileStatus]) -> str:
+    """Pick a group category from the dominant kind of file in ``files``."""
+    kinds: Counter[str] = Counter()
+    for file in files:
+        path_lower = file.path.lower()
+        name = path_lower.rsplit("/", 1)[-1]
+        if "test" in path_lower or ".spec." in name:
+            kinds["test"] += 1
+        elif file.file_type == "documentation" or path_lower.startswith(("docs/", "doc/")):
+            kinds["docs"] += 1
+        elif file.file_type == "configuration" or name in ("dockerfile", "makefile") or name.startswith(".env"):
+            kinds["config"] += 1
+        else:
+            kinds["feature"] += 1
+    return kinds.most_common(1)[0][0] if kinds else "chore"
+
+
+def _common_directory(paths: list[str]) -> str:
+    """Deepest directory shared by ``paths`` ("" for the repository root)."""
+    dirs = [posixpath.dirname(p) for p in paths]
+    return posixpath.commonpath(dirs) if dirs and all(dirs) else ""
+
+
+class GroupingStrategy(ABC):
+    """Base class for registered grouping strategies."""
+
+    name: str = ""
+    description: str = ""
+
+    def __init__(self) -> None:
+        """Initialize the strategy."""
+        self.logger = get_logger(__name__)
+
+    @abstractmethod
+    def group(
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis | None = None,
+        max_files_per_pr: int = 8,
+    ) -> list[ChangeGroup]:
+        """Partition ``files`` into groups of at most ``max_files_per_pr`` files."""
+
+    def _make_group(self, index: int, files: list[FileStatus], reasoning: str, confidence: float) -> ChangeGroup:
+        """Build a group with a stable ``<strategy>_<n>`` id."""
+        return ChangeGroup(
+            id=f"{self.name}_{index + 1}",
+            files=sorted(files, key=lambda f: f.path),
+            category=infer_category(files),
+            confidence=confidence,
+            reasoning=reasoning,
+            semantic_similarity=confidence,
+        )
+
+
+class _DirNode:
+    """Directory trie node with its direct files and subtree file count."""
+
+    __slots__ = ("children", "files", "count")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _DirNode] = {}
+        self.files: list[FileStatus] = []
+        self.count = 0
+
+
+def _first_fit_decreasing(units: list[list[FileStatus]], capacity: int) -> list[list[FileStatus]]:
+    """Pack file units (each at most ``capacity`` files) into as few bins as possible."""
+    bins: list[list[FileStatus]] = []
+    for unit in sorted(units, key=lambda u: (-len(u), u[0].path)):
+        for target in bins:
+            if len(target) + len(unit) <= capacity:
+                target.extend(unit)
+                break
+        else:
+            bins.append(list(unit))
+    return bins
+
+
+@register_strategy
+class DirectoryStrategy(GroupingStrategy):
+    """Balanced partitioning of the directory tree.
+
+    Whole subtrees that fit in one PR stay together. Larger directories are
+    split along their subdirectories, and the small leftovers of a directory
+    (its direct files and small subdirectories) are packed first-fit
+    decreasing so sibling changes share PRs instead of producing many tiny ones.
+    """
+
+    name = "directory"
+    description = "Groups files by directory structure, splitting large directories into balanced PRs"
+
+    def group(
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis | None = None,
+        max_files_per_pr: int = 8,
+    ) -> list[ChangeGroup]:
+        """Partition ``files`` along the directory tree."""
+        groups: list[ChangeGroup] = []
+        for i, part in enumerate(self.partition(files, max_files_per_pr)):
+            directory = _common_directory([f.path for f in part]) or "repository root"
+            groups.append(self._make_group(i, part, f"Changes under {directory} ({len(part)} files)", 0.8))
+        return groups
+
+    def partition(self, files: list[FileStatus], max_files_per_pr: int) -> list[list[FileStatus]]:
+        """Split ``files`` into directory-coherent chunks without building groups."""
+        root = _DirNode()
+        for file in files:
+            node = root
+            node.count += 1
+            for part in file.path.split("/")[:-1]:
+                node = node.children.setdefault(part, _DirNode())
+                node.count += 1
+            node.files.append(file)
+
+        return self._partition(root, max(1, max_files_per_pr))
+
+    def _partition(self, node: _DirNode, capacity: int) -> list[list[FileStatus]]:
+        """Recursively partition a subtree into chunks of at most ``capacity`` files."""
+        if node.count <= capacity:
+            return [self._collect(node)] if node.count else []
+
+        result: list[list[FileStatus]] = []
+        units: list[list[FileStatus]] = []
+        for name in sorted(node.children):
+            child = node.children[name]
+            if child.count <= capacity:
+                units.append(self._collect(child))
+            else:
+                result.extend(self._partition(child, capacity))
+
+        direct = sorted(node.files, key=lambda f: f.path)
+        units.extend(direct[i : i + capacity] for i in range(0, len(direct), capacity))
+        result.extend(_first_fit_decreasing(units, capacity))
+        return result
+
+    def _collect(self, node: _DirNode) -> list[FileStatus]:
+        """All files in a subtree, in deterministic traversal order."""
+        collected = list(node.files)
+        for name in sorted(node.children):
+            collected.extend(self._collect(node.children[name]))
+        return collected
+
+
+@register_strategy
+class SizeStrategy(GroupingStrategy):
+    """Bin-packing by changed lines.
+
+    Files are placed best-fit decreasing into PRs capped at ``max_lines_per_pr``
+    changed lines and ``max_files_per_pr`` files. Files larger than the line
+    cap get a PR of their own.
+    """
+
+    name = "size"
+    description = "Bin-packs files into PRs of balanced, reviewable size by changed lines"
+
+    def __init__(self, max_lines_per_pr: int | None = None) -> None:
+        """Initialize with a line cap (defaults to the ``size_strategy_max_lines`` setting)."""
+        super().__init__()
+        self.max_lines_per_pr = max_lines_per_pr if max_lines_per_pr is not None else settings().size_strategy_max_lines
+
+    def group(
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis | None = None,
+        max_files_per_pr: int = 8,
+    ) -> list[ChangeGroup]:
+        """Pack ``files`` into line- and file-capped bins."""
+        capacity = self.max_lines_per_pr
+        max_files = max(1, max_files_per_pr)
+        bins: list[list[FileStatus]] = []
+        # Sorted (remaining_lines, bin_index) for bins that can still take files
+        open_bins: list[tuple[int, int]] = []
+
+        for file in sorted(files, key=lambda f: (-f.total_changes, f.path)):
+            size = file.total_changes
+            if size >= capacity:
+                bins.append([file])
+                continue
+
+            # Best fit: the open bin with the least room that still fits this file
+            pos = bisect_left(open_bins, (size, -1))
+            if pos < len(open_bins):
+                remaining, index = open_bins.pop(pos)
+            else:
+                remaining, index = capacity, len(bins)
+                bins.append([])
+
+            bins[index].append(file)
+            if len(bins[index]) < max_files:
+                insort(open_bins, (remaining - size, index))
+
+        groups: list[ChangeGroup] = []
+        for i, part in enumerate(bins):
+            lines = sum(f.total_changes for f in part)
+            groups.append(self._make_group(i, part, f"Size-balanced PR with {len(part)} files, {lines} lines", 0.7))
+        return groups
+
+
+_PY_IMPORT = re.compile(
+    r"^[ \t]*(?:from[ \t]+(\.*)([\w.]*)[ \t]+import[ \t]+(?:\(([^)]*)\)|([\w \t,*]+))"
+    r"|import[ \t]+([\w.]+(?:[ \t]*,[ \t]*[\w.]+)*))",
+    re.M,
+)
+_JS_IMPORT = re.compile(
+    r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\(\s*)['"](\.{1,2}/[^'"]+)['"]""",
+)
+_JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+_JS_SUFFIXES = ("", *_JS_EXTENSIONS, *(f"/index{ext}" for ext in _JS_EXTENSIONS))
+# Only the head of a file is scanned; imports live at the top in practice
+_MAX_SCAN_BYTES = 64 * 1024
+
+
+class _UnionFind:
+    """Union-find over file indices with path halving."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+@register_strategy
+class DependencyStrategy(GroupingStrategy):
+    """Groups files connected by imports.
+
+    Python (absolute and relative) and JavaScript/TypeScript relative imports
+    between changed files are resolved into an import graph whose connected
+    components become PRs. Oversized components are split along directories,
+    and files with no changed dependencies are packed by directory.
+    """
+
+    name = "dependency"
+    description = "Groups files that import each other using a static import graph"
+
+    def group(
+        self,
+        files: list[FileStatus],
+        analysis: OutstandingChangesAnalysis | None = None,
+        max_files_per_pr: int = 8,
+    ) -> list[ChangeGroup]:
+        """Group ``files`` by the connected components of their import graph."""
+        root = Path(analysis.repository_path) if analysis is not None else Path(".")
+        ordered = sorted(files, key=lambda f: f.path)
+        edges = self.import_edges(ordered, root)
+
+        uf = _UnionFind(len(ordered))
+        for a, b in edges:
+            uf.union(a, b)
+        components: dict[int, list[FileStatus]] = {}
+        for i, file in enumerate(ordered):
+            components.setdefault(uf.find(i), []).append(file)
+
+        directory = DirectoryStrategy()
+        connected: list[list[FileStatus]] = []
+        isolated: list[FileStatus] = []
+        for component in components.values():
+            if len(component) == 1:
+                isolated.extend(component)
+            elif len(component) <= max_files_per_pr:
+                connected.append(component)
+            else:
+                connected.extend(directory.partition(component, max_files_per_pr))
+
+        groups: list[ChangeGroup] = []
+        for part in connected:
+            groups.append(self._make_group(len(groups), part, f"Files linked by imports ({len(part)} files)", 0.85))
+        for part in directory.partition(isolated, max_files_per_pr):
+            directory_name = _common_directory([f.path for f in part]) or "repository root"
+            groups.append(
+                self._make_group(
+                    len(groups), part, f"Independent changes under {directory_name} ({len(part)} files)", 0.6
+                )
+            )
+
+        self.logger.info(f"Dependency graph: {len(edges)} import edges, {len(connected)} connected groups")
+        return groups
+
+    def import_edges(self, files: list[FileStatus], root: Path) -> list[tuple[int, int]]:
+        """Resolve imports between ``files`` into (importer, imported) index pairs."""
+        index_of = {f.path: i for i, f in enumerate(files)}
+        modules = self._module_index(files)
+
+        edges: list[tuple[int, int]] = []
+        for i, file in enumerate(files):
+            if file.status_code == "D" or file.is_binary:
+                continue
+            ext = posixpath.splitext(file.path)[1]
+            if ext not in (".py", *_JS_EXTENSIONS):
+                continue
+            source = self._read_head(root / file.path)
+            if not source:
+                continue
+
+            if ext == ".py":
+                targets = self._python_targets(file.path, source, modules)
+            else:
+                targets = self._js_targets(file.path, source, index_of)
+
+            edges.extend((i, index_of[target]) for target in targets if target != file.path)
+        return edges
+
+    @staticmethod
+    def _read_head(path: Path) -> str:
+        """Read the beginning of a file, or "" if it cannot be read."""
+        try:
+            with open(path, "rb") as f:
+                return f.read(_MAX_SCAN_BYTES).decode("utf-8", errors="ignore")
+        except OSError:
+            return ""
+
+    @staticmethod
+    def _module_index(files: list[FileStatus]) -> dict[str, str | None]:
+        """Map every dotted-name suffix of changed Python modules to its path (None if ambiguous)."""
+        modules: dict[str, str | None] = {}
+        for file in files:
+            if not file.path.endswith(".py"):
+                continue
+            parts = file.path[:-3].split("/")
+            if parts[-1] == "__init__":
+                parts.pop()
+            for start in range(len(parts)):
+                name = ".".join(parts[start:])
+                if name:
+                    modules[name] = file.path if modules.get(name, file.path) == file.path else None
+        return modules
+
+    @staticmethod
+    def _python_targets(path: str, source: str, modules: dict[str, str | None]) -> set[str]:
+        """Changed files imported by a Python module."""
+        package = path[:-3].split("/")[:-1]
+        candidates: list[str] = []
+        for dots, module, grouped, names, plain in _PY_IMPORT.findall(source):
+            if plain:
+                candidates.extend(name.strip() for name in plain.split(","))
+                continue
+            if dots:
+                base = package[: len(package) - (len(dots) - 1)] if len(dots) - 1 <= len(package) else []
+                module = ".".join([*base, *module.split(".")]) if module else ".".join(base)
+            for name in (grouped or names).split(","):
+                name = name.split("#")[0].strip().split(" as ")[0].strip()
+                if name and name != "*":
+                    candidates.append(f"{module}.{name}" if module else name)
+            candidates.append(module)
+
+        targets = set()
+        for candidate in candidates:
+            # Longest importable prefix wins: "pkg.mod.func" resolves to "pkg.mod"
+            parts = candidate.split(".")
+            for end in range(len(parts), 0, -1):
+                target = modules.get(".".join(parts[:end]))
+                if target:
+                    targets.add(target)
+                    break
+        return targets
+
+    @staticmethod
+    def _js_targets(path: str, source: str, index_of: dict[str, int]) -> set[str]:
+        """Changed files imported through relative JavaScript/TypeScript specifiers."""
+        directory = posixpath.dirname(path)
+        targets = set()
+        for specifier in _JS_IMPORT.findall(source):
+            base = posixpath.normpath(posixpath.join(directory, specifier))
+            for suffix in _JS_SUFFIXES:
+                if base + suffix in index_of:
+                    targets.add(base + suffix)
+                    break
+        return targets
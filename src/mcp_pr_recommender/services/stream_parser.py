@@ -0,0 +1,98 @@
+"""Incremental JSON parser for streamed LLM grouping responses."""
+
+import json
+from typing import Any
+
+from shared.utils.logging import get_logger
+
+
+class IncrementalGroupParser:
+    """Emits each object of the top-level ``"groups"`` array as soon as it closes.
+
+    The parser is a small character state machine that tracks string/escape
+    state and container nesting, so it never re-scans earlier input. Only the
+    text of the group currently being received is buffered. Groups that were
+    fully received stay available in ``groups`` even if the stream is cut off
+    or the tail of the response is malformed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize parser state."""
+        self.logger = get_logger(__name__)
+        self.groups: list[dict[str, Any]] = []
+        self.complete = False
+
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_chars: list[str] = []
+        self._last_string = ""
+        self._key: str | None = None
+        self._groups_depth: int | None = None
+        self._capture: list[str] | None = None
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Consume a chunk of streamed text and return the groups completed by it."""
+        emitted: list[dict[str, Any]] = []
+
+        for ch in chunk:
+            if self._capture is not None:
+                self._capture.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string = "".join(self._string_chars)
+                    continue
+                # Only top-level keys are needed, so skip collecting nested strings
+                if len(self._stack) == 1:
+                    self._string_chars.append(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_chars = []
+            elif ch == ":":
+                if len(self._stack) == 1:
+                    self._key = self._last_string
+            elif ch == ",":
+                if len(self._stack) == 1:
+                    self._key = None
+            elif ch in "{[":
+                if ch == "{" and self._capture is None and len(self._stack) == self._groups_depth:
+                    self._capture = ["{"]
+                if ch == "[" and self._stack == ["{"] and self._key == "groups":
+                    self._groups_depth = 2
+                self._stack.append(ch)
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if self._capture is not None and ch == "}" and len(self._stack) == self._groups_depth:
+                    group = self._close_capture()
+                    if group is not None:
+                        emitted.append(group)
+                if self._groups_depth is not None and len(self._stack) < self._groups_depth:
+                    self._groups_depth = None
+                if not self._stack:
+                    self.complete = True
+
+        return emitted
+
+    def _close_capture(self) -> dict[str, Any] | None:
+        """Decode the buffered group object."""
+        text = "".join(self._capture or [])
+        self._capture = None
+        try:
+            group = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.logger.debug(f"Skipping malformed streamed group: {e}")
+            return None
+
+        if not isinstance(group, dict):
+            return None
+        self.groups.append(group)
+        return group
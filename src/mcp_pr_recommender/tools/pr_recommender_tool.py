@@ -1,13 +1,22 @@
 """PR recommendation generation tool - now using SemanticAnalyzer directly with enhanced file handling."""
 
+import functools
 from pathlib import Path
 from typing import Any
 
+from fastmcp import Context
+
 from mcp_local_repo_analyzer.models.categorization import ChangeCategorization
 from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
 from mcp_local_repo_analyzer.models.risk import RiskAssessment
+from mcp_pr_recommender.config import settings
+from mcp_pr_recommender.models.recommendations import PRStrategy
+from mcp_pr_recommender.services.file_index import FileIndex
+from mcp_pr_recommender.services.incremental_grouper import IncrementalGrouper
 from mcp_pr_recommender.services.semantic_analyzer import SemanticAnalyzer
+from mcp_pr_recommender.services.session_store import RecommendationSessionStore
+from mcp_pr_recommender.services.strategies import get_strategy
 from shared.utils.logging import get_logger
 
 
@@ -15,28 +24,53 @@ class PRRecommenderTool:
     """Tool for generating PR recommendations from git analysis."""
 
     def __init__(self) -> None:
-        """Initialize PR recommender tool with semantic analyzer."""
+        """Initialize PR recommender tool; the semantic analyzer is built on first use."""
         super().__init__()
-        self.semantic_analyzer = SemanticAnalyzer()
+        self.session_store = RecommendationSessionStore(max_sessions=settings().incremental_max_sessions)
         self.logger = get_logger(__name__)
 
+    @functools.cached_property
+    def semantic_analyzer(self) -> SemanticAnalyzer:
+        """The semantic analyzer, built by the first call that needs it.
+
+        Deterministic strategies only use its file filtering and PR formatting,
+        which never create the LLM backend.
+        """
+        return SemanticAnalyzer()
+
+    @functools.cached_property
+    def incremental_grouper(self) -> IncrementalGrouper:
+        """The incremental grouper, built by the first incremental semantic call."""
+        return IncrementalGrouper(self.semantic_analyzer)
+
     async def generate_recommendations(
         self,
         analysis_data: dict[str, Any],
         strategy: str = "semantic",
-        _max_files_per_pr: int = 8,
+        max_files_per_pr: int = 8,
+        incremental: bool = False,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Generate PR recommendations from git analysis data.
 
         Args:
             analysis_data: Git analysis data from mcp_local_repo_analyzer (enhanced with untracked files)
-            strategy: Grouping strategy to use (always semantic now)
-            max_files_per_pr: Maximum files per PR (LLM decides, but this is a hint)
+            strategy: Grouping strategy to use. "directory", "size" and "dependency" run
+                deterministic engines without the LLM; anything else uses semantic analysis
+            max_files_per_pr: Maximum files per PR (hard limit for deterministic strategies,
+                a hint for the LLM)
+            incremental: Reuse the previous recommendation for this repository and only
+                re-analyze files that changed since then
+            ctx: Optional MCP context used to report grouping progress
 
         Returns:
             Dict containing PR recommendations and metadata
         """
-        self.logger.info("Generating PR recommendations using LLM-based semantic analysis")
+        grouping_strategy = get_strategy(strategy)
+        if grouping_strategy is not None:
+            self.logger.info(f"Generating PR recommendations using the {strategy} strategy")
+        else:
+            self.logger.info("Generating PR recommendations using LLM-based semantic analysis")
 
         try:
             # Handle MCP response format - extract structuredContent if present
@@ -89,9 +123,36 @@ class PRRecommenderTool:
 
             # Create OutstandingChangesAnalysis object with proper data
             analysis: OutstandingChangesAnalysis = self._create_analysis_object(actual_data, all_files)
-
-            # Generate recommendations using semantic analyzer directly
-            pr_recommendations = await self.semantic_analyzer.analyze_and_generate_prs(all_files, analysis)
+            file_index = FileIndex(all_files)
+
+            incremental_stats: dict[str, Any] | None = None
+            if grouping_strategy is not None:
+                # Deterministic engines are fast and reproducible, so they skip the LLM and sessions
+                clean_files = self.semantic_analyzer.filter_files(all_files)
+                groups = grouping_strategy.group(clean_files, analysis, max_files_per_pr)
+                pr_recommendations = self.semantic_analyzer.generate_recommendations_from_groups(groups, analysis)
+            elif incremental:
+                # Session mode: keep the previous groups and only place the delta
+                previous = self.session_store.get(analysis.repository_path)
+                if previous is not None:
+                    groups, incremental_stats = await self.incremental_grouper.regroup(
+                        previous, all_files, analysis, ctx
+                    )
+                else:
+                    groups = await self.semantic_analyzer.group_files(all_files, analysis, ctx)
+                pr_recommendations = self.semantic_analyzer.generate_recommendations_from_groups(groups, analysis)
+                self.session_store.save(
+                    analysis.repository_path,
+                    PRStrategy(
+                        strategy_name=strategy,
+                        source_analysis=analysis,
+                        change_groups=groups,
+                        recommended_prs=pr_recommendations,
+                    ),
+                )
+            else:
+                # Generate recommendations using semantic analyzer directly
+                pr_recommendations = await self.semantic_analyzer.analyze_and_generate_prs(all_files, analysis, ctx)
 
             self.logger.info(f"Generated {len(pr_recommendations)} PR recommendations")
 
@@ -101,23 +162,14 @@ class PRRecommenderTool:
             total_changes_in_prs = sum(pr.total_lines_changed for pr in pr_recommendations)
 
             # Enhanced validation - check if untracked files are included
-            untracked_files = [f for f in all_files if f.change_type == "untracked"]
-            untracked_count = len(untracked_files)
-
-            untracked_in_prs = 0
-            for pr in pr_recommendations:
-                for file_path in pr.files:
-                    # Find the file and check if it's untracked
-                    for f in all_files:
-                        if f.path == file_path and f.change_type == "untracked":
-                            untracked_in_prs += 1
-                            break
+            untracked_count = sum(1 for f in all_files if f.change_type == "untracked")
+            untracked_in_prs = sum(file_index.count_untracked(pr.files) for pr in pr_recommendations)
 
             self.logger.info(f"Untracked files: {untracked_count} total, {untracked_in_prs} included in PRs")
 
             # Format response
             return {
-                "strategy_used": "llm_semantic_analysis",
+                "strategy_used": strategy if grouping_strategy is not None else "llm_semantic_analysis",
                 "total_prs_recommended": len(pr_recommendations),
                 "average_pr_size": round(average_pr_size, 1),
                 "total_files_analyzed": len(all_files),
@@ -145,16 +197,18 @@ class PRRecommenderTool:
                     }
                     for pr in pr_recommendations
                 ],
-                "summary": f"Generated {len(pr_recommendations)} atomic PRs from {len(all_files)} changed files using LLM analysis",
+                "summary": f"Generated {len(pr_recommendations)} atomic PRs from {len(all_files)} changed files using "
+                + (f"the {strategy} strategy" if grouping_strategy is not None else "LLM analysis"),
                 "metadata": {
                     "repository_path": str(analysis.repository_path),
                     "analysis_timestamp": (
                         analysis.analysis_timestamp.isoformat() if hasattr(analysis, "analysis_timestamp") else None
                     ),
                     "risk_level": analysis.risk_assessment.risk_level,
-                    "grouping_method": "llm_semantic",
-                    "llm_model_used": "gpt-4",  # or get from settings
+                    "grouping_method": strategy if grouping_strategy is not None else "llm_semantic",
+                    "llm_model_used": None if grouping_strategy is not None else "gpt-4",  # or get from settings
                     "files_by_type": file_type_counts,
+                    "incremental": incremental_stats,
                 },
             }
 
@@ -95,7 +95,7 @@ class StrategyManagerTool(BaseMCPTool):
                 "cons": [
                     "Requires code analysis",
                     "May create large groups",
-                    "Complex to implement fully",
+                    "Only Python and relative JS/TS imports are resolved",
                 ],
             },
             "hybrid": {
@@ -119,6 +119,7 @@ class StrategyManagerTool(BaseMCPTool):
                 "max_files_per_pr": settings().max_files_per_pr,
                 "min_files_per_pr": settings().min_files_per_pr,
                 "similarity_threshold": settings().similarity_threshold,
+                "size_strategy_max_lines": settings().size_strategy_max_lines,
                 "enable_llm_analysis": settings().enable_llm_analysis,
             },
             "recommendations": self._get_strategy_recommendations(),
@@ -2,10 +2,12 @@
 
 from .cli import BaseMCPCLI
 from .server import BaseMCPServer
+from .services import LazyServices
 from .tool import BaseMCPTool
 
 __all__ = [
     "BaseMCPCLI",
     "BaseMCPServer",
     "BaseMCPTool",
+    "LazyServices",
 ]
@@ -0,0 +1,60 @@
+"""FastMCP middleware recording per-tool call counts and latencies, and profiling calls on demand."""
+
+import time
+
+import mcp.types as mt
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from ..utils.metrics import TOOL_CALLS, TOOL_LATENCY
+from ..utils.profiling import ToolProfiler
+
+# Label for calls of tools the server does not have, so clients cannot create label values at will
+UNKNOWN_TOOL = "unknown"
+
+
+class ToolMetricsMiddleware(Middleware):
+    """Time every tool call into ``mcp_tool_duration_seconds`` and count it by outcome.
+
+    Calls of unregistered tools are recorded under the ``unknown`` tool label.
+    """
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Run the tool and record its latency and outcome."""
+        tool = context.message.name
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = await call_next(context)
+            status = "ok"
+            return result
+        except NotFoundError:
+            tool = UNKNOWN_TOOL
+            raise
+        finally:
+            TOOL_LATENCY.observe(time.perf_counter() - start, tool=tool)
+            TOOL_CALLS.inc(tool=tool, status=status)
+
+
+class ToolProfilingMiddleware(Middleware):
+    """Profile tool calls selected by a ``ToolProfiler``; a single flag check while it is idle."""
+
+    def __init__(self, profiler: ToolProfiler) -> None:
+        """Profile calls as ``profiler`` is armed."""
+        self.profiler = profiler
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        """Run the tool, under the profiler when it claims this call."""
+        if not self.profiler.active or not self.profiler.claim(context.message.name):
+            return await call_next(context)
+        with self.profiler.session(context.message.name):
+            return await call_next(context)
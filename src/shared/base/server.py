@@ -9,13 +9,18 @@ import traceback
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 
-from ..utils import logging_service
+from ..utils import dumps, install_log_level_handler, logging_service
+from ..utils.metrics import cache_hit_rates, metrics
+from ..utils.profiling import ProfileMode, ToolProfiler
+from .instrumentation import ToolMetricsMiddleware, ToolProfilingMiddleware
+from .services import LazyServices
 
 
 class BaseMCPServer(ABC):
@@ -28,6 +33,7 @@ class BaseMCPServer(ABC):
         self._initialization_lock = asyncio.Lock()
         self.mcp: FastMCP | None = None
         self.services: dict[str, Any] = {}
+        self.profiler = ToolProfiler.from_env()
 
     @property
     @abstractmethod
@@ -71,6 +77,10 @@ class BaseMCPServer(ABC):
         """
         pass
 
+    async def shutdown_services(self) -> None:
+        """Release service-specific resources when the server shuts down."""
+        return
+
     @asynccontextmanager
     async def lifespan(self, _app: Any) -> AsyncIterator[None]:
         """Manage server lifecycle for proper startup and shutdown."""
@@ -90,6 +100,7 @@ class BaseMCPServer(ABC):
             self.logger.info("FastMCP server shutting down...")
             async with self._initialization_lock:
                 self._server_initialized = False
+            await self.shutdown_services()
 
     def add_health_endpoints(self, mcp: FastMCP) -> None:
         """Add standard health check endpoints."""
@@ -116,6 +127,52 @@ class BaseMCPServer(ABC):
                 }
             )
 
+    def add_metrics_endpoints(self, mcp: FastMCP) -> None:
+        """Expose performance metrics on ``/metrics`` (Prometheus text) and as a tool."""
+        mcp.add_middleware(ToolMetricsMiddleware())
+
+        @mcp.custom_route("/metrics", methods=["GET"])
+        async def prometheus_metrics(_request: Request) -> PlainTextResponse:
+            return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+        @mcp.tool()
+        async def get_performance_stats() -> dict[str, Any]:
+            """Get performance statistics of this server process.
+
+            Returns per-tool call counts and latency percentiles, per-git-subcommand
+            counts, durations and bytes read, LLM request latency and token usage,
+            and cache hit rates.
+            """
+            return {
+                "service": self.service_name,
+                "metrics": metrics.snapshot(),
+                "cache_hit_rates": cache_hit_rates(),
+            }
+
+    def add_profiling(self, mcp: FastMCP) -> None:
+        """Let operators profile selected tool calls without restarting the server."""
+        mcp.add_middleware(ToolProfilingMiddleware(self.profiler))
+
+        @mcp.tool()
+        async def configure_profiling(
+            calls: int | None = 1,
+            tools: list[str] | None = None,
+            mode: ProfileMode | None = None,
+        ) -> dict[str, Any]:
+            """Profile upcoming tool calls of this server.
+
+            Profiles the next ``calls`` tool calls, restricted to ``tools`` when given;
+            with ``tools`` and ``calls=None`` every matching call is profiled until
+            ``calls=0`` disables profiling. ``mode`` is ``cprofile`` (pstats output) or
+            ``sample`` (collapsed stacks for flame graphs). Each profile also lists the
+            git commands the call ran. Returns the profiler state and recent output files.
+            """
+            if calls == 0:
+                self.profiler.disarm()
+            else:
+                self.profiler.arm(calls=calls, tools=tools, mode=mode)
+            return self.profiler.status()
+
     async def create_server(self) -> tuple[FastMCP, dict[str, Any]]:
         """Create and configure the FastMCP server."""
         try:
@@ -126,11 +183,17 @@ class BaseMCPServer(ABC):
                 name=self.service_name,
                 lifespan=self.lifespan,
                 instructions=self.service_instructions,
+                tool_serializer=dumps,
             )
             self.logger.info("FastMCP server instance created successfully")
 
+            # Let clients choose which log messages are sent to them
+            install_log_level_handler(self.mcp)
+
             # Add health check endpoints for HTTP mode
             self.add_health_endpoints(self.mcp)
+            self.add_metrics_endpoints(self.mcp)
+            self.add_profiling(self.mcp)
 
             # Initialize services with error handling
             self.logger.info("Initializing services...")
@@ -172,8 +235,25 @@ class BaseMCPServer(ABC):
             help="Logging level",
         )
         parser.add_argument("--work-dir", help="Default working directory for operations")
+        parser.add_argument("--profile-calls", type=int, help="Profile the next N tool calls")
+        parser.add_argument(
+            "--profile-tool",
+            action="append",
+            help="Profile calls of this tool (repeatable; every call unless --profile-calls is set)",
+        )
+        parser.add_argument("--profile-mode", choices=["cprofile", "sample"], help="Profiler to use")
+        parser.add_argument("--profile-dir", help="Directory for profile output (default: MCP_PROFILE_DIR)")
         return parser
 
+    def setup_profiling(self, args: argparse.Namespace) -> None:
+        """Apply the ``--profile-*`` options on top of the ``MCP_PROFILE_*`` defaults."""
+        if args.profile_dir:
+            self.profiler.output_dir = Path(args.profile_dir)
+        if args.profile_calls is not None or args.profile_tool:
+            self.profiler.arm(calls=args.profile_calls, tools=args.profile_tool, mode=args.profile_mode)
+        elif args.profile_mode:
+            self.profiler.mode = args.profile_mode
+
     def setup_logging(self, args: argparse.Namespace) -> None:
         """Configure logging for the server.
 
@@ -194,6 +274,15 @@ class BaseMCPServer(ABC):
             work_dir = "/repo" if os.path.exists("/repo") else "."
         return work_dir
 
+    def warm_services(self) -> None:
+        """Build lazily registered services up front.
+
+        Long-running HTTP/SSE servers pay the construction cost at startup instead
+        of on the first request; stdio servers keep it deferred.
+        """
+        if isinstance(self.services, LazyServices):
+            self.services.warm()
+
     async def run_stdio_mode(self) -> None:
         """Run server in STDIO mode."""
         try:
@@ -211,6 +300,7 @@ class BaseMCPServer(ABC):
         try:
             self.logger.info(f"Starting {self.service_name} in HTTP mode on {host}:{port}...")
             mcp, _ = await self.create_server()
+            self.warm_services()
             self.logger.info(f"Running MCP server with streamable-http transport on {host}:{port}...")
             await mcp.run(transport="streamable-http", host=host, port=port)  # type: ignore[func-returns-value]
         except Exception as e:
@@ -223,6 +313,7 @@ class BaseMCPServer(ABC):
         try:
             self.logger.info(f"Starting {self.service_name} in SSE mode on {host}:{port}...")
             mcp, _ = await self.create_server()
+            self.warm_services()
             self.logger.info(f"Running MCP server with SSE transport on {host}:{port}...")
             await mcp.run(transport="sse", host=host, port=port)  # type: ignore[func-returns-value]
         except Exception as e:
@@ -237,6 +328,7 @@ class BaseMCPServer(ABC):
 
         # Setup logging
         self.setup_logging(args)
+        self.setup_profiling(args)
 
         # Set default work directory with Docker volume mount support
         work_dir = self.determine_work_dir(args)
@@ -0,0 +1,71 @@
+"""Services dict that constructs each service on first use."""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..utils.logging import logging_service
+
+ServiceFactory = Callable[["LazyServices"], Any]
+
+
+class LazyServices(dict[str, Any]):
+    """Services dict whose entries are built by their factory on first lookup.
+
+    Stdio servers are spawned per editor session, so services (and the modules
+    they import) are only constructed when a tool first needs them. Factories
+    receive this dict to look up the services they depend on. A factory that
+    raises is retried on the next lookup. Iteration only covers services that
+    have been built; ``in``, ``get`` and ``setdefault`` also see pending ones.
+    """
+
+    def __init__(self, factories: dict[str, ServiceFactory]) -> None:
+        """Register ``factories`` without running any of them."""
+        super().__init__()
+        self._factories = dict(factories)
+        self._lock = threading.RLock()
+        self.logger = logging_service.get_logger(__name__)
+
+    def __missing__(self, name: str) -> Any:
+        """Build ``name`` with its factory."""
+        factory = self._factories.get(name)
+        if factory is None:
+            raise KeyError(name)
+        with self._lock:
+            if dict.__contains__(self, name):
+                return dict.__getitem__(self, name)
+            start = time.perf_counter()
+            try:
+                service = factory(self)
+            except Exception as e:
+                self.logger.error(f"Failed to initialize {name}: {e}")
+                raise
+            dict.__setitem__(self, name, service)
+            self.logger.info(f"{name} initialized in {(time.perf_counter() - start) * 1000:.1f}ms")
+            return service
+
+    def __contains__(self, name: object) -> bool:
+        """Return True for built and pending services."""
+        return dict.__contains__(self, name) or name in self._factories
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the service ``name`` (building it if pending), or ``default``."""
+        return self[name] if name in self else default
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        """Return the service ``name`` (building it if pending), storing ``default`` if unknown."""
+        if name in self:
+            return self[name]
+        self[name] = default
+        return default
+
+    @property
+    def pending(self) -> list[str]:
+        """Names of services that have not been built yet."""
+        return [name for name in self._factories if not dict.__contains__(self, name)]
+
+    def warm(self) -> None:
+        """Build every pending service now, e.g. before a long-running HTTP server accepts requests."""
+        for name in self.pending:
+            self[name]
@@ -1,17 +1,24 @@
 """Utility functions for MCP components."""
 
+# Client logging utilities
+from .context_logging import ContextLogger, install_log_level_handler
+
 # File utilities
 from .file import get_file_extension, is_binary_file
 
 # Git utilities
 from .git import (
+    common_git_dir,
     find_git_root,
     format_commit_message,
     format_file_size,
+    git_dir,
     is_git_repository,
     normalize_path,
+    object_id_size,
     parse_diff_stats,
     parse_git_url,
+    repository_fingerprint,
     safe_filename,
     truncate_text,
 )
@@ -19,13 +26,32 @@ from .git import (
 # Logging utilities
 from .logging import get_logger, logging_service, setup_logging
 
+# Metrics utilities
+from .metrics import MetricsRegistry, metrics
+
+# Profiling utilities
+from .profiling import ToolProfiler
+
+# Serialization utilities
+from .serialization import HAS_ORJSON, dumps, paginate
+
+# Single-flight utilities
+from .singleflight import SingleFlight
+
 __all__ = [
+    # Client logging utils
+    "ContextLogger",
+    "install_log_level_handler",
     # File utils
     "get_file_extension",
     "is_binary_file",
     # Git utils
     "is_git_repository",
     "find_git_root",
+    "git_dir",
+    "common_git_dir",
+    "object_id_size",
+    "repository_fingerprint",
     "parse_git_url",
     "format_file_size",
     "format_commit_message",
@@ -37,4 +63,15 @@ __all__ = [
     "setup_logging",
     "get_logger",
     "logging_service",
+    # Metrics utils
+    "MetricsRegistry",
+    "metrics",
+    # Profiling utils
+    "ToolProfiler",
+    # Single-flight utils
+    "SingleFlight",
+    # Serialization utils
+    "HAS_ORJSON",
+    "dumps",
+    "paginate",
 ]
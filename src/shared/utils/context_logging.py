@@ -0,0 +1,207 @@
+"""Level-gated, batched logging to MCP clients.
+
+Every ``Context.debug``/``info``/``report_progress`` call is an MCP notification
+sent over the transport, so logging once per file in a large repository costs
+more than the git work itself. ``ContextLogger`` wraps a FastMCP ``Context``
+and
+
+- drops messages below the log level the client requested via
+  ``logging/setLevel`` before formatting them (``%``-style arguments are only
+  interpolated for messages that are sent),
+- coalesces per-item messages into periodic summaries, and
+- rate-limits progress notifications to one per ``progress_interval``.
+
+Wrapping is idempotent, so services that receive a ``ContextLogger`` in place
+of a ``Context`` share its batching state with the calling tool.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from shared.base.types import LogLevel
+
+if TYPE_CHECKING:
+    from fastmcp import Context, FastMCP
+
+# Threshold used until a client sends logging/setLevel
+DEFAULT_CLIENT_LOG_LEVEL = LogLevel.INFO
+
+# Client-requested thresholds, keyed by MCP session
+_session_levels: weakref.WeakKeyDictionary[Any, LogLevel] = weakref.WeakKeyDictionary()
+
+
+def install_log_level_handler(mcp: FastMCP) -> None:
+    """Record the log level each client requests with ``logging/setLevel``.
+
+    FastMCP does not keep track of it, so the handler is registered on the
+    underlying low-level server; this also advertises the logging capability.
+    """
+    lowlevel = mcp._mcp_server
+
+    @lowlevel.set_logging_level()
+    async def _set_logging_level(level: str) -> None:
+        set_client_log_level(lowlevel.request_context.session, level)
+
+
+def set_client_log_level(session: Any, level: str | LogLevel) -> None:
+    """Set the threshold for messages sent to ``session``."""
+    _session_levels[session] = level if isinstance(level, LogLevel) else LogLevel[level.upper()]
+
+
+def client_log_level(ctx: Any) -> LogLevel:
+    """Return the threshold requested by the client behind ``ctx``."""
+    try:
+        return _session_levels.get(ctx.session, DEFAULT_CLIENT_LOG_LEVEL)
+    except (AttributeError, RuntimeError, TypeError):
+        # No active request (e.g. called outside a tool) or unhashable session
+        return DEFAULT_CLIENT_LOG_LEVEL
+
+
+class _Batch:
+    """Pending per-item messages of one category."""
+
+    __slots__ = ("level", "count", "reported", "last_emit", "message", "args")
+
+    def __init__(self, level: LogLevel) -> None:
+        self.level = level
+        self.count = 0
+        self.reported = 0
+        self.last_emit = float("-inf")
+        self.message = ""
+        self.args: tuple[Any, ...] = ()
+
+
+class ContextLogger:
+    """Adapter around a FastMCP ``Context`` for logging from hot loops.
+
+    All methods are no-ops when constructed with ``ctx=None``, so callers do
+    not need ``if ctx:`` guards.
+    """
+
+    def __init__(
+        self,
+        ctx: Context | None,
+        progress_interval: float = 0.25,
+        summary_interval: float = 2.0,
+    ) -> None:
+        """Wrap ``ctx``.
+
+        Args:
+            ctx: Context of the current tool call, or None to disable client logging
+            progress_interval: Minimum seconds between progress notifications
+            summary_interval: Minimum seconds between summaries of one item category
+        """
+        self.ctx = ctx
+        self.progress_interval = progress_interval
+        self.summary_interval = summary_interval
+        self.level = client_log_level(ctx) if ctx is not None else LogLevel.EMERGENCY
+        self._last_progress = float("-inf")
+        self._batches: dict[str, _Batch] = {}
+
+    @classmethod
+    def wrap(cls, ctx: Context | ContextLogger | None) -> ContextLogger:
+        """Return ``ctx`` if it already is a ``ContextLogger``, otherwise wrap it."""
+        return ctx if isinstance(ctx, ContextLogger) else cls(ctx)
+
+    def __bool__(self) -> bool:
+        """Truthy when messages can reach a client, like the wrapped context."""
+        return self.ctx is not None
+
+    def enabled(self, level: LogLevel) -> bool:
+        """Check whether a message at ``level`` would be sent."""
+        return self.ctx is not None and level <= self.level
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug messages are sent; use to skip building expensive messages."""
+        return self.enabled(LogLevel.DEBUG)
+
+    async def _send(self, level: LogLevel, message: str, args: tuple[Any, ...]) -> None:
+        if args:
+            message = message % args
+        ctx = self.ctx
+        if level == LogLevel.DEBUG:
+            await ctx.debug(message)  # type: ignore[union-attr]
+        elif level >= LogLevel.NOTICE:
+            await ctx.info(message)  # type: ignore[union-attr]
+        elif level == LogLevel.WARNING:
+            await ctx.warning(message)  # type: ignore[union-attr]
+        else:
+            await ctx.error(message)  # type: ignore[union-attr]
+
+    async def log(self, level: LogLevel, message: str, *args: Any) -> None:
+        """Send ``message % args`` at ``level`` if the client wants it."""
+        if self.ctx is not None and level <= self.level:
+            await self._send(level, message, args)
+
+    async def debug(self, message: str, *args: Any) -> None:
+        """Send a debug message."""
+        await self.log(LogLevel.DEBUG, message, *args)
+
+    async def info(self, message: str, *args: Any) -> None:
+        """Send an info message."""
+        await self.log(LogLevel.INFO, message, *args)
+
+    async def warning(self, message: str, *args: Any) -> None:
+        """Send a warning message."""
+        await self.log(LogLevel.WARNING, message, *args)
+
+    async def error(self, message: str, *args: Any) -> None:
+        """Send an error message."""
+        await self.log(LogLevel.ERROR, message, *args)
+
+    async def item(self, category: str, message: str, *args: Any, level: LogLevel = LogLevel.DEBUG) -> None:
+        """Record a per-item message, sending at most one summary per category and interval.
+
+        The summary reports how many items were seen since the previous one and
+        the latest message; ``flush`` reports what is left at the end.
+        """
+        if self.ctx is None or level > self.level:
+            return
+        batch = self._batches.get(category)
+        if batch is None:
+            batch = self._batches[category] = _Batch(level)
+        batch.count += 1
+        batch.message, batch.args = message, args
+
+        now = time.monotonic()
+        if now - batch.last_emit >= self.summary_interval:
+            await self._emit(category, batch, now)
+
+    async def _emit(self, category: str, batch: _Batch, now: float) -> None:
+        latest = batch.message % batch.args if batch.args else batch.message
+        pending = batch.count - batch.reported
+        await self._send(batch.level, f"{category}: {pending} item(s), {batch.count} total (latest: {latest})", ())
+        batch.reported = batch.count
+        batch.last_emit = now
+
+    async def progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        """Report progress, dropping updates that arrive within ``progress_interval``.
+
+        The first update and the final one (``progress >= total``) are always sent.
+        """
+        if self.ctx is None:
+            return
+        now = time.monotonic()
+        final = total is not None and progress >= total
+        if not final and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        if message is None:
+            await self.ctx.report_progress(progress, total)
+        else:
+            await self.ctx.report_progress(progress, total, message)
+
+    async def report_progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        """Alias of ``progress`` matching the ``Context`` method name."""
+        await self.progress(progress, total, message)
+
+    async def flush(self) -> None:
+        """Send summaries for item categories with unreported messages."""
+        now = time.monotonic()
+        for category, batch in self._batches.items():
+            if batch.count > batch.reported:
+                await self._emit(category, batch, now)
@@ -5,9 +5,10 @@ SPDX-License-Identifier: Apache-2.0
 Author: Manav Gupta <manavg@gmail.com>
 
 This module provides utility functions for git repository detection,
-URL parsing, file size formatting, commit message formatting, safe filename
-generation, diff stats parsing, text truncation, path normalization, file
-extension extraction, and binary file detection.
+repository state fingerprints, URL parsing, file size formatting, commit
+message formatting, safe filename generation, diff stats parsing, text
+truncation, path normalization, file extension extraction, and binary file
+detection.
 """
 from __future__ import annotations
 
@@ -46,6 +47,108 @@ def find_git_root(path: str | Path) -> Path | None:
     return None
 
 
+def git_dir(path: str | Path) -> Path | None:
+    """Return the git directory of the repository rooted at ``path``.
+
+    Follows ``.git`` files (``gitdir: ...``) used by worktrees and submodules.
+
+    Args:
+        path: Repository root.
+
+    Returns:
+        Path to the git directory or None if ``path`` is not a repository root.
+    """
+    dot_git = Path(path) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    target = Path(content[len("gitdir:") :].strip())
+    return target if target.is_absolute() else (Path(path) / target).resolve()
+
+
+def common_git_dir(directory: str | Path) -> Path:
+    """Return the git directory holding objects and shared refs for ``directory``.
+
+    Linked worktrees have their own git directory for HEAD and the index and
+    point to the main repository's through a ``commondir`` file.
+
+    Args:
+        directory: A git directory, as returned by ``git_dir``.
+
+    Returns:
+        The common git directory (``directory`` itself outside worktrees).
+    """
+    directory = Path(directory)
+    try:
+        return (directory / (directory / "commondir").read_text().strip()).resolve()
+    except OSError:
+        return directory
+
+
+_SHA256_CONFIG = re.compile(r"^\s*objectformat\s*=\s*sha256\s*$", re.IGNORECASE | re.MULTILINE)
+
+
+def object_id_size(directory: str | Path) -> int:
+    """Return the size in bytes of object ids in the repository of git directory ``directory``.
+
+    Args:
+        directory: A git directory, as returned by ``git_dir``.
+
+    Returns:
+        32 for SHA-256 repositories, otherwise 20.
+    """
+    try:
+        config = (common_git_dir(directory) / "config").read_text(errors="replace")
+    except OSError:
+        return 20
+    return 32 if _SHA256_CONFIG.search(config) else 20
+
+
+def repository_fingerprint(path: str | Path) -> tuple[tuple[str, int, int], ...]:
+    """Cheap identity of a repository's git state, read from file metadata without running git.
+
+    Covers HEAD, the index, the checked-out branch ref, packed refs and the
+    stash, so it changes on commits, staging, checkouts, resets and stashes.
+    Edits to the working tree alone do not change it.
+
+    Args:
+        path: Repository root.
+
+    Returns:
+        ``(name, mtime_ns, size)`` per file, with ``(name, 0, -1)`` for missing
+        files; empty if ``path`` is not a repository root.
+    """
+    directory = git_dir(path)
+    if directory is None:
+        return ()
+    # Worktrees keep refs in the main repository's git directory
+    common = common_git_dir(directory)
+
+    files = [("HEAD", directory / "HEAD"), ("index", directory / "index")]
+    try:
+        head = (directory / "HEAD").read_text().strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref:"):
+        ref = head[len("ref:") :].strip()
+        files.append((ref, common / ref))
+    files += [("packed-refs", common / "packed-refs"), ("refs/stash", common / "refs" / "stash")]
+
+    fingerprint = []
+    for name, file in files:
+        try:
+            stat = file.stat()
+            fingerprint.append((name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((name, 0, -1))
+    return tuple(fingerprint)
+
+
 def parse_git_url(url: str) -> dict[str, str]:
     """Parse a git URL into components.
 
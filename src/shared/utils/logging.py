@@ -13,12 +13,91 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Literal
 
 from shared.base.types import LogLevel
 
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "sample"]
+
+
+class LogSubscriber:
+    """Bounded ring buffer of log events for one subscriber.
+
+    ``push`` never blocks: when the buffer is full the overflow policy decides
+    what is lost and the ``dropped`` counter records it.
+
+    - ``drop_oldest``: keep the most recent events
+    - ``drop_newest``: keep the events already queued
+    - ``sample``: while full, admit one of every ``sample_rate`` new events
+      (evicting the oldest), so a slow subscriber still sees a thinned live feed
+    """
+
+    def __init__(self, capacity: int = 1000, policy: OverflowPolicy = "drop_oldest", sample_rate: int = 10) -> None:
+        """Create an empty buffer.
+
+        Args:
+            capacity: Maximum number of queued events
+            policy: What to do with new events while the buffer is full
+            sample_rate: For ``sample``, admit one of this many events while full
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.policy = policy
+        self.sample_rate = max(1, sample_rate)
+        self.dropped = 0
+        self.delivered = 0
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._overflow_seen = 0
+        self._ready = asyncio.Event()
+
+    def __len__(self) -> int:
+        """Number of queued events."""
+        return len(self._buffer)
+
+    def push(self, message: dict[str, Any]) -> None:
+        """Queue ``message`` without blocking, applying the overflow policy when full."""
+        buffer = self._buffer
+        if len(buffer) >= self.capacity:
+            if self.policy == "drop_newest":
+                self.dropped += 1
+                return
+            if self.policy == "sample":
+                self._overflow_seen += 1
+                if self._overflow_seen % self.sample_rate:
+                    self.dropped += 1
+                    return
+            buffer.popleft()
+            self.dropped += 1
+        buffer.append(message)
+        self._ready.set()
+
+    async def get_batch(self, max_items: int) -> list[dict[str, Any]]:
+        """Wait until events are queued and return up to ``max_items`` of them, oldest first."""
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        buffer = self._buffer
+        batch = [buffer.popleft() for _ in range(min(max_items, len(buffer)))]
+        if not buffer:
+            self._ready.clear()
+            self._overflow_seen = 0
+        self.delivered += len(batch)
+        return batch
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and delivery counters."""
+        return {
+            "policy": self.policy,
+            "capacity": self.capacity,
+            "queued": len(self._buffer),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
 
 class LoggingService:
     """MCP logging service.
@@ -26,14 +105,14 @@ class LoggingService:
     Implements structured logging with:
     - RFC 5424 severity levels
     - Log level management
-    - Log event subscriptions
+    - Log event subscriptions (bounded, non-blocking fan-out)
     - Logger name tracking
     """
 
     def __init__(self) -> None:
         """Initialize logging service."""
         self._level = LogLevel.INFO
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+        self._subscribers: list[LogSubscriber] = []
         self._loggers: dict[str, logging.Logger] = {}
 
     async def initialize(self, level: LogLevel) -> None:
@@ -101,6 +180,14 @@ class LoggingService:
         if not self._should_log(level):
             return
 
+        # Log through standard logging
+        logger = self.get_logger(logger_name or "")
+        log_func = getattr(logger, level.name.lower(), logger.info)
+        log_func(data)
+
+        if not self._subscribers:
+            return
+
         # Format notification message
         log_data: dict[str, Any] = {
             "level": level,
@@ -114,34 +201,62 @@ class LoggingService:
         if logger_name:
             log_data["logger"] = logger_name
 
-        # Log through standard logging
-        logger = self.get_logger(logger_name or "")
-        log_func = getattr(logger, level.name.lower(), logger.info)
-        log_func(data)
-
-        # Notify subscribers
-        for queue in self._subscribers:
-            try:
-                await queue.put(message)
-            except Exception as e:
-                logger.error(f"Failed to notify subscriber: {e}")
+        # Notify subscribers; push never blocks, so a slow subscriber only loses its own events
+        for subscriber in self._subscribers:
+            subscriber.push(message)
 
-    async def subscribe(self) -> AsyncGenerator[dict[str, Any], None]:
+    async def subscribe(
+        self, capacity: int = 1000, policy: OverflowPolicy = "drop_oldest"
+    ) -> AsyncGenerator[dict[str, Any], None]:
         """Subscribe to log messages.
 
         Returns a generator yielding log message events.
 
+        Args:
+            capacity: Maximum number of events buffered for this subscriber
+            policy: Overflow policy when the subscriber falls behind (see ``LogSubscriber``)
+
         Yields:
             Log message events
         """
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._subscribers.append(queue)
+        subscriber = LogSubscriber(capacity=capacity, policy=policy)
+        self._subscribers.append(subscriber)
         try:
             while True:
-                message = await queue.get()
-                yield message
+                for message in await subscriber.get_batch(capacity):
+                    yield message
         finally:
-            self._subscribers.remove(queue)
+            self._subscribers.remove(subscriber)
+
+    async def subscribe_batches(
+        self,
+        max_batch: int = 100,
+        capacity: int = 1000,
+        policy: OverflowPolicy = "drop_oldest",
+        sample_rate: int = 10,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Subscribe to log messages, receiving everything queued since the last batch at once.
+
+        Args:
+            max_batch: Maximum number of events per batch
+            capacity: Maximum number of events buffered for this subscriber
+            policy: Overflow policy when the subscriber falls behind (see ``LogSubscriber``)
+            sample_rate: For the ``sample`` policy, admit one of this many events while full
+
+        Yields:
+            Lists of log message events, oldest first
+        """
+        subscriber = LogSubscriber(capacity=capacity, policy=policy, sample_rate=sample_rate)
+        self._subscribers.append(subscriber)
+        try:
+            while True:
+                yield await subscriber.get_batch(max_batch)
+        finally:
+            self._subscribers.remove(subscriber)
+
+    def subscriber_stats(self) -> list[dict[str, Any]]:
+        """Return queue depth and drop counters for every active subscriber."""
+        return [subscriber.stats() for subscriber in self._subscribers]
 
     def _should_log(self, level: LogLevel) -> bool:
         """Check if level meets minimum threshold.
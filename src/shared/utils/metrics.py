@@ -0,0 +1,318 @@
+"""In-process performance metrics with Prometheus text exposition.
+
+A small, dependency-free registry of labelled counters, gauges and histograms. Servers
+record tool latencies, git subprocess timings, LLM usage and cache lookups
+into the process-wide ``metrics`` registry; ``render_prometheus`` serves it on
+``/metrics`` and ``snapshot`` backs the ``get_performance_stats`` tool.
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+# Latency buckets in seconds, from sub-millisecond git plumbing to slow LLM calls
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    """Common state of a labelled metric family."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_str(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, values, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Create a counter family."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` to the counter for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Return the current value for ``labels``."""
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list[str]:
+        """Return Prometheus exposition lines."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [f"{self.name}{self._label_str(k)} {_format_value(v)}" for k, v in items]
+
+    def snapshot(self) -> dict[str, float]:
+        """Return values keyed by comma-joined label values."""
+        with self._lock:
+            return {",".join(k): v for k, v in sorted(self._values.items())}
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down, e.g. a queue depth."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        """Subtract ``amount`` from the gauge for ``labels``."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge for ``labels`` to ``value``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class _HistogramSeries:
+    """Bucket counts, sum and count of one label set."""
+
+    __slots__ = ("buckets", "sum", "count", "max")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """Create a histogram family with ascending upper bounds ``buckets``."""
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation for ``labels``."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets) + 1)
+            series.buckets[index] += 1
+            series.sum += value
+            series.count += 1
+            series.max = max(series.max, value)
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        """Return the number of observations for ``labels``."""
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def _quantile(self, series: _HistogramSeries, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        rank = q * series.count
+        seen = 0
+        for bound, n in zip(self.buckets, series.buckets, strict=False):
+            seen += n
+            if seen >= rank:
+                return min(bound, series.max)
+        return series.max
+
+    def render(self) -> list[str]:
+        """Return Prometheus exposition lines."""
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._series.items())
+            for key, series in items:
+                cumulative = 0
+                for bound, n in zip((*self.buckets, math.inf), series.buckets, strict=True):
+                    cumulative += n
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{self.name}_bucket{self._label_str(key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{self._label_str(key)} {_format_value(series.sum)}")
+                lines.append(f"{self.name}_count{self._label_str(key)} {series.count}")
+        return lines
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return count, sum, mean, max and estimated p50/p95/p99 per label set."""
+        with self._lock:
+            return {
+                ",".join(key): {
+                    "count": s.count,
+                    "sum": round(s.sum, 6),
+                    "mean": round(s.sum / s.count, 6) if s.count else 0.0,
+                    "max": round(s.max, 6),
+                    "p50": self._quantile(s, 0.5),
+                    "p95": self._quantile(s, 0.95),
+                    "p99": self._quantile(s, 0.99),
+                }
+                for key, s in sorted(self._series.items())
+            }
+
+
+class MetricsRegistry:
+    """Named collection of metric families.
+
+    ``counter``, ``gauge`` and ``histogram`` return the existing family when called again
+    with the same name, so modules can declare the metrics they record at import
+    time without coordinating.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter family ``name``, creating it if needed."""
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[no-any-return]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge family ``name``, creating it if needed."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[no-any-return]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram family ``name``, creating it if needed."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)  # type: ignore[no-any-return]
+
+    def render_prometheus(self) -> str:
+        """Render every family in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())  # type: ignore[attr-defined]
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON-friendly summary of every family."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return {m.name: m.snapshot() for m in metrics}  # type: ignore[attr-defined]
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+# Metrics shared by both servers
+TOOL_CALLS = metrics.counter("mcp_tool_calls_total", "MCP tool calls by tool and outcome", ("tool", "status"))
+TOOL_LATENCY = metrics.histogram("mcp_tool_duration_seconds", "MCP tool call latency", ("tool",))
+GIT_COMMANDS = metrics.counter(
+    "mcp_git_commands_total", "Git subprocesses by subcommand and status", ("command", "status")
+)
+GIT_LATENCY = metrics.histogram("mcp_git_command_duration_seconds", "Git subprocess wall time", ("command",))
+GIT_TERMINATIONS = metrics.counter(
+    "mcp_git_terminations_total",
+    "Git subprocesses stopped early by reason (timeout, cancelled) and final signal (term, kill)",
+    ("command", "reason", "signal"),
+)
+GIT_QUEUE_DEPTH = metrics.gauge(
+    "mcp_git_queue_depth", "Git commands waiting for a scheduler slot by priority class", ("priority",)
+)
+GIT_QUEUE_WAIT = metrics.histogram(
+    "mcp_git_queue_wait_seconds", "Time git commands waited for a scheduler slot", ("priority",)
+)
+GIT_RUNNING = metrics.gauge("mcp_git_running", "Git subprocesses holding a scheduler slot")
+GIT_BYTES = metrics.counter("mcp_git_pipe_bytes_total", "Bytes read from git stdout/stderr pipes", ("command",))
+LLM_REQUESTS = metrics.counter("mcp_llm_requests_total", "LLM completions by mode and outcome", ("mode", "status"))
+LLM_LATENCY = metrics.histogram("mcp_llm_request_duration_seconds", "LLM completion latency", ("mode",))
+LLM_TOKENS = metrics.counter("mcp_llm_tokens_total", "LLM tokens reported by the API", ("kind",))
+CACHE_LOOKUPS = metrics.counter("mcp_cache_lookups_total", "Cache lookups by cache and result", ("cache", "result"))
+COALESCED_CALLS = metrics.counter(
+    "mcp_singleflight_calls_total",
+    "Coalesced calls by operation; role is leader (computed) or shared (awaited a leader)",
+    ("operation", "role"),
+)
+
+
+def git_subcommand(command: Sequence[str]) -> str:
+    """Return the git subcommand of an argument list (without ``git -C <path>``), for labels."""
+    for arg in command:
+        if not arg.startswith("-"):
+            return arg
+    return "unknown"
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one lookup of ``cache``."""
+    CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def cache_hit_rates() -> dict[str, dict[str, float]]:
+    """Return hits, misses and hit rate per cache."""
+    rates: dict[str, dict[str, float]] = {}
+    for key, value in CACHE_LOOKUPS.snapshot().items():
+        cache, result = key.split(",")
+        entry = rates.setdefault(cache, {"hit": 0, "miss": 0})
+        entry[result] = value
+    for entry in rates.values():
+        lookups = entry["hit"] + entry["miss"]
+        entry["hit_rate"] = round(entry["hit"] / lookups, 3) if lookups else 0.0
+    return rates
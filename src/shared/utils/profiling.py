@@ -0,0 +1,266 @@
+"""On-demand profiling of MCP tool calls.
+
+A ``ToolProfiler`` is idle until armed, either for the next N tool calls, for
+calls of given tools, or both. Each profiled call writes one output file to
+the profile directory: ``.pstats`` (cProfile, open with ``python -m pstats``
+or snakeviz) or ``.collapsed`` (stack samples in the collapsed format read by
+flamegraph.pl and speedscope). A ``.git.json`` file next to it lists every git
+subprocess the call ran with its duration and outcome.
+
+When idle, the only cost is one attribute check per tool call and one context
+variable lookup per git command. Only one call is profiled at a time; calls
+arriving while a profile is running are executed normally. Both profilers see
+the whole event loop thread, so concurrent requests show up in the output.
+
+Defaults come from ``MCP_PROFILE_*`` environment variables: ``DIR``,
+``MODE`` (``cprofile`` or ``sample``), ``INTERVAL_MS``, and ``CALLS`` /
+``TOOLS`` (comma separated) to arm the profiler at startup.
+"""
+
+import cProfile
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any, Literal
+
+from .git import safe_filename
+from .logging import logging_service
+
+ProfileMode = Literal["cprofile", "sample"]
+
+DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "mcp-auto-pr" / "profiles"
+
+# Room for the timestamp, sequence number and suffix within a 255 byte name
+_MAX_STEM_LENGTH = 100
+
+_active_session: ContextVar["ProfileSession | None"] = ContextVar("mcp_profile_session", default=None)
+
+
+def current_profile() -> "ProfileSession | None":
+    """Return the profile session of the running tool call, if it is being profiled."""
+    return _active_session.get()
+
+
+class StackSampler:
+    """Samples the stack of one thread from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        """Sample ``thread_id`` every ``interval`` seconds once started."""
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="mcp-profile-sampler", daemon=True)
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self._collapse(frame)] += 1
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+
+class ProfileSession:
+    """Profile of one tool call and the git commands it ran."""
+
+    __slots__ = ("tool", "mode", "interval", "started", "git_spans", "_profile", "_sampler")
+
+    def __init__(self, tool: str, mode: ProfileMode, interval: float) -> None:
+        """Prepare a session for ``tool``; nothing runs until ``start``."""
+        self.tool = tool
+        self.mode = mode
+        self.interval = interval
+        self.started = 0.0
+        self.git_spans: list[dict[str, Any]] = []
+        self._profile: cProfile.Profile | None = None
+        self._sampler: StackSampler | None = None
+
+    def start(self) -> None:
+        """Start collecting."""
+        self.started = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop collecting."""
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    def record_git(self, command: str, start: float, duration: float, status: str) -> None:
+        """Record a git subprocess that started at ``start`` (``time.perf_counter``)."""
+        self.git_spans.append(
+            {
+                "command": command,
+                "start_ms": round((start - self.started) * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "status": status,
+            }
+        )
+
+    def write(self, base: Path) -> list[Path]:
+        """Write the profile and git spans next to ``base`` and return the files written."""
+        written = []
+        if self._profile is not None:
+            path = base.with_suffix(".pstats")
+            self._profile.dump_stats(path)
+            written.append(path)
+        if self._sampler is not None:
+            path = base.with_suffix(".collapsed")
+            stacks = Counter(self._sampler.stacks)
+            # Git runs in child processes; show its wall time as sibling stacks in sample units
+            for span in self.git_spans:
+                samples = round(span["duration_ms"] / 1000 / self.interval)
+                if samples:
+                    stacks[f"[git];{span['command']}"] += samples
+            path.write_text("".join(f"{stack} {count}\n" for stack, count in stacks.items()))
+            written.append(path)
+        path = base.with_suffix(".git.json")
+        path.write_text(json.dumps({"tool": self.tool, "git_commands": self.git_spans}, indent=2))
+        written.append(path)
+        return written
+
+
+def _file_stem(tool: str) -> str:
+    """Turn a client-supplied tool name into a file name stem inside the profile directory.
+
+    Path separators and ``..`` cannot escape the directory, and dots are
+    replaced so the suffixes added by ``ProfileSession.write`` keep the name.
+    """
+    stem = "".join(c if c.isprintable() else "_" for c in tool).replace(".", "_")
+    return safe_filename(stem)[:_MAX_STEM_LENGTH]
+
+
+class ToolProfiler:
+    """Decides which tool calls are profiled and where their output goes."""
+
+    def __init__(
+        self,
+        output_dir: Path | str = DEFAULT_PROFILE_DIR,
+        mode: ProfileMode = "cprofile",
+        interval: float = 0.005,
+    ) -> None:
+        """Create an idle profiler writing to ``output_dir``."""
+        self.output_dir = Path(output_dir)
+        self.mode: ProfileMode = mode
+        self.interval = interval
+        self.active = False
+        self.remaining: int | None = None
+        self.tools: frozenset[str] | None = None
+        self.recent: deque[str] = deque(maxlen=20)
+        self._busy = False
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self.logger = logging_service.get_logger(__name__)
+
+    @classmethod
+    def from_env(cls) -> "ToolProfiler":
+        """Create a profiler from ``MCP_PROFILE_*`` variables, armed if ``CALLS`` or ``TOOLS`` is set."""
+        mode = os.environ.get("MCP_PROFILE_MODE", "cprofile")
+        profiler = cls(
+            output_dir=os.environ.get("MCP_PROFILE_DIR") or DEFAULT_PROFILE_DIR,
+            mode="sample" if mode == "sample" else "cprofile",
+            interval=float(os.environ.get("MCP_PROFILE_INTERVAL_MS", "5")) / 1000,
+        )
+        calls = os.environ.get("MCP_PROFILE_CALLS")
+        tools = [t.strip() for t in os.environ.get("MCP_PROFILE_TOOLS", "").split(",") if t.strip()]
+        if calls or tools:
+            profiler.arm(calls=int(calls) if calls else None, tools=tools or None)
+        return profiler
+
+    def arm(self, calls: int | None = 1, tools: Iterable[str] | None = None, mode: ProfileMode | None = None) -> None:
+        """Profile the next ``calls`` matching calls (all of them while ``calls`` is None).
+
+        ``tools`` restricts profiling to those tool names. ``calls=None`` without
+        ``tools`` would profile everything, so it is treated as one call.
+        """
+        with self._lock:
+            self.tools = frozenset(tools) if tools else None
+            self.remaining = calls if calls is not None or self.tools else 1
+            if mode:
+                self.mode = mode
+            self.active = self.remaining is None or self.remaining > 0
+
+    def disarm(self) -> None:
+        """Stop profiling new calls."""
+        with self._lock:
+            self.active = False
+            self.remaining = 0
+            self.tools = None
+
+    def claim(self, tool: str) -> bool:
+        """Reserve the profiler for a call of ``tool``; False when it should run unprofiled."""
+        with self._lock:
+            if not self.active or self._busy or (self.tools is not None and tool not in self.tools):
+                return False
+            if self.remaining is not None:
+                self.remaining -= 1
+                self.active = self.remaining > 0
+            self._busy = True
+            return True
+
+    @contextmanager
+    def session(self, tool: str) -> Iterator[ProfileSession]:
+        """Profile the enclosed call of ``tool``; must follow a successful ``claim``."""
+        session = ProfileSession(tool, self.mode, self.interval)
+        token = _active_session.set(session)
+        session.start()
+        try:
+            yield session
+        finally:
+            session.stop()
+            _active_session.reset(token)
+            try:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                stamp = time.strftime("%Y%m%d-%H%M%S")
+                base = self.output_dir / f"{_file_stem(tool)}-{stamp}-{next(self._sequence)}"
+                for path in session.write(base):
+                    self.recent.append(str(path))
+                    self.logger.info(f"Wrote profile of {tool} to {path}")
+            except OSError as e:
+                self.logger.error(f"Failed to write profile of {tool}: {e}")
+            finally:
+                with self._lock:
+                    self._busy = False
+
+    def status(self) -> dict[str, Any]:
+        """Return the arming state and the most recently written files."""
+        return {
+            "active": self.active,
+            "remaining_calls": self.remaining if self.active else 0,
+            "tools": sorted(self.tools) if self.tools else None,
+            "mode": self.mode,
+            "output_dir": str(self.output_dir),
+            "recent_files": list(self.recent),
+        }
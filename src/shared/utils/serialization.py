@@ -0,0 +1,75 @@
+"""JSON serialization helpers for large tool responses.
+
+Tool results are encoded with orjson when it is installed and with pydantic-core
+otherwise; both are considerably faster than the stdlib ``json`` module on large
+nested payloads. List-valued results can be paginated so clients fetch very
+large file listings in bounded pieces.
+"""
+
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+import pydantic_core
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+T = TypeVar("T")
+
+
+def _default(value: Any) -> Any:
+    """Convert values orjson does not handle natively (models, paths, sets, ...)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return pydantic_core.to_jsonable_python(value, fallback=str)
+
+
+def dumps(data: Any) -> str:
+    """Serialize ``data`` to a JSON string using the fastest available encoder.
+
+    Used as the FastMCP tool result serializer. Values neither encoder
+    understands are converted with ``str`` rather than failing the tool call.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; pydantic-core handles those
+            pass
+    return pydantic_core.to_json(data, fallback=str).decode()
+
+
+def paginate(items: Sequence[T], offset: int = 0, limit: int | None = None) -> tuple[Sequence[T], dict[str, Any]]:
+    """Return one page of ``items`` and pagination metadata.
+
+    Args:
+        items: Full, stably ordered sequence
+        offset: Index of the first item of the page
+        limit: Maximum page size, or None for everything from ``offset`` on
+
+    Returns:
+        Tuple of (page, metadata) where metadata contains ``offset``, ``limit``,
+        ``returned``, ``total``, ``has_more`` and ``next_offset`` (None on the last page)
+    """
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    total = len(items)
+    end = total if limit is None else min(total, offset + limit)
+    page = items[offset:end] if offset or end != total else items
+    has_more = end < total
+    return page, {
+        "offset": offset,
+        "limit": limit,
+        "returned": len(page),
+        "total": total,
+        "has_more": has_more,
+        "next_offset": end if has_more else None,
+    }
@@ -0,0 +1,65 @@
+"""Coalescing of identical concurrent async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from .metrics import COALESCED_CALLS
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One in-flight computation and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs a computation once for all concurrent callers using the same key.
+
+    The first caller for a key starts the computation in its own task; callers
+    arriving while it runs await that task and receive the same result or
+    exception. Nothing is kept after it finishes, so the next call computes
+    again. The computation is cancelled only once every caller awaiting it has
+    been cancelled. Shared results must be treated as read-only.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Create an empty group; ``name`` labels its ``mcp_singleflight_calls_total`` metrics."""
+        self.name = name
+        self._flights: dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of computations currently running."""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of ``compute()``, sharing a computation already running for ``key``."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(compute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            COALESCED_CALLS.inc(operation=self.name, role="leader")
+        else:
+            COALESCED_CALLS.inc(operation=self.name, role="shared")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)  # type: ignore[no-any-return]
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
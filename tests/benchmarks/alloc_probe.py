@@ -0,0 +1,125 @@
+"""Measure Python allocation peaks of benchmark workloads in a pristine interpreter.
+
+Inside the pytest process the peak of a call depends on which tests ran
+before: interpreter tables such as the interned string dict grow with
+everything imported and parsed so far, and a one-off resize is charged to
+whichever call crosses the threshold. ``ProbeServer`` starts one fresh
+interpreter (``python -m benchmarks.alloc_probe``) with a fixed hash seed. It
+imports the benchmark module and forks a child per measurement, so every
+measurement starts from the same state whatever the test order, without paying
+for interpreter start-up and imports each time. The module must define
+``isolated_workload(test_name, params, tmp_path)`` returning the benchmarked
+callable.
+"""
+
+import asyncio
+import gc
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import traceback
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Any
+
+
+def call(target: Callable[[], Any]) -> Any:
+    """Call ``target``, running the coroutine it returns if it is async."""
+    result = target()
+    return asyncio.run(result) if inspect.iscoroutine(result) else result
+
+
+def peak_alloc_mb(target: Callable[[], Any]) -> float:
+    """Return the peak of Python allocations made while calling ``target``, in MiB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call(target)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / (1024 * 1024), 3)
+
+
+class ProbeServer:
+    """Client for a fork server measuring workloads of benchmark modules."""
+
+    def __init__(self) -> None:
+        self._process: subprocess.Popen[str] | None = None
+
+    def peak_alloc_mb(self, module_name: str, test_name: str, params: dict[str, Any]) -> float:
+        """Return the allocation peak of ``test_name``'s workload measured in a forked child."""
+        if self._process is None:
+            env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONHASHSEED": "0"}
+            self._process = subprocess.Popen(
+                [sys.executable, "-m", __name__], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env
+            )
+        assert self._process.stdin is not None and self._process.stdout is not None
+        self._process.stdin.write(json.dumps([module_name, test_name, params]) + "\n")
+        self._process.stdin.flush()
+        reply = json.loads(self._process.stdout.readline() or '{"error": "probe server exited"}')
+        if "error" in reply:
+            raise RuntimeError(f"Allocation probe failed for {test_name}{params}:\n{reply['error']}")
+        return float(reply["peak_mb"])
+
+    def close(self) -> None:
+        """Stop the server process."""
+        if self._process is not None:
+            assert self._process.stdin is not None
+            self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+def _measure(module_name: str, test_name: str, params: dict[str, Any]) -> float:
+    module = importlib.import_module(module_name)
+    with tempfile.TemporaryDirectory() as tmp:
+        target = module.isolated_workload(test_name, params, Path(tmp))
+        # The first call pays for lazy imports and caches, which are not part of the workload
+        call(target)
+        return peak_alloc_mb(target)
+
+
+def _serve_one(request: str, out: IO[str]) -> None:
+    module_name, test_name, params = json.loads(request)
+    # Imported by the server so the import is not repeated, or measured, in every child
+    importlib.import_module(module_name)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        # Replies go to stdout, so anything the workload prints goes to stderr instead
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        reply: dict[str, Any]
+        try:
+            reply = {"peak_mb": _measure(module_name, test_name, params)}
+        except BaseException:
+            reply = {"error": traceback.format_exc()}
+        with os.fdopen(write_fd, "w") as pipe:
+            json.dump(reply, pipe)
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = pipe.read()
+    os.waitpid(pid, 0)
+    out.write((result or json.dumps({"error": "probe child exited without a result"})) + "\n")
+    out.flush()
+
+
+def main() -> None:
+    """Serve measurement requests, one JSON line each, from stdin until it closes."""
+    for request in sys.stdin:
+        try:
+            _serve_one(request, sys.stdout)
+        except Exception:
+            sys.stdout.write(json.dumps({"error": traceback.format_exc()}) + "\n")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Regression gate comparing benchmark measurements with a stored baseline.
+
+``baseline.json`` maps benchmark names to ``{"time_s": ..., "peak_alloc_mb": ...}``.
+A measurement fails the gate when it exceeds the baseline by more than the
+tolerance ratio plus a small absolute slack (so tiny benchmarks are not
+flagged for noise). Allocation peaks are gated by default; wall time depends
+on the machine the baseline was recorded on, so it is only gated when
+``BENCH_TIME_TOLERANCE`` is set. Run with ``BENCH_UPDATE_BASELINE=1`` to record
+new values after an intentional change; entries missing from the file are not
+gated.
+"""
+
+import json
+import os
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Absolute slack added on top of the ratio, per metric
+_SLACK = {"time_s": 0.002, "peak_alloc_mb": 0.25}
+
+
+class BaselineGate:
+    """Loads, checks and (optionally) rewrites the benchmark baseline."""
+
+    def __init__(
+        self,
+        path: Path = BASELINE_PATH,
+        time_tolerance: float | None = None,
+        alloc_tolerance: float | None = None,
+        update: bool | None = None,
+    ) -> None:
+        """Load the baseline; unset arguments come from ``BENCH_*`` environment variables.
+
+        Without ``time_tolerance`` or ``BENCH_TIME_TOLERANCE`` timings are
+        recorded but not gated.
+        """
+        self.path = path
+        time_env = os.environ.get("BENCH_TIME_TOLERANCE")
+        self.tolerance: dict[str, float | None] = {
+            "time_s": time_tolerance or (float(time_env) if time_env else None),
+            "peak_alloc_mb": alloc_tolerance or float(os.environ.get("BENCH_ALLOC_TOLERANCE", "1.25")),
+        }
+        self.update = update if update is not None else os.environ.get("BENCH_UPDATE_BASELINE") == "1"
+        self.entries: dict[str, dict[str, float]] = json.loads(path.read_text()) if path.exists() else {}
+        self._measured: dict[str, dict[str, float]] = {}
+
+    def check(self, name: str, measured: dict[str, float]) -> list[str]:
+        """Record ``measured`` for ``name`` and return a message for every metric over its limit."""
+        self._measured[name] = measured
+        if self.update:
+            return []
+        baseline = self.entries.get(name, {})
+        failures = []
+        for metric, value in measured.items():
+            tolerance = self.tolerance[metric]
+            if metric not in baseline or tolerance is None:
+                continue
+            limit = baseline[metric] * tolerance + _SLACK[metric]
+            if value > limit:
+                failures.append(
+                    f"{name}: {metric}={value:.4g} exceeds baseline {baseline[metric]:.4g} "
+                    f"x{tolerance} (limit {limit:.4g})"
+                )
+        return failures
+
+    def save(self) -> None:
+        """Write recorded measurements into the baseline file when updating."""
+        if not self.update or not self._measured:
+            return
+        entries = {**self.entries, **self._measured}
+        self.path.write_text(json.dumps(dict(sorted(entries.items())), indent=2) + "\n")
@@ -0,0 +1,122 @@
+"""Fixtures for analyzer benchmarks.
+
+Repository sizes come from ``BENCH_FILE_COUNTS`` (comma separated, default
+``100,1000``), e.g. ``BENCH_FILE_COUNTS=1000,10000,100000``. Each benchmark
+records git subprocess counts and memory peaks in ``extra_info``, which
+pytest-benchmark stores alongside the timings in ``--benchmark-json`` and
+``--benchmark-autosave`` output, so runs can be compared.
+"""
+
+import os
+import resource
+import sys
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services import ChangeDetector, DiffAnalyzer, GitClient, StatusTracker
+from shared.utils.metrics import GIT_COMMANDS
+
+from .alloc_probe import ProbeServer, call, peak_alloc_mb
+from .baseline import BaselineGate
+from .synthetic_repo import SyntheticRepo, SyntheticRepoSpec, build_synthetic_repo
+
+
+def _file_counts() -> list[int]:
+    return [int(n) for n in os.environ.get("BENCH_FILE_COUNTS", "100,1000").split(",") if n.strip()]
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark everything in this directory as a benchmark needing git."""
+    for item in items:
+        if "benchmarks" in item.nodeid.split("/"):
+            item.add_marker(pytest.mark.benchmark)
+            item.add_marker(pytest.mark.git)
+
+
+@pytest.fixture(scope="session", params=_file_counts(), ids=lambda n: f"{n}_files")
+def synthetic_repo(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> SyntheticRepo:
+    """A dirty repository with the default shape, built once per size and session."""
+    count = request.param
+    spec = SyntheticRepoSpec(file_count=count, commits=max(50, count // 50))
+    return build_synthetic_repo(tmp_path_factory.mktemp(f"repo_{count}"), spec)
+
+
+@pytest.fixture(scope="session")
+def analyzer_services() -> dict[str, Any]:
+    """Analyzer services wired the same way as ``GitAnalyzerServer.initialize_services``."""
+    settings = GitAnalyzerSettings()
+    git_client = GitClient(settings)
+    change_detector = ChangeDetector(git_client)
+    return {
+        "git_client": git_client,
+        "change_detector": change_detector,
+        "diff_analyzer": DiffAnalyzer(settings),
+        "status_tracker": StatusTracker(git_client, change_detector),
+    }
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _git_subprocesses() -> float:
+    return sum(GIT_COMMANDS.snapshot().values())
+
+
+@pytest.fixture(scope="session")
+def baseline_gate() -> Iterator[BaselineGate]:
+    """The stored baseline; rewritten at the end of the session with ``BENCH_UPDATE_BASELINE=1``."""
+    gate = BaselineGate()
+    yield gate
+    gate.save()
+
+
+@pytest.fixture(scope="session")
+def alloc_probe() -> Iterator[ProbeServer]:
+    """Fork server measuring gated allocation peaks, started on first use."""
+    server = ProbeServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def run_benchmark(
+    benchmark: Any, baseline_gate: BaselineGate, alloc_probe: ProbeServer, request: pytest.FixtureRequest
+) -> Callable[..., Any]:
+    """Benchmark a sync or async callable and attach resource usage to the result.
+
+    One untimed run under ``tracemalloc`` measures git subprocesses spawned and
+    the peak of Python allocations; the timed rounds follow. With ``gate=True``
+    the fastest round and the allocation peak are checked against the baseline
+    (timings only when pytest-benchmark actually timed the rounds and
+    ``BENCH_TIME_TOLERANCE`` is set). The gated peak is measured by
+    ``alloc_probe`` on the test module's ``isolated_workload``, in a child of
+    a pristine interpreter, so it does not depend on which tests ran before.
+    """
+
+    def run(target: Callable[[], Any], rounds: int = 5, gate: bool = False) -> Any:
+        git_before = _git_subprocesses()
+        peak_mb = peak_alloc_mb(target)
+        benchmark.extra_info["git_subprocesses"] = int(_git_subprocesses() - git_before)
+        if gate:
+            params = request.node.callspec.params if hasattr(request.node, "callspec") else {}
+            peak_mb = alloc_probe.peak_alloc_mb(request.module.__name__, request.node.originalname, params)
+        benchmark.extra_info["peak_python_alloc_mb"] = peak_mb
+
+        result = benchmark.pedantic(lambda: call(target), rounds=rounds, iterations=1)
+        benchmark.extra_info["max_rss_mb"] = _max_rss_mb()
+
+        if gate:
+            measured = {"peak_alloc_mb": peak_mb}
+            if benchmark.enabled and benchmark.stats:
+                measured["time_s"] = round(benchmark.stats.stats.min, 6)
+            failures = baseline_gate.check(request.node.name, measured)
+            assert not failures, "Performance regression:\n" + "\n".join(failures)
+        return result
+
+    return run
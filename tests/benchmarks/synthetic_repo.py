@@ -0,0 +1,182 @@
+"""Deterministic synthetic git repositories for benchmarks.
+
+``build_synthetic_repo`` creates a repository of a requested size and shape:
+the committed history is written in one ``git fast-import`` stream (100k
+files and thousands of commits build in well under a minute), then the
+working tree is checked out and dirtied according to the spec. The same spec and seed always
+produce the same files, contents, commits and changes.
+"""
+
+import os
+import random
+import subprocess
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+_IDENTITY = "Bench Bot <bench@example.com>"
+_EPOCH = 1_700_000_000
+_TEXT_EXTENSIONS = (".py", ".py", ".py", ".md", ".json", ".txt", ".yaml", ".ts")
+_WORDS = ("alpha", "beta", "gamma", "delta", "value", "result", "config", "items", "handler", "cache")
+
+
+class SyntheticRepoSpec(BaseModel):
+    """Shape of a synthetic repository; ratios are fractions of ``file_count``."""
+
+    file_count: int = Field(1000, ge=1, description="Committed files")
+    modified_ratio: float = Field(0.05, ge=0, le=1, description="Tracked files with unstaged edits")
+    staged_ratio: float = Field(0.03, ge=0, le=1, description="Tracked files with staged edits")
+    untracked_ratio: float = Field(0.02, ge=0, le=1, description="New untracked files")
+    binary_ratio: float = Field(0.02, ge=0, le=1, description="Committed files with binary content")
+    renames: int = Field(5, ge=0, description="Staged renames")
+    commits: int = Field(50, ge=1, description="Commits in history")
+    files_per_commit: int = Field(5, ge=1, description="Files touched by each history commit")
+    unpushed_commits: int = Field(3, ge=0, description="Commits ahead of refs/remotes/origin/main")
+    stashes: int = Field(2, ge=0, description="Stash entries")
+    seed: int = Field(0, description="Random seed")
+
+
+class SyntheticRepo:
+    """A generated repository and the changes applied to its working tree."""
+
+    def __init__(self, path: Path, spec: SyntheticRepoSpec) -> None:
+        """Describe an empty repository at ``path``; filled in by ``build_synthetic_repo``."""
+        self.path = path
+        self.spec = spec
+        self.tracked: list[str] = []
+        self.binary: list[str] = []
+        self.modified: list[str] = []
+        self.staged: list[str] = []
+        self.untracked: list[str] = []
+        self.renamed: list[tuple[str, str]] = []
+
+    @property
+    def outstanding_files(self) -> int:
+        """Number of paths git status reports."""
+        return len(self.modified) + len(self.staged) + len(self.untracked) + len(self.renamed)
+
+
+def _git(path: Path, *args: str, input: bytes | None = None) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Bench Bot",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "Bench Bot",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+        "GIT_AUTHOR_DATE": f"{_EPOCH} +0000",
+        "GIT_COMMITTER_DATE": f"{_EPOCH} +0000",
+    }
+    subprocess.run(["git", "-C", str(path), *args], input=input, env=env, check=True, capture_output=True)
+
+
+def _paths(spec: SyntheticRepoSpec, rng: random.Random) -> list[str]:
+    """Spread files over a two-level directory tree of roughly 50 files per directory."""
+    dirs = max(1, spec.file_count // 50)
+    top = max(1, int(dirs**0.5))
+    binary_count = int(spec.file_count * spec.binary_ratio)
+    paths = []
+    for i in range(spec.file_count):
+        d = i % dirs
+        ext = ".bin" if i < binary_count else rng.choice(_TEXT_EXTENSIONS)
+        paths.append(f"pkg{d % top}/mod{d}/file_{i:06d}{ext}")
+    return sorted(paths)
+
+
+def _text(rng: random.Random, lines: int, tag: str) -> bytes:
+    body = (f"{rng.choice(_WORDS)}_{n} = {rng.randint(0, 10**6)}  # {tag}" for n in range(lines))
+    return ("\n".join(body) + "\n").encode()
+
+
+def _content(path: str, rng: random.Random, tag: str) -> bytes:
+    if path.endswith(".bin"):
+        return b"\x00\x01BIN" + rng.randbytes(rng.randint(64, 1024))
+    return _text(rng, rng.randint(5, 40), tag)
+
+
+def _fast_import_stream(repo: SyntheticRepo, rng: random.Random) -> bytes:
+    spec = repo.spec
+    out: list[bytes] = []
+    mark = 0
+
+    def blob(data: bytes) -> int:
+        nonlocal mark
+        mark += 1
+        out.append(b"blob\nmark :%d\ndata %d\n%s\n" % (mark, len(data), data))
+        return mark
+
+    def commit(number: int, changes: list[tuple[str, int]]) -> int:
+        nonlocal mark
+        mark += 1
+        message = f"Commit {number}\n".encode()
+        out.append(
+            b"commit refs/heads/main\nmark :%d\ncommitter %s %d +0000\ndata %d\n%s"
+            % (mark, _IDENTITY.encode(), _EPOCH + number * 60, len(message), message)
+        )
+        out.extend(b"M 100644 :%d %s\n" % (blob_mark, path.encode()) for path, blob_mark in changes)
+        out.append(b"\n")
+        return mark
+
+    initial = [(path, blob(_content(path, rng, "v0"))) for path in repo.tracked]
+    commit_marks = [commit(0, initial)]
+    for number in range(1, spec.commits):
+        touched = rng.sample(repo.tracked, min(spec.files_per_commit, len(repo.tracked)))
+        changes = [(path, blob(_content(path, rng, f"v{number}"))) for path in sorted(touched)]
+        commit_marks.append(commit(number, changes))
+
+    upstream = commit_marks[max(0, len(commit_marks) - 1 - spec.unpushed_commits)]
+    out.append(b"reset refs/remotes/origin/main\nfrom :%d\n\n" % upstream)
+    return b"".join(out)
+
+
+def build_synthetic_repo(path: Path, spec: SyntheticRepoSpec | None = None) -> SyntheticRepo:
+    """Create a repository at ``path`` (an empty or missing directory) shaped by ``spec``."""
+    spec = spec or SyntheticRepoSpec()
+    rng = random.Random(spec.seed)
+    repo = SyntheticRepo(path, spec)
+    repo.tracked = _paths(spec, rng)
+    repo.binary = [p for p in repo.tracked if p.endswith(".bin")]
+
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "remote.origin.url", str(path / "origin.git"))
+    _git(path, "config", "remote.origin.fetch", "+refs/heads/*:refs/remotes/origin/*")
+    _git(path, "config", "branch.main.remote", "origin")
+    _git(path, "config", "branch.main.merge", "refs/heads/main")
+    _git(path, "fast-import", "--quiet", input=_fast_import_stream(repo, rng))
+    _git(path, "reset", "-q", "--hard", "main")
+
+    text_files = [p for p in repo.tracked if not p.endswith(".bin")]
+    for n in range(spec.stashes):
+        target = text_files[n % len(text_files)] if text_files else repo.tracked[0]
+        with open(path / target, "ab") as f:
+            f.write(b"stashed %d\n" % n)
+        _git(path, "stash", "push", "-q", "-m", f"stash {n}", "--", target)
+
+    # Disjoint samples so each file shows up in exactly one change category
+    n_modified = int(spec.file_count * spec.modified_ratio)
+    n_staged = int(spec.file_count * spec.staged_ratio)
+    n_renamed = min(spec.renames, max(0, spec.file_count - n_modified - n_staged))
+    chosen = rng.sample(repo.tracked, min(spec.file_count, n_modified + n_staged + n_renamed))
+    repo.modified = sorted(chosen[:n_modified])
+    repo.staged = sorted(chosen[n_modified : n_modified + n_staged])
+    renamed = sorted(chosen[n_modified + n_staged :])
+
+    for rel in repo.modified + repo.staged:
+        with open(path / rel, "ab") as f:
+            f.write(rng.randbytes(32) if rel.endswith(".bin") else _text(rng, rng.randint(1, 10), "edit"))
+    if repo.staged:
+        _git(path, "add", "--pathspec-from-file=-", "--pathspec-file-nul", input="\0".join(repo.staged).encode())
+
+    for rel in renamed:
+        new = rel.replace("file_", "moved_", 1)
+        _git(path, "mv", rel, new)
+        repo.renamed.append((rel, new))
+
+    # Next to tracked files, so git status lists each one instead of a new directory
+    for n in range(int(spec.file_count * spec.untracked_ratio)):
+        rel = f"{rng.choice(repo.tracked).rsplit('/', 1)[0]}/new_{n:06d}.py"
+        (path / rel).write_bytes(_text(rng, rng.randint(5, 40), "new"))
+        repo.untracked.append(rel)
+    repo.untracked.sort()
+
+    return repo
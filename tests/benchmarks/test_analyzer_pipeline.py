@@ -0,0 +1,82 @@
+"""Benchmarks of the analyzer pipeline on synthetic repositories.
+
+Run with ``make test-benchmark`` or
+``pytest tests/benchmarks --benchmark-only --benchmark-verbose``.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from fastmcp import Client
+
+from mcp_local_repo_analyzer.models import LocalRepository
+from mcp_local_repo_analyzer.server import LocalRepoAnalyzerServer
+
+from .synthetic_repo import SyntheticRepo
+
+
+def _local_repo(repo: SyntheticRepo) -> LocalRepository:
+    return LocalRepository(path=repo.path, name=repo.path.name, current_branch="main")
+
+
+def test_get_status(run_benchmark, synthetic_repo, analyzer_services):
+    git_client = analyzer_services["git_client"]
+
+    status = run_benchmark(lambda: git_client.get_status(synthetic_repo.path))
+
+    assert len(status["files"]) == synthetic_repo.outstanding_files
+
+
+def test_detect_working_directory_changes(run_benchmark, synthetic_repo, analyzer_services):
+    detector = analyzer_services["change_detector"]
+    repo = _local_repo(synthetic_repo)
+
+    changes = run_benchmark(lambda: detector.detect_working_directory_changes(repo))
+
+    assert len(changes.modified_files) == len(synthetic_repo.modified)
+
+
+def test_detect_staged_changes(run_benchmark, synthetic_repo, analyzer_services):
+    detector = analyzer_services["change_detector"]
+    repo = _local_repo(synthetic_repo)
+
+    staged = run_benchmark(lambda: detector.detect_staged_changes(repo))
+
+    assert staged.total_staged == len(synthetic_repo.staged) + len(synthetic_repo.renamed)
+
+
+def test_get_repository_status(run_benchmark, synthetic_repo, analyzer_services):
+    tracker = analyzer_services["status_tracker"]
+    repo = _local_repo(synthetic_repo)
+
+    status = run_benchmark(lambda: tracker.get_repository_status(repo), rounds=3)
+
+    assert status.unpushed_commits
+    assert len(status.stashed_changes) == synthetic_repo.spec.stashes
+
+
+def test_parse_diff(benchmark, synthetic_repo, analyzer_services):
+    git_client = analyzer_services["git_client"]
+    diff_text = asyncio.run(git_client.get_diff(synthetic_repo.path))
+    diff_analyzer = analyzer_services["diff_analyzer"]
+
+    benchmark.extra_info["diff_bytes"] = len(diff_text)
+    file_diffs = benchmark(diff_analyzer.parse_diff, diff_text)
+
+    assert len(file_diffs) == len(synthetic_repo.modified)
+
+
+@pytest.mark.parametrize("tool", ["get_outstanding_summary", "analyze_repository_health"])
+def test_summary_tools_end_to_end(run_benchmark, synthetic_repo, tool):
+    server = LocalRepoAnalyzerServer()
+    mcp, _ = asyncio.run(server.create_server())
+
+    async def call() -> Any:
+        async with Client(mcp) as client:
+            return await client.call_tool(tool, {"repository_path": str(synthetic_repo.path)})
+
+    result = run_benchmark(call, rounds=3)
+
+    assert not result.is_error
+    assert "error" not in result.data
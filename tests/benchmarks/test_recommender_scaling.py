@@ -0,0 +1,194 @@
+"""Scaling benchmarks of the PR recommender with a stored regression baseline.
+
+Population sizes come from ``BENCH_RECOMMENDER_SIZES`` (comma separated,
+default ``10,1000``; e.g. ``10,1000,10000,100000`` for the full sweep). The
+LLM is replaced by a deterministic local stub, so every strategy is measured
+without network access. Gated results are compared with ``baseline.json``
+(see ``baseline.py``); their allocation peaks are measured on
+``isolated_workload`` in a pristine interpreter (see ``alloc_probe.py``).
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from unit.factories.files import make_analysis, make_file_population, write_sources
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_pr_recommender.services.atomicity_validator import AtomicityValidator
+from mcp_pr_recommender.services.grouping_engine import GroupingEngine
+from mcp_pr_recommender.services.strategies import available_strategies
+from mcp_pr_recommender.tools.feasibility_analyzer_tool import FeasibilityAnalyzerTool
+from mcp_pr_recommender.tools.validator_tool import ValidatorTool
+
+
+def _sizes() -> list[int]:
+    return [int(n) for n in os.environ.get("BENCH_RECOMMENDER_SIZES", "10,1000").split(",") if n.strip()]
+
+
+class StubLLMBackend:
+    """Deterministic stand-in for ``LLMBackend`` that groups files by package."""
+
+    def __init__(self, files: list[FileStatus]) -> None:
+        """Prepare the grouping response for ``files``."""
+        packages: dict[str, list[str]] = {}
+        for file in files:
+            packages.setdefault("/".join(file.path.split("/")[:2]), []).append(file.path)
+        groups = [
+            {"id": f"stub_{i}", "files": paths, "category": "feature", "reasoning": f"Changes in {name}"}
+            for i, (name, paths) in enumerate(sorted(packages.items()))
+        ]
+        self.content = json.dumps({"groups": groups, "rationale": "grouped by package"})
+
+    async def create_chat_completion(self, **kwargs: Any) -> Any:
+        """Return the prepared response as a completion."""
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")], usage=None)
+
+    async def stream_chat_completion(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Stream the prepared response as a single chunk."""
+        delta = SimpleNamespace(content=self.content)
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason="stop")], usage=None)
+
+
+def build_population(size: int, root: Path) -> dict[str, Any]:
+    """Changed files, their analysis, and sources with imports under ``root`` for the dependency strategy."""
+    files = make_file_population(size, seed=size)
+    write_sources(root, files, seed=size)
+    return {"files": files, "analysis": make_analysis(files, root)}
+
+
+def build_grouping_engine() -> GroupingEngine:
+    """Engine whose semantic analyzer talks to the stub instead of an LLM."""
+    with pytest.MonkeyPatch.context() as mp:
+        # The real client is never used, but it refuses to be created without a key. Settings
+        # cached by earlier tests may predate the key, so they are re-read for construction
+        mp.setenv("OPENAI_API_KEY", "benchmark-stub")
+        mp.setattr("mcp_pr_recommender.config._settings_instance", None)
+        engine = GroupingEngine()
+    engine.semantic_analyzer.cache = None
+    return engine
+
+
+def build_recommendations(population: dict[str, Any], engine: GroupingEngine) -> list[dict[str, Any]]:
+    """Recommendations of the directory strategy, as clients pass them to the validation tools."""
+    strategy = asyncio.run(engine.generate_pr_recommendations(population["analysis"], "directory"))
+    return [pr.model_dump(mode="json") for pr in strategy.recommended_prs]
+
+
+def generate_workload(population: dict[str, Any], engine: GroupingEngine, strategy: str) -> Callable[[], Any]:
+    """Generate recommendations with ``strategy``, the semantic one backed by the stub."""
+    engine.semantic_analyzer.backend = StubLLMBackend(population["files"])
+    analysis = population["analysis"]
+    return lambda: engine.generate_pr_recommendations(analysis, strategy)
+
+
+def atomicity_workload(population: dict[str, Any], engine: GroupingEngine) -> tuple[Callable[[], Any], int]:
+    """Split the simple logical groups; also returns their file count."""
+    # The simple logical groups are large and mixed, so most of them get split
+    groups = engine._create_simple_groups(population["files"])
+    validator = AtomicityValidator()
+    return lambda: validator.validate_and_split(groups), sum(len(g.files) for g in groups)
+
+
+def validate_workload(recommendations: list[dict[str, Any]]) -> Callable[[], Any]:
+    """Validate ``recommendations`` with the validator tool."""
+    tool = ValidatorTool()
+    return lambda: tool.validate_recommendations(recommendations)
+
+
+def feasibility_workload(recommendations: list[dict[str, Any]]) -> Callable[[], Any]:
+    """Analyze the feasibility of each of ``recommendations`` in turn."""
+    tool = FeasibilityAnalyzerTool()
+
+    async def analyze_all() -> list[dict[str, Any]]:
+        return [await tool.analyze_feasibility(rec) for rec in recommendations]
+
+    return analyze_all
+
+
+def isolated_workload(test_name: str, params: dict[str, Any], tmp_path: Path) -> Callable[[], Any]:
+    """Rebuild the target of a gated test from scratch, for ``alloc_probe``."""
+    population = build_population(params["population"], tmp_path)
+    engine = build_grouping_engine()
+    if test_name == "test_generate_pr_recommendations":
+        return generate_workload(population, engine, params["strategy"])
+    if test_name == "test_atomicity_validate_and_split":
+        return atomicity_workload(population, engine)[0]
+    recommendations = build_recommendations(population, engine)
+    if test_name == "test_validate_recommendations":
+        return validate_workload(recommendations)
+    if test_name == "test_feasibility_analysis":
+        return feasibility_workload(recommendations)
+    raise ValueError(f"No isolated workload for {test_name}")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def recommender_settings() -> Iterator[None]:
+    """Give the stub key to settings read in this module, and drop them afterwards.
+
+    Settings are cached process-wide, so ones cached here (or by earlier
+    tests, without the key) would otherwise leak into later tests.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "benchmark-stub")
+        mp.setattr("mcp_pr_recommender.config._settings_instance", None)
+        yield
+
+
+@pytest.fixture(scope="module", params=_sizes(), ids=lambda n: f"{n}_files")
+def population(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> dict[str, Any]:
+    """Changed files, their analysis, and sources with imports for the dependency strategy."""
+    return build_population(request.param, tmp_path_factory.mktemp(f"sources_{request.param}"))
+
+
+@pytest.fixture(scope="module")
+def grouping_engine() -> GroupingEngine:
+    """Engine whose semantic analyzer talks to the stub instead of an LLM."""
+    return build_grouping_engine()
+
+
+@pytest.fixture(scope="module")
+def recommendations(population: dict[str, Any], grouping_engine: GroupingEngine) -> list[dict[str, Any]]:
+    """Recommendations of the directory strategy, as clients pass them to the validation tools."""
+    return build_recommendations(population, grouping_engine)
+
+
+@pytest.mark.parametrize("strategy", ["semantic", *available_strategies()])
+def test_generate_pr_recommendations(run_benchmark, population, grouping_engine, strategy):
+    result = run_benchmark(generate_workload(population, grouping_engine, strategy), gate=True)
+
+    assert result.recommended_prs
+
+
+def test_atomicity_validate_and_split(run_benchmark, population, grouping_engine):
+    target, file_count = atomicity_workload(population, grouping_engine)
+
+    validated = run_benchmark(target, gate=True)
+
+    assert sum(len(g.files) for g in validated) == file_count
+
+
+def test_validate_recommendations(run_benchmark, recommendations):
+    result = run_benchmark(validate_workload(recommendations), gate=True)
+
+    assert "error" not in result
+
+
+def test_feasibility_analysis(run_benchmark, recommendations):
+    results = run_benchmark(feasibility_workload(recommendations), gate=True)
+
+    assert len(results) == len(recommendations)
+
+
+def test_stub_covers_population(population):
+    stub = StubLLMBackend(population["files"])
+    grouped = {path for group in json.loads(stub.content)["groups"] for path in group["files"]}
+
+    assert grouped == {f.path for f in population["files"]}
+    assert isinstance(population["analysis"].repository_path, Path)
@@ -0,0 +1,14 @@
+"""Fixtures shared by every test suite."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_recommender_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start each test without cached recommender settings and restore the cache afterwards.
+
+    ``mcp_pr_recommender.config.get_settings`` caches the first settings it
+    builds for the whole process, so settings read under one test's
+    environment (e.g. a stub API key) would otherwise leak into later tests.
+    """
+    monkeypatch.setattr("mcp_pr_recommender.config._settings_instance", None)
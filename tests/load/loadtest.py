@@ -0,0 +1,317 @@
+"""HTTP load test for both MCP servers on a synthetic repository.
+
+Both servers are started in-process with the streamable-http transport on
+ephemeral ports, and N concurrent MCP clients repeatedly run the tool chain an
+agent uses before opening PRs::
+
+    get_outstanding_summary -> validate_staged_changes -> get_push_readiness
+        -> analyze_working_directory -> generate_pr_recommendations
+
+The report lists p50/p95/p99 latency per tool and per chain, throughput,
+event-loop lag (the servers share the loop with the clients, so lag shows
+blocking work in the request path) and the git subprocesses spawned.
+
+Run with ``make test-load`` or, e.g.::
+
+    PYTHONPATH=src:tests python -m load.loadtest --clients 16 --iterations 5 --files 10000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+from benchmarks.synthetic_repo import SyntheticRepoSpec, build_synthetic_repo
+from fastmcp import Client, FastMCP
+
+from mcp_local_repo_analyzer.server import LocalRepoAnalyzerServer
+from mcp_pr_recommender import config as recommender_config
+from mcp_pr_recommender.server import PRRecommenderServer
+from shared.utils.metrics import GIT_COMMANDS
+
+CHAIN = (
+    "get_outstanding_summary",
+    "validate_staged_changes",
+    "get_push_readiness",
+    "analyze_working_directory",
+    "generate_pr_recommendations",
+)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile ``q`` (0-100) of ``samples``; 0.0 when empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Count and latency percentiles of ``samples`` (seconds)."""
+    return {
+        "count": len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples, default=0.0),
+    }
+
+
+class LoopLagSampler:
+    """Measures how late the event loop wakes up from short sleeps."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        """Sample every ``interval`` seconds once started."""
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+@asynccontextmanager
+async def serve(mcp: FastMCP, host: str = "127.0.0.1") -> AsyncIterator[str]:
+    """Serve ``mcp`` over streamable HTTP on an ephemeral port and yield its MCP URL."""
+    # log_config=None keeps uvicorn from re-running dictConfig over the servers' logging
+    app = mcp.http_app(transport="streamable-http")
+    config = uvicorn.Config(app, host=host, port=0, log_config=None, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+            raise RuntimeError("uvicorn exited before startup")
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{port}/mcp"
+    finally:
+        server.should_exit = True
+        await task
+
+
+class LoadStats:
+    """Latencies and errors collected by all clients."""
+
+    def __init__(self) -> None:
+        """Start with no samples."""
+        self.latencies: dict[str, list[float]] = {name: [] for name in (*CHAIN, "chain")}
+        self.errors: dict[str, int] = {}
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        """Record one call of ``name``."""
+        self.latencies[name].append(seconds)
+        if error:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+async def _timed(stats: LoadStats, client: Client, tool: str, arguments: dict[str, Any]) -> Any:
+    start = time.perf_counter()
+    try:
+        result = await client.call_tool(tool, arguments, raise_on_error=False)
+    except Exception:
+        stats.record(tool, time.perf_counter() - start, error=True)
+        return None
+    data = result.data if isinstance(result.data, dict) else {}
+    stats.record(tool, time.perf_counter() - start, error=result.is_error or "error" in data)
+    return data
+
+
+async def run_chain(
+    analyzer: Client, recommender: Client, repository_path: str, strategy: str, stats: LoadStats
+) -> None:
+    """Run the tool chain once, feeding the working-directory analysis to the recommender."""
+    start = time.perf_counter()
+    repo = {"repository_path": repository_path}
+    await _timed(stats, analyzer, "get_outstanding_summary", {**repo, "detailed": True})
+    await _timed(stats, analyzer, "validate_staged_changes", repo)
+    await _timed(stats, analyzer, "get_push_readiness", repo)
+    analysis = await _timed(stats, analyzer, "analyze_working_directory", {**repo, "include_diffs": False})
+    await _timed(
+        stats, recommender, "generate_pr_recommendations", {"analysis_data": analysis or {}, "strategy": strategy}
+    )
+    stats.record("chain", time.perf_counter() - start)
+
+
+async def _drop_server_log(message: Any) -> None:
+    """Discard log notifications; tools log a lot and the report is what matters."""
+
+
+async def _client_loop(
+    urls: tuple[str, str], repository_path: str, strategy: str, iterations: int, deadline: float, stats: LoadStats
+) -> int:
+    chains = 0
+    analyzer = Client(urls[0], log_handler=_drop_server_log)
+    recommender = Client(urls[1], log_handler=_drop_server_log)
+    async with analyzer, recommender:
+        while chains < iterations or time.perf_counter() < deadline:
+            await run_chain(analyzer, recommender, repository_path, strategy, stats)
+            chains += 1
+    return chains
+
+
+async def run_load_test(
+    repository_path: str | Path,
+    clients: int = 4,
+    iterations: int = 3,
+    duration: float = 0.0,
+    strategy: str = "directory",
+) -> dict[str, Any]:
+    """Start both servers and drive ``clients`` concurrent clients; return the report.
+
+    Each client runs the chain ``iterations`` times, and keeps going until
+    ``duration`` seconds have passed when that is longer.
+    """
+    with recommender_settings():
+        return await _run_load_test(repository_path, clients, iterations, duration, strategy)
+
+
+@contextmanager
+def recommender_settings() -> Iterator[None]:
+    """Install fresh recommender settings with an OpenAI key for the run, then restore the cached ones.
+
+    Settings are cached process-wide, and ones cached earlier without a key
+    would be reused however the environment is set. The placeholder key is
+    enough for the deterministic strategies, which never call the LLM.
+    """
+    previous = recommender_config._settings_instance
+    recommender_config._settings_instance = recommender_config.PRRecommenderSettings(
+        openai_api_key=os.environ.get("OPENAI_API_KEY") or "load-test"
+    )
+    try:
+        yield
+    finally:
+        recommender_config._settings_instance = previous
+
+
+async def _run_load_test(
+    repository_path: str | Path, clients: int, iterations: int, duration: float, strategy: str
+) -> dict[str, Any]:
+    analyzer_mcp, _ = await LocalRepoAnalyzerServer().create_server()
+    recommender_mcp, _ = await PRRecommenderServer().create_server()
+    stats = LoadStats()
+    sampler = LoopLagSampler()
+
+    async with serve(analyzer_mcp) as analyzer_url, serve(recommender_mcp) as recommender_url:
+        git_before = GIT_COMMANDS.snapshot()
+        sampler.start()
+        start = time.perf_counter()
+        chains = await asyncio.gather(
+            *(
+                _client_loop(
+                    (analyzer_url, recommender_url), str(repository_path), strategy, iterations, start + duration, stats
+                )
+                for _ in range(clients)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        await sampler.stop()
+        git_after = GIT_COMMANDS.snapshot()
+
+    git_by_command: dict[str, float] = {}
+    for key, value in git_after.items():
+        delta = value - git_before.get(key, 0)
+        if delta:
+            command = key.split(",")[0]
+            git_by_command[command] = git_by_command.get(command, 0) + delta
+    total_chains = sum(chains)
+    total_calls = sum(len(stats.latencies[name]) for name in CHAIN)
+    git_total = sum(git_by_command.values())
+
+    return {
+        "clients": clients,
+        "chains": total_chains,
+        "elapsed_s": elapsed,
+        "requests_per_s": total_calls / elapsed if elapsed else 0.0,
+        "chains_per_s": total_chains / elapsed if elapsed else 0.0,
+        "latency_s": {name: summarize(samples) for name, samples in stats.latencies.items()},
+        "errors": stats.errors,
+        "event_loop_lag_s": summarize(sampler.lags),
+        "git_processes": {
+            "total": git_total,
+            "per_chain": git_total / total_chains if total_chains else 0.0,
+            "by_command": dict(sorted(git_by_command.items(), key=lambda item: -item[1])),
+        },
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render ``report`` as a plain-text table."""
+    lines = [
+        f"{report['clients']} clients, {report['chains']} chains in {report['elapsed_s']:.2f}s: "
+        f"{report['requests_per_s']:.1f} req/s, {report['chains_per_s']:.2f} chains/s",
+        "",
+        f"{'tool':<30} {'calls':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for name, s in report["latency_s"].items():
+        lines.append(
+            f"{name:<30} {s['count']:>6} {report['errors'].get(name, 0):>6} "
+            f"{s['p50'] * 1000:>9.1f} {s['p95'] * 1000:>9.1f} {s['p99'] * 1000:>9.1f} {s['max'] * 1000:>9.1f}"
+        )
+    lag = report["event_loop_lag_s"]
+    git = report["git_processes"]
+    lines += [
+        "",
+        f"event loop lag: p50 {lag['p50'] * 1000:.1f}ms, p99 {lag['p99'] * 1000:.1f}ms, "
+        f"max {lag['max'] * 1000:.1f}ms ({lag['count']} samples)",
+        f"git processes: {git['total']:.0f} total, {git['per_chain']:.1f} per chain",
+    ]
+    lines += [f"  {command:<20} {count:>8.0f}" for command, count in git["by_command"].items()]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Build a synthetic repository, run the load test and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent MCP clients")
+    parser.add_argument("--iterations", type=int, default=3, help="Chains per client (minimum)")
+    parser.add_argument("--duration", type=float, default=0.0, help="Keep running for at least this many seconds")
+    parser.add_argument("--files", type=int, default=1000, help="Committed files in the synthetic repository")
+    parser.add_argument("--repo", type=Path, help="Use an existing repository instead of a synthetic one")
+    parser.add_argument("--strategy", default="directory", help="Grouping strategy (semantic calls the LLM)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--log-level", default="WARNING", help="Log level of the servers and clients")
+    args = parser.parse_args()
+    # Servers configure their own loggers on startup, so filter globally instead
+    logging.disable(logging.getLevelName(args.log_level.upper()) - 1)
+    # FastMCP echoes every log notification sent to a client, bypassing levels
+    logging.getLogger("fastmcp.server.context.to_client").disabled = True
+
+    with tempfile.TemporaryDirectory(prefix="mcp-load-") as tmp:
+        repo_path = args.repo
+        if repo_path is None:
+            spec = SyntheticRepoSpec(file_count=args.files, commits=max(50, args.files // 50))
+            repo_path = build_synthetic_repo(Path(tmp) / "repo", spec).path
+        report = asyncio.run(run_load_test(repo_path, args.clients, args.iterations, args.duration, args.strategy))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Smoke test of the HTTP load-test harness."""
+
+import pytest
+from benchmarks.synthetic_repo import SyntheticRepoSpec, build_synthetic_repo
+
+from mcp_pr_recommender import config as recommender_config
+
+from .loadtest import CHAIN, format_report, percentile, recommender_settings, run_load_test
+
+
+@pytest.mark.unit
+def test_percentile_nearest_rank():
+    samples = [float(n) for n in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.unit
+def test_recommender_settings_replace_cached_settings_without_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    stale = recommender_config.PRRecommenderSettings()
+    monkeypatch.setattr(recommender_config, "_settings_instance", stale)
+
+    with recommender_settings():
+        assert recommender_config.settings().openai_api_key == "load-test"
+
+    assert recommender_config.settings() is stale
+
+
+@pytest.mark.git
+@pytest.mark.asyncio
+async def test_run_load_test_over_http(tmp_path):
+    repo = build_synthetic_repo(tmp_path / "repo", SyntheticRepoSpec(file_count=50, commits=5))
+
+    report = await run_load_test(repo.path, clients=2, iterations=1)
+
+    assert report["chains"] == 2
+    assert report["errors"] == {}
+    for tool in CHAIN:
+        assert report["latency_s"][tool]["count"] == 2
+    assert report["requests_per_s"] > 0
+    assert report["git_processes"]["total"] > 0
+    assert "status" in report["git_processes"]["by_command"]
+    assert "generate_pr_recommendations" in format_report(report)
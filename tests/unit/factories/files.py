@@ -1 +1,141 @@
-"""Test file factory module."""
+"""Test file factory module.
+
+Builders for ``FileStatus`` objects and realistic change sets. Populations are
+monorepo-shaped: a few large packages and a long tail of small ones (Zipf-like
+sizes), each with source, tests and docs, plus root-level configuration.
+Everything is derived from a seed, so the same arguments always produce the
+same files.
+"""
+
+import itertools
+import random
+from datetime import datetime
+from pathlib import Path
+
+from mcp_local_repo_analyzer.models.analysis_repository import BranchStatus, RepositoryStatus
+from mcp_local_repo_analyzer.models.categorization import ChangeCategorization
+from mcp_local_repo_analyzer.models.changes import StagedChanges, WorkingDirectoryChanges
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.repository import LocalRepository
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.models.risk import RiskAssessment
+
+_ROOTS = ("services", "packages", "libs", "apps")
+_PACKAGE_WORDS = ("auth", "billing", "search", "users", "orders", "gateway", "ui", "common", "events", "reports")
+_MODULE_WORDS = ("models", "views", "handlers", "utils", "client", "schema", "service", "routes", "tasks", "store")
+_ROOT_CONFIG = ("pyproject.toml", "package.json", "Makefile", "Dockerfile", ".env.example", "tsconfig.json")
+# (weight, status code, staged) of the change types in a typical working tree
+_STATUS_MIX = ((70, "M", False), (12, "M", True), (8, "A", True), (5, "?", False), (3, "D", False), (2, "R", True))
+
+
+def make_file_status(
+    path: str, status_code: str = "M", lines_added: int = 10, lines_deleted: int = 2, **fields: object
+) -> FileStatus:
+    """Build one ``FileStatus`` with sensible defaults."""
+    return FileStatus(
+        path=path, status_code=status_code, lines_added=lines_added, lines_deleted=lines_deleted, **fields
+    )
+
+
+def monorepo_paths(count: int, seed: int = 0) -> list[str]:
+    """Return ``count`` distinct, sorted paths laid out like a monorepo."""
+    rng = random.Random(seed)
+    packages = max(1, count // 40)
+    # Zipf-like package weights: the first packages receive most of the files
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(packages)))
+    names = [
+        f"{_ROOTS[i % len(_ROOTS)]}/{_PACKAGE_WORDS[i % len(_PACKAGE_WORDS)]}{i // len(_PACKAGE_WORDS) or ''}"
+        for i in range(packages)
+    ]
+
+    paths = set(_ROOT_CONFIG[: min(len(_ROOT_CONFIG), max(1, count // 100))])
+    while len(paths) < count:
+        package = rng.choices(names, cum_weights=cum_weights)[0]
+        kind = rng.random()
+        module = f"{rng.choice(_MODULE_WORDS)}_{rng.randrange(1000)}"
+        if kind < 0.55:
+            ext = ".py" if package.startswith(("services", "libs")) else rng.choice((".ts", ".tsx", ".py"))
+            paths.add(f"{package}/src/{rng.choice(_MODULE_WORDS)}/{module}{ext}")
+        elif kind < 0.8:
+            paths.add(f"{package}/tests/test_{module}.py")
+        elif kind < 0.9:
+            paths.add(f"{package}/docs/{module}.md")
+        elif kind < 0.97:
+            paths.add(f"{package}/config/{module}.{rng.choice(('yaml', 'json', 'toml'))}")
+        else:
+            paths.add(f"{package}/assets/{module}.png")
+    return sorted(paths)
+
+
+def make_file_population(count: int, seed: int = 0) -> list[FileStatus]:
+    """Return ``count`` changed files with a realistic mix of statuses and change sizes."""
+    rng = random.Random(seed)
+    weights = [w for w, _, _ in _STATUS_MIX]
+    files = []
+    for path in monorepo_paths(count, seed):
+        _, status_code, staged = rng.choices(_STATUS_MIX, weights)[0]
+        is_binary = path.endswith(".png")
+        # Log-normal change sizes: mostly small edits with a long tail of large ones
+        added = 0 if is_binary or status_code == "D" else int(rng.lognormvariate(2.5, 1.2))
+        deleted = 0 if is_binary or status_code in ("A", "?") else int(rng.lognormvariate(1.5, 1.2))
+        files.append(
+            FileStatus(
+                path=path,
+                status_code=status_code,
+                staged=staged,
+                index_status=status_code if staged else None,
+                working_tree_status=None if staged else status_code,
+                lines_added=added,
+                lines_deleted=deleted,
+                is_binary=is_binary,
+                old_path=path.replace("/src/", "/old/", 1) if status_code == "R" else None,
+            )
+        )
+    return files
+
+
+def write_sources(root: Path, files: list[FileStatus], seed: int = 0, imports_per_file: int = 2) -> None:
+    """Write Python/TypeScript sources for ``files`` under ``root`` that import sibling modules."""
+    rng = random.Random(seed)
+    by_dir: dict[str, list[str]] = {}
+    for file in files:
+        by_dir.setdefault(file.path.rsplit("/", 1)[0], []).append(file.path)
+
+    for file in files:
+        if not file.path.endswith((".py", ".ts", ".tsx")) or file.status_code == "D":
+            continue
+        directory, _, name = file.path.rpartition("/")
+        siblings = [p for p in by_dir[directory] if p != file.path and p.endswith(file.path[-3:])]
+        targets = rng.sample(siblings, min(imports_per_file, len(siblings)))
+        if file.path.endswith(".py"):
+            lines = [f"from .{t.rsplit('/', 1)[1].rsplit('.', 1)[0]} import value" for t in targets]
+        else:
+            lines = [f"import {{ value }} from './{t.rsplit('/', 1)[1].rsplit('.', 1)[0]}';" for t in targets]
+        target = root / file.path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("\n".join([*lines, f"# {name}", ""]))
+
+
+def make_analysis(files: list[FileStatus], repository_path: str | Path = "test_repo") -> OutstandingChangesAnalysis:
+    """Wrap ``files`` in an ``OutstandingChangesAnalysis`` as the analyzer would produce it."""
+    working = [f for f in files if not f.staged]
+    staged = [f for f in files if f.staged]
+    repository_status = RepositoryStatus(
+        repository=LocalRepository(path=Path(repository_path), name=Path(repository_path).name, current_branch="main"),
+        working_directory=WorkingDirectoryChanges(
+            modified_files=[f for f in working if f.status_code == "M"],
+            deleted_files=[f for f in working if f.status_code == "D"],
+            untracked_files=[f for f in working if f.status_code == "?"],
+        ),
+        staged_changes=StagedChanges(staged_files=staged),
+        branch_status=BranchStatus(current_branch="main", upstream_branch="origin/main", is_up_to_date=True),
+    )
+    return OutstandingChangesAnalysis(
+        repository_path=Path(repository_path),
+        analysis_timestamp=datetime(2024, 1, 1),
+        total_outstanding_files=len(files),
+        categories=ChangeCategorization(),
+        risk_assessment=RiskAssessment(risk_level="medium"),
+        summary=f"{len(files)} outstanding files",
+        repository_status=repository_status,
+    )
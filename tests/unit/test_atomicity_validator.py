@@ -25,6 +25,8 @@ class TestAtomicityValidator:
         with patch("mcp_pr_recommender.services.atomicity_validator.get_pr_recommender_settings") as mock_settings_func:
             mock_settings_instance = Mock()
             mock_settings_instance.max_files_per_pr = 8
+            mock_settings_instance.max_lines_per_pr = 1000
+            mock_settings_instance.max_review_minutes_per_pr = 120
             mock_settings_func.return_value = mock_settings_instance
             yield mock_settings_instance
 
@@ -516,3 +518,36 @@ class TestAtomicityValidator:
 
         # All doc files, no mixed concerns
         assert validator._has_mixed_concerns(group) is False
+
+    def test_split_by_directory_merges_small_directories(self, validator, mock_settings):
+        """Test that many one-file directories are packed instead of becoming one-file PRs."""
+        files = [FileStatus(path=f"src/feature_{i}/handler.py", status_code="M", lines_added=5) for i in range(24)]
+        group = ChangeGroup(
+            id="wide_group",
+            files=files,
+            category="source",
+            confidence=0.9,
+            reasoning="Many small directories",
+        )
+
+        split_groups = validator._split_by_directory(group)
+
+        assert len(split_groups) == 3
+        assert [g.id for g in split_groups] == ["wide_group_split_0", "wide_group_split_1", "wide_group_split_2"]
+        assert all(len(g.files) == 8 for g in split_groups)
+
+    def test_split_by_size_balances_lines(self, validator, mock_settings):
+        """Test that a group over the line limit is split even when the file count is fine."""
+        files = [FileStatus(path=f"src/file_{i}.py", status_code="M", lines_added=400) for i in range(4)]
+        group = ChangeGroup(
+            id="heavy",
+            files=files,
+            category="source",
+            confidence=0.9,
+            reasoning="Large rewrite",
+        )
+
+        split_groups = validator._split_by_size(group)
+
+        assert len(split_groups) == 2
+        assert all(g.total_changes <= 1000 for g in split_groups)
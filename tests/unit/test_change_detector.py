@@ -50,7 +50,7 @@ class TestChangeDetector:
     async def test_detect_working_directory_changes_basic(self):
         """Test basic working directory change detection."""
         # Mock git status response
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -103,7 +103,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_with_rename(self):
         """Test working directory change detection with renamed files."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -136,7 +136,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_deleted_file(self):
         """Test working directory change detection with deleted files."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -167,7 +167,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_binary_file(self):
         """Test working directory change detection with binary files."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -197,7 +197,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_mixed_status(self):
         """Test working directory change detection with mixed status files."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -227,7 +227,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_diff_stats_error(self):
         """Test working directory change detection when diff stats fail."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -248,7 +248,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_no_working_status(self):
         """Test working directory change detection with no working status."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
@@ -270,7 +270,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_empty_status(self):
         """Test working directory change detection with empty status."""
-        self.git_client.get_status = AsyncMock(return_value={"files": []})
+        self.git_client.get_working_directory_status = AsyncMock(return_value={"files": []})
 
         result = await self.change_detector.detect_working_directory_changes(self.test_repo, self.mock_ctx)
 
@@ -281,6 +281,24 @@ class TestChangeDetector:
         assert len(result.renamed_files) == 0
         assert len(result.untracked_files) == 0
 
+    @pytest.mark.asyncio
+    async def test_detect_working_directory_changes_porcelain_untracked(self):
+        """Test that untracked files as git reports them ("??") need no diff stats."""
+        self.git_client.get_working_directory_status = AsyncMock(
+            return_value={
+                "files": [
+                    {"filename": "build/", "status_code": "??", "working_status": "?", "index_status": "?"},
+                    {"filename": "notes.txt", "status_code": "??", "working_status": "?", "index_status": "?"},
+                ]
+            }
+        )
+        self.git_client.get_diff_stats = AsyncMock()
+
+        result = await self.change_detector.detect_working_directory_changes(self.test_repo, self.mock_ctx)
+
+        assert [f.path for f in result.untracked_files] == ["build/", "notes.txt"]
+        self.git_client.get_diff_stats.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_detect_staged_changes_basic(self):
         """Test basic staged changes detection."""
@@ -622,7 +640,7 @@ class TestChangeDetector:
     @pytest.mark.asyncio
     async def test_detect_working_directory_changes_no_context(self):
         """Test working directory change detection without context."""
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
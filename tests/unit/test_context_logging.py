@@ -0,0 +1,171 @@
+"""Tests for the level-gated, batched MCP context logger."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastmcp import Client, Context, FastMCP
+
+from shared.base.types import LogLevel
+from shared.utils import context_logging
+from shared.utils.context_logging import (
+    ContextLogger,
+    client_log_level,
+    install_log_level_handler,
+    set_client_log_level,
+)
+
+
+class _Session:
+    """Stand-in for an MCP session (must be hashable and weak-referenceable)."""
+
+
+def _ctx(level: str | None = None) -> Mock:
+    ctx = Mock()
+    ctx.session = _Session()
+    for name in ("debug", "info", "warning", "error", "report_progress"):
+        setattr(ctx, name, AsyncMock())
+    if level is not None:
+        set_client_log_level(ctx.session, level)
+    return ctx
+
+
+class _Exploding:
+    """Argument whose formatting would fail the test."""
+
+    def __str__(self) -> str:
+        raise AssertionError("message was formatted although it is not sent")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(context_logging.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestLevelGating:
+    """Test that messages below the client's level are dropped before formatting."""
+
+    @pytest.mark.asyncio
+    async def test_debug_dropped_by_default(self):
+        ctx = _ctx()
+        log = ContextLogger(ctx)
+
+        await log.debug("expensive %s", _Exploding())
+        await log.info("kept %d", 1)
+
+        ctx.debug.assert_not_awaited()
+        ctx.info.assert_awaited_once_with("kept 1")
+
+    @pytest.mark.asyncio
+    async def test_client_requested_level(self):
+        ctx = _ctx("warning")
+        log = ContextLogger(ctx)
+
+        await log.info("dropped")
+        await log.warning("disk %s", "full")
+        await log.error("failed")
+
+        ctx.info.assert_not_awaited()
+        ctx.warning.assert_awaited_once_with("disk full")
+        ctx.error.assert_awaited_once_with("failed")
+
+    @pytest.mark.asyncio
+    async def test_debug_level_enables_debug(self):
+        ctx = _ctx("debug")
+        log = ContextLogger(ctx)
+
+        assert log.debug_enabled
+        await log.debug("value=%s", 3)
+        ctx.debug.assert_awaited_once_with("value=3")
+
+    @pytest.mark.asyncio
+    async def test_without_context_everything_is_a_noop(self):
+        log = ContextLogger(None)
+
+        assert not log
+        await log.error("ignored")
+        await log.item("files", "%s", _Exploding())
+        await log.progress(1, 2)
+        await log.flush()
+
+    def test_wrap_is_idempotent(self):
+        log = ContextLogger(_ctx())
+        assert ContextLogger.wrap(log) is log
+        assert ContextLogger.wrap(None).ctx is None
+
+    def test_unavailable_session_uses_default(self):
+        class _NoRequest:
+            @property
+            def session(self):
+                raise RuntimeError("no active request")
+
+        assert client_log_level(_NoRequest()) == context_logging.DEFAULT_CLIENT_LOG_LEVEL
+
+
+@pytest.mark.unit
+class TestBatching:
+    """Test coalescing of per-item messages and progress rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_items_are_summarized_per_interval(self, clock):
+        ctx = _ctx("debug")
+        log = ContextLogger(ctx, summary_interval=1.0)
+
+        for i in range(1000):
+            await log.item("Diff stats", "file_%d.py", i)
+            clock[0] += 0.0025  # 1000 items over 2.5 seconds
+        await log.flush()
+
+        messages = [call.args[0] for call in ctx.debug.await_args_list]
+        assert len(messages) == 4
+        assert messages[0] == "Diff stats: 1 item(s), 1 total (latest: file_0.py)"
+        assert messages[-1].startswith("Diff stats: ")
+        assert "1000 total (latest: file_999.py)" in messages[-1]
+
+    @pytest.mark.asyncio
+    async def test_items_respect_level(self):
+        ctx = _ctx("info")
+        log = ContextLogger(ctx)
+
+        await log.item("files", "%s", _Exploding())
+        await log.item("conflicts", "%s", "a.py", level=LogLevel.WARNING)
+        await log.flush()
+
+        ctx.debug.assert_not_awaited()
+        ctx.warning.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_progress_is_rate_limited(self, clock):
+        ctx = _ctx()
+        log = ContextLogger(ctx, progress_interval=0.5)
+
+        for i in range(100):
+            await log.progress(i, 100)
+            clock[0] += 0.01
+        await log.progress(100, 100)
+
+        sent = [call.args for call in ctx.report_progress.await_args_list]
+        assert sent[0] == (0, 100)
+        assert sent[-1] == (100, 100)
+        assert len(sent) == 3  # first, one after 0.5s, final
+
+
+@pytest.mark.unit
+class TestLogLevelHandler:
+    """Test that logging/setLevel requests reach the adapter."""
+
+    @pytest.mark.asyncio
+    async def test_set_level_over_mcp(self):
+        mcp = FastMCP("logging-test")
+        install_log_level_handler(mcp)
+
+        @mcp.tool()
+        async def current_level(ctx: Context) -> str:
+            return ContextLogger(ctx).level.name
+
+        async with Client(mcp) as client:
+            assert (await client.call_tool("current_level", {})).data == "INFO"
+            await client.set_logging_level("debug")
+            assert (await client.call_tool("current_level", {})).data == "DEBUG"
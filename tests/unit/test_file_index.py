@@ -0,0 +1,83 @@
+"""Unit tests for the per-request file index."""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.models.analysis_repository import BranchStatus, RepositoryStatus
+from mcp_local_repo_analyzer.models.changes import StagedChanges, WorkingDirectoryChanges
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.repository import LocalRepository
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.models.risk import RiskAssessment
+from mcp_pr_recommender.services.file_index import FileIndex
+
+
+@pytest.mark.unit
+class TestFileIndex:
+    """Test path lookups and untracked bookkeeping."""
+
+    @pytest.fixture
+    def index(self):
+        """Create an index with tracked, untracked and duplicate entries."""
+        return FileIndex(
+            [
+                FileStatus(path="src/app.py", status_code="M", lines_added=3),
+                FileStatus(path="notes.txt", status_code="?"),
+                FileStatus(path="src/app.py", status_code="A", lines_added=99),
+                FileStatus(path="scratch.py", status_code="?"),
+            ]
+        )
+
+    def test_lookup_and_membership(self, index):
+        """Test O(1) lookups, with the first file winning on duplicate paths."""
+        assert len(index) == 3
+        assert "src/app.py" in index
+        assert "missing.py" not in index
+        assert index.get("src/app.py").lines_added == 3
+        assert index.get("missing.py") is None
+
+    def test_select_keeps_order_and_skips_unknown(self, index):
+        """Test selecting files for a recommendation's path list."""
+        selected = index.select(["scratch.py", "missing.py", "src/app.py"])
+
+        assert [f.path for f in selected] == ["scratch.py", "src/app.py"]
+
+    def test_count_untracked(self, index):
+        """Test counting untracked paths in a PR file list."""
+        assert index.untracked_paths == frozenset({"notes.txt", "scratch.py"})
+        assert index.count_untracked(["notes.txt", "src/app.py", "scratch.py", "missing.py"]) == 2
+
+    def test_untracked_set_built_once(self):
+        """Test that counting untracked files across many PRs reuses one set."""
+        files = [FileStatus(path=f"src/f{i}.py", status_code="?" if i % 3 else "M") for i in range(20_000)]
+        pr_files = [[f.path for f in files[i : i + 8]] for i in range(0, len(files), 8)]
+        index = FileIndex(files)
+
+        untracked_in_prs = sum(index.count_untracked(paths) for paths in pr_files)
+
+        assert untracked_in_prs == sum(1 for f in files if f.status_code == "?")
+        assert index.untracked_paths is index.untracked_paths
+
+    def test_from_analysis_shares_the_cached_index(self):
+        """Test that an analysis-backed index wraps the analysis path map without copying it."""
+        analysis = OutstandingChangesAnalysis(
+            repository_path=Path("/repo"),
+            repository_status=RepositoryStatus(
+                repository=LocalRepository(path=Path("/repo"), name="repo", current_branch="main"),
+                working_directory=WorkingDirectoryChanges(
+                    modified_files=[FileStatus(path="a.py", status_code="M")],
+                    untracked_files=[FileStatus(path="new.py", status_code="?")],
+                ),
+                staged_changes=StagedChanges(),
+                branch_status=BranchStatus(current_branch="main"),
+            ),
+            risk_assessment=RiskAssessment(risk_level="low"),
+            summary="test",
+        )
+
+        index = FileIndex.from_analysis(analysis)
+
+        assert index.by_path is analysis.changed_files_by_path
+        assert [f.path for f in index.select(["new.py", "a.py"])] == ["new.py", "a.py"]
+        assert index.untracked_paths == frozenset({"new.py"})
@@ -0,0 +1,73 @@
+"""Unit tests for the columnar FileStatusTable."""
+
+import pytest
+
+from mcp_local_repo_analyzer.models import FileStatus, FileStatusTable
+
+
+@pytest.mark.unit
+class TestFileStatusTable:
+    """Test columnar storage, row views and conversion at the boundary."""
+
+    @pytest.fixture
+    def files(self):
+        """Create a mix of file statuses covering every field."""
+        return [
+            FileStatus(path="src/app.py", status_code="M", staged=True, lines_added=10, lines_deleted=2),
+            FileStatus(path="notes.md", status_code="?", working_tree_status="?"),
+            FileStatus(path="img/logo.png", status_code="A", index_status="A", is_binary=True),
+            FileStatus(path="src/new.py", status_code="R", old_path="src/old.py", lines_added=1),
+        ]
+
+    def test_round_trip(self, files):
+        """Test that models survive conversion to the table and back."""
+        table = FileStatusTable.from_models(files)
+
+        assert len(table) == 4
+        assert table.to_models() == files
+        assert table.to_dicts() == [f.model_dump() for f in files]
+
+    def test_row_views_match_file_status(self, files):
+        """Test that row views expose the same attributes and derived properties."""
+        table = FileStatusTable.from_models(files)
+
+        for row, file in zip(table, files, strict=True):
+            for name in ("path", "status_code", "staged", "is_binary", "old_path", "lines_added"):
+                assert getattr(row, name) == getattr(file, name)
+            assert row.total_changes == file.total_changes
+            assert row.change_type == file.change_type
+            assert row.status_description == file.status_description
+            assert row.file_type == file.file_type
+        assert table[-1].path == "src/new.py"
+        with pytest.raises(IndexError):
+            table[4]
+
+    def test_slices_are_row_views(self, files):
+        """Test that slicing returns row views, as pagination does."""
+        table = FileStatusTable.from_models(files)
+
+        assert [row.path for row in table[1:3]] == ["notes.md", "img/logo.png"]
+        assert [row.to_file_status() for row in table[2:]] == files[2:]
+        assert table[5:] == []
+
+    def test_from_dicts_and_validation(self):
+        """Test building from payload dicts and rejecting negative line counts."""
+        table = FileStatusTable.from_dicts([{"path": "a.py", "status_code": "M", "lines_added": 3}])
+
+        assert table[0].lines_added == 3
+        assert table[0].staged is False
+        assert table.total_changes() == 3
+        with pytest.raises(ValueError):
+            table.append("b.py", "M", lines_deleted=-1)
+
+    def test_interning_keeps_memory_small(self):
+        """Test that repeated codes are stored once and the table stays compact."""
+        table = FileStatusTable()
+        for i in range(10_000):
+            table.append(f"src/module_{i}.py", "M", staged=i % 2 == 0, lines_added=i % 100)
+
+        assert len(table._codes) == 2  # None plus "M"
+        assert table[9_998].staged is True
+        assert table[9_999].staged is False
+        # Columns cost a few bytes per row on top of the path strings themselves
+        assert table.nbytes < 10_000 * 100
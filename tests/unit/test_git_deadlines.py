@@ -0,0 +1,121 @@
+"""Tests for git command deadlines and termination of cancelled commands."""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services.client import GitClient, GitCommandTimeout
+from shared.utils.metrics import GIT_COMMANDS, GIT_TERMINATIONS
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="checks processes through /proc")
+
+
+def _alive(pid: int) -> bool:
+    """Return True if ``pid`` is running (zombies waiting to be reaped count as dead)."""
+    try:
+        state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+    except (FileNotFoundError, IndexError):
+        return False
+    return state not in ("Z", "X")
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    # Shell aliases run in a child of git; record the pid of the grandchild sleep
+    subprocess.run(
+        ["git", "-C", str(repo), "config", "alias.hang", "!sleep 30 & echo $! > sleep.pid; wait"], check=True
+    )
+    subprocess.run(
+        ["git", "-C", str(repo), "config", "alias.stubborn", "!trap '' TERM; sleep 30 & echo $! > sleep.pid; wait"],
+        check=True,
+    )
+    return repo
+
+
+async def _sleep_pid(repo: Path) -> int:
+    pid_file = repo / "sleep.pid"
+    for _ in range(200):
+        if pid_file.exists() and pid_file.read_text().strip():
+            return int(pid_file.read_text())
+        await asyncio.sleep(0.01)
+    raise AssertionError("git alias did not start")
+
+
+async def _gone(pid: int) -> bool:
+    for _ in range(100):
+        if not _alive(pid):
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.mark.unit
+class TestGitDeadlines:
+    """Test per-class deadlines, process group termination and metrics."""
+
+    def test_timeout_per_command_class(self):
+        client = GitClient(GitAnalyzerSettings(git_timeout_seconds=5, git_content_timeout_seconds=60))
+
+        assert client.timeout_for("status") == 5
+        assert client.timeout_for("diff") == 60
+        assert client.timeout_for("log") == 60
+        assert GitClient(GitAnalyzerSettings(git_timeout_seconds=0)).timeout_for("status") is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_terminates_process_group(self, git_repo):
+        client = GitClient(GitAnalyzerSettings(git_timeout_seconds=0.3))
+        before = GIT_TERMINATIONS.value(command="hang", reason="timeout", signal="term")
+
+        with pytest.raises(GitCommandTimeout) as exc_info:
+            await client.execute_command(git_repo, ["hang"])
+
+        assert exc_info.value.timeout == 0.3
+        assert await _gone(await _sleep_pid(git_repo))
+        assert GIT_TERMINATIONS.value(command="hang", reason="timeout", signal="term") == before + 1
+        assert GIT_COMMANDS.value(command="hang", status="timeout") >= 1
+
+    @pytest.mark.asyncio
+    async def test_per_call_timeout_overrides_settings(self, git_repo):
+        client = GitClient(GitAnalyzerSettings(git_timeout_seconds=0))
+
+        with pytest.raises(GitCommandTimeout):
+            await client.execute_command(git_repo, ["hang"], timeout=0.2)
+
+    @pytest.mark.asyncio
+    async def test_kill_after_grace_period(self, git_repo):
+        client = GitClient(GitAnalyzerSettings(git_timeout_seconds=0.3, git_terminate_grace_seconds=0.2))
+        before = GIT_TERMINATIONS.value(command="stubborn", reason="timeout", signal="kill")
+
+        with pytest.raises(GitCommandTimeout):
+            await client.execute_command(git_repo, ["stubborn"])
+
+        assert await _gone(await _sleep_pid(git_repo))
+        assert GIT_TERMINATIONS.value(command="stubborn", reason="timeout", signal="kill") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_terminates_process_group(self, git_repo):
+        client = GitClient(GitAnalyzerSettings())
+        before = GIT_TERMINATIONS.value(command="hang", reason="cancelled", signal="term")
+
+        task = asyncio.create_task(client.execute_command(git_repo, ["hang"]))
+        pid = await _sleep_pid(git_repo)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await _gone(pid)
+        assert GIT_TERMINATIONS.value(command="hang", reason="cancelled", signal="term") == before + 1
+        assert GIT_COMMANDS.value(command="hang", status="cancelled") >= 1
+
+    @pytest.mark.asyncio
+    async def test_fast_commands_unaffected(self, git_repo):
+        client = GitClient(GitAnalyzerSettings(git_timeout_seconds=5))
+
+        assert await client.execute_command(git_repo, ["rev-parse", "--is-inside-work-tree"]) == "true"
@@ -0,0 +1,271 @@
+"""Tests for the in-process git index reader and worktree comparison."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services.client import GitClient
+from mcp_local_repo_analyzer.services.git_index import (
+    IndexFormatError,
+    read_index,
+    scan_worktree,
+)
+from shared.utils.metrics import GIT_COMMANDS
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=T", "-c", "user.email=t@example.com", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def _backdate(repo: Path) -> None:
+    """Move file timestamps a minute into the past so index entries are not racily clean."""
+    past = time.time() - 60
+    for path in repo.rglob("*"):
+        if ".git" not in path.parts and (path.is_file() or path.is_symlink()):
+            os.utime(path, (past, past), follow_symlinks=False)
+
+
+def _ls_files(repo: Path) -> list[tuple[str, str, int, str]]:
+    entries = []
+    for line in _git(repo, "ls-files", "-s").splitlines():
+        info, path = line.split("\t", 1)
+        mode, oid, stage = info.split()
+        entries.append((mode, oid, int(stage), path))
+    return entries
+
+
+def _entries(repo: Path) -> list[tuple[str, str, int, str]]:
+    return [(f"{e.mode:o}", e.oid.hex(), e.stage, e.path) for e in read_index(repo).entries]
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "src" / "pkg").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "a.txt").write_text("a\n")
+    (repo / "src" / "main.py").write_text("print('hi')\n")
+    (repo / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (repo / "src" / "pkg" / "mod_test.py").write_text("y = 2\n")
+    (repo / "run.sh").write_text("#!/bin/sh\n")
+    (repo / "run.sh").chmod(0o755)
+    os.symlink("a.txt", repo / "link")
+    _backdate(repo)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", "init")
+    return repo
+
+
+@pytest.mark.unit
+class TestIndexFormat:
+    """Test parsing of each index version and extension against ``git ls-files``."""
+
+    @pytest.mark.parametrize("version", [2, 4])
+    def test_versions_match_ls_files(self, git_repo, version):
+        _git(git_repo, "update-index", "--index-version", str(version))
+
+        index = read_index(git_repo)
+
+        assert index.version == version
+        assert _entries(git_repo) == _ls_files(git_repo)
+
+    def test_intent_to_add(self, git_repo):
+        (git_repo / "new.txt").write_text("new\n")
+        _git(git_repo, "add", "-N", "new.txt")
+
+        index = read_index(git_repo)
+
+        assert index.version == 3
+        assert [e.path for e in index.entries if e.intent_to_add] == ["new.txt"]
+        assert scan_worktree(git_repo).modified == ["new.txt"]
+
+    def test_split_index(self, git_repo):
+        _git(git_repo, "update-index", "--split-index")
+        (git_repo / "a.txt").write_text("split\n")
+        (git_repo / "b.txt").write_text("b\n")
+        _git(git_repo, "add", "a.txt", "b.txt")
+        _git(git_repo, "rm", "-q", "--cached", "src/main.py")
+
+        assert list((git_repo / ".git").glob("sharedindex.*"))
+        assert read_index(git_repo).shared_index is not None
+        assert _entries(git_repo) == _ls_files(git_repo)
+
+    def test_cache_tree_and_untracked_cache(self, git_repo):
+        _git(git_repo, "config", "core.untrackedCache", "true")
+        (git_repo / "untracked.txt").write_text("u\n")
+        _git(git_repo, "update-index", "--untracked-cache")
+        _git(git_repo, "status", "--porcelain")
+
+        index = read_index(git_repo)
+
+        assert index.cache_tree[""] == bytes.fromhex(_git(git_repo, "rev-parse", "HEAD^{tree}").strip())
+        assert index.untracked_cache is not None
+        assert _entries(git_repo) == _ls_files(git_repo)
+
+    def test_unmerged_stages(self, git_repo):
+        _git(git_repo, "checkout", "-qb", "other")
+        (git_repo / "a.txt").write_text("other\n")
+        _git(git_repo, "commit", "-qam", "other")
+        _git(git_repo, "checkout", "-q", "-")
+        (git_repo / "a.txt").write_text("main\n")
+        _git(git_repo, "commit", "-qam", "main")
+        with pytest.raises(subprocess.CalledProcessError):
+            _git(git_repo, "merge", "-q", "other")
+
+        assert _entries(git_repo) == _ls_files(git_repo)
+        assert scan_worktree(git_repo).unmerged == ["a.txt"]
+
+    def test_corrupt_index(self, git_repo):
+        (git_repo / ".git" / "index").write_bytes(b"DIRX" + b"\0" * 40)
+
+        with pytest.raises(IndexFormatError):
+            read_index(git_repo)
+
+    def test_missing_index(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+
+        assert read_index(tmp_path).entries == []
+
+
+@pytest.mark.unit
+class TestWorktreeScan:
+    """Test stat comparison of index entries with the working tree."""
+
+    def test_clean(self, git_repo):
+        changes = scan_worktree(git_repo)
+
+        assert (changes.modified, changes.deleted, changes.unmerged, changes.uncertain) == ([], [], [], [])
+
+    def test_modified_and_deleted(self, git_repo):
+        (git_repo / "src" / "main.py").write_text("print('changed')\n")
+        (git_repo / "src" / "pkg" / "mod.py").unlink()
+        (git_repo / "link").unlink()
+        (git_repo / "link").write_text("no longer a link\n")
+        (git_repo / "untracked.txt").write_text("u\n")
+
+        changes = scan_worktree(git_repo)
+
+        assert changes.modified == ["link", "src/main.py"]
+        assert changes.deleted == ["src/pkg/mod.py"]
+
+    def test_same_size_rewrite_is_uncertain(self, git_repo):
+        (git_repo / "a.txt").write_text("b\n")
+
+        changes = scan_worktree(git_repo)
+
+        assert changes.modified == []
+        assert changes.uncertain == ["a.txt"]
+
+    def test_racily_clean_entry_is_uncertain(self, git_repo):
+        (git_repo / "a.txt").write_text("racy\n")
+        index = git_repo / ".git" / "index"
+        _git(git_repo, "add", "a.txt")
+        stamp = (git_repo / "a.txt").stat().st_mtime
+        os.utime(index, (stamp, stamp))
+
+        assert "a.txt" in scan_worktree(git_repo).uncertain
+
+    def test_parallel_scan_matches_serial(self, git_repo):
+        for i in range(2500):
+            (git_repo / "many" / f"d{i % 50}").mkdir(parents=True, exist_ok=True)
+            (git_repo / "many" / f"d{i % 50}" / f"f{i}.txt").write_text(f"{i}\n")
+        _backdate(git_repo)
+        _git(git_repo, "add", "-A")
+        (git_repo / "many" / "d3" / "f3.txt").write_text("changed\n")
+        (git_repo / "many" / "d49" / "f2499.txt").unlink()
+
+        serial = scan_worktree(git_repo, max_workers=1)
+        parallel = scan_worktree(git_repo, max_workers=4)
+
+        assert parallel.modified == serial.modified == ["many/d3/f3.txt"]
+        assert parallel.deleted == serial.deleted == ["many/d49/f2499.txt"]
+
+
+@pytest.mark.unit
+class TestGitClientWorktreeChanges:
+    """Test GitClient.get_worktree_changes and get_working_directory_status with and without the index reader."""
+
+    @pytest.mark.asyncio
+    async def test_no_git_for_decided_entries(self, git_repo):
+        (git_repo / "src" / "main.py").write_text("print('changed')\n")
+        (git_repo / "run.sh").unlink()
+        client = GitClient(GitAnalyzerSettings())
+        before = sum(GIT_COMMANDS.snapshot().values())
+
+        changes = await client.get_worktree_changes(git_repo)
+
+        assert changes == {"modified": ["src/main.py"], "deleted": ["run.sh"], "unmerged": []}
+        assert sum(GIT_COMMANDS.snapshot().values()) == before
+
+    @pytest.mark.asyncio
+    async def test_uncertain_entries_checked_with_git(self, git_repo):
+        (git_repo / "a.txt").write_text("b\n")
+        (git_repo / "src" / "main.py").write_text("print('hi')\n")
+        os.utime(git_repo / "src" / "main.py")
+        client = GitClient(GitAnalyzerSettings())
+        before = GIT_COMMANDS.value(command="status", status="ok")
+
+        changes = await client.get_worktree_changes(git_repo)
+
+        assert changes["modified"] == ["a.txt"]
+        assert GIT_COMMANDS.value(command="status", status="ok") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_reader_uses_git_status(self, git_repo):
+        (git_repo / "src" / "main.py").write_text("print('changed')\n")
+        (git_repo / "run.sh").unlink()
+        client = GitClient(GitAnalyzerSettings(use_index_reader=False))
+
+        changes = await client.get_worktree_changes(git_repo)
+
+        assert changes == {"modified": ["src/main.py"], "deleted": ["run.sh"], "unmerged": []}
+
+    @pytest.mark.asyncio
+    async def test_working_directory_status_matches_git_status(self, git_repo):
+        (git_repo / "a.txt").write_text("staged\n")
+        _git(git_repo, "add", "a.txt")
+        (git_repo / "a.txt").write_text("staged, then changed again\n")
+        (git_repo / "src" / "main.py").write_text("print('changed')\n")
+        (git_repo / "run.sh").unlink()
+        (git_repo / "src" / "pkg" / "mod.py").write_text("x = 2\n")
+        _git(git_repo, "add", "src/pkg/mod.py")
+        (git_repo / "notes.txt").write_text("new\n")
+        (git_repo / "build").mkdir()
+        (git_repo / "build" / "out.txt").write_text("new\n")
+        client = GitClient(GitAnalyzerSettings())
+
+        status = await client.get_working_directory_status(git_repo)
+        expected = [f for f in (await client.get_status(git_repo))["files"] if f["working_status"]]
+
+        def by_name(files):
+            return sorted(files, key=lambda f: f["filename"])
+
+        assert by_name(status["files"]) == by_name(expected)
+        assert {f["filename"]: f["status_code"] for f in status["files"]}["a.txt"] == "MM"
+
+    @pytest.mark.asyncio
+    async def test_clean_working_directory_runs_one_git_command(self, git_repo):
+        client = GitClient(GitAnalyzerSettings())
+        before = sum(GIT_COMMANDS.snapshot().values())
+
+        status = await client.get_working_directory_status(git_repo)
+
+        assert status == {"files": []}
+        assert sum(GIT_COMMANDS.snapshot().values()) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_repository_info_dirty_flag(self, git_repo):
+        client = GitClient(GitAnalyzerSettings())
+        assert (await client.get_repository_info(git_repo))["is_dirty"] is False
+
+        (git_repo / "a.txt").write_text("dirty\n")
+        assert (await client.get_repository_info(git_repo))["is_dirty"] is True
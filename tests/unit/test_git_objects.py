@@ -0,0 +1,275 @@
+"""Tests for the in-process git object store reader and staged line counts."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services.client import GitClient
+from mcp_local_repo_analyzer.services.diff_analyzer import count_changed_lines, is_binary_content
+from mcp_local_repo_analyzer.services.git_objects import (
+    DeltaBaseCache,
+    ObjectNotFoundError,
+    ObjectStore,
+    ObjectStoreError,
+    apply_delta,
+    head_entry,
+    open_object_store,
+)
+from shared.utils.metrics import GIT_COMMANDS
+
+
+def _git(repo: Path, *args: str, input: bytes | None = None) -> bytes:
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=T", "-c", "user.email=t@example.com", *args],
+        check=True,
+        capture_output=True,
+        input=input,
+    ).stdout
+
+
+def _all_objects(repo: Path) -> dict[str, tuple[str, bytes]]:
+    """Return every object of ``repo`` as read by ``git cat-file --batch``."""
+    names = _git(repo, "cat-file", "--batch-all-objects", "--batch-check=%(objectname)").split()
+    raw = _git(repo, "cat-file", "--batch", input=b"\n".join(names) + b"\n")
+    objects = {}
+    pos = 0
+    while pos < len(raw):
+        end = raw.index(b"\n", pos)
+        name, kind, size = raw[pos:end].decode().split()
+        objects[name] = (kind, raw[end + 1 : end + 1 + int(size)])
+        pos = end + 2 + int(size)
+    return objects
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """A repository whose history packs into delta chains."""
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    for i in range(1, 16):
+        (repo / "numbers.txt").write_text("".join(f"{n}\n" for n in range(i * 20)))
+        (repo / "src" / f"copy{i % 3}.txt").write_text("".join(f"line {n}\n" for n in range(i * 10)))
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-qm", f"commit {i}")
+    return repo
+
+
+@pytest.mark.unit
+class TestObjectStore:
+    """Test reading loose and packed objects against ``git cat-file``."""
+
+    def _assert_matches_git(self, repo: Path) -> None:
+        store = ObjectStore(repo / ".git" / "objects")
+        expected = _all_objects(repo)
+
+        assert expected
+        assert {name: store.read(name) for name in expected} == expected
+
+    def test_loose_objects(self, git_repo):
+        assert not list((git_repo / ".git" / "objects" / "pack").glob("*.pack"))
+        self._assert_matches_git(git_repo)
+
+    def test_packed_offset_deltas(self, git_repo):
+        _git(git_repo, "gc", "-q", "--aggressive")
+
+        assert list((git_repo / ".git" / "objects" / "pack").glob("*.pack"))
+        self._assert_matches_git(git_repo)
+
+    def test_packed_ref_deltas(self, git_repo):
+        _git(git_repo, "-c", "repack.useDeltaBaseOffset=false", "repack", "-qadf")
+
+        self._assert_matches_git(git_repo)
+
+    def test_new_packs_found_after_repack(self, git_repo):
+        store = open_object_store(git_repo)
+        head = _git(git_repo, "rev-parse", "HEAD").decode().strip()
+        assert store.read(head)[0] == "commit"
+
+        _git(git_repo, "gc", "-q")
+
+        assert store.read(head)[0] == "commit"
+
+    def test_sha256_repository(self, tmp_path):
+        subprocess.run(["git", "init", "-q", "--object-format=sha256", str(tmp_path)], check=True)
+        (tmp_path / "a.txt").write_text("a\n")
+        _git(tmp_path, "add", "a.txt")
+        _git(tmp_path, "commit", "-qm", "init")
+        _git(tmp_path, "gc", "-q")
+
+        assert open_object_store(tmp_path).hash_size == 32
+        assert head_entry(tmp_path, "a.txt")[1].hex() == _git(tmp_path, "rev-parse", "HEAD:a.txt").decode().strip()
+
+    def test_missing_object(self, git_repo):
+        with pytest.raises(ObjectNotFoundError):
+            open_object_store(git_repo).read("00" * 20)
+
+    def test_read_blob_rejects_other_types(self, git_repo):
+        with pytest.raises(ObjectStoreError):
+            open_object_store(git_repo).read_blob(_git(git_repo, "rev-parse", "HEAD").decode().strip())
+
+
+@pytest.mark.unit
+class TestDeltas:
+    """Test delta application and the delta base cache."""
+
+    def test_copy_and_insert(self):
+        # Base size 11, result size 11: copy "hello " (offset 0, size 6), insert "there"
+        delta = bytes([11, 11, 0x90, 6, 5]) + b"there"
+
+        assert apply_delta(b"hello world", delta) == b"hello there"
+
+    def test_wrong_base_size(self):
+        with pytest.raises(ObjectStoreError):
+            apply_delta(b"short", bytes([11, 5, 5]) + b"there")
+
+    def test_truncated_delta(self):
+        with pytest.raises(ObjectStoreError):
+            apply_delta(b"hello world", bytes([11, 11, 0x90]))
+
+    def test_cache_bounded_by_size(self):
+        cache = DeltaBaseCache(max_bytes=100)
+        for offset in range(5):
+            cache.put("pack", offset, 3, b"x" * 20)
+        cache.put("pack", 5, 3, b"x" * 20)
+        cache.put("pack", 6, 3, b"x" * 60)
+
+        assert cache.size <= 100
+        assert cache.get("pack", 0) is None
+        assert cache.get("pack", 5) is not None
+
+
+@pytest.mark.unit
+class TestHeadEntry:
+    """Test resolving paths in the HEAD commit."""
+
+    def test_nested_path(self, git_repo):
+        expected = _git(git_repo, "rev-parse", "HEAD:src/copy1.txt").decode().strip()
+
+        assert head_entry(git_repo, "src/copy1.txt") == (0o100644, bytes.fromhex(expected))
+        assert head_entry(git_repo, "src/missing.txt") is None
+        assert head_entry(git_repo, "numbers.txt/below") is None
+
+    def test_packed_refs_and_detached_head(self, git_repo):
+        expected = head_entry(git_repo, "numbers.txt")
+        _git(git_repo, "pack-refs", "--all")
+        assert head_entry(git_repo, "numbers.txt") == expected
+
+        _git(git_repo, "checkout", "-q", "--detach", "HEAD~1")
+        assert head_entry(git_repo, "numbers.txt") != expected
+
+    def test_unborn_head(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+
+        assert head_entry(tmp_path, "a.txt") is None
+
+
+@pytest.mark.unit
+class TestLineCounts:
+    """Test line counts against ``git diff --numstat``."""
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            (b"a\nb\nc\n", b"a\nc\nd\n"),
+            (b"", b"a\nb\n"),
+            (b"a\nb\n", b""),
+            (b"a\nb", b"a\nb\n"),
+            (b"x\n" * 5 + b"y\n", b"y\n" + b"x\n" * 5),
+            (b"a\r\nb\r\n", b"a\nb\r\n"),
+        ],
+    )
+    def test_matches_numstat(self, tmp_path, old, new):
+        (tmp_path / "old").write_bytes(old)
+        (tmp_path / "new").write_bytes(new)
+        result = subprocess.run(
+            ["git", "diff", "--no-index", "--numstat", str(tmp_path / "old"), str(tmp_path / "new")],
+            capture_output=True,
+            text=True,
+        )
+        added, deleted = result.stdout.split()[:2]
+
+        assert count_changed_lines(old, new) == (int(added), int(deleted))
+
+    def test_too_many_edits(self):
+        old = b"".join(b"%d\n" % n for n in range(1, 301))
+        new = b"".join(b"%d\n" % -n for n in range(1, 301))
+
+        assert count_changed_lines(old, new) is None
+        assert count_changed_lines(old, new, max_edits=600) == (300, 300)
+
+    def test_binary_content(self):
+        assert is_binary_content(b"PK\x03\x04\0")
+        assert not is_binary_content(b"text\n")
+        assert not is_binary_content(b"x" * 8000 + b"\0")
+
+
+@pytest.mark.unit
+class TestStagedDiffStats:
+    """Test GitClient staged line counts from the object store."""
+
+    def _stage_changes(self, repo: Path) -> list[str]:
+        (repo / "numbers.txt").write_text("".join(f"{n}\n" for n in range(290)) + "extra\n")
+        (repo / "src" / "copy1.txt").unlink()
+        (repo / "new.txt").write_text("one\ntwo\n")
+        (repo / "data.bin").write_bytes(b"\0\1\2")
+        _git(repo, "add", "-A")
+        return ["numbers.txt", "src/copy1.txt", "new.txt", "data.bin"]
+
+    @pytest.mark.asyncio
+    async def test_matches_git_without_subprocesses(self, git_repo):
+        files = self._stage_changes(git_repo)
+        client = GitClient(GitAnalyzerSettings())
+        expected = [
+            await GitClient(GitAnalyzerSettings(use_object_reader=False)).get_diff_stats(git_repo, path, staged=True)
+            for path in files
+        ]
+        _git(git_repo, "gc", "-q")
+        before = sum(GIT_COMMANDS.snapshot().values())
+
+        stats = [await client.get_diff_stats(git_repo, path, staged=True) for path in files]
+
+        assert stats == expected
+        assert stats[3]["is_binary"] is True
+        assert sum(GIT_COMMANDS.snapshot().values()) == before
+
+    @pytest.mark.asyncio
+    async def test_attributes_fall_back_to_git(self, git_repo):
+        (git_repo / ".gitattributes").write_text("*.txt binary\n")
+        self._stage_changes(git_repo)
+        client = GitClient(GitAnalyzerSettings())
+        before = GIT_COMMANDS.value(command="diff", status="ok")
+
+        stats = await client.get_diff_stats(git_repo, "numbers.txt", staged=True)
+
+        assert stats["is_binary"] is True
+        assert GIT_COMMANDS.value(command="diff", status="ok") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_partial_clone_reads_missing_blobs_with_git(self, git_repo, tmp_path):
+        _git(git_repo, "config", "uploadpack.allowFilter", "true")
+        clone = tmp_path / "clone"
+        _git(
+            tmp_path,
+            "-c",
+            "protocol.file.allow=always",
+            "clone",
+            "-q",
+            "--no-checkout",
+            "--filter=blob:none",
+            f"file://{git_repo}",
+            str(clone),
+        )
+        _git(clone, "config", "protocol.file.allow", "always")
+        _git(clone, "reset", "-q")
+        (clone / "numbers.txt").write_text("".join(f"{n}\n" for n in range(295)))
+        _git(clone, "add", "numbers.txt")
+        client = GitClient(GitAnalyzerSettings())
+        before = GIT_COMMANDS.value(command="cat-file", status="ok")
+
+        stats = await client.get_diff_stats(clone, "numbers.txt", staged=True)
+
+        assert stats == {"lines_added": 0, "lines_deleted": 5, "is_binary": False}
+        assert GIT_COMMANDS.value(command="cat-file", status="ok") == before + 1
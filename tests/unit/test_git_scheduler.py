@@ -0,0 +1,159 @@
+"""Tests for the process-wide git subprocess scheduler."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services.client import GitClient
+from mcp_local_repo_analyzer.services.git_scheduler import (
+    GitPriority,
+    GitScheduler,
+    default_git_concurrency,
+    get_git_scheduler,
+    priority_for,
+)
+from shared.utils.metrics import GIT_QUEUE_DEPTH, GIT_QUEUE_WAIT
+
+
+async def _queue(scheduler: GitScheduler, order: list[str], name: str, repo: str, priority: GitPriority) -> None:
+    async with scheduler.slot(repo, priority):
+        order.append(name)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+class TestGitScheduler:
+    """Test the concurrency cap, priority order, per-repository fairness and cancellation."""
+
+    def test_priority_classes(self):
+        assert priority_for("branch") is GitPriority.METADATA
+        assert priority_for("rev-parse") is GitPriority.METADATA
+        assert priority_for("status") is GitPriority.STATUS
+        assert priority_for("unknown-command") is GitPriority.STATUS
+        assert priority_for("diff") is GitPriority.CONTENT
+        assert priority_for("log") is GitPriority.CONTENT
+
+    def test_process_wide_instance(self):
+        assert get_git_scheduler(3) is get_git_scheduler(3)
+        assert get_git_scheduler().max_concurrency == default_git_concurrency()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        scheduler = GitScheduler(2)
+        active = peak = 0
+
+        async def command() -> None:
+            nonlocal active, peak
+            async with scheduler.slot("repo", GitPriority.STATUS):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(command() for _ in range(6)))
+
+        assert peak == 2
+        assert scheduler.running == 0
+        assert scheduler.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        scheduler = GitScheduler(1)
+        order: list[str] = []
+
+        async with scheduler.slot("repo", GitPriority.CONTENT):
+            tasks = [
+                asyncio.create_task(_queue(scheduler, order, name, "repo", priority))
+                for name, priority in [
+                    ("log", GitPriority.CONTENT),
+                    ("status", GitPriority.STATUS),
+                    ("branch", GitPriority.METADATA),
+                ]
+            ]
+            await _settle()
+            assert scheduler.queued == 3
+            assert GIT_QUEUE_DEPTH.value(priority="metadata") >= 1
+        await asyncio.gather(*tasks)
+
+        assert order == ["branch", "status", "log"]
+
+    @pytest.mark.asyncio
+    async def test_repositories_take_turns(self):
+        scheduler = GitScheduler(1)
+        order: list[str] = []
+
+        async with scheduler.slot("a", GitPriority.CONTENT):
+            tasks = [
+                asyncio.create_task(_queue(scheduler, order, name, name[0], GitPriority.CONTENT))
+                for name in ("a1", "a2", "a3", "b1", "c1")
+            ]
+            await _settle()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a1", "b1", "c1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = GitScheduler(1)
+        order: list[str] = []
+        depth = GIT_QUEUE_DEPTH.value(priority="content")
+
+        async with scheduler.slot("repo", GitPriority.STATUS):
+            cancelled = asyncio.create_task(_queue(scheduler, order, "cancelled", "repo", GitPriority.CONTENT))
+            waiting = asyncio.create_task(_queue(scheduler, order, "waiting", "repo", GitPriority.CONTENT))
+            await _settle()
+            cancelled.cancel()
+            await _settle()
+            assert scheduler.queued == 1
+        await waiting
+
+        assert order == ["waiting"]
+        assert cancelled.cancelled()
+        assert scheduler.running == 0
+        assert GIT_QUEUE_DEPTH.value(priority="content") == depth
+
+    @pytest.mark.asyncio
+    async def test_slot_handed_to_cancelled_waiter_is_passed_on(self):
+        scheduler = GitScheduler(1)
+        order: list[str] = []
+
+        holder = scheduler.slot("repo", GitPriority.STATUS)
+        await holder.__aenter__()
+        first = asyncio.create_task(_queue(scheduler, order, "first", "repo", GitPriority.STATUS))
+        second = asyncio.create_task(_queue(scheduler, order, "second", "repo", GitPriority.STATUS))
+        await _settle()
+        # Hand the slot to ``first`` and cancel it before it runs
+        await holder.__aexit__(None, None, None)
+        first.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+
+        assert order == ["second"]
+        assert scheduler.running == 0
+        assert scheduler.queued == 0
+
+
+@pytest.mark.unit
+class TestGitClientScheduling:
+    """Test that GitClient runs git through the shared scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_commands_queue_behind_cap(self, tmp_path: Path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        client = GitClient(GitAnalyzerSettings(git_max_concurrency=1))
+        waits = GIT_QUEUE_WAIT.count(priority="metadata")
+
+        results = await asyncio.gather(
+            *(client.execute_command(tmp_path, ["rev-parse", "--is-inside-work-tree"]) for _ in range(4))
+        )
+
+        assert results == ["true"] * 4
+        assert client.scheduler is get_git_scheduler(1)
+        assert client.scheduler.running == 0
+        assert GIT_QUEUE_WAIT.count(priority="metadata") == waits + 4
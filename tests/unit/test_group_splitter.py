@@ -0,0 +1,110 @@
+"""Unit tests for the balanced group splitter."""
+
+import math
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_pr_recommender.services.group_splitter import BalancedSplitter, estimate_review_time
+
+
+def _file(path, added=10):
+    return FileStatus(path=path, status_code="M", lines_added=added)
+
+
+@pytest.mark.unit
+class TestBalancedSplitter:
+    """Test multi-constraint bin-packing of files into PR-sized chunks."""
+
+    def test_respects_all_limits(self):
+        """Test that every chunk stays within files, lines and review time limits."""
+        files = [_file(f"src/mod{i % 7}/f{i}.py", added=(i * 37) % 300) for i in range(200)]
+
+        chunks = BalancedSplitter(max_files=8, max_lines=600, max_review_minutes=45).split(files)
+
+        assert sorted(f.path for chunk in chunks for f in chunk) == sorted(f.path for f in files)
+        for chunk in chunks:
+            lines = sum(f.total_changes for f in chunk)
+            assert len(chunk) <= 8
+            assert lines <= 600
+            assert estimate_review_time(len(chunk), lines) <= 45
+
+    def test_oversized_file_gets_own_chunk(self):
+        """Test that a file over the line limit is isolated instead of dropped."""
+        files = [_file("src/big.py", added=5000), _file("src/small.py", added=5)]
+
+        chunks = BalancedSplitter(max_files=8, max_lines=1000).split(files)
+
+        assert [f.path for f in chunks[0]] == ["src/big.py"]
+        assert [f.path for f in chunks[1]] == ["src/small.py"]
+
+    def test_small_sibling_directories_are_merged(self):
+        """Test that one-file directories no longer become one-file PRs."""
+        files = [_file(f"src/feature_{i}/handler.py") for i in range(40)]
+
+        chunks = BalancedSplitter(max_files=8, max_lines=1000).split(files)
+
+        assert len(chunks) == 5
+
+    def test_top_level_directories_stay_apart(self):
+        """Test that locality keeps unrelated top-level directories in separate chunks."""
+        files = [_file("src/a.py"), _file("src/b.py"), _file("lib/c.py"), _file("lib/d.py")]
+
+        chunks = BalancedSplitter(max_files=8, max_lines=1000, locality_depth=1).split(files)
+
+        assert sorted([f.path for f in chunk] for chunk in chunks) == [
+            ["lib/c.py", "lib/d.py"],
+            ["src/a.py", "src/b.py"],
+        ]
+
+    def test_same_directory_files_stay_together(self):
+        """Test that a directory fitting in one chunk is never split."""
+        files = [_file(f"pkg/{name}/f{i}.py") for name in ("a", "b", "c") for i in range(3)]
+
+        chunks = BalancedSplitter(max_files=6, max_lines=1000, locality_depth=0).split(files)
+
+        for name in ("a", "b", "c"):
+            assert sum(any(f.path.startswith(f"pkg/{name}/") for f in chunk) for chunk in chunks) == 1
+
+    def test_improvement_pass_balances_review_time(self):
+        """Test that units move from the most to the least expensive chunk."""
+        files = [_file("src/a/big.py", added=400), _file("src/a/mid.py", added=300), _file("src/b/x.py", added=300)]
+        files += [_file(f"src/c/f{i}.py", added=1) for i in range(2)]
+
+        packed = BalancedSplitter(max_files=8, max_lines=800, improvement_passes=0).split(files)
+        improved = BalancedSplitter(max_files=8, max_lines=800, improvement_passes=3).split(files)
+
+        def worst(chunks):
+            return max(estimate_review_time(len(c), sum(f.total_changes for f in c)) for c in chunks)
+
+        assert worst(improved) < worst(packed)
+        assert [f.path for f in improved[1]] == ["src/b/x.py", "src/c/f0.py", "src/c/f1.py"]
+
+    def test_10k_files_is_linear(self, monkeypatch):
+        """Test that 10,000 files are packed close to the lower bound with linear fit checks.
+
+        Wall-clock limits are enforced by the gated benchmarks in tests/benchmarks.
+        """
+        fits = BalancedSplitter._fits
+        checks = 0
+
+        def counting_fits(self, files, lines):
+            nonlocal checks
+            checks += 1
+            return fits(self, files, lines)
+
+        monkeypatch.setattr(BalancedSplitter, "_fits", counting_fits)
+
+        def split(count):
+            nonlocal checks
+            files = [_file(f"src/pkg{i % 37}/mod{i % 211}/f{i}.py", added=(i * 7919) % 40) for i in range(count)]
+            checks = 0
+            chunks = BalancedSplitter(max_files=8, max_lines=1000, max_review_minutes=60).split(files)
+            assert sum(len(c) for c in chunks) == count
+            return chunks, checks
+
+        chunks, checks_10k = split(10_000)
+        _, checks_5k = split(5_000)
+
+        assert len(chunks) <= math.ceil(10_000 / 8) * 1.05
+        assert checks_10k <= 2.1 * checks_5k
@@ -37,6 +37,8 @@ class TestGroupingEngine:
         ):
             # Mock settings for SemanticAnalyzer
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
             # Mock settings for GroupingEngine
             mock_ge_settings.return_value.openai_api_key = "test_key"
             mock_ge_settings.return_value.enable_llm_analysis = True
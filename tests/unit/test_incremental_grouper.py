@@ -0,0 +1,247 @@
+"""Unit tests for incremental re-grouping and the recommendation session store."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.models.risk import RiskAssessment
+from mcp_pr_recommender.models.recommendations import ChangeGroup, PRStrategy
+from mcp_pr_recommender.services.incremental_grouper import IncrementalGrouper
+from mcp_pr_recommender.services.semantic_analyzer import SemanticAnalyzer
+from mcp_pr_recommender.services.session_store import RecommendationSessionStore
+
+
+def _llm_response(content):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = content
+    return response
+
+
+@pytest.mark.unit
+class TestIncrementalGrouper:
+    """Test delta computation and incremental group updates."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Mock settings shared by the analyzer and the grouper."""
+        with (
+            patch("mcp_pr_recommender.services.semantic_analyzer.settings") as mock_sa_settings,
+            patch("mcp_pr_recommender.services.incremental_grouper.settings") as mock_ig_settings,
+        ):
+            instance = Mock()
+            instance.openai_api_key = "test_key"
+            instance.openai_model = "gpt-4"
+            instance.max_tokens_per_request = 1000
+            instance.llm_cache_enabled = False
+            instance.llm_streaming = False
+            instance.incremental_full_regroup_ratio = 0.5
+            mock_sa_settings.return_value = instance
+            mock_ig_settings.return_value = instance
+            yield instance
+
+    @pytest.fixture
+    def grouper(self, mock_settings):
+        """Create an incremental grouper with a mocked OpenAI client."""
+        with patch("openai.AsyncOpenAI"):
+            analyzer = SemanticAnalyzer()
+        analyzer.client.chat.completions.create = AsyncMock(side_effect=Exception("no network"))
+        return IncrementalGrouper(analyzer)
+
+    @pytest.fixture
+    def analysis(self):
+        """Create a minimal analysis object."""
+        return OutstandingChangesAnalysis(
+            repository_path=Path("/test/repo"),
+            total_outstanding_files=0,
+            risk_assessment=RiskAssessment(risk_level="low"),
+            summary="test",
+        )
+
+    @pytest.fixture
+    def previous(self, analysis):
+        """Create a previous strategy with two groups."""
+        api = ChangeGroup(
+            id="api",
+            files=[
+                FileStatus(path="src/api/routes.py", status_code="M", lines_added=10),
+                FileStatus(path="src/api/models.py", status_code="M", lines_added=5),
+            ],
+            category="feature",
+            confidence=0.9,
+            reasoning="API work",
+        )
+        docs = ChangeGroup(
+            id="docs",
+            files=[FileStatus(path="docs/guide.md", status_code="M", lines_added=3)],
+            category="docs",
+            confidence=0.9,
+            reasoning="Docs",
+        )
+        return PRStrategy(
+            strategy_name="semantic",
+            source_analysis=analysis,
+            change_groups=[api, docs],
+            recommended_prs=[],
+        )
+
+    def test_compute_delta(self, grouper, previous):
+        """Test classification of unchanged, changed, renamed, new and removed files."""
+        files = [
+            FileStatus(path="src/api/routes.py", status_code="M", lines_added=10),
+            FileStatus(path="src/api/models.py", status_code="M", lines_added=8),
+            FileStatus(path="docs/manual.md", status_code="R", lines_added=3, old_path="docs/guide.md"),
+            FileStatus(path="src/api/auth.py", status_code="A", lines_added=20),
+        ]
+
+        delta = grouper.compute_delta(previous.change_groups, files)
+
+        assert delta.unchanged == 1
+        assert delta.changed == 1
+        assert delta.renamed == 1
+        assert delta.added == 1
+        assert delta.removed == []
+        assert [f.path for f in delta.kept["docs"]] == ["docs/manual.md"]
+        assert delta.previous_group == {"src/api/models.py": "api"}
+
+    @pytest.mark.asyncio
+    async def test_regroup_without_delta_skips_llm(self, grouper, previous, analysis):
+        """Test that an unchanged file set reuses the previous groups without an LLM call."""
+        files = [f for group in previous.change_groups for f in group.files]
+
+        groups, stats = await grouper.regroup(previous, files, analysis)
+
+        grouper.semantic_analyzer.client.chat.completions.create.assert_not_called()
+        assert [g.id for g in groups] == ["api", "docs"]
+        assert stats["unchanged_files"] == 3
+        assert stats["full_regroup"] is False
+
+    @pytest.mark.asyncio
+    async def test_regroup_drops_removed_files_and_empty_groups(self, grouper, previous, analysis):
+        """Test that removed files are patched out and emptied groups disappear."""
+        files = list(previous.change_groups[0].files)
+
+        groups, stats = await grouper.regroup(previous, files, analysis)
+
+        assert [g.id for g in groups] == ["api"]
+        assert stats["removed_files"] == 1
+
+    @pytest.mark.asyncio
+    async def test_regroup_assigns_new_file_with_llm(self, grouper, previous, analysis):
+        """Test that only the new file is sent to the LLM and lands in the chosen group."""
+        grouper.semantic_analyzer.client.chat.completions.create = AsyncMock(
+            return_value=_llm_response(
+                json.dumps({"assignments": [{"file": "src/api/auth.py", "group_id": "api", "new_group": False}]})
+            )
+        )
+        files = [f for group in previous.change_groups for f in group.files]
+        files.append(FileStatus(path="src/api/auth.py", status_code="A", lines_added=20))
+
+        groups, stats = await grouper.regroup(previous, files, analysis)
+
+        prompt = grouper.semantic_analyzer.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "src/api/auth.py" in prompt
+        assert "- src/api/routes.py (" not in prompt
+        assert "src/api/auth.py" in next(g for g in groups if g.id == "api").file_paths
+        assert stats["llm_assigned"] == 1
+
+    @pytest.mark.asyncio
+    async def test_regroup_heuristic_fallback(self, grouper, previous, analysis):
+        """Test directory-based placement when the LLM is unavailable."""
+        files = [f for group in previous.change_groups for f in group.files]
+        files.append(FileStatus(path="src/api/auth.py", status_code="A", lines_added=20))
+        files.append(FileStatus(path="scripts/deploy.sh", status_code="A", lines_added=4))
+
+        groups, stats = await grouper.regroup(previous, files, analysis)
+
+        by_id = {g.id: g for g in groups}
+        assert "src/api/auth.py" in by_id["api"].file_paths
+        assert "scripts/deploy.sh" not in by_id["api"].file_paths
+        assert any("scripts/deploy.sh" in g.file_paths for g in groups)
+        assert stats["heuristic_assigned"] == 2
+
+    @pytest.mark.asyncio
+    async def test_regroup_large_delta_triggers_full_regroup(self, grouper, previous, analysis):
+        """Test that a mostly new file set falls back to full grouping."""
+        files = [FileStatus(path=f"lib/module_{i}.py", status_code="A", lines_added=1) for i in range(10)]
+
+        groups, stats = await grouper.regroup(previous, files, analysis)
+
+        assert stats["full_regroup"] is True
+        assert sum(len(g.files) for g in groups) == 10
+
+    @pytest.mark.asyncio
+    async def test_regroup_duplicate_group_ids_triggers_full_regroup(self, grouper, previous, analysis):
+        """Test that groups sharing an id are re-grouped instead of merging their files."""
+        docs = previous.change_groups[1]
+        previous.change_groups[1] = docs.model_copy(update={"id": "api"})
+        files = [f for group in previous.change_groups for f in group.files]
+        ctx = Mock()
+        grouper.semantic_analyzer.group_files = AsyncMock(return_value=previous.change_groups)
+
+        groups, stats = await grouper.regroup(previous, files, analysis, ctx)
+
+        grouper.semantic_analyzer.group_files.assert_awaited_once_with(files, analysis, ctx)
+        assert stats["full_regroup"] is True
+        assert [g.file_paths for g in groups] == [["src/api/routes.py", "src/api/models.py"], ["docs/guide.md"]]
+
+    @pytest.mark.asyncio
+    async def test_full_regroup_receives_context(self, grouper, previous, analysis):
+        """Test that the caller's context reaches the full re-grouping."""
+        files = [FileStatus(path=f"lib/module_{i}.py", status_code="A", lines_added=1) for i in range(10)]
+        ctx = Mock()
+        grouper.semantic_analyzer.group_files = AsyncMock(return_value=[])
+
+        await grouper.regroup(previous, files, analysis, ctx)
+
+        grouper.semantic_analyzer.group_files.assert_awaited_once_with(files, analysis, ctx)
+
+
+@pytest.mark.unit
+class TestRecommendationSessionStore:
+    """Test the per-repository session store."""
+
+    def _strategy(self, name="semantic"):
+        analysis = OutstandingChangesAnalysis(
+            repository_path=Path("/repo"),
+            risk_assessment=RiskAssessment(risk_level="low"),
+            summary="test",
+        )
+        return PRStrategy(strategy_name=name, source_analysis=analysis, change_groups=[], recommended_prs=[])
+
+    def test_save_and_get(self, tmp_path):
+        """Test round-tripping a strategy by repository path."""
+        store = RecommendationSessionStore()
+        strategy = self._strategy()
+
+        store.save(tmp_path, strategy)
+
+        assert store.get(tmp_path) is strategy
+        assert store.get(tmp_path / "other") is None
+
+    def test_lru_limit(self, tmp_path):
+        """Test that the least recently used repository is forgotten first."""
+        store = RecommendationSessionStore(max_sessions=2)
+        store.save(tmp_path / "a", self._strategy("a"))
+        store.save(tmp_path / "b", self._strategy("b"))
+        store.get(tmp_path / "a")
+        store.save(tmp_path / "c", self._strategy("c"))
+
+        assert store.get(tmp_path / "b") is None
+        assert store.get(tmp_path / "a") is not None
+        assert len(store) == 2
+
+    def test_clear(self, tmp_path):
+        """Test clearing a single session and all sessions."""
+        store = RecommendationSessionStore()
+        store.save(tmp_path / "a", self._strategy())
+        store.save(tmp_path / "b", self._strategy())
+
+        store.clear(tmp_path / "a")
+        assert store.get(tmp_path / "a") is None
+        store.clear()
+        assert len(store) == 0
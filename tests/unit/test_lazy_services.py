@@ -0,0 +1,74 @@
+"""Tests for the lazily constructed services dict."""
+
+import pytest
+
+from shared.base.services import LazyServices
+
+
+@pytest.mark.unit
+class TestLazyServices:
+    """Test deferred construction, dependencies and dict behaviour."""
+
+    def test_built_on_first_lookup_only(self):
+        built = []
+        services = LazyServices({"a": lambda _: built.append("a") or "A", "b": lambda _: built.append("b") or "B"})
+
+        assert built == []
+        assert services.pending == ["a", "b"]
+        assert services["a"] == "A"
+        assert services["a"] == "A"
+        assert built == ["a"]
+        assert services.pending == ["b"]
+
+    def test_factories_resolve_dependencies(self):
+        services = LazyServices({"settings": lambda _: {"depth": 3}, "client": lambda s: ("client", s["settings"])})
+
+        assert services["client"] == ("client", {"depth": 3})
+        assert services.pending == []
+
+    def test_dict_protocol(self):
+        services = LazyServices({"a": lambda _: "A"})
+
+        assert "a" in services
+        assert "missing" not in services
+        assert services.get("missing", 1) == 1
+        assert services.setdefault("a", "other") == "A"
+        assert services.setdefault("b", "B") == "B"
+        assert services["b"] == "B"
+        with pytest.raises(KeyError):
+            services["missing"]
+
+    def test_failed_factory_is_retried(self):
+        attempts = []
+
+        def flaky(_services: LazyServices) -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("not yet")
+            return "ok"
+
+        services = LazyServices({"flaky": flaky})
+
+        with pytest.raises(RuntimeError):
+            services["flaky"]
+        assert services["flaky"] == "ok"
+        assert len(attempts) == 2
+
+    def test_warm_builds_everything(self):
+        services = LazyServices({"a": lambda _: "A", "b": lambda s: s["a"] + "B"})
+
+        services.warm()
+
+        assert services.pending == []
+        assert dict(services) == {"a": "A", "b": "AB"}
+
+    @pytest.mark.asyncio
+    async def test_servers_defer_services(self):
+        from mcp_local_repo_analyzer.server import LocalRepoAnalyzerServer
+        from mcp_pr_recommender.server import PRRecommenderServer
+
+        for server in (LocalRepoAnalyzerServer(), PRRecommenderServer()):
+            _, services = await server.create_server()
+
+            assert isinstance(services, LazyServices)
+            assert services.pending == list(services._factories)
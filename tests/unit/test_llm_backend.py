@@ -0,0 +1,195 @@
+"""Unit tests for the OpenAI-compatible LLM backend."""
+
+import asyncio
+import json
+
+import httpx
+import openai
+import pytest
+
+from mcp_pr_recommender.services.llm_backend import LLMBackend, _get_semaphore, get_shared_http_client
+
+BASE_URL = "http://llm.local/v1"
+
+
+def _completion(content):
+    return {
+        "id": "cmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "local-model",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+    }
+
+
+def _backend(handler, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    options = {"max_retries": 2, "retry_base_delay": 0.0, "hedge_delay": 0.0, "max_concurrency": 4}
+    options.update(kwargs)
+    return LLMBackend(api_key="local", base_url=BASE_URL, model="local-model", http_client=http_client, **options)
+
+
+@pytest.mark.unit
+class TestLLMBackend:
+    """Test retries, hedging, concurrency limits and streaming against a stand-in server."""
+
+    @pytest.mark.asyncio
+    async def test_completion_against_compatible_server(self):
+        """Test a completion request against an OpenAI-compatible base URL."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json=_completion("hello"))
+
+        backend = _backend(handler)
+        response = await backend.create_chat_completion(messages=[{"role": "user", "content": "hi"}])
+
+        assert response.choices[0].message.content == "hello"
+        assert str(seen[0].url) == f"{BASE_URL}/chat/completions"
+        assert json.loads(seen[0].content)["model"] == "local-model"
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        """Test that 5xx responses are retried until success."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503, json={"error": {"message": "busy"}})
+            return httpx.Response(200, json=_completion("ok"))
+
+        backend = _backend(handler)
+        response = await backend.create_chat_completion(messages=[])
+
+        assert response.choices[0].message.content == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """Test that 4xx errors other than rate limits fail immediately."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+
+        backend = _backend(handler)
+        with pytest.raises(openai.BadRequestError):
+            await backend.create_chat_completion(messages=[])
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_exhausted(self):
+        """Test that the last transient error is raised once retries are used up."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"error": {"message": "down"}})
+
+        backend = _backend(handler, max_retries=1)
+        with pytest.raises(openai.InternalServerError):
+            await backend.create_chat_completion(messages=[])
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins(self):
+        """Test that a hedge request is sent when the first attempt is slow."""
+        backend = _backend(lambda request: httpx.Response(200, json=_completion("unused")), hedge_delay=0.01)
+        attempts = []
+
+        async def factory():
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                await asyncio.sleep(5)
+                return "slow"
+            return "fast"
+
+        assert await backend._hedged(factory) == "fast"
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test that in-flight requests never exceed max_concurrency."""
+        backend = _backend(lambda request: httpx.Response(200, json=_completion("unused")), max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "done"
+
+        backend.client.chat.completions.create = create
+        results = await asyncio.gather(*(backend.create_chat_completion(messages=[]) for _ in range(6)))
+
+        assert results == ["done"] * 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_client_created_on_first_request(self, monkeypatch):
+        """Test that a backend without credentials can be built and only fails when it sends a request."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        backend = LLMBackend(api_key="", base_url=BASE_URL, max_retries=0)
+
+        assert backend._client is None
+        with pytest.raises(openai.OpenAIError, match="credentials"):
+            await backend.create_chat_completion(messages=[])
+
+    def test_backend_reused_across_event_loops(self):
+        """Test that semaphores and pooled connections are not carried over to a new event loop."""
+        backend = _backend(lambda request: httpx.Response(200, json=_completion("hi")), max_concurrency=1)
+
+        async def run():
+            await backend.create_chat_completion(messages=[])
+            pool = get_shared_http_client()._transport._pool()
+            return _get_semaphore(BASE_URL, 1), pool, pool is get_shared_http_client()._transport._pool()
+
+        first_semaphore, first_pool, stable = asyncio.run(run())
+        second_semaphore, second_pool, _ = asyncio.run(run())
+
+        assert stable
+        assert first_semaphore is not second_semaphore
+        assert first_pool is not second_pool
+
+    @pytest.mark.asyncio
+    async def test_server_shutdown_closes_shared_client(self):
+        """Test that the recommender server closes pooled LLM connections on shutdown."""
+        from mcp_pr_recommender.server import PRRecommenderServer
+
+        client = get_shared_http_client()
+        await PRRecommenderServer().shutdown_services()
+
+        assert client.is_closed
+        assert get_shared_http_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_streaming(self):
+        """Test streaming chunks from a server-sent events response."""
+
+        def handler(request):
+            assert json.loads(request.content)["stream"] is True
+            events = []
+            for piece in ["Hel", "lo"]:
+                chunk = {
+                    "id": "c",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "local-model",
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                events.append(f"data: {json.dumps(chunk)}\n\n")
+            events.append("data: [DONE]\n\n")
+            return httpx.Response(200, text="".join(events), headers={"content-type": "text/event-stream"})
+
+        backend = _backend(handler)
+        text = ""
+        async for chunk in backend.stream_chat_completion(messages=[]):
+            text += chunk.choices[0].delta.content or ""
+
+        assert text == "Hello"
@@ -0,0 +1,104 @@
+"""Unit tests for the LLM response cache."""
+
+import time
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_pr_recommender.services.llm_cache import LLMResponseCache
+
+
+@pytest.mark.unit
+class TestLLMResponseCache:
+    """Test the SQLite-backed LLM response cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temporary directory."""
+        cache = LLMResponseCache(path=tmp_path / "llm_cache.sqlite3", ttl_seconds=0, max_entries=3)
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def files(self):
+        """Create sample file status objects."""
+        return [
+            FileStatus(path="src/main.py", status_code="M", lines_added=10, lines_deleted=5),
+            FileStatus(path="README.md", status_code="A", lines_added=3, lines_deleted=0),
+        ]
+
+    def test_make_key_is_order_independent(self, files):
+        """Test that the key ignores file ordering."""
+        key_a = LLMResponseCache.make_key("gpt-4", "system", files)
+        key_b = LLMResponseCache.make_key("gpt-4", "system", list(reversed(files)))
+
+        assert key_a == key_b
+
+    def test_make_key_changes_with_content(self, files):
+        """Test that model, prompt and line stats all affect the key."""
+        base = LLMResponseCache.make_key("gpt-4", "system", files)
+        changed = [
+            FileStatus(path="src/main.py", status_code="M", lines_added=11, lines_deleted=5),
+            files[1],
+        ]
+
+        assert LLMResponseCache.make_key("gpt-4o", "system", files) != base
+        assert LLMResponseCache.make_key("gpt-4", "other", files) != base
+        assert LLMResponseCache.make_key("gpt-4", "system", changed) != base
+
+    def test_get_put_roundtrip(self, cache):
+        """Test storing and retrieving a response."""
+        assert cache.get("key") is None
+
+        cache.put("key", '{"groups": []}')
+
+        assert cache.get("key") == '{"groups": []}'
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive reopening the database."""
+        path = tmp_path / "llm_cache.sqlite3"
+        first = LLMResponseCache(path=path)
+        first.put("key", "value")
+        first.close()
+
+        second = LLMResponseCache(path=path)
+        assert second.get("key") == "value"
+        second.close()
+
+    def test_lru_eviction(self, cache):
+        """Test that the least recently used entry is evicted first."""
+        cache.put("a", "1")
+        time.sleep(0.01)
+        cache.put("b", "2")
+        time.sleep(0.01)
+        cache.put("c", "3")
+        time.sleep(0.01)
+        assert cache.get("a") == "1"  # refresh "a" so "b" is now the oldest
+        time.sleep(0.01)
+
+        cache.put("d", "4")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test that expired entries are treated as misses."""
+        cache = LLMResponseCache(path=tmp_path / "ttl.sqlite3", ttl_seconds=1)
+        cache.put("key", "value")
+        cache._conn.execute("UPDATE llm_responses SET created_at = created_at - 10")
+
+        assert cache.get("key") is None
+        assert cache.stats()["evictions"] == 1
+        cache.close()
+
+    def test_clear(self, cache):
+        """Test removing all entries."""
+        cache.put("key", "value")
+        cache.clear()
+
+        assert cache.stats()["entries"] == 0
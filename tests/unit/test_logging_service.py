@@ -0,0 +1,118 @@
+"""Tests for bounded log subscriptions in the logging service."""
+
+import asyncio
+
+import pytest
+
+from shared.base.types import LogLevel
+from shared.utils.logging import LoggingService, LogSubscriber
+
+
+def _message(n: int) -> dict:
+    return {"type": "log", "data": {"data": n}}
+
+
+def _values(batch: list[dict]) -> list[int]:
+    return [m["data"]["data"] for m in batch]
+
+
+@pytest.mark.unit
+class TestLogSubscriber:
+    """Test overflow policies of the per-subscriber ring buffer."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_latest(self):
+        subscriber = LogSubscriber(capacity=3)
+        for n in range(5):
+            subscriber.push(_message(n))
+
+        assert subscriber.dropped == 2
+        assert _values(await subscriber.get_batch(10)) == [2, 3, 4]
+        assert subscriber.delivered == 3
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_keeps_queued(self):
+        subscriber = LogSubscriber(capacity=3, policy="drop_newest")
+        for n in range(5):
+            subscriber.push(_message(n))
+
+        assert subscriber.dropped == 2
+        assert _values(await subscriber.get_batch(10)) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_sample_admits_every_nth_overflowing_event(self):
+        subscriber = LogSubscriber(capacity=2, policy="sample", sample_rate=3)
+        for n in range(8):
+            subscriber.push(_message(n))
+
+        # 6 overflowing events: 4 and 7 admitted (evicting the oldest), the rest dropped
+        assert subscriber.dropped == 6
+        assert _values(await subscriber.get_batch(10)) == [4, 7]
+
+    @pytest.mark.asyncio
+    async def test_batches_respect_max_items(self):
+        subscriber = LogSubscriber(capacity=10)
+        for n in range(5):
+            subscriber.push(_message(n))
+
+        assert _values(await subscriber.get_batch(2)) == [0, 1]
+        assert _values(await subscriber.get_batch(10)) == [2, 3, 4]
+        assert len(subscriber) == 0
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            LogSubscriber(capacity=0)
+
+
+@pytest.mark.unit
+class TestLoggingServiceSubscriptions:
+    """Test non-blocking fan-out from ``notify``."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_yields_messages(self):
+        service = LoggingService()
+        stream = service.subscribe()
+        receiver = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0)
+
+        await service.notify("hello", LogLevel.INFO, "test")
+        message = await asyncio.wait_for(receiver, 1)
+
+        assert message["data"]["data"] == "hello"
+        assert message["data"]["logger"] == "test"
+        await stream.aclose()
+        assert service.subscriber_stats() == []
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_notify(self):
+        service = LoggingService()
+        batches = service.subscribe_batches(max_batch=50, capacity=10)
+        receiver = asyncio.create_task(batches.__anext__())
+        await asyncio.sleep(0)
+
+        # The receiver cannot run while these are sent, so notify must not wait for it
+        for n in range(100):
+            await service.notify(str(n), LogLevel.INFO)
+
+        [stats] = service.subscriber_stats()
+        assert stats["queued"] == 10
+        assert stats["dropped"] == 90
+
+        batch = await asyncio.wait_for(receiver, 1)
+        assert [m["data"]["data"] for m in batch] == [str(n) for n in range(90, 100)]
+        await batches.aclose()
+
+    @pytest.mark.asyncio
+    async def test_filtered_levels_are_not_queued(self):
+        service = LoggingService()
+        await service.set_level(LogLevel.WARNING)
+        stream = service.subscribe()
+        receiver = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0)
+
+        await service.notify("ignored", LogLevel.DEBUG)
+        assert service.subscriber_stats()[0]["queued"] == 0
+
+        receiver.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await receiver
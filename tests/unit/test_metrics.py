@@ -0,0 +1,173 @@
+"""Tests for the performance metrics registry and its server integration."""
+
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.exceptions import ToolError
+from starlette.testclient import TestClient
+
+from shared.base.instrumentation import ToolMetricsMiddleware
+from shared.base.server import BaseMCPServer
+from shared.utils.metrics import (
+    TOOL_CALLS,
+    TOOL_LATENCY,
+    MetricsRegistry,
+    cache_hit_rates,
+    git_subcommand,
+    record_cache_lookup,
+)
+
+
+class _Server(BaseMCPServer):
+    service_name = "Metrics Test"
+    service_version = "0.0.1"
+    service_instructions = "test"
+
+    async def initialize_services(self) -> dict[str, Any]:
+        return {}
+
+    async def register_tools(self, mcp: FastMCP, services: dict[str, Any]) -> None:
+        @mcp.tool()
+        async def echo(text: str) -> dict[str, str]:
+            return {"text": text}
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Test counters, gauges, histograms and rendering."""
+
+    def test_counter_labels(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls", ("tool",))
+        calls.inc(tool="a")
+        calls.inc(2, tool="a")
+        calls.inc(tool="b")
+
+        assert calls.value(tool="a") == 3
+        assert registry.snapshot()["calls_total"] == {"a": 3, "b": 1}
+        with pytest.raises(ValueError):
+            calls.inc(other="x")
+
+    def test_same_name_returns_same_family(self):
+        registry = MetricsRegistry()
+        assert registry.counter("x_total", "X") is registry.counter("x_total", "X")
+        with pytest.raises(ValueError):
+            registry.histogram("x_total", "X")
+
+    def test_gauge(self):
+        registry = MetricsRegistry()
+        depth = registry.gauge("queue_depth", "Depth", ("queue",))
+        depth.inc(3, queue="a")
+        depth.dec(queue="a")
+        depth.set(7, queue="b")
+
+        assert depth.value(queue="a") == 2
+        assert registry.snapshot()["queue_depth"] == {"a": 2, "b": 7}
+        assert "# TYPE queue_depth gauge" in registry.render_prometheus()
+        with pytest.raises(ValueError):
+            registry.counter("queue_depth", "Depth", ("queue",))
+
+    def test_histogram_snapshot(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0, 10.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            latency.observe(value)
+
+        stats = registry.snapshot()["latency_seconds"][""]
+        assert stats["count"] == 4
+        assert stats["sum"] == pytest.approx(5.6)
+        assert stats["p50"] == 0.1
+        assert stats["p99"] == 5.0  # capped at the largest observation
+        assert stats["max"] == 5.0
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.counter("calls_total", "Calls", ("tool",)).inc(tool='say "hi"')
+        registry.histogram("latency_seconds", "Latency", ("tool",), buckets=(0.1, 1.0)).observe(0.5, tool="a")
+
+        text = registry.render_prometheus()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="say \\"hi\\""} 1' in text
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{tool="a",le="0.1"} 0' in text
+        assert 'latency_seconds_bucket{tool="a",le="1"} 1' in text
+        assert 'latency_seconds_bucket{tool="a",le="+Inf"} 1' in text
+        assert 'latency_seconds_count{tool="a"} 1' in text
+
+    def test_git_subcommand(self):
+        assert git_subcommand(["--no-pager", "diff", "--cached"]) == "diff"
+        assert git_subcommand(["status", "--porcelain=v1"]) == "status"
+        assert git_subcommand([]) == "unknown"
+
+    def test_cache_hit_rates(self):
+        before = cache_hit_rates().get("test_cache", {"hit": 0, "miss": 0})
+        record_cache_lookup("test_cache", True)
+        record_cache_lookup("test_cache", True)
+        record_cache_lookup("test_cache", False)
+
+        rates = cache_hit_rates()["test_cache"]
+        assert rates["hit"] - before["hit"] == 2
+        assert rates["miss"] - before["miss"] == 1
+        assert 0 < rates["hit_rate"] <= 1
+
+
+@pytest.mark.unit
+class TestServerMetrics:
+    """Test tool instrumentation, the /metrics route and get_performance_stats."""
+
+    @pytest.mark.asyncio
+    async def test_middleware_records_tool_calls(self):
+        mcp = FastMCP("test")
+        mcp.add_middleware(ToolMetricsMiddleware())
+
+        @mcp.tool()
+        async def probe_tool() -> dict[str, bool]:
+            return {"ok": True}
+
+        before = TOOL_CALLS.value(tool="probe_tool", status="ok")
+        async with Client(mcp) as client:
+            await client.call_tool("probe_tool", {})
+
+        assert TOOL_CALLS.value(tool="probe_tool", status="ok") == before + 1
+        assert TOOL_LATENCY.count(tool="probe_tool") >= 1
+
+    @pytest.mark.asyncio
+    async def test_unregistered_tools_share_one_label(self):
+        mcp = FastMCP("test")
+        mcp.add_middleware(ToolMetricsMiddleware())
+        names = [f"no_such_tool_{i}" for i in range(3)]
+
+        before = TOOL_CALLS.value(tool="unknown", status="error")
+        async with Client(mcp) as client:
+            for name in names:
+                with pytest.raises(ToolError):
+                    await client.call_tool(name, {})
+
+        assert TOOL_CALLS.value(tool="unknown", status="error") == before + 3
+        assert not any(key.startswith("no_such_tool") for key in TOOL_CALLS.snapshot())
+        assert not any(key.startswith("no_such_tool") for key in TOOL_LATENCY.snapshot())
+
+    @pytest.mark.asyncio
+    async def test_performance_stats_tool(self):
+        mcp, _ = await _Server().create_server()
+        async with Client(mcp) as client:
+            await client.call_tool("echo", {"text": "hi"})
+            result = await client.call_tool("get_performance_stats", {})
+
+        stats = result.data
+        assert stats["service"] == "Metrics Test"
+        assert stats["metrics"]["mcp_tool_calls_total"]["echo,ok"] >= 1
+        assert stats["metrics"]["mcp_tool_duration_seconds"]["echo"]["count"] >= 1
+        assert "cache_hit_rates" in stats
+
+    @pytest.mark.asyncio
+    async def test_metrics_route(self):
+        mcp, _ = await _Server().create_server()
+        async with Client(mcp) as client:
+            await client.call_tool("echo", {"text": "hi"})
+
+        response = TestClient(mcp.http_app()).get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'mcp_tool_calls_total{tool="echo",status="ok"}' in response.text
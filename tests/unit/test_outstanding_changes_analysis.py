@@ -0,0 +1,86 @@
+"""Unit tests for the cached file views of OutstandingChangesAnalysis."""
+
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.models.analysis_repository import BranchStatus, RepositoryStatus
+from mcp_local_repo_analyzer.models.changes import StagedChanges, WorkingDirectoryChanges
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.repository import LocalRepository
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.models.risk import RiskAssessment
+
+
+def _status(modified, staged):
+    return RepositoryStatus(
+        repository=LocalRepository(path=Path("/repo"), name="repo", current_branch="main"),
+        working_directory=WorkingDirectoryChanges(modified_files=modified),
+        staged_changes=StagedChanges(staged_files=staged),
+        branch_status=BranchStatus(current_branch="main"),
+    )
+
+
+@pytest.mark.unit
+class TestAllChangedFilesCache:
+    """Test materialization, indexing and invalidation of all_changed_files."""
+
+    @pytest.fixture
+    def analysis(self):
+        """Create an analysis with one file both modified and staged."""
+        return OutstandingChangesAnalysis(
+            repository_path=Path("/repo"),
+            risk_assessment=RiskAssessment(risk_level="low"),
+            summary="test",
+            repository_status=_status(
+                [FileStatus(path="a.py", status_code="M"), FileStatus(path="b.py", status_code="M")],
+                [FileStatus(path="b.py", status_code="M", staged=True), FileStatus(path="c.py", status_code="A")],
+            ),
+        )
+
+    def test_merged_and_deduplicated(self, analysis):
+        """Test that staged files already in the working directory are not repeated."""
+        assert [f.path for f in analysis.all_changed_files] == ["a.py", "b.py", "c.py"]
+        assert analysis.changed_files_by_path["b.py"].staged is False
+        assert set(analysis.changed_files_by_path) == {"a.py", "b.py", "c.py"}
+
+    def test_computed_once(self, analysis):
+        """Test that repeated access returns the cached list."""
+        assert analysis.all_changed_files is analysis.all_changed_files
+
+    def test_replacing_repository_status_invalidates(self, analysis):
+        """Test that assigning a new repository status rebuilds the view."""
+        first = analysis.all_changed_files
+
+        analysis.repository_status = _status([FileStatus(path="z.py", status_code="M")], [])
+
+        assert analysis.all_changed_files is not first
+        assert [f.path for f in analysis.all_changed_files] == ["z.py"]
+        assert "a.py" not in analysis.changed_files_by_path
+
+    def test_appending_files_is_detected(self, analysis):
+        """Test that growing a file list in place rebuilds the view."""
+        assert len(analysis.all_changed_files) == 3
+
+        analysis.repository_status.working_directory.untracked_files.append(FileStatus(path="new.py", status_code="?"))
+
+        assert "new.py" in analysis.changed_files_by_path
+
+    def test_explicit_invalidation(self, analysis):
+        """Test that same-length in-place edits are picked up after invalidation."""
+        assert "a.py" in analysis.changed_files_by_path
+
+        analysis.repository_status.working_directory.modified_files[0] = FileStatus(path="renamed.py", status_code="M")
+        analysis.invalidate_changed_files()
+
+        assert "renamed.py" in analysis.changed_files_by_path
+        assert "a.py" not in analysis.changed_files_by_path
+
+    def test_no_repository_status(self):
+        """Test the empty view without a repository status."""
+        analysis = OutstandingChangesAnalysis(
+            repository_path=Path("/repo"), risk_assessment=RiskAssessment(risk_level="low"), summary="test"
+        )
+
+        assert analysis.all_changed_files == []
+        assert analysis.changed_files_by_path == {}
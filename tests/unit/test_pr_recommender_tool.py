@@ -37,6 +37,8 @@ class TestPRRecommenderTool:
         ):
             # Mock settings for SemanticAnalyzer
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
 
             # Create a mock instance for the SemanticAnalyzer class
             mock_analyzer_instance = Mock()
@@ -442,3 +444,75 @@ class TestPRRecommenderTool:
 
         assert "error" in result
         assert "analysis failed" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_generate_pr_recommendations_incremental_session(self, pr_recommender_tool):
+        """Test that incremental mode reuses the previous session for the same repository."""
+        from mcp_local_repo_analyzer.models.files import FileStatus
+        from mcp_pr_recommender.models.recommendations import ChangeGroup
+        from mcp_pr_recommender.services.session_store import RecommendationSessionStore
+
+        pr_recommender_tool.session_store = RecommendationSessionStore()
+        files = [FileStatus(path="src/app.py", status_code="M", lines_added=10, lines_deleted=2)]
+        group = ChangeGroup(id="app", files=files, category="feature", confidence=0.9, reasoning="App changes")
+        analysis_data = {"all_files": [{"path": "src/app.py", "status_code": "M", "lines_added": 10}]}
+
+        analyzer = pr_recommender_tool.semantic_analyzer
+        analyzer.group_files = AsyncMock(return_value=[group])
+        analyzer.generate_recommendations_from_groups = Mock(return_value=[])
+        pr_recommender_tool.incremental_grouper.regroup = AsyncMock(
+            return_value=([group], {"unchanged_files": 1, "full_regroup": False})
+        )
+
+        first = await pr_recommender_tool.generate_recommendations(analysis_data=analysis_data, incremental=True)
+        second = await pr_recommender_tool.generate_recommendations(analysis_data=analysis_data, incremental=True)
+
+        analyzer.group_files.assert_awaited_once()
+        pr_recommender_tool.incremental_grouper.regroup.assert_awaited_once()
+        analyzer.analyze_and_generate_prs.assert_not_called()
+        assert first["metadata"]["incremental"] is None
+        assert second["metadata"]["incremental"]["unchanged_files"] == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_pr_recommendations_deterministic_strategy(self, pr_recommender_tool):
+        """Test that registered strategies group files without the LLM."""
+        analysis_data = {
+            "all_files": [
+                {"path": "src/api/routes.py", "status_code": "M", "lines_added": 10},
+                {"path": "src/api/models.py", "status_code": "M", "lines_added": 5},
+                {"path": "docs/guide.md", "status_code": "M", "lines_added": 3},
+            ]
+        }
+        analyzer = pr_recommender_tool.semantic_analyzer
+        analyzer.filter_files = Mock(side_effect=lambda files: files)
+        analyzer.generate_recommendations_from_groups = Mock(return_value=[])
+
+        result = await pr_recommender_tool.generate_recommendations(
+            analysis_data=analysis_data, strategy="directory", max_files_per_pr=2
+        )
+
+        analyzer.analyze_and_generate_prs.assert_not_called()
+        groups = analyzer.generate_recommendations_from_groups.call_args.args[0]
+        assert sorted(g.file_paths for g in groups) == [["docs/guide.md"], ["src/api/models.py", "src/api/routes.py"]]
+        assert result["strategy_used"] == "directory"
+
+    @pytest.mark.asyncio
+    async def test_deterministic_strategy_without_api_key(self, monkeypatch):
+        """Test that the tool builds and runs a deterministic strategy with no OpenAI key configured."""
+        from mcp_pr_recommender.tools.pr_recommender_tool import PRRecommenderTool
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        analysis_data = {
+            "all_files": [
+                {"path": "src/api/routes.py", "status_code": "M", "lines_added": 10},
+                {"path": "docs/guide.md", "status_code": "M", "lines_added": 3},
+            ]
+        }
+
+        tool = PRRecommenderTool()
+        result = await tool.generate_recommendations(analysis_data=analysis_data, strategy="directory")
+
+        assert "error" not in result
+        assert result["strategy_used"] == "directory"
+        assert result["total_prs_recommended"] >= 1
+        assert "backend" not in vars(tool.semantic_analyzer)
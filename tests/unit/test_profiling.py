@@ -0,0 +1,197 @@
+"""Tests for on-demand tool call profiling."""
+
+import json
+import pstats
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.services import GitClient
+from shared.base.server import BaseMCPServer
+from shared.utils.profiling import ToolProfiler, current_profile
+
+
+class _Server(BaseMCPServer):
+    service_name = "Profiling Test"
+    service_version = "0.0.1"
+    service_instructions = "test"
+
+    def __init__(self, repo: Path, output_dir: Path) -> None:
+        super().__init__()
+        self.repo = repo
+        self.profiler.output_dir = output_dir
+
+    async def initialize_services(self) -> dict[str, Any]:
+        return {"git_client": GitClient(GitAnalyzerSettings())}
+
+    async def register_tools(self, mcp: FastMCP, services: dict[str, Any]) -> None:
+        @mcp.tool()
+        async def git_status() -> dict[str, Any]:
+            await services["git_client"].execute_command(self.repo, ["rev-parse", "HEAD"])
+            await services["git_client"].get_status(self.repo)
+            return {"profiled": current_profile() is not None}
+
+        @mcp.tool()
+        async def busy() -> dict[str, Any]:
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                pass
+            return {"profiled": current_profile() is not None}
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "a.txt").write_text("a\n")
+    subprocess.run(["git", "-C", str(repo), "add", "a.txt"], check=True)
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=T", "-c", "user.email=t@example.com", "commit", "-qm", "init"],
+        check=True,
+    )
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def _no_profile_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("MCP_PROFILE_CALLS", "MCP_PROFILE_TOOLS", "MCP_PROFILE_MODE", "MCP_PROFILE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.mark.unit
+class TestToolProfiler:
+    """Test arming, claiming and environment defaults."""
+
+    def test_idle_by_default(self, tmp_path):
+        profiler = ToolProfiler(tmp_path)
+
+        assert not profiler.active
+        assert not profiler.claim("any_tool")
+
+    def test_next_n_calls(self, tmp_path):
+        profiler = ToolProfiler(tmp_path)
+        profiler.arm(calls=2)
+
+        assert profiler.claim("a")
+        assert not profiler.claim("b")  # busy until the first session ends
+        profiler._busy = False
+        assert profiler.claim("b")
+        profiler._busy = False
+        assert not profiler.active
+        assert not profiler.claim("c")
+
+    def test_tool_filter_without_limit(self, tmp_path):
+        profiler = ToolProfiler(tmp_path)
+        profiler.arm(calls=None, tools=["slow_tool"])
+
+        for _ in range(3):
+            assert not profiler.claim("other_tool")
+            assert profiler.claim("slow_tool")
+            profiler._busy = False
+        assert profiler.active
+
+        profiler.disarm()
+        assert not profiler.claim("slow_tool")
+
+    def test_unlimited_without_tools_profiles_one_call(self, tmp_path):
+        profiler = ToolProfiler(tmp_path)
+        profiler.arm(calls=None)
+
+        assert profiler.remaining == 1
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MCP_PROFILE_DIR", str(tmp_path))
+        monkeypatch.setenv("MCP_PROFILE_TOOLS", "get_outstanding_summary, get_push_readiness")
+        monkeypatch.setenv("MCP_PROFILE_MODE", "sample")
+
+        profiler = ToolProfiler.from_env()
+
+        assert profiler.output_dir == tmp_path
+        assert profiler.mode == "sample"
+        assert profiler.active
+        assert profiler.tools == {"get_outstanding_summary", "get_push_readiness"}
+        assert profiler.remaining is None
+
+    @pytest.mark.parametrize(
+        "tool",
+        ["../../escaped", "/abs/path", "..", "dotted.name", "nul\0byte", "x" * 300],
+        ids=["parent", "absolute", "dotdot", "dotted", "nul", "long"],
+    )
+    def test_output_stays_in_profile_dir(self, tmp_path, tool):
+        output_dir = tmp_path / "profiles"
+        profiler = ToolProfiler(output_dir)
+        profiler.arm(calls=1)
+
+        assert profiler.claim(tool)
+        with profiler.session(tool):
+            pass
+
+        written = [Path(p) for p in profiler.recent]
+        assert sorted(p.suffix for p in written) == [".json", ".pstats"]
+        assert all(p.parent == output_dir and p.exists() for p in written)
+        assert list(tmp_path.iterdir()) == [output_dir]
+
+
+@pytest.mark.unit
+class TestServerProfiling:
+    """Test the configure_profiling tool, middleware output and CLI flags."""
+
+    @pytest.mark.asyncio
+    async def test_cprofile_with_git_spans(self, git_repo, tmp_path):
+        server = _Server(git_repo, tmp_path / "profiles")
+        mcp, _ = await server.create_server()
+
+        async with Client(mcp) as client:
+            status = (await client.call_tool("configure_profiling", {"calls": 1})).data
+            profiled = (await client.call_tool("git_status", {})).data
+            unprofiled = (await client.call_tool("git_status", {})).data
+            status = (await client.call_tool("configure_profiling", {"calls": 0})).data
+
+        assert profiled == {"profiled": True}
+        assert unprofiled == {"profiled": False}
+        assert not status["active"]
+        files = sorted(Path(p) for p in status["recent_files"])
+        assert [p.name.split(".", 1)[1] for p in files] == ["git.json", "pstats"]
+        assert pstats.Stats(str(files[1])).total_calls > 0
+        spans = json.loads(files[0].read_text())
+        assert spans["tool"] == "git_status"
+        assert [s["command"] for s in spans["git_commands"]] == ["rev-parse", "status"]
+        assert all(s["status"] == "ok" and s["duration_ms"] > 0 for s in spans["git_commands"])
+
+    @pytest.mark.asyncio
+    async def test_sampling_matching_tool(self, git_repo, tmp_path):
+        server = _Server(git_repo, tmp_path / "profiles")
+        server.profiler.interval = 0.001
+        mcp, _ = await server.create_server()
+
+        async with Client(mcp) as client:
+            await client.call_tool("configure_profiling", {"calls": None, "tools": ["busy"], "mode": "sample"})
+            assert (await client.call_tool("git_status", {})).data == {"profiled": False}
+            assert (await client.call_tool("busy", {})).data == {"profiled": True}
+            assert (await client.call_tool("busy", {})).data == {"profiled": True}
+
+        collapsed = sorted((tmp_path / "profiles").glob("busy-*.collapsed"))
+        assert len(collapsed) == 2
+        lines = collapsed[0].read_text().splitlines()
+        assert any("busy (test_profiling.py:" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_cli_flags_arm_profiler(self, git_repo, tmp_path):
+        server = _Server(git_repo, tmp_path)
+        args = server.create_cli_parser().parse_args(
+            ["--profile-tool", "get_outstanding_summary", "--profile-mode", "sample", "--profile-dir", str(tmp_path)]
+        )
+
+        server.setup_profiling(args)
+
+        assert server.profiler.active
+        assert server.profiler.tools == {"get_outstanding_summary"}
+        assert server.profiler.remaining is None
+        assert server.profiler.mode == "sample"
+        assert server.profiler.output_dir == tmp_path
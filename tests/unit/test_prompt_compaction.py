@@ -0,0 +1,93 @@
+"""Unit tests for token-budgeted prompt compaction."""
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_pr_recommender.prompts.compaction import DirectoryTrie, compact_file_listing, estimate_tokens
+
+
+def _flat_listing(files):
+    return "\n".join(f"- {f.path} ({f.status_code}) +{f.lines_added}/-{f.lines_deleted} lines" for f in files)
+
+
+@pytest.mark.unit
+class TestDirectoryTrie:
+    """Test directory trie rendering."""
+
+    def test_shared_prefixes_emitted_once(self):
+        """Test that a common directory prefix appears only as one header."""
+        files = [
+            FileStatus(path="packages/core/src/api/routes.py", status_code="M", lines_added=10, lines_deleted=2),
+            FileStatus(path="packages/core/src/api/models.py", status_code="A", lines_added=40),
+            FileStatus(path="README.md", status_code="M", lines_added=1, lines_deleted=1),
+        ]
+
+        listing = DirectoryTrie(files).render()
+
+        assert listing.count("packages/core/src/api/") == 1
+        assert "  routes.py M +10/-2" in listing
+        assert "README.md M +1/-1" in listing
+
+    def test_homogeneous_subtree_collapsed(self):
+        """Test that generated files with identical stats collapse to one line."""
+        files = [
+            FileStatus(path=f"src/gen/api/client_{i}.py", status_code="M", lines_added=1, lines_deleted=1)
+            for i in range(42)
+        ]
+        files.append(FileStatus(path="src/app.py", status_code="M", lines_added=5))
+
+        listing = DirectoryTrie(files).render()
+
+        assert "gen/api/ (42 files, all M +1/-1)" in listing
+        assert "client_0.py" not in listing
+
+    def test_no_changes_marker(self):
+        """Test that files without line changes are flagged."""
+        listing = DirectoryTrie([FileStatus(path="moved.py", status_code="M")]).render()
+
+        assert "moved.py M NO CHANGES" in listing
+
+    def test_depth_limited_summary(self):
+        """Test that directories deeper than max_depth become summaries."""
+        files = [
+            FileStatus(path="src/a/x.py", status_code="M", lines_added=3),
+            FileStatus(path="src/b/y.py", status_code="A", lines_added=7),
+        ]
+
+        listing = DirectoryTrie(files).render(max_depth=0)
+
+        assert listing == "src/ (2 files, +10/-0; 1 M, 1 A)"
+
+
+@pytest.mark.unit
+class TestCompactFileListing:
+    """Test fitting listings into a token budget."""
+
+    @pytest.fixture
+    def monorepo_files(self):
+        """Create a deep monorepo change set with varied stats."""
+        return [
+            FileStatus(
+                path=f"services/team_{t}/backend/src/module_{m}/file_{f}.py",
+                status_code="M",
+                lines_added=t + m + f + 1,
+                lines_deleted=f,
+            )
+            for t in range(5)
+            for m in range(10)
+            for f in range(10)
+        ]
+
+    def test_compaction_reduces_tokens(self, monorepo_files):
+        """Test that the trie listing is much smaller than the flat listing."""
+        flat = _flat_listing(monorepo_files)
+        compact = compact_file_listing(monorepo_files, token_budget=10**6)
+
+        assert estimate_tokens(compact) < estimate_tokens(flat) / 2
+
+    @pytest.mark.parametrize("budget", [2000, 300, 50])
+    def test_fits_budget(self, monorepo_files, budget):
+        """Test that the listing always fits the requested budget."""
+        listing = compact_file_listing(monorepo_files, token_budget=budget)
+
+        assert estimate_tokens(listing) <= budget
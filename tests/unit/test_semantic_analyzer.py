@@ -10,6 +10,7 @@ from mcp_local_repo_analyzer.models.files import FileStatus
 from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
 from mcp_local_repo_analyzer.models.risk import RiskAssessment
 from mcp_pr_recommender.models.recommendations import ChangeGroup, PRRecommendation
+from mcp_pr_recommender.services.llm_backend import get_shared_http_client
 from mcp_pr_recommender.services.semantic_analyzer import SemanticAnalyzer
 
 
@@ -25,13 +26,16 @@ class TestSemanticAnalyzer:
             mock_settings_instance.openai_api_key = "test_key"
             mock_settings_instance.openai_model = "gpt-4"
             mock_settings_instance.max_tokens_per_request = 1000
+            mock_settings_instance.llm_cache_enabled = False
+            mock_settings_instance.llm_streaming = False
+            mock_settings_instance.prompt_compaction_min_files = 25
             mock_settings_func.return_value = mock_settings_instance
             yield mock_settings_instance
 
     @pytest.fixture
     def analyzer(self, mock_settings):
         """Create semantic analyzer instance."""
-        with patch("mcp_pr_recommender.services.semantic_analyzer.openai.AsyncOpenAI"):
+        with patch("openai.AsyncOpenAI"):
             return SemanticAnalyzer()
 
     @pytest.fixture
@@ -80,12 +84,16 @@ class TestSemanticAnalyzer:
     @pytest.mark.asyncio
     async def test_analyzer_initialization(self, mock_settings):
         """Test analyzer initialization."""
-        with patch("mcp_pr_recommender.services.semantic_analyzer.openai.AsyncOpenAI") as mock_openai:
+        with patch("openai.AsyncOpenAI") as mock_openai:
             analyzer = SemanticAnalyzer()
 
             assert analyzer.client is not None
             assert analyzer.logger is not None
-            mock_openai.assert_called_once_with(api_key="test_key")
+            mock_openai.assert_called_once()
+            kwargs = mock_openai.call_args.kwargs
+            assert kwargs["api_key"] == "test_key"
+            assert kwargs["max_retries"] == 0  # retries are handled by the LLM backend
+            assert kwargs["http_client"] is get_shared_http_client()
 
     @pytest.mark.asyncio
     async def test_analyze_and_generate_prs_success(self, analyzer, sample_files, sample_analysis):
@@ -203,6 +211,91 @@ class TestSemanticAnalyzer:
         assert len(groups) > 0
         assert any(g.id in ["source_code_changes", "other_changes"] for g in groups)
 
+    @pytest.mark.asyncio
+    async def test_llm_group_files_uses_cache(self, analyzer, sample_files, sample_analysis, tmp_path):
+        """Test that an identical change set is served from the response cache."""
+        from mcp_pr_recommender.services.llm_cache import LLMResponseCache
+
+        analyzer.cache = LLMResponseCache(path=tmp_path / "llm_cache.sqlite3")
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {"groups": [{"id": "group_1", "files": ["src/main.py", "src/utils.py"], "category": "feature"}]}
+        )
+        analyzer.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        first = await analyzer._llm_group_files(sample_files, sample_analysis)
+        second = await analyzer._llm_group_files(list(reversed(sample_files)), sample_analysis)
+
+        analyzer.client.chat.completions.create.assert_awaited_once()
+        assert [g.id for g in second] == [g.id for g in first]
+        assert analyzer.cache.stats()["hits"] == 1
+        analyzer.cache.close()
+
+    @staticmethod
+    def _stream(text, chunk_size=7, finish_reason="stop"):
+        """Build an async iterator of streamed completion chunks."""
+
+        async def _gen():
+            pieces = [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+            for i, piece in enumerate(pieces):
+                chunk = Mock()
+                chunk.choices = [Mock()]
+                chunk.choices[0].delta.content = piece
+                chunk.choices[0].finish_reason = finish_reason if i == len(pieces) - 1 else None
+                yield chunk
+
+        return _gen()
+
+    @pytest.mark.asyncio
+    async def test_llm_group_files_streaming(self, analyzer, mock_settings, sample_files, sample_analysis):
+        """Test streamed grouping reports rate-limited progress as groups arrive."""
+        mock_settings.llm_streaming = True
+        content = json.dumps(
+            {
+                "groups": [
+                    {"id": "source", "files": ["src/main.py", "src/utils.py"], "category": "feature"},
+                    {"id": "tests", "files": ["tests/test_main.py"], "category": "test"},
+                ]
+            }
+        )
+        analyzer.client.chat.completions.create = AsyncMock(return_value=self._stream(content))
+        ctx = AsyncMock()
+
+        groups = await analyzer._llm_group_files(sample_files, sample_analysis, ctx)
+
+        assert analyzer.client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert [g.id for g in groups] == ["source", "tests", "ungrouped_files"]
+        progress = [call.args for call in ctx.report_progress.await_args_list]
+        # The second group arrives within the progress interval and is coalesced
+        assert progress == [(2, 5), (5, 5)]
+
+    @pytest.mark.asyncio
+    async def test_llm_group_files_streaming_truncated(self, analyzer, mock_settings, sample_files, sample_analysis):
+        """Test that fully received groups survive a truncated stream and are not cached."""
+        mock_settings.llm_streaming = True
+        analyzer.cache = Mock()
+        analyzer.cache.get.return_value = None
+        content = json.dumps(
+            {
+                "groups": [
+                    {"id": "source", "files": ["src/main.py", "src/utils.py"], "category": "feature"},
+                    {"id": "tests", "files": ["tests/test_main.py"], "category": "test"},
+                ]
+            }
+        )
+        truncated = content[: content.index('"tests"')]
+        analyzer.client.chat.completions.create = AsyncMock(
+            return_value=self._stream(truncated, finish_reason="length")
+        )
+
+        groups = await analyzer._llm_group_files(sample_files, sample_analysis)
+
+        assert groups[0].id == "source"
+        assert groups[-1].id == "ungrouped_files"
+        assert len(groups[-1].files) == 3
+        analyzer.cache.put.assert_not_called()
+
     def test_filter_files(self, analyzer):
         """Test file filtering."""
         files = [
@@ -252,6 +345,37 @@ class TestSemanticAnalyzer:
         assert "Files without changes: 1" in prompt
         assert "NO CHANGES" in prompt
 
+    def test_create_grouping_prompt_compacts_large_change_sets(self, analyzer, sample_analysis):
+        """Test that large change sets use the compact directory listing within budget."""
+        from mcp_pr_recommender.prompts.compaction import estimate_tokens
+
+        files = [
+            FileStatus(path=f"src/gen/api/v1/client_{i}.py", status_code="M", lines_added=1, lines_deleted=1)
+            for i in range(200)
+        ]
+        files.append(FileStatus(path="src/app.py", status_code="M", lines_added=12, lines_deleted=3))
+
+        prompt = analyzer._create_grouping_prompt(files, sample_analysis)
+
+        assert "Group these 201 files" in prompt
+        assert "gen/api/v1/ (200 files, all M +1/-1)" in prompt
+        assert "app.py M +12/-3" in prompt
+        assert estimate_tokens(prompt) <= 1000
+
+    def test_parse_grouping_response_expands_directories(self, analyzer):
+        """Test that directory entries from a compacted listing expand to their files."""
+        files = [
+            FileStatus(path="src/gen/a.py", status_code="M", lines_added=1, lines_deleted=1),
+            FileStatus(path="src/gen/b.py", status_code="M", lines_added=1, lines_deleted=1),
+            FileStatus(path="src/general.py", status_code="M", lines_added=4),
+        ]
+        response = json.dumps({"groups": [{"id": "generated", "files": ["src/gen/"], "category": "chore"}]})
+
+        groups = analyzer._parse_grouping_response(response, files)
+
+        assert groups[0].file_paths == ["src/gen/a.py", "src/gen/b.py"]
+        assert groups[1].file_paths == ["src/general.py"]
+
     def test_parse_grouping_response_valid_json(self, analyzer, sample_files):
         """Test parsing valid JSON grouping response."""
         response = """Here are the groups:
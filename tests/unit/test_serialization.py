@@ -0,0 +1,76 @@
+"""Tests for the shared JSON serialization helpers."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from shared.utils import serialization
+from shared.utils.serialization import dumps, paginate
+
+
+@pytest.mark.unit
+class TestDumps:
+    """Test the tool result serializer."""
+
+    def test_round_trips_plain_data(self):
+        data = {"files": [{"path": "a.py", "lines_added": 3, "is_binary": False}], "total": 1, "note": None}
+        assert json.loads(dumps(data)) == data
+
+    def test_serializes_models_paths_and_datetimes(self):
+        data = {
+            "file": FileStatus(path="src/a.py", status_code="M", lines_added=2),
+            "path": Path("/repo"),
+            "when": datetime(2025, 1, 2, 3, 4, 5),
+        }
+        decoded = json.loads(dumps(data))
+        assert decoded["file"]["path"] == "src/a.py"
+        assert decoded["file"]["lines_added"] == 2
+        assert decoded["path"] == "/repo"
+        assert decoded["when"].startswith("2025-01-02T03:04:05")
+
+    def test_handles_values_outside_orjson_range(self):
+        assert json.loads(dumps({"big": 2**70})) == {"big": 2**70}
+
+    def test_falls_back_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert json.loads(dumps({"path": Path("/repo"), "count": 2})) == {"path": "/repo", "count": 2}
+
+    def test_matches_stdlib_on_large_file_lists(self):
+        files = [
+            {"path": f"src/pkg_{i % 50}/file_{i}.py", "status": "M", "lines_added": i, "staged": i % 2 == 0}
+            for i in range(5000)
+        ]
+        assert json.loads(dumps({"files": files})) == {"files": files}
+
+
+@pytest.mark.unit
+class TestPaginate:
+    """Test offset/limit pagination."""
+
+    def test_whole_sequence_by_default(self):
+        items = list(range(5))
+        page, meta = paginate(items)
+        assert page is items
+        assert meta == {"offset": 0, "limit": None, "returned": 5, "total": 5, "has_more": False, "next_offset": None}
+
+    def test_pages_cover_sequence_in_order(self):
+        items = list(range(7))
+        collected, offset = [], 0
+        while offset is not None:
+            page, meta = paginate(items, offset, 3)
+            collected.extend(page)
+            offset = meta["next_offset"]
+        assert collected == items
+
+    def test_offset_past_end_returns_empty_page(self):
+        page, meta = paginate([1, 2], offset=5, limit=2)
+        assert list(page) == []
+        assert meta["has_more"] is False
+
+    @pytest.mark.parametrize(("offset", "limit"), [(-1, None), (0, 0)])
+    def test_rejects_invalid_arguments(self, offset, limit):
+        with pytest.raises(ValueError):
+            paginate([1, 2, 3], offset, limit)
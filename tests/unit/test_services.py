@@ -100,7 +100,7 @@ class TestChangeDetector:
     async def test_detect_working_directory_changes(self):
         """Test working directory change detection."""
         # Mock git status response
-        self.git_client.get_status = AsyncMock(
+        self.git_client.get_working_directory_status = AsyncMock(
             return_value={
                 "files": [
                     {
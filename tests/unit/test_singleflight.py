@@ -0,0 +1,220 @@
+"""Tests for single-flight coalescing of concurrent identical requests."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mcp_local_repo_analyzer.config import GitAnalyzerSettings
+from mcp_local_repo_analyzer.models.repository import LocalRepository
+from mcp_local_repo_analyzer.services import ChangeDetector, GitClient, RequestCoalescer, StatusTracker
+from shared.utils.git import repository_fingerprint
+from shared.utils.metrics import COALESCED_CALLS, GIT_COMMANDS
+from shared.utils.singleflight import SingleFlight
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=T", "-c", "user.email=t@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q", str(repo)], check=True)
+    (repo / "a.txt").write_text("a\n")
+    _git(repo, "add", "a.txt")
+    _git(repo, "commit", "-qm", "init")
+    return repo
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test sharing, failure propagation, retention and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_computation(self):
+        flights = SingleFlight("test_share")
+        calls = 0
+
+        async def compute() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [calls]
+
+        results = await asyncio.gather(*(flights.do("key", compute) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert COALESCED_CALLS.value(operation="test_share", role="leader") == 1
+        assert COALESCED_CALLS.value(operation="test_share", role="shared") == 4
+
+    @pytest.mark.asyncio
+    async def test_different_keys_compute_separately(self):
+        flights = SingleFlight("test_keys")
+
+        async def compute(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        assert await asyncio.gather(flights.do("a", lambda: compute("a")), flights.do("b", lambda: compute("b"))) == [
+            "a",
+            "b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_waiters(self):
+        flights = SingleFlight("test_failure")
+
+        async def compute() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flights.do("key", compute) for _ in range(3)), return_exceptions=True)
+
+        assert len(results) == 3
+        assert all(isinstance(r, ValueError) and str(r) == "boom" for r in results)
+        assert flights.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_result_not_retained_after_completion(self):
+        flights = SingleFlight("test_retention")
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flights.do("key", compute) == 1
+        assert flights.in_flight == 0
+        assert await flights.do("key", compute) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_computation(self):
+        flights = SingleFlight("test_cancel_one")
+        started = asyncio.Event()
+
+        async def compute() -> str:
+            started.set()
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flights.do("key", compute))
+        second = asyncio.create_task(flights.do("key", compute))
+        await started.wait()
+        first.cancel()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_cancelling_all_waiters_cancels_computation(self):
+        flights = SingleFlight("test_cancel_all")
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def compute() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.create_task(flights.do("key", compute)) for _ in range(2)]
+        await started.wait()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert flights.in_flight == 0
+
+
+@pytest.mark.unit
+class TestRequestCoalescer:
+    """Test repository keys and coalescing of real repository analyses."""
+
+    def test_fingerprint_tracks_git_state(self, git_repo):
+        before = repository_fingerprint(git_repo)
+        (git_repo / "a.txt").write_text("changed\n")
+        assert repository_fingerprint(git_repo) == before
+
+        _git(git_repo, "add", "a.txt")
+        staged = repository_fingerprint(git_repo)
+        assert staged != before
+
+        _git(git_repo, "commit", "-qm", "change")
+        assert repository_fingerprint(git_repo) != staged
+
+    def test_fingerprint_outside_repository(self, tmp_path):
+        assert repository_fingerprint(tmp_path) == ()
+
+    @pytest.mark.asyncio
+    async def test_state_change_starts_new_flight(self, git_repo):
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            call = calls
+            await release.wait()
+            return call
+
+        first = asyncio.create_task(coalescer.run("status", git_repo, compute))
+        await asyncio.sleep(0)
+        (git_repo / "b.txt").write_text("b\n")
+        _git(git_repo, "add", "b.txt")
+        second = asyncio.create_task(coalescer.run("status", git_repo, compute))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert sorted(await asyncio.gather(first, second)) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_disabled_computes_every_call(self, git_repo):
+        coalescer = RequestCoalescer(enabled=False)
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            call = calls
+            await asyncio.sleep(0.01)
+            return call
+
+        assert sorted(await asyncio.gather(*(coalescer.run("status", git_repo, compute) for _ in range(3)))) == [
+            1,
+            2,
+            3,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_runs_git_once(self, git_repo):
+        (git_repo / "a.txt").write_text("changed\n")
+        git_client = GitClient(GitAnalyzerSettings())
+        coalescer = RequestCoalescer()
+        tracker = StatusTracker(git_client, ChangeDetector(git_client, coalescer), coalescer)
+        repo = LocalRepository(path=git_repo, name=git_repo.name, current_branch="main", head_commit="unknown")
+
+        await tracker.get_repository_status(repo)
+        single = sum(GIT_COMMANDS.snapshot().values())
+        await tracker.get_repository_status(repo)
+        single = sum(GIT_COMMANDS.snapshot().values()) - single
+
+        before = sum(GIT_COMMANDS.snapshot().values())
+        statuses = await asyncio.gather(*(tracker.get_repository_status(repo) for _ in range(4)))
+
+        assert sum(GIT_COMMANDS.snapshot().values()) - before == single
+        assert all(status is statuses[0] for status in statuses)
+        assert statuses[0].working_directory.modified_files[0].path == "a.txt"
@@ -0,0 +1,102 @@
+"""Tests for the pagination snapshot cache."""
+
+import pytest
+
+from mcp_local_repo_analyzer.services.snapshot_cache import (
+    CursorError,
+    SnapshotCache,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Test opaque cursor encoding."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor("abc123", 42)
+        assert "abc123" not in cursor
+        assert decode_cursor(cursor) == ("abc123", 42)
+
+    @pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor("abc", 1)[:-2] + "%%", "bm9jb2xvbg"])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(CursorError):
+            decode_cursor(cursor)
+
+
+@pytest.mark.unit
+class TestSnapshotCache:
+    """Test snapshot storage, expiry and paging."""
+
+    def test_single_page_creates_no_snapshot(self):
+        cache = SnapshotCache()
+        page, pagination = cache.first_page("tool", [1, 2, 3], limit=5)
+        assert list(page) == [1, 2, 3]
+        assert pagination["next_cursor"] is None
+        assert len(cache) == 0
+
+    def test_pages_through_snapshot(self):
+        cache = SnapshotCache()
+        items = list(range(10))
+        page, pagination = cache.first_page("tool", items, context={"total": 10}, limit=4)
+        collected = list(page)
+        while pagination["next_cursor"]:
+            snapshot, page, pagination = cache.next_page("tool", pagination["next_cursor"], limit=4)
+            assert snapshot.context == {"total": 10}
+            collected.extend(page)
+        assert collected == items
+        assert len(cache) == 1
+
+    def test_snapshot_is_isolated_from_later_results(self):
+        cache = SnapshotCache()
+        _, pagination = cache.first_page("tool", ["a", "b", "c"], limit=1)
+        cache.first_page("tool", ["x", "y", "z"], limit=1)
+        _, page, _ = cache.next_page("tool", pagination["next_cursor"], limit=5)
+        assert list(page) == ["b", "c"]
+
+    def test_pack_applied_only_to_snapshots(self):
+        cache = SnapshotCache()
+        packed = []
+
+        def pack(items):
+            packed.append(items)
+            return tuple(items)
+
+        cache.first_page("tool", [1, 2], limit=5, pack=pack)
+        assert packed == []
+
+        page, pagination = cache.first_page("tool", [1, 2, 3], limit=1, pack=pack)
+        assert page == [1]
+        snapshot, page, _ = cache.next_page("tool", pagination["next_cursor"])
+        assert snapshot.items == (1, 2, 3)
+        assert page == (2, 3)
+
+    def test_wrong_kind_rejected(self):
+        cache = SnapshotCache()
+        _, pagination = cache.first_page("tool_a", [1, 2], limit=1)
+        with pytest.raises(CursorError, match="tool_a"):
+            cache.next_page("tool_b", pagination["next_cursor"])
+
+    def test_expired_snapshot(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("mcp_local_repo_analyzer.services.snapshot_cache.time.monotonic", lambda: clock[0])
+        cache = SnapshotCache(ttl_seconds=60)
+        _, pagination = cache.first_page("tool", [1, 2], limit=1)
+
+        clock[0] += 59
+        cache.next_page("tool", pagination["next_cursor"])
+        clock[0] += 2
+        with pytest.raises(CursorError, match="expired"):
+            cache.next_page("tool", pagination["next_cursor"])
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = SnapshotCache(max_snapshots=2)
+        first = cache.create("tool", [1])
+        second = cache.create("tool", [2])
+        assert cache.get(first.snapshot_id) is first  # refresh first
+        cache.create("tool", [3])
+        assert cache.get(second.snapshot_id) is None
+        assert cache.get(first.snapshot_id) is first
+        assert len(cache) == 2
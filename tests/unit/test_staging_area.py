@@ -46,6 +46,41 @@ class TestAnalyzeStagedChanges:
 
         shutil.rmtree(self.temp_dir)
 
+    @pytest.mark.asyncio
+    async def test_analyze_staged_changes_cursor_pagination(self):
+        """Test paging staged files with a cursor; diffs only come with the first page."""
+        from fastmcp import Client, FastMCP
+
+        mcp = FastMCP()
+        register_staging_area_tools(mcp, self.mock_services)
+
+        staged_files = [
+            FileStatus(path=f"src/file_{i}.py", status_code="M", staged=True, lines_added=i) for i in range(5)
+        ]
+        self.mock_services["change_detector"].detect_staged_changes.return_value = StagedChanges(
+            staged_files=staged_files
+        )
+        self.mock_services["git_client"].get_diff.return_value = "+change"
+
+        async with Client(mcp) as client:
+            first = (
+                await client.call_tool("analyze_staged_changes", {"repository_path": self.repo_path, "limit": 2})
+            ).data
+            second = (
+                await client.call_tool(
+                    "analyze_staged_changes", {"cursor": first["pagination"]["next_cursor"], "limit": 10}
+                )
+            ).data
+
+        assert [f["path"] for f in first["staged_files"]] == ["src/file_0.py", "src/file_1.py"]
+        assert len(first["diffs"]) == 2
+        assert [f["path"] for f in second["staged_files"]] == ["src/file_2.py", "src/file_3.py", "src/file_4.py"]
+        assert "diffs" not in second
+        assert second["total_staged_files"] == 5
+        assert second["statistics"]["total_additions"] == 10
+        assert second["pagination"]["next_cursor"] is None
+        assert self.mock_services["change_detector"].detect_staged_changes.await_count == 1
+
     @pytest.mark.asyncio
     async def test_analyze_staged_changes_with_files(self):
         """Test analyzing staged changes with staged files."""
@@ -0,0 +1,27 @@
+"""Cold-start budget of both servers, measured by scripts/measure_startup.py."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "measure_startup.py"
+
+
+@pytest.mark.slow
+def test_startup_within_budget():
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--runs", "2", "--top", "5", "--json", "--check"],
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    report = json.loads(proc.stdout)
+
+    assert proc.returncode == 0, proc.stderr
+    for name, result in report.items():
+        assert result["startup_ms"] <= result["budget_ms"], name
+        assert result["deferred_loaded"] == [], name
+        assert result["pending_services"], f"{name} built services at startup"
@@ -0,0 +1,184 @@
+"""Unit tests for the deterministic grouping strategies."""
+
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
+from mcp_local_repo_analyzer.models.risk import RiskAssessment
+from mcp_pr_recommender.services.strategies import (
+    DependencyStrategy,
+    DirectoryStrategy,
+    SizeStrategy,
+    available_strategies,
+    get_strategy,
+)
+
+
+def _file(path, added=10, deleted=0, status="M"):
+    return FileStatus(path=path, status_code=status, lines_added=added, lines_deleted=deleted)
+
+
+def _analysis(repo_path):
+    return OutstandingChangesAnalysis(
+        repository_path=Path(repo_path),
+        risk_assessment=RiskAssessment(risk_level="low"),
+        summary="test",
+    )
+
+
+def _all_paths(groups):
+    return sorted(path for group in groups for path in group.file_paths)
+
+
+@pytest.mark.unit
+class TestStrategyRegistry:
+    """Test strategy registration and lookup."""
+
+    def test_available_strategies(self):
+        """Test that the advertised deterministic strategies are registered."""
+        assert available_strategies() == ["dependency", "directory", "size"]
+
+    def test_get_strategy(self):
+        """Test lookup of known and unknown strategies."""
+        assert isinstance(get_strategy("size"), SizeStrategy)
+        assert get_strategy("semantic") is None
+        assert get_strategy("nonexistent_strategy") is None
+
+
+@pytest.mark.unit
+class TestDirectoryStrategy:
+    """Test trie-based directory partitioning."""
+
+    def test_small_directories_stay_together(self):
+        """Test that a subtree fitting in one PR is not split."""
+        files = [_file("src/auth/login.py"), _file("src/auth/logout.py"), _file("docs/auth.md")]
+
+        groups = DirectoryStrategy().group(files, max_files_per_pr=2)
+
+        assert sorted(g.file_paths for g in groups) == [["docs/auth.md"], ["src/auth/login.py", "src/auth/logout.py"]]
+
+    def test_large_directory_is_split_and_balanced(self):
+        """Test that oversized directories are split and small siblings packed together."""
+        files = [_file(f"src/core/mod_{i}.py") for i in range(6)]
+        files += [_file("src/a/x.py"), _file("src/b/y.py"), _file("src/c/z.py")]
+
+        groups = DirectoryStrategy().group(files, max_files_per_pr=4)
+
+        assert all(len(g.files) <= 4 for g in groups)
+        assert _all_paths(groups) == sorted(f.path for f in files)
+        assert len(groups) == 3
+
+    def test_deterministic(self):
+        """Test that input order does not change the result."""
+        files = [_file(f"pkg{i % 3}/sub{i % 5}/f{i}.py") for i in range(40)]
+
+        first = DirectoryStrategy().group(files, max_files_per_pr=6)
+        second = DirectoryStrategy().group(list(reversed(files)), max_files_per_pr=6)
+
+        assert [g.file_paths for g in first] == [g.file_paths for g in second]
+
+
+@pytest.mark.unit
+class TestSizeStrategy:
+    """Test bin-packing by changed lines."""
+
+    def test_respects_line_and_file_caps(self):
+        """Test that bins stay under both caps and oversized files are isolated."""
+        files = [_file(f"f{i}.py", added=added) for i, added in enumerate([300, 250, 150, 100, 50, 50, 900])]
+
+        groups = SizeStrategy(max_lines_per_pr=400).group(files, max_files_per_pr=3)
+
+        assert _all_paths(groups) == sorted(f.path for f in files)
+        assert any(g.file_paths == ["f6.py"] for g in groups)
+        for group in groups:
+            assert len(group.files) <= 3
+            assert group.total_changes <= 400 or len(group.files) == 1
+
+    def test_packs_tightly(self):
+        """Test that best-fit decreasing reaches the optimal bin count for an easy instance."""
+        files = [_file(f"f{i}.py", added=added) for i, added in enumerate([200, 200, 100, 100, 300, 100])]
+
+        groups = SizeStrategy(max_lines_per_pr=400).group(files, max_files_per_pr=8)
+
+        assert len(groups) == 3
+
+
+@pytest.mark.unit
+class TestDependencyStrategy:
+    """Test import-graph grouping."""
+
+    def test_python_imports_are_grouped(self, tmp_path):
+        """Test that absolute and relative Python imports connect files."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "models.py").write_text("class User: ...\n")
+        (tmp_path / "pkg" / "service.py").write_text("from .models import User\n")
+        (tmp_path / "pkg" / "other.py").write_text("import os\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_service.py").write_text("from pkg.service import run\n")
+        files = [_file("pkg/models.py"), _file("pkg/service.py"), _file("pkg/other.py"), _file("tests/test_service.py")]
+
+        groups = DependencyStrategy().group(files, _analysis(tmp_path), max_files_per_pr=8)
+
+        linked = next(g for g in groups if "pkg/service.py" in g.file_paths)
+        assert linked.file_paths == ["pkg/models.py", "pkg/service.py", "tests/test_service.py"]
+        assert any(g.file_paths == ["pkg/other.py"] for g in groups)
+
+    def test_js_relative_imports_are_grouped(self, tmp_path):
+        """Test that relative JS/TS imports resolve across extensions and index files."""
+        (tmp_path / "web" / "api").mkdir(parents=True)
+        (tmp_path / "web" / "app.ts").write_text("import { client } from './api';\n")
+        (tmp_path / "web" / "api" / "index.ts").write_text("export const client = require('../util');\n")
+        (tmp_path / "web" / "util.js").write_text("module.exports = {};\n")
+        files = [_file("web/app.ts"), _file("web/api/index.ts"), _file("web/util.js")]
+
+        groups = DependencyStrategy().group(files, _analysis(tmp_path), max_files_per_pr=8)
+
+        assert [g.file_paths for g in groups] == [["web/api/index.ts", "web/app.ts", "web/util.js"]]
+
+    def test_missing_repository_falls_back_to_directories(self):
+        """Test that unreadable files are grouped by directory."""
+        files = [_file("a/one.py"), _file("a/two.py"), _file("b/three.py")]
+
+        groups = DependencyStrategy().group(files, _analysis("/nonexistent/repo"), max_files_per_pr=8)
+
+        assert _all_paths(groups) == sorted(f.path for f in files)
+        assert all(len(g.files) <= 8 for g in groups)
+
+
+class _CountingFile(FileStatus):
+    """A FileStatus that counts reads of ``path``, the key every strategy works from."""
+
+    path_reads: ClassVar[int] = 0
+
+    def __getattribute__(self, name):
+        if name == "path":
+            type(self).path_reads += 1
+        return super().__getattribute__(name)
+
+
+@pytest.mark.unit
+class TestStrategyPerformance:
+    """Test that deterministic strategies do linear work on large change sets.
+
+    Wall-clock limits are enforced by the gated benchmarks in tests/benchmarks.
+    """
+
+    def _path_reads(self, name, count):
+        files = [
+            _CountingFile(path=f"src/pkg{i % 20}/mod{i % 50}/file_{i}.py", status_code="M", lines_added=i % 300)
+            for i in range(count)
+        ]
+        _CountingFile.path_reads = 0
+        groups = get_strategy(name).group(files, _analysis("/nonexistent/repo"), max_files_per_pr=8)
+
+        assert sum(len(g.files) for g in groups) == count
+        assert all(len(g.files) <= 8 for g in groups)
+        return _CountingFile.path_reads
+
+    @pytest.mark.parametrize("name", ["directory", "size", "dependency"])
+    def test_large_change_set_is_linear(self, name):
+        """Test that doubling 2,500 files to 5,000 at most doubles the per-file work."""
+        assert self._path_reads(name, 5000) <= 2.1 * self._path_reads(name, 2500)
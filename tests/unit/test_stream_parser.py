@@ -0,0 +1,62 @@
+"""Unit tests for the incremental streamed-JSON group parser."""
+
+import json
+
+import pytest
+
+from mcp_pr_recommender.services.stream_parser import IncrementalGroupParser
+
+RESPONSE = json.dumps(
+    {
+        "groups": [
+            {"id": "auth", "files": ["src/auth.py"], "reasoning": 'Handles "login" {braces} and [brackets]'},
+            {"id": "docs", "files": ["README.md"], "dependencies": ["auth"]},
+        ],
+        "validation": {"files_not_grouped": []},
+        "rationale": "Split by feature",
+    }
+)
+
+
+@pytest.mark.unit
+class TestIncrementalGroupParser:
+    """Test incremental parsing of streamed grouping responses."""
+
+    def test_emits_groups_as_they_close(self):
+        """Test that each group is emitted by the chunk that closes it."""
+        parser = IncrementalGroupParser()
+        first_close = RESPONSE.index("}, {") + 1
+
+        emitted_first = parser.feed(RESPONSE[:first_close])
+        emitted_rest = parser.feed(RESPONSE[first_close:])
+
+        assert [g["id"] for g in emitted_first] == ["auth"]
+        assert [g["id"] for g in emitted_rest] == ["docs"]
+        assert parser.complete
+
+    def test_character_by_character(self):
+        """Test that chunk boundaries, escapes and nested brackets do not matter."""
+        parser = IncrementalGroupParser()
+
+        for ch in "```json\n" + RESPONSE + "\n```":
+            parser.feed(ch)
+
+        assert [g["id"] for g in parser.groups] == ["auth", "docs"]
+        assert parser.groups[0]["reasoning"] == 'Handles "login" {braces} and [brackets]'
+
+    def test_truncated_response_keeps_completed_groups(self):
+        """Test that a cut-off stream keeps fully received groups only."""
+        parser = IncrementalGroupParser()
+
+        parser.feed(RESPONSE[: RESPONSE.index('"docs"') + 10])
+
+        assert [g["id"] for g in parser.groups] == ["auth"]
+        assert not parser.complete
+
+    def test_ignores_objects_outside_groups(self):
+        """Test that nested objects under other keys are not emitted."""
+        parser = IncrementalGroupParser()
+
+        parser.feed(json.dumps({"validation": {"groups": [{"id": "x"}]}, "groups": [{"id": "real"}]}))
+
+        assert [g["id"] for g in parser.groups] == ["real"]
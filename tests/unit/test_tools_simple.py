@@ -36,6 +36,8 @@ class TestPRRecommenderToolSimple:
             patch("mcp_pr_recommender.services.semantic_analyzer.settings") as mock_sa_settings,
         ):
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
             tool = PRRecommenderTool()
             assert tool is not None
             assert hasattr(tool, "semantic_analyzer")
@@ -48,6 +50,8 @@ class TestPRRecommenderToolSimple:
             patch("mcp_pr_recommender.services.semantic_analyzer.settings") as mock_sa_settings,
         ):
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
             tool = PRRecommenderTool()
 
             # Mock the semantic analyzer
@@ -176,6 +180,8 @@ class TestToolIntegration:
             patch("mcp_pr_recommender.services.semantic_analyzer.settings") as mock_sa_settings,
         ):
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
             pr_tool = PRRecommenderTool()
             strategy_tool = StrategyManagerTool()
             validator_tool = ValidatorTool()
@@ -192,6 +198,8 @@ class TestToolIntegration:
             patch("mcp_pr_recommender.services.semantic_analyzer.settings") as mock_sa_settings,
         ):
             mock_sa_settings.return_value.openai_api_key = "test_key"
+            mock_sa_settings.return_value.llm_cache_enabled = False
+            mock_sa_settings.return_value.llm_streaming = False
             # Initialize tools
             strategy_tool = StrategyManagerTool()
             pr_tool = PRRecommenderTool()
@@ -9,9 +9,13 @@ from fastmcp import Client, FastMCP
 
 from mcp_local_repo_analyzer.models.categorization import ChangeCategorization
 from mcp_local_repo_analyzer.models.changes import WorkingDirectoryChanges
+from mcp_local_repo_analyzer.models.file_table import FileStatusTable
 from mcp_local_repo_analyzer.models.files import FileStatus
+from mcp_local_repo_analyzer.models.results import OutstandingChangesAnalysis
 from mcp_local_repo_analyzer.models.risk import RiskAssessment
+from mcp_local_repo_analyzer.services.snapshot_cache import decode_cursor
 from mcp_local_repo_analyzer.tools.working_directory import (
+    _render_working_directory,
     register_working_directory_tools,
 )
 
@@ -264,6 +268,90 @@ class TestAnalyzeWorkingDirectory:
         working_dir = repo_status["working_directory"]
         assert working_dir["total_files"] == 20
 
+    @pytest.mark.asyncio
+    async def test_analyze_working_directory_paginated(self, mcp_server, mock_services, temp_repo_path):
+        """Test that a page spans categories while totals cover every file."""
+        mock_working_changes = WorkingDirectoryChanges(
+            modified_files=[FileStatus(path=f"src/mod_{i}.py", status_code="M") for i in range(3)],
+            untracked_files=[FileStatus(path=f"new_{i}.py", status_code="??") for i in range(3)],
+        )
+        mock_services["change_detector"].detect_working_directory_changes = AsyncMock(return_value=mock_working_changes)
+        mock_services["diff_analyzer"].categorize_changes = Mock(return_value=ChangeCategorization())
+        mock_services["diff_analyzer"].assess_risk = Mock(return_value=RiskAssessment(risk_level="low"))
+
+        result = await call_tool_helper(
+            mcp_server,
+            "analyze_working_directory",
+            repository_path=temp_repo_path,
+            include_diffs=False,
+            offset=2,
+            limit=2,
+        )
+
+        working_dir = result["repository_status"]["working_directory"]
+        assert [f["path"] for f in working_dir["modified_files"]] == ["src/mod_2.py"]
+        assert [f["path"] for f in working_dir["untracked_files"]] == ["new_0.py"]
+        assert working_dir["total_files"] == 6
+        assert result["total_outstanding_files"] == 6
+        pagination = result["pagination"]
+        assert (pagination["offset"], pagination["returned"], pagination["total"]) == (2, 2, 6)
+        assert pagination["next_offset"] == 4
+        assert pagination["next_cursor"]
+
+    @pytest.mark.asyncio
+    async def test_analyze_working_directory_cursor_pages_from_snapshot(
+        self, mcp_server, mock_services, temp_repo_path
+    ):
+        """Test that following cursors lists every file once without re-running git."""
+        mock_working_changes = WorkingDirectoryChanges(
+            modified_files=[FileStatus(path=f"src/mod_{i}.py", status_code="M") for i in range(4)],
+            untracked_files=[FileStatus(path=f"new_{i}.py", status_code="??") for i in range(3)],
+        )
+        detect = AsyncMock(return_value=mock_working_changes)
+        mock_services["change_detector"].detect_working_directory_changes = detect
+        mock_services["diff_analyzer"].categorize_changes = Mock(return_value=ChangeCategorization())
+        mock_services["diff_analyzer"].assess_risk = Mock(return_value=RiskAssessment(risk_level="low"))
+
+        listed = []
+        result = await call_tool_helper(
+            mcp_server, "analyze_working_directory", repository_path=temp_repo_path, include_diffs=False, limit=3
+        )
+        snapshot = mock_services["snapshot_cache"].get(decode_cursor(result["pagination"]["next_cursor"])[0])
+        while True:
+            working_dir = result["repository_status"]["working_directory"]
+            listed.extend(working_dir["modified_files"] + working_dir["untracked_files"])
+            cursor = result["pagination"]["next_cursor"]
+            if cursor is None:
+                break
+            result = await call_tool_helper(mcp_server, "analyze_working_directory", cursor=cursor, limit=3)
+            assert result["total_outstanding_files"] == 7
+
+        assert listed == [f.model_dump() for f in mock_working_changes.all_files]
+        assert detect.await_count == 1
+        # The snapshot keeps the files in columnar form, not the analysis' FileStatus models
+        assert isinstance(snapshot.items, FileStatusTable)
+        assert snapshot.context[0].repository_status.working_directory.all_files == []
+
+    def test_render_without_repository_status(self):
+        """Test that an analysis without repository status is dumped unpaged."""
+        analysis = OutstandingChangesAnalysis(
+            repository_path=Path("/repo"), risk_assessment=RiskAssessment(risk_level="low"), summary="test"
+        )
+        pagination = {"offset": 0, "limit": 2, "returned": 0, "total": 0, "has_more": False}
+
+        result = _render_working_directory(analysis, (0, 0, 0, 0, 0), [], pagination)
+
+        assert result["repository_status"] is None
+        assert result["pagination"] == pagination
+
+    @pytest.mark.asyncio
+    async def test_analyze_working_directory_invalid_cursor(self, mcp_server):
+        """Test that an unknown cursor is reported as an error."""
+        result = await call_tool_helper(mcp_server, "analyze_working_directory", cursor="bm9wZTow")
+
+        assert "error" in result
+        assert "expired" in result["error"]
+
 
 @pytest.mark.unit
 class TestGetFileDiff:
@@ -438,6 +526,59 @@ class TestGetUntrackedFiles:
         assert "files" in result
         assert len(result["files"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_untracked_files_paginated(self, mcp_server, mock_services, temp_repo_path):
+        """Test paging through untracked files with offset and limit."""
+        mock_services["change_detector"].detect_working_directory_changes = AsyncMock(
+            return_value=WorkingDirectoryChanges(
+                untracked_files=[FileStatus(path=f"new_{i}.py", status_code="??") for i in range(5)],
+            )
+        )
+
+        first = await call_tool_helper(
+            mcp_server, "get_untracked_files", repository_path=temp_repo_path, offset=0, limit=2
+        )
+        assert [f["path"] for f in first["files"]] == ["new_0.py", "new_1.py"]
+        assert first["untracked_count"] == 5
+        assert first["pagination"]["has_more"] is True
+
+        last = await call_tool_helper(
+            mcp_server,
+            "get_untracked_files",
+            repository_path=temp_repo_path,
+            offset=first["pagination"]["next_offset"] + 2,
+            limit=2,
+        )
+        assert [f["path"] for f in last["files"]] == ["new_4.py"]
+        assert last["pagination"]["has_more"] is False
+        assert last["pagination"]["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_untracked_files_cursor(self, mcp_server, mock_services, temp_repo_path):
+        """Test that a cursor continues from the snapshot of the first call."""
+        detect = AsyncMock(
+            return_value=WorkingDirectoryChanges(
+                untracked_files=[FileStatus(path=f"new_{i}.py", status_code="??") for i in range(5)],
+            )
+        )
+        mock_services["change_detector"].detect_working_directory_changes = detect
+
+        first = await call_tool_helper(mcp_server, "get_untracked_files", repository_path=temp_repo_path, limit=3)
+        second = await call_tool_helper(
+            mcp_server, "get_untracked_files", cursor=first["pagination"]["next_cursor"], limit=3
+        )
+
+        assert [f["path"] for f in second["files"]] == ["new_3.py", "new_4.py"]
+        assert second["untracked_count"] == 5
+        assert second["repository_path"] == first["repository_path"]
+        assert second["pagination"]["next_cursor"] is None
+        assert detect.await_count == 1
+
+        wrong_tool = await call_tool_helper(
+            mcp_server, "analyze_working_directory", cursor=first["pagination"]["next_cursor"]
+        )
+        assert "get_untracked_files" in wrong_tool["error"]
+
 
 @pytest.mark.unit
 class TestWorkingDirectoryToolIntegration: